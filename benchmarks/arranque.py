@@ -0,0 +1,104 @@
+"""
+Benchmark del arranque en frío de main.py.
+
+Cada medición lanza un intérprete nuevo y mide el tiempo hasta que el
+proceso termina, en tres modos que salen enseguida:
+
+- menu:   muestra el menú y elige "0) Salir"
+- script: ejecuta un script vacío (--script - con la entrada vacía)
+- ayuda:  --help, solo argparse
+
+A la mediana se le resta la de `python -c pass`, de modo que el presupuesto
+se aplica al arranque propio del sistema y no al del intérprete. Una corrida
+adicional con -X importtime informa los módulos que más tardan en importarse.
+
+Uso:
+    python -m benchmarks.arranque [--repeticiones N] [--presupuesto MS] [--datos DIRECTORIO]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(RAIZ, "main.py")
+
+# Modo -> (argumentos de main.py, entrada estándar)
+MODOS = {
+    "menu": ([], "0\n"),
+    "script": (["--script", "-"], ""),
+    "ayuda": (["--help"], ""),
+}
+
+
+def medir_proceso(comando: list[str], entrada: str, repeticiones: int) -> float:
+    """
+    Ejecuta el comando varias veces y devuelve la mediana del tiempo total.
+
+    Returns:
+        float: Segundos desde el lanzamiento hasta la salida del proceso
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(comando, input=entrada, capture_output=True, text=True, cwd=RAIZ)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+
+def tiempos_importacion(argumentos: list[str], entrada: str) -> list[tuple[int, str]]:
+    """
+    Ejecuta main.py con -X importtime y devuelve los módulos por tiempo acumulado.
+
+    Returns:
+        list[tuple[int, str]]: (microsegundos acumulados, módulo), de mayor a menor
+    """
+    proceso = subprocess.run([sys.executable, "-X", "importtime", MAIN, *argumentos],
+                             input=entrada, capture_output=True, text=True, cwd=RAIZ)
+    modulos = []
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, modulo = linea.split("|")
+        modulos.append((int(acumulado), modulo.strip()))
+    return sorted(modulos, reverse=True)
+
+
+def main(argv=None):
+    """Mide el arranque de cada modo e informa si alguno supera el presupuesto."""
+    parser = argparse.ArgumentParser(description="Arranque en frío de main.py")
+    parser.add_argument("--repeticiones", type=int, default=10, help="procesos lanzados por modo")
+    parser.add_argument("--presupuesto", type=float, default=100.0,
+                        help="milisegundos máximos de arranque propio (descontado el intérprete)")
+    parser.add_argument("--datos", metavar="DIRECTORIO",
+                        help="carpeta persistida a pasar con --datos (el menú no debería cargarla)")
+    parser.add_argument("--detalle", type=int, default=10, help="módulos más lentos a mostrar por modo")
+    argumentos = parser.parse_args(argv)
+
+    interprete = medir_proceso([sys.executable, "-c", "pass"], "", argumentos.repeticiones)
+    print(f"{'intérprete':<10} {interprete * 1000:8.1f} ms")
+
+    excedidos = []
+    for modo, (extra, entrada) in MODOS.items():
+        if argumentos.datos:
+            extra = ["--datos", argumentos.datos, *extra]
+        total = medir_proceso([sys.executable, MAIN, *extra], entrada, argumentos.repeticiones)
+        propio = (total - interprete) * 1000
+        marca = ""
+        if propio > argumentos.presupuesto:
+            marca = "  EXCEDE EL PRESUPUESTO"
+            excedidos.append(modo)
+        print(f"{modo:<10} {total * 1000:8.1f} ms  (propio {propio:6.1f} ms){marca}")
+        for microsegundos, modulo in tiempos_importacion(extra, entrada)[:argumentos.detalle]:
+            print(f"    {microsegundos / 1000:7.1f} ms  {modulo}")
+
+    if excedidos:
+        print(f"Presupuesto de {argumentos.presupuesto:.0f} ms excedido en: {', '.join(excedidos)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark del formato binario: guardar y cargar una clínica grande.
+
+Sobre una clínica sintética (por defecto 1.000.000 de turnos) mide el
+tiempo de guardar_binario y cargar_binario y el tamaño del archivo, y lo
+compara con los registros del snapshot de DiarioClinica (los de
+serializacion, cargados con restaurar_turno igual que al abrir el diario)
+escritos con pickle y con JSON.
+
+Uso:
+    python -m benchmarks.binario [--turnos N] [--solo-binario]
+"""
+import argparse
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+from benchmarks.suite import generar_clinica, MEDICAMENTOS
+from src.modelo.clinica import Clinica
+from src.persistencia.binario import guardar_binario, cargar_binario
+from src.persistencia.serializacion import (
+    serializar_paciente, deserializar_paciente, serializar_medico, deserializar_medico,
+    serializar_turno, deserializar_turno, serializar_receta, deserializar_receta,
+)
+
+
+def estado_snapshot(clinica: Clinica) -> dict:
+    """Arma los mismos registros que el snapshot de DiarioClinica."""
+    return {
+        "pacientes": [serializar_paciente(p) for p in clinica.iter_pacientes()],
+        "medicos": [serializar_medico(m) for m in clinica.iter_medicos()],
+        "turnos": [serializar_turno(t) for t in clinica.iter_turnos()],
+        "recetas": [serializar_receta(r) for r in clinica.iter_recetas()],
+    }
+
+
+def clinica_desde_estado(estado: dict) -> Clinica:
+    """Reconstruye la clínica igual que DiarioClinica al cargar el snapshot."""
+    clinica = Clinica()
+    for datos in estado["pacientes"]:
+        clinica.agregar_paciente(deserializar_paciente(datos))
+    for datos in estado["medicos"]:
+        clinica.agregar_medico(deserializar_medico(datos))
+    for datos in estado["turnos"]:
+        clinica.restaurar_turno(deserializar_turno(datos, clinica))
+    for datos in estado["recetas"]:
+        clinica.restaurar_receta(deserializar_receta(datos, clinica))
+    return clinica
+
+
+def guardar_json(clinica: Clinica, ruta: str) -> None:
+    """Escribe el snapshot en JSON."""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(estado_snapshot(clinica), archivo, ensure_ascii=False)
+
+
+def cargar_json(ruta: str) -> Clinica:
+    """Carga el snapshot escrito en JSON."""
+    with open(ruta, encoding="utf-8") as archivo:
+        return clinica_desde_estado(json.load(archivo))
+
+
+def guardar_pickle(clinica: Clinica, ruta: str) -> None:
+    """Escribe el snapshot con pickle (la Clinica en sí no se puede recargar con pickle)."""
+    with open(ruta, "wb") as archivo:
+        pickle.dump(estado_snapshot(clinica), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def cargar_pickle(ruta: str) -> Clinica:
+    """Carga el snapshot escrito con pickle."""
+    with open(ruta, "rb") as archivo:
+        return clinica_desde_estado(pickle.load(archivo))
+
+
+def medir(nombre: str, guardar, cargar, clinica: Clinica, ruta: str) -> None:
+    """Guarda y carga la clínica con un formato y muestra tiempos y tamaño."""
+    inicio = time.perf_counter()
+    guardar(clinica, ruta)
+    guardado = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    cargada = cargar(ruta)
+    carga = time.perf_counter() - inicio
+    if cargada.contar_turnos() != clinica.contar_turnos():
+        raise AssertionError(f"{nombre}: se cargaron {cargada.contar_turnos()} turnos")
+    print(f"{nombre:<10} guardar {guardado:7.2f} s   cargar {carga:7.2f} s   "
+          f"{os.path.getsize(ruta) / 2 ** 20:8.1f} MiB")
+
+
+def main(argv=None):
+    """Mide cada formato y muestra los resultados."""
+    parser = argparse.ArgumentParser(description="Guardado y carga de la clínica en formato binario")
+    parser.add_argument("--turnos", type=int, default=1_000_000)
+    parser.add_argument("--solo-binario", action="store_true", help="no medir los snapshots pickle y JSON (los más lentos)")
+    argumentos = parser.parse_args(argv)
+
+    clinica = generar_clinica(argumentos.turnos)
+    for i, paciente in enumerate(clinica.iter_pacientes(limite=10_000)):
+        clinica.emitir_receta(paciente.obtener_dni(), "MED0000", MEDICAMENTOS[:1 + i % 3])
+    print(f"{clinica.contar_turnos()} turnos, {len(clinica.obtener_pacientes())} pacientes")
+
+    directorio = tempfile.mkdtemp()
+    try:
+        medir("binario", guardar_binario, cargar_binario, clinica, os.path.join(directorio, "clinica.bin"))
+        if not argumentos.solo_binario:
+            medir("pickle", guardar_pickle, cargar_pickle, clinica, os.path.join(directorio, "clinica.pickle"))
+            medir("json", guardar_json, cargar_json, clinica, os.path.join(directorio, "clinica.json"))
+    finally:
+        shutil.rmtree(directorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark de la exportación de historias clínicas: secuencial contra procesos.
+
+Sobre una clínica sintética (por defecto 20.000 pacientes con 20 turnos y
+algunas recetas cada uno) mide:
+
+- el camino secuencial: str(obtener_historia_clinica(dni)) para cada paciente
+- ExportadorHistorias con 1, 2, 4, ... procesos hasta la cantidad de núcleos
+
+e informa historias/s y la aceleración respecto del secuencial. También
+informa cuánto tarda el proceso principal sólo en armar los registros
+compactos, que es la parte que no se reparte y acota la aceleración.
+
+Uso:
+    python -m benchmarks.exportacion [--pacientes N] [--turnos-por-paciente N] [--procesos N ...]
+"""
+import argparse
+import io
+import os
+import time
+
+from benchmarks.suite import generar_clinica, MEDICAMENTOS
+from src.persistencia.exportacion import ExportadorHistorias, registro_paciente
+
+
+def main(argv=None):
+    """Ejecuta las exportaciones y muestra el ritmo de cada una."""
+    parser = argparse.ArgumentParser(description="Exportación de historias clínicas en paralelo")
+    parser.add_argument("--pacientes", type=int, default=20_000)
+    parser.add_argument("--turnos-por-paciente", type=int, default=20)
+    parser.add_argument("--procesos", type=int, nargs="+",
+                        help="cantidades de procesos a medir (por defecto 1, 2, 4, ... hasta los núcleos)")
+    argumentos = parser.parse_args(argv)
+
+    nucleos = os.cpu_count() or 1
+    procesos = argumentos.procesos or [2 ** i for i in range(nucleos.bit_length()) if 2 ** i <= nucleos]
+    clinica = generar_clinica(argumentos.pacientes * argumentos.turnos_por_paciente,
+                              pacientes=argumentos.pacientes)
+    for i in range(0, argumentos.pacientes, 3):
+        clinica.emitir_receta(f"{i:08d}", "MED0000", MEDICAMENTOS[:2])
+    print(f"{argumentos.pacientes} pacientes, {clinica.contar_turnos()} turnos, {nucleos} núcleos")
+
+    inicio = time.perf_counter()
+    for paciente in clinica.iter_pacientes():
+        registro_paciente(clinica, paciente)
+    print(f"{'registros (proceso principal)':<32} {time.perf_counter() - inicio:7.2f} s")
+
+    inicio = time.perf_counter()
+    salida = io.StringIO()
+    for paciente in clinica.iter_pacientes():
+        salida.write(str(clinica.obtener_historia_clinica(paciente.obtener_dni())) + "\n")
+    secuencial = time.perf_counter() - inicio
+    print(f"{'secuencial (str por paciente)':<32} {secuencial:7.2f} s  "
+          f"{argumentos.pacientes / secuencial:9.0f} historias/s")
+
+    for cantidad in procesos:
+        resultado = ExportadorHistorias(clinica, cantidad).exportar_archivo(io.StringIO())
+        print(f"{f'{cantidad} procesos':<32} {resultado.segundos:7.2f} s  "
+              f"{resultado.historias_por_segundo():9.0f} historias/s  x{secuencial / resultado.segundos:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark de memoria por objeto de las clases del modelo.
+
+Construye una clínica sintética (por defecto 1.000.000 de turnos) dos
+veces: con las clases del modelo, que usan __slots__, y con copias de esas
+mismas clases sin __slots__ (cada instancia con su __dict__, como antes).
+Informa los bytes asignados por objeto según tracemalloc, incluyendo los
+valores propios de cada objeto (fechas, listas) pero no los compartidos.
+
+También mide cuánto ocupa cada turno guardado en AlmacenMemoria, que los
+guarda en una tabla columnar (TablaTurnos) en lugar de objetos Turno.
+
+Uso:
+    python -m benchmarks.memoria [--turnos N]
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta, date
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import Turno
+from src.modelo.receta import Receta
+from src.modelo.almacen import AlmacenMemoria
+
+
+def sin_slots(clase: type) -> type:
+    """
+    Devuelve una copia de la clase sin __slots__.
+
+    Los métodos son los mismos, así que los atributos privados (con nombre
+    ya transformado, como _Turno__paciente) pasan a guardarse en __dict__.
+    """
+    # Se descartan __slots__ y sus descriptores (_Clase__atributo)
+    atributos = {
+        nombre: valor for nombre, valor in vars(clase).items()
+        if nombre != "__slots__" and not nombre.startswith(f"_{clase.__name__}__")
+    }
+    return type(clase.__name__, (), atributos)
+
+
+def medir(crear, cantidad: int) -> float:
+    """Devuelve los bytes asignados por objeto al crear 'cantidad' objetos."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = crear(cantidad)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return (despues - antes) / cantidad
+
+
+def clinica_sintetica(clases: dict, turnos: int) -> dict:
+    """Mide pacientes, turnos y recetas de una clínica con las clases indicadas."""
+    ClasePaciente, ClaseTurno, ClaseReceta = clases["Paciente"], clases["Turno"], clases["Receta"]
+    medico = Medico("Dr. García", "MED001")
+    medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+    inicio = datetime(2030, 6, 3, 8, 0)
+    duracion = timedelta(minutes=30)
+    pacientes = [
+        ClasePaciente.restaurar(f"Paciente {i}", f"{i:08d}", date(1985, 3, 15))
+        for i in range(max(1, turnos // 10))
+    ]
+
+    def crear_turnos(n):
+        return [
+            ClaseTurno.restaurar(pacientes[i % len(pacientes)], medico, inicio + i * duracion, "Cardiología", duracion)
+            for i in range(n)
+        ]
+
+    def crear_recetas(n):
+        return [
+            ClaseReceta.restaurar(pacientes[i % len(pacientes)], medico, ["Aspirina 100mg"], inicio)
+            for i in range(n)
+        ]
+
+    def crear_pacientes(n):
+        return [ClasePaciente.restaurar("Paciente", f"{i:08d}", date(1985, 3, 15)) for i in range(n)]
+
+    return {
+        "Turno": medir(crear_turnos, turnos),
+        "Receta": medir(crear_recetas, max(1, turnos // 4)),
+        "Paciente": medir(crear_pacientes, max(1, turnos // 10)),
+    }
+
+
+def bytes_por_turno_almacenado(turnos: int) -> float:
+    """Mide los bytes por turno agregado a un AlmacenMemoria (10 médicos, turnos / 10 pacientes)."""
+    almacen = AlmacenMemoria()
+    medicos = [Medico(f"Dr. {i}", f"MED{i:03d}") for i in range(10)]
+    pacientes = [Paciente.restaurar("Paciente", f"{i:08d}", date(1985, 3, 15)) for i in range(max(1, turnos // 10))]
+    inicio = datetime(2030, 6, 3, 8, 0)
+    duracion = timedelta(minutes=30)
+    lote = 100_000
+
+    def crear(n):
+        for desde in range(0, n, lote):
+            almacen.agregar_turnos([
+                Turno.restaurar(pacientes[i % len(pacientes)], medicos[i % 10],
+                                inicio + (i // 10) * duracion, "Cardiología", duracion)
+                for i in range(desde, min(n, desde + lote))
+            ])
+        return almacen
+
+    return medir(crear, turnos)
+
+
+def main(argv=None):
+    """Ejecuta el benchmark e imprime los bytes por objeto."""
+    parser = argparse.ArgumentParser(description="Memoria por objeto con y sin __slots__")
+    parser.add_argument("--turnos", type=int, default=1_000_000)
+    argumentos = parser.parse_args(argv)
+
+    con_slots = {"Paciente": Paciente, "Turno": Turno, "Receta": Receta}
+    sin = {nombre: sin_slots(clase) for nombre, clase in con_slots.items()}
+    antes = clinica_sintetica(sin, argumentos.turnos)
+    despues = clinica_sintetica(con_slots, argumentos.turnos)
+
+    print(f"{'Clase':<10} {'sin __slots__':>14} {'con __slots__':>14} {'ahorro':>8}")
+    for nombre in antes:
+        ahorro = 1 - despues[nombre] / antes[nombre]
+        print(f"{nombre:<10} {antes[nombre]:>12.0f} B {despues[nombre]:>12.0f} B {ahorro:>7.0%}")
+    print(f"Turno guardado en AlmacenMemoria: {bytes_por_turno_almacenado(argumentos.turnos):.0f} B")
+
+
+if __name__ == "__main__":
+    main()
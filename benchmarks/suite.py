@@ -0,0 +1,281 @@
+"""
+Suite de benchmarks de rendimiento del modelo de la clínica.
+
+Mide, con datos sintéticos reproducibles (semilla fija), el throughput y la
+latencia por operación de:
+
+- registro de pacientes (agregar_paciente)
+- agendar_turno sobre clínicas con 10.000, 100.000 y 1.000.000 de turnos previos
+- emitir_receta
+- armado y renderizado de la historia clínica (primera consulta y siguientes)
+- listado de turnos de la CLI (primera página) y una página profunda de iter_turnos
+
+Los resultados se emiten como JSON (con la versión de Python y el commit)
+para guardarlos y compararlos entre commits con --comparar.
+
+Uso:
+    python -m benchmarks.suite [--tamanos N ...] [--operaciones N] [--salida resultados.json]
+    python -m benchmarks.suite --comparar base.json [--tolerancia 0.15]
+"""
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import Turno, DURACION_POR_DEFECTO
+from src.interfaz.cli import CLI
+
+
+VERSION_RESULTADOS = 1
+SEMILLA = 1504
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes"]
+PRIMER_LUNES = datetime(2030, 6, 3)
+# Horarios de 30 minutos entre las 8 y las 20, de lunes a viernes
+HORARIOS_POR_SEMANA = 24 * 5
+MEDICAMENTOS = ["Aspirina 100mg", "Ibuprofeno 400mg", "Amoxicilina 500mg", "Omeprazol 20mg", "Enalapril 10mg"]
+
+
+def horario(numero: int) -> datetime:
+    """Devuelve el número-ésimo horario de atención de un médico a partir de PRIMER_LUNES."""
+    semana, resto = divmod(numero, HORARIOS_POR_SEMANA)
+    dia, franja = divmod(resto, 24)
+    return PRIMER_LUNES + timedelta(weeks=semana, days=dia, hours=8, minutes=30 * franja)
+
+
+def generar_pacientes(cantidad: int, desde: int = 0) -> list[Paciente]:
+    """Genera pacientes con DNI consecutivos."""
+    return [
+        Paciente.restaurar(f"Paciente {i}", f"{i:08d}", date(1950 + i % 60, 1 + i % 12, 1 + i % 28))
+        for i in range(desde, desde + cantidad)
+    ]
+
+
+def generar_clinica(turnos: int, medicos: int = 100, pacientes: int | None = None) -> Clinica:
+    """
+    Crea una clínica con 'turnos' turnos previos repartidos entre médicos y pacientes.
+
+    Cada médico atiende Clínica Médica de lunes a viernes; los turnos ocupan
+    sus primeros horarios consecutivos. Se cargan en lotes con
+    restaurar_turnos, sin las validaciones de agendar_turno.
+    """
+    clinica = Clinica()
+    lista_medicos = []
+    for i in range(medicos):
+        medico = Medico(f"Dr. {i}", f"MED{i:04d}")
+        medico.agregar_especialidad(Especialidad("Clínica Médica", DIAS))
+        clinica.agregar_medico(medico)
+        lista_medicos.append(medico)
+    lista_pacientes = generar_pacientes(pacientes if pacientes is not None else max(1, turnos // 10))
+    clinica.agregar_pacientes_lote(lista_pacientes)
+
+    lote = 100_000
+    for desde in range(0, turnos, lote):
+        clinica.restaurar_turnos([
+            Turno.restaurar(lista_pacientes[i % len(lista_pacientes)], lista_medicos[i % medicos],
+                            horario(i // medicos), "Clínica Médica", DURACION_POR_DEFECTO)
+            for i in range(desde, min(turnos, desde + lote))
+        ])
+    return clinica
+
+
+def medir(nombre: str, operacion, argumentos: list, **parametros) -> dict:
+    """
+    Ejecuta la operación una vez por argumento y resume throughput y latencias.
+
+    Returns:
+        dict: Nombre, parámetros, operaciones, segundos, ops/s y percentiles en microsegundos
+    """
+    latencias = []
+    reloj = time.perf_counter_ns
+    gc.collect()
+    inicio = reloj()
+    for argumento in argumentos:
+        t0 = reloj()
+        operacion(*argumento)
+        latencias.append(reloj() - t0)
+    total = (reloj() - inicio) / 1e9
+    latencias.sort()
+
+    def percentil(p: float) -> float:
+        return latencias[min(len(latencias) - 1, int(p * len(latencias)))] / 1e3
+
+    return {
+        "nombre": nombre,
+        "parametros": parametros,
+        "operaciones": len(latencias),
+        "segundos": round(total, 6),
+        "ops_por_segundo": round(len(latencias) / total, 1) if total else None,
+        "latencia_us": {
+            "p50": round(percentil(0.50), 2),
+            "p95": round(percentil(0.95), 2),
+            "p99": round(percentil(0.99), 2),
+            "max": round(latencias[-1] / 1e3, 2),
+        },
+    }
+
+
+def benchmark_registro_pacientes(operaciones: int) -> dict:
+    """Registro de pacientes nuevos uno por uno."""
+    clinica = Clinica()
+    pacientes = generar_pacientes(operaciones)
+    return medir("agregar_paciente", clinica.agregar_paciente, [(p,) for p in pacientes])
+
+
+def benchmark_agendar_turno(existentes: int, operaciones: int) -> dict:
+    """agendar_turno sobre una clínica que ya tiene 'existentes' turnos."""
+    medicos = 100
+    clinica = generar_clinica(existentes, medicos)
+    pacientes = len(clinica.vista_pacientes())
+    rng = random.Random(SEMILLA)
+    # Horarios libres: después de los ocupados, en orden aleatorio entre médicos
+    primero_libre = -(-existentes // medicos)
+    solicitudes = [
+        (f"{rng.randrange(pacientes):08d}", f"MED{i % medicos:04d}", "Clínica Médica",
+         horario(primero_libre + i // medicos))
+        for i in range(operaciones)
+    ]
+    rng.shuffle(solicitudes)
+    return medir("agendar_turno", clinica.agendar_turno, solicitudes, turnos_existentes=existentes)
+
+
+def benchmark_emitir_receta(operaciones: int) -> dict:
+    """emitir_receta con uno a tres medicamentos de un vocabulario chico."""
+    clinica = generar_clinica(0, medicos=10, pacientes=1_000)
+    rng = random.Random(SEMILLA)
+    solicitudes = [
+        (f"{rng.randrange(1_000):08d}", f"MED{rng.randrange(10):04d}", rng.sample(MEDICAMENTOS, rng.randint(1, 3)))
+        for _ in range(operaciones)
+    ]
+    return medir("emitir_receta", clinica.emitir_receta, solicitudes)
+
+
+def benchmark_historia_clinica(turnos_por_paciente: int, pacientes: int) -> list[dict]:
+    """Historia clínica de pacientes con muchos turnos: primera consulta y renderizados siguientes."""
+    clinica = generar_clinica(turnos_por_paciente * pacientes, medicos=10, pacientes=pacientes)
+    for i in range(pacientes):
+        clinica.emitir_receta(f"{i:08d}", "MED0000", MEDICAMENTOS[:2])
+    dnis = [(f"{i:08d}",) for i in range(pacientes)]
+
+    def renderizar(dni):
+        return str(clinica.obtener_historia_clinica(dni))
+
+    parametros = {"turnos_por_paciente": turnos_por_paciente}
+    return [
+        medir("historia_clinica_primera", renderizar, dnis, **parametros),
+        medir("historia_clinica", renderizar, dnis, **parametros),
+    ]
+
+
+def benchmark_listado_cli(existentes: int, repeticiones: int) -> list[dict]:
+    """Listado de turnos de la CLI (primera página, sin interacción) y una página al final."""
+    clinica = generar_clinica(existentes)
+    cli = CLI(clinica)
+
+    def listar():
+        # Se responde 'q' a la pregunta de la primera página y se descarta la salida
+        with mock.patch("builtins.input", return_value="q"), redirect_stdout(io.StringIO()):
+            cli.ver_todos_turnos()
+
+    def pagina_profunda():
+        return [str(turno) for turno in clinica.iter_turnos(offset=existentes - 20, limite=20)]
+
+    return [
+        medir("listado_cli_turnos", listar, [()] * repeticiones, turnos_existentes=existentes),
+        medir("iter_turnos_pagina_final", pagina_profunda, [()] * repeticiones, turnos_existentes=existentes),
+    ]
+
+
+def commit_actual() -> str | None:
+    """Devuelve el hash del commit actual, si el directorio es un repositorio git."""
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return salida.stdout.strip()
+
+
+def ejecutar(tamanos: list[int], operaciones: int) -> dict:
+    """Ejecuta todos los benchmarks y devuelve el documento de resultados."""
+    resultados = [benchmark_registro_pacientes(operaciones)]
+    for existentes in tamanos:
+        resultados.append(benchmark_agendar_turno(existentes, operaciones))
+    resultados.append(benchmark_emitir_receta(operaciones))
+    resultados.extend(benchmark_historia_clinica(200, max(1, operaciones // 100)))
+    resultados.extend(benchmark_listado_cli(max(tamanos), max(1, operaciones // 100)))
+    return {
+        "version": VERSION_RESULTADOS,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit_actual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def clave(resultado: dict) -> tuple:
+    """Identifica un resultado por nombre y parámetros, para comparar entre ejecuciones."""
+    return resultado["nombre"], tuple(sorted(resultado["parametros"].items()))
+
+
+def comparar(base: dict, actual: dict, tolerancia: float) -> list[str]:
+    """
+    Compara los ops/s de dos ejecuciones.
+
+    Returns:
+        list[str]: Líneas de informe; las regresiones mayores a la tolerancia llevan "REGRESIÓN"
+    """
+    anteriores = {clave(r): r for r in base["resultados"]}
+    lineas = []
+    for resultado in actual["resultados"]:
+        anterior = anteriores.get(clave(resultado))
+        if anterior is None or not anterior["ops_por_segundo"] or not resultado["ops_por_segundo"]:
+            continue
+        cambio = resultado["ops_por_segundo"] / anterior["ops_por_segundo"] - 1
+        marca = "  REGRESIÓN" if cambio < -tolerancia else ""
+        parametros = ", ".join(f"{k}={v}" for k, v in resultado["parametros"].items())
+        lineas.append(f"{resultado['nombre']:<28} {parametros:<26} {cambio:>+8.1%}{marca}")
+    return lineas
+
+
+def main(argv=None):
+    """Ejecuta la suite, guarda o imprime el JSON y, opcionalmente, compara con una ejecución anterior."""
+    parser = argparse.ArgumentParser(description="Benchmarks de throughput y latencia de la clínica")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="turnos previos para agendar_turno")
+    parser.add_argument("--operaciones", type=int, default=10_000, help="operaciones medidas por benchmark")
+    parser.add_argument("--salida", help="archivo donde guardar el JSON (por defecto, salida estándar)")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior contra la cual comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.15,
+                        help="caída de ops/s a partir de la cual se informa una regresión")
+    argumentos = parser.parse_args(argv)
+
+    actual = ejecutar(argumentos.tamanos, argumentos.operaciones)
+    texto = json.dumps(actual, ensure_ascii=False, indent=2)
+    if argumentos.salida:
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as archivo:
+            lineas = comparar(json.load(archivo), actual, argumentos.tolerancia)
+        print("\n".join(lineas), file=sys.stderr)
+        if any(linea.endswith("REGRESIÓN") for linea in lineas):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark de agendamiento: turno por turno contra agendar_turnos_lote.
+
+Agenda la misma cantidad de turnos en dos clínicas nuevas, como series de
+sesiones semanales de un paciente con un médico: una llamando a
+agendar_turno por cada sesión y otra con un agendar_turnos_lote por serie.
+Informa los turnos por segundo de cada camino, en memoria y con
+AlmacenSQLite (donde cada llamada individual es una transacción).
+
+Uso:
+    python -m benchmarks.turnos_lote [--series N] [--sesiones N] [--medicos N]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.almacen import AlmacenMemoria
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.persistencia.almacen_sqlite import AlmacenSQLite
+
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes"]
+
+
+def clinica_con_datos(almacen, medicos: int, pacientes: int) -> Clinica:
+    """Crea una clínica con médicos de Kinesiología que atienden de lunes a viernes."""
+    clinica = Clinica(almacen)
+    for i in range(medicos):
+        medico = Medico(f"Dr. {i}", f"MED{i:04d}")
+        medico.agregar_especialidad(Especialidad("Kinesiología", DIAS))
+        clinica.agregar_medico(medico)
+    clinica.agregar_pacientes_lote([
+        Paciente.restaurar(f"Paciente {i}", f"{i:08d}", date(1985, 3, 15)) for i in range(pacientes)
+    ])
+    return clinica
+
+
+def generar_series(series: int, sesiones: int, medicos: int) -> list[list[tuple]]:
+    """Arma series semanales sin superposiciones: cada serie ocupa un horario propio del médico."""
+    lunes = datetime(2030, 6, 3, 8, 0)
+    resultado = []
+    for s in range(series):
+        # 24 horarios de 30 minutos por día, 5 días por semana, rotando médicos
+        medico, horario = s % medicos, s // medicos
+        inicio = lunes + timedelta(days=(horario // 24) % 5, minutes=30 * (horario % 24),
+                                   weeks=sesiones * (horario // 120))
+        resultado.append([
+            (f"{s:08d}", f"MED{medico:04d}", "Kinesiología", inicio + timedelta(weeks=semana))
+            for semana in range(sesiones)
+        ])
+    return resultado
+
+
+def medir(agendar, series: list[list[tuple]]) -> float:
+    """Devuelve los turnos por segundo al agendar todas las series con la función indicada."""
+    inicio = time.perf_counter()
+    for serie in series:
+        agendar(serie)
+    segundos = time.perf_counter() - inicio
+    return sum(map(len, series)) / segundos
+
+
+def comparar(crear_almacen, argumentos, series: list[list[tuple]]) -> tuple:
+    """Devuelve los turnos por segundo (individual, lote) sobre almacenes nuevos."""
+    resultados = []
+    for lote in (False, True):
+        almacen = crear_almacen()
+        clinica = clinica_con_datos(almacen, argumentos.medicos, argumentos.series)
+        if lote:
+            resultados.append(medir(clinica.agendar_turnos_lote, series))
+        else:
+            resultados.append(medir(lambda serie: [clinica.agendar_turno(*s) for s in serie], series))
+        if isinstance(almacen, AlmacenSQLite):
+            almacen.cerrar()
+    return tuple(resultados)
+
+
+def main(argv=None):
+    """Ejecuta el benchmark e imprime los turnos por segundo de cada camino."""
+    parser = argparse.ArgumentParser(description="Turnos por segundo: agendar_turno contra agendar_turnos_lote")
+    parser.add_argument("--series", type=int, default=2_000)
+    parser.add_argument("--sesiones", type=int, default=10, help="turnos por serie")
+    parser.add_argument("--medicos", type=int, default=50)
+    argumentos = parser.parse_args(argv)
+
+    series = generar_series(argumentos.series, argumentos.sesiones, argumentos.medicos)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = (os.path.join(directorio, f"clinica{i}.db") for i in range(2))
+        almacenes = {
+            "memoria": AlmacenMemoria,
+            "sqlite": lambda: AlmacenSQLite(next(rutas)),
+        }
+        print(f"{'Almacén':<10} {'agendar_turno':>16} {'agendar_turnos_lote':>22}")
+        for nombre, crear_almacen in almacenes.items():
+            individual, lote = comparar(crear_almacen, argumentos, series)
+            print(f"{nombre:<10} {individual:>10.0f} turnos/s {lote:>12.0f} turnos/s ({lote / individual:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,28 +2,259 @@
 """
 Punto de entrada principal del Sistema de Gestión de Clínica.
 Ejecuta la interfaz de línea de comandos (CLI).
+
+Para que el arranque sea rápido, cada modo importa solo lo que usa (el
+servidor no carga la CLI, el script no carga asyncio ni SQLite) y, en el
+menú, la clínica y su almacenamiento se abren recién en la primera opción
+que los necesita. `python -m benchmarks.arranque` mide el arranque en frío.
 """
 
+import argparse
 import sys
-import os
 
-# Agregar el directorio actual al path para las importaciones
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.interfaz.cli import CLI
+def parsear_argumentos(argv=None):
+    """
+    Interpreta los argumentos de la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Sistema de Gestión de Clínica")
+    almacenamiento = parser.add_mutually_exclusive_group()
+    almacenamiento.add_argument(
+        "--datos",
+        metavar="DIRECTORIO",
+        help="carpeta donde persistir la clínica (log de operaciones y snapshot)",
+    )
+    almacenamiento.add_argument(
+        "--sqlite",
+        metavar="ARCHIVO",
+        help="base SQLite donde guardar la clínica",
+    )
+    almacenamiento.add_argument(
+        "--binario",
+        metavar="ARCHIVO",
+        help="archivo binario compacto: se carga al abrir la clínica y se guarda al salir",
+    )
+    servicio = parser.add_mutually_exclusive_group()
+    servicio.add_argument(
+        "--servir",
+        metavar="[HOST:]PUERTO",
+        help="en lugar del menú, atender solicitudes JSON por TCP (ver src/interfaz/comandos.py)",
+    )
+    servicio.add_argument(
+        "--socket",
+        metavar="RUTA",
+        help="en lugar del menú, atender solicitudes JSON por un socket Unix",
+    )
+    servicio.add_argument(
+        "--script",
+        metavar="ARCHIVO",
+        help="en lugar del menú, ejecutar las solicitudes JSON (una por línea) de un archivo, o '-' para la entrada estándar",
+    )
+    servicio.add_argument(
+        "--exportar-historias",
+        metavar="RUTA",
+        help="en lugar del menú, exportar la historia clínica de todos los pacientes a un archivo "
+             "(o, con --por-paciente, a un archivo por paciente en la carpeta RUTA)",
+    )
+    parser.add_argument(
+        "--por-paciente",
+        action="store_true",
+        help="con --exportar-historias, escribir un archivo por paciente",
+    )
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        metavar="N",
+        help="con --exportar-historias, procesos que renderizan (por defecto, uno por núcleo)",
+    )
+    parser.add_argument(
+        "--respuestas",
+        metavar="ARCHIVO",
+        help="con --script, archivo donde escribir las respuestas (por defecto, la salida estándar)",
+    )
+    for tipo in ("medicos", "pacientes", "turnos"):
+        parser.add_argument(
+            f"--importar-{tipo}",
+            metavar="ARCHIVO",
+            help=f"importar {tipo} desde un archivo CSV o JSONL antes de abrir el menú",
+        )
+    return parser.parse_args(argv)
+
+
+class AperturaClinica:
+    """
+    Abre la clínica indicada en la línea de comandos la primera vez que se pide.
+
+    Atributos privados:
+        __argumentos (argparse.Namespace): Argumentos con --datos, --sqlite o --binario
+        __clinica (Clinica | None): Clínica abierta, o None si todavía no se usó
+        __cerrar (callable | None): Cierra el almacenamiento abierto
+    """
+
+    def __init__(self, argumentos):
+        """
+        Inicializa la apertura sin cargar nada.
+
+        Args:
+            argumentos (argparse.Namespace): Argumentos de la línea de comandos
+        """
+        self.__argumentos = argumentos
+        self.__clinica = None
+        self.__cerrar = None
+
+    def __call__(self):
+        """
+        Devuelve la clínica, recuperándola del almacenamiento en el primer llamado.
+
+        Returns:
+            Clinica: Clínica persistida, o una vacía en memoria
+        """
+        if self.__clinica is None:
+            if self.__argumentos.datos:
+                from src.persistencia.diario import DiarioClinica
+                diario = DiarioClinica(self.__argumentos.datos)
+                self.__clinica = diario.abrir()
+                self.__cerrar = diario.cerrar
+            elif self.__argumentos.sqlite:
+                from src.modelo.clinica import Clinica
+                from src.persistencia.almacen_sqlite import AlmacenSQLite
+                almacen = AlmacenSQLite(self.__argumentos.sqlite)
+                self.__cerrar = almacen.cerrar
+                self.__clinica = Clinica(almacen)
+            elif self.__argumentos.binario:
+                import os
+                from src.modelo.clinica import Clinica
+                from src.persistencia.binario import cargar_binario, guardar_binario
+                ruta = self.__argumentos.binario
+                self.__clinica = cargar_binario(ruta) if os.path.exists(ruta) else Clinica()
+                clinica = self.__clinica
+                self.__cerrar = lambda: guardar_binario(clinica, ruta)
+            else:
+                from src.modelo.clinica import Clinica
+                self.__clinica = Clinica()
+        return self.__clinica
+
+    def cerrar(self):
+        """Cierra el almacenamiento, si llegó a abrirse."""
+        if self.__cerrar is not None:
+            self.__cerrar()
+            self.__cerrar = None
+
+
+def hay_importaciones(argumentos) -> bool:
+    """Indica si se pidió importar algún archivo."""
+    return bool(argumentos.importar_medicos or argumentos.importar_pacientes or argumentos.importar_turnos)
+
+
+def importar_archivos(clinica, argumentos, salida=None):
+    """
+    Importa los archivos indicados en la línea de comandos e informa el resultado.
+    """
+    from src.persistencia.importacion import ImportadorClinica
+
+    salida = salida or sys.stdout
+    importador = ImportadorClinica(clinica)
+    importaciones = [
+        ("médicos", argumentos.importar_medicos, importador.importar_medicos),
+        ("pacientes", argumentos.importar_pacientes, importador.importar_pacientes),
+        ("turnos", argumentos.importar_turnos, importador.importar_turnos),
+    ]
+    for nombre, ruta, importar in importaciones:
+        if not ruta:
+            continue
+        resultado = importar(ruta)
+        print(f"Importación de {nombre}: {resultado}", file=salida)
+        for error in resultado.errores[:20]:
+            print(f"  fila {error.fila}: {error.mensaje}", file=salida)
+        if len(resultado.errores) > 20:
+            print(f"  ... y {len(resultado.errores) - 20} errores más", file=salida)
+
+
+async def servir(clinica, argumentos):
+    """
+    Atiende solicitudes por TCP o socket Unix hasta que se interrumpa el proceso.
+    """
+    from src.interfaz.servidor import ServidorClinica
+
+    servidor = ServidorClinica(clinica)
+    if argumentos.socket:
+        print(f"Escuchando en el socket {await servidor.iniciar_unix(argumentos.socket)}")
+    else:
+        host, _, puerto = argumentos.servir.rpartition(":")
+        host, puerto = await servidor.iniciar_tcp(host or "127.0.0.1", int(puerto))
+        print(f"Escuchando en {host}:{puerto}")
+    await servidor.servir()
+
+
+def ejecutar_script(clinica, argumentos) -> bool:
+    """
+    Ejecuta un script de solicitudes JSON sin interacción e informa el resumen por stderr.
+
+    Las respuestas van a la salida estándar (o al archivo de --respuestas), así
+    que pueden encadenarse con otros programas.
+
+    Returns:
+        bool: True si todos los comandos se ejecutaron sin error
+    """
+    from src.interfaz.lote import EjecutorLote
+
+    entrada = sys.stdin if argumentos.script == "-" else open(argumentos.script, encoding="utf-8")
+    salida = open(argumentos.respuestas, "w", encoding="utf-8") if argumentos.respuestas else sys.stdout
+    try:
+        resultado = EjecutorLote(clinica, salida).ejecutar(entrada)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    print(f"Script: {resultado.informe()}", file=sys.stderr)
+    return not resultado.errores
+
+
+def exportar_historias(clinica, argumentos):
+    """
+    Exporta en paralelo las historias clínicas de todos los pacientes e informa el resultado.
+    """
+    from src.persistencia.exportacion import ExportadorHistorias
+
+    exportador = ExportadorHistorias(clinica, argumentos.procesos)
+    if argumentos.por_paciente:
+        resultado = exportador.exportar_directorio(argumentos.exportar_historias)
+    else:
+        with open(argumentos.exportar_historias, "w", encoding="utf-8") as salida:
+            resultado = exportador.exportar_archivo(salida)
+    print(f"Exportación: {resultado}")
 
 
 def main():
     """
     Función principal que inicia el sistema de gestión de clínica.
     """
-    print("Iniciando Sistema de Gestión de Clínica...")
-    print("=" * 50)
+    argumentos = parsear_argumentos()
+    
+    # En modo script la salida estándar queda reservada para las respuestas
+    if not argumentos.script:
+        print("Iniciando Sistema de Gestión de Clínica...")
+        print("=" * 50)
     
+    exito = True
+    apertura = AperturaClinica(argumentos)
     try:
-        # Crear e iniciar la interfaz CLI
-        cli = CLI()
-        cli.ejecutar()
+        if hay_importaciones(argumentos):
+            importar_archivos(apertura(), argumentos, sys.stderr if argumentos.script else sys.stdout)
+        
+        if argumentos.script:
+            exito = ejecutar_script(apertura(), argumentos)
+        elif argumentos.exportar_historias:
+            exportar_historias(apertura(), argumentos)
+        elif argumentos.servir or argumentos.socket:
+            import asyncio
+            asyncio.run(servir(apertura(), argumentos))
+        else:
+            # Crear e iniciar la interfaz CLI; la clínica se abre en la primera opción que la usa
+            from src.interfaz.cli import CLI
+            cli = CLI(abrir=apertura)
+            cli.ejecutar()
         
     except KeyboardInterrupt:
         print("\n\n¡Sistema cerrado por el usuario!")
@@ -31,6 +262,10 @@ def main():
         print(f"\n❌ Error crítico al iniciar el sistema: {e}")
         print("Por favor, verifique que todos los archivos del modelo estén presentes.")
         sys.exit(1)
+    finally:
+        apertura.cerrar()
+    if not exito:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,24 +3,34 @@ Interfaz de línea de comandos (CLI) para el sistema de gestión de clínica.
 Proporciona un menú interactivo para todas las operaciones del sistema.
 """
 
-from datetime import datetime
-import sys
-import os
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable
 
-# Agregar el directorio padre al path para importar el modelo
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.modelo.clinica import Clinica
-from src.modelo.paciente import Paciente
+from src.modelo.paciente import Paciente, parsear_fecha_nacimiento
 from src.modelo.medico import Medico
 from src.modelo.especialidad import Especialidad
 from src.modelo.excepciones import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException, 
     TurnoOcupadoException,
-    RecetaInvalidaException
+    RecetaInvalidaException,
+    DatosInvalidosException
 )
 
+if TYPE_CHECKING:
+    # Clinica (con el almacén y la tabla de turnos) se importa recién al usarla
+    from src.modelo.clinica import Clinica
+
+
+def _clinica_vacia() -> "Clinica":
+    """Crea una clínica en memoria, sin datos."""
+    from src.modelo.clinica import Clinica
+    return Clinica()
+
+
+# Elementos mostrados por página en los listados
+TAMANO_PAGINA = 20
+
 
 class CLI:
     """
@@ -28,9 +38,25 @@ class CLI:
     Maneja la interacción con el usuario y delega la lógica de negocio a la clase Clinica.
     """
     
-    def __init__(self):
-        """Inicializa la CLI con una nueva instancia de Clinica."""
-        self.clinica = Clinica()
+    def __init__(self, clinica: "Clinica | None" = None, abrir: "Callable[[], Clinica] | None" = None):
+        """
+        Inicializa la CLI.
+        
+        Args:
+            clinica (Clinica | None): Clínica a operar
+            abrir (Callable[[], Clinica] | None): Si no se indica la clínica, función
+                que la crea (o la carga del almacenamiento) la primera vez que se usa;
+                por defecto, una clínica vacía. Así el menú aparece sin esperar la carga.
+        """
+        self.__clinica = clinica
+        self.__abrir = abrir or _clinica_vacia
+
+    @property
+    def clinica(self) -> "Clinica":
+        """Clínica que opera la CLI; se abre en el primer acceso."""
+        if self.__clinica is None:
+            self.__clinica = self.__abrir()
+        return self.__clinica
     
     def mostrar_menu(self):
         """Muestra el menú principal de opciones."""
@@ -113,8 +139,8 @@ class CLI:
             
             # Validar formato de fecha
             try:
-                datetime.strptime(fecha_nacimiento, "%d/%m/%Y")
-            except ValueError:
+                parsear_fecha_nacimiento(fecha_nacimiento)
+            except DatosInvalidosException:
                 print("❌ Formato de fecha inválido. Use dd/mm/aaaa")
                 return
             
@@ -322,29 +348,66 @@ class CLI:
                 return
             
             historia = self.clinica.obtener_historia_clinica(dni)
+            filtro = input("Mostrar (Enter: todo, N: últimos N registros, "
+                           "dd/mm/aaaa-dd/mm/aaaa: rango de fechas): ").strip()
+            try:
+                opciones = self.interpretar_filtro_historia(filtro)
+            except ValueError:
+                print("❌ Filtro inválido. Use un número o un rango dd/mm/aaaa-dd/mm/aaaa")
+                return
+            
             print(f"\n📋 HISTORIA CLÍNICA")
             print("-" * 50)
-            print(historia)
+            print(historia.renderizar(**opciones))
             
         except PacienteNoEncontradoException as e:
             print(f"❌ {e}")
         except Exception as e:
             print(f"❌ Error al obtener historia clínica: {e}")
     
+    def interpretar_filtro_historia(self, filtro: str) -> dict:
+        """
+        Convierte el filtro ingresado en argumentos para HistoriaClinica.renderizar.
+        
+        Args:
+            filtro (str): Vacío, un número N o un rango dd/mm/aaaa-dd/mm/aaaa (ambos días incluidos)
+            
+        Returns:
+            dict: Argumentos ultimos o desde/hasta
+            
+        Raises:
+            ValueError: Si el filtro no tiene un formato válido
+        """
+        if not filtro:
+            return {}
+        if filtro.isdigit():
+            return {"ultimos": int(filtro)}
+        desde, separador, hasta = filtro.partition("-")
+        if not separador:
+            raise ValueError(filtro)
+        return {
+            "desde": datetime.strptime(desde.strip(), "%d/%m/%Y"),
+            "hasta": datetime.strptime(hasta.strip(), "%d/%m/%Y") + timedelta(days=1),
+        }
+    
     def ver_todos_turnos(self):
         """Muestra todos los turnos agendados en el sistema."""
         print("\n--- TODOS LOS TURNOS ---")
         try:
-            turnos = self.clinica.obtener_turnos()
-            if not turnos:
+            total = self.clinica.contar_turnos()
+            if not total:
                 print("📅 No hay turnos agendados.")
                 return
             
-            print(f"\n📅 TURNOS AGENDADOS ({len(turnos)} total)")
+            print(f"\n📅 TURNOS AGENDADOS ({total} total)")
             print("-" * 80)
-            for i, turno in enumerate(turnos, 1):
+            
+            def mostrar(i, turno):
                 print(f"{i}. {turno}")
                 print("-" * 40)
+            
+            self.mostrar_paginado(total, lambda offset: self.clinica.iter_turnos(
+                offset=offset, limite=TAMANO_PAGINA), mostrar)
                 
         except Exception as e:
             print(f"❌ Error al obtener turnos: {e}")
@@ -353,15 +416,15 @@ class CLI:
         """Muestra todos los pacientes registrados."""
         print("\n--- TODOS LOS PACIENTES ---")
         try:
-            pacientes = self.clinica.obtener_pacientes()
-            if not pacientes:
+            total = len(self.clinica.vista_pacientes())
+            if not total:
                 print("👥 No hay pacientes registrados.")
                 return
             
-            print(f"\n👥 PACIENTES REGISTRADOS ({len(pacientes)} total)")
+            print(f"\n👥 PACIENTES REGISTRADOS ({total} total)")
             print("-" * 60)
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}. {paciente}")
+            self.mostrar_paginado(total, lambda offset: self.clinica.iter_pacientes(offset, TAMANO_PAGINA),
+                                  lambda i, paciente: print(f"{i}. {paciente}"))
                 
         except Exception as e:
             print(f"❌ Error al obtener pacientes: {e}")
@@ -370,20 +433,42 @@ class CLI:
         """Muestra todos los médicos registrados."""
         print("\n--- TODOS LOS MÉDICOS ---")
         try:
-            medicos = self.clinica.obtener_medicos()
-            if not medicos:
+            total = len(self.clinica.vista_medicos())
+            if not total:
                 print("👨‍⚕️ No hay médicos registrados.")
                 return
             
-            print(f"\n👨‍⚕️ MÉDICOS REGISTRADOS ({len(medicos)} total)")
+            print(f"\n👨‍⚕️ MÉDICOS REGISTRADOS ({total} total)")
             print("-" * 70)
-            for i, medico in enumerate(medicos, 1):
+            
+            def mostrar(i, medico):
                 print(f"{i}. {medico}")
                 print()
+            
+            self.mostrar_paginado(total, lambda offset: self.clinica.iter_medicos(offset, TAMANO_PAGINA), mostrar)
                 
         except Exception as e:
             print(f"❌ Error al obtener médicos: {e}")
     
+    def mostrar_paginado(self, total: int, obtener_pagina, mostrar):
+        """
+        Muestra un listado de a TAMANO_PAGINA elementos, preguntando antes de cada página.
+        
+        Args:
+            total (int): Cantidad total de elementos
+            obtener_pagina (callable): Recibe el offset y devuelve los elementos de esa página
+            mostrar (callable): Recibe el número (desde 1) y el elemento, y lo imprime
+        """
+        offset = 0
+        while offset < total:
+            for i, elemento in enumerate(obtener_pagina(offset), offset + 1):
+                mostrar(i, elemento)
+            offset += TAMANO_PAGINA
+            if offset < total:
+                respuesta = input(f"Mostrando {offset} de {total}. Enter para ver más, 'q' para volver: ")
+                if respuesta.strip().lower() == "q":
+                    break
+    
     def pausar(self):
         """Pausa la ejecución esperando que el usuario presione Enter."""
         input("\nPresione Enter para continuar...")
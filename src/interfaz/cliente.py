@@ -0,0 +1,179 @@
+"""
+Cliente asyncio para el servidor de la clínica, con una prueba de carga.
+
+Las solicitudes se envían sin esperar las respuestas anteriores
+(pipelining) hasta un máximo de solicitudes en vuelo; el servidor responde
+en orden, así que cada respuesta corresponde a la solicitud pendiente más
+antigua.
+
+Uso como prueba de carga sobre un servidor local:
+    python -m src.interfaz.cliente --puerto 8765 --clientes 20 --solicitudes 5000
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+from src.interfaz.servidor import LIMITE_LINEA
+
+
+# Solicitudes enviadas y todavía sin respuesta, por conexión
+MAX_EN_VUELO = 256
+
+
+class ClienteClinica:
+    """
+    Conexión a un ServidorClinica.
+
+    Atributos privados:
+        __lector (asyncio.StreamReader): Lado de lectura de la conexión
+        __escritor (asyncio.StreamWriter): Lado de escritura de la conexión
+        __pendientes (deque[asyncio.Future]): Respuestas esperadas, en orden de envío
+        __en_vuelo (asyncio.Semaphore): Limita las solicitudes sin respuesta
+        __siguiente_id (int): Id de la próxima solicitud
+        __receptor (asyncio.Task): Tarea que lee las respuestas
+    """
+
+    def __init__(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter,
+                 max_en_vuelo: int = MAX_EN_VUELO):
+        """
+        Inicializa el cliente sobre una conexión abierta (ver conectar_tcp y conectar_unix).
+
+        Args:
+            lector (asyncio.StreamReader): Lado de lectura
+            escritor (asyncio.StreamWriter): Lado de escritura
+            max_en_vuelo (int): Máximo de solicitudes sin respuesta
+        """
+        self.__lector = lector
+        self.__escritor = escritor
+        self.__pendientes = deque()
+        self.__en_vuelo = asyncio.Semaphore(max_en_vuelo)
+        self.__siguiente_id = 1
+        self.__receptor = asyncio.create_task(self.__recibir())
+
+    @classmethod
+    async def conectar_tcp(cls, host: str, puerto: int, max_en_vuelo: int = MAX_EN_VUELO) -> "ClienteClinica":
+        """Abre una conexión TCP con el servidor."""
+        lector, escritor = await asyncio.open_connection(host, puerto, limit=LIMITE_LINEA)
+        return cls(lector, escritor, max_en_vuelo)
+
+    @classmethod
+    async def conectar_unix(cls, ruta: str, max_en_vuelo: int = MAX_EN_VUELO) -> "ClienteClinica":
+        """Abre una conexión con el servidor por un socket Unix."""
+        lector, escritor = await asyncio.open_unix_connection(ruta, limit=LIMITE_LINEA)
+        return cls(lector, escritor, max_en_vuelo)
+
+    async def enviar(self, comando: str, **datos) -> dict:
+        """
+        Envía una solicitud y espera su respuesta.
+
+        Varias llamadas concurrentes (por ejemplo, con asyncio.gather) comparten
+        la conexión sin esperarse entre sí.
+
+        Args:
+            comando (str): Nombre del comando (ver DespachadorComandos)
+            **datos: Datos del comando
+
+        Returns:
+            dict: Respuesta del servidor
+
+        Raises:
+            ConnectionError: Si la conexión se cerró antes de la respuesta
+        """
+        await self.__en_vuelo.acquire()
+        try:
+            if self.__receptor.done():
+                raise ConnectionError("La conexión con el servidor está cerrada")
+            respuesta = asyncio.get_running_loop().create_future()
+            solicitud = {"id": self.__siguiente_id, "comando": comando, "datos": datos}
+            self.__siguiente_id += 1
+            self.__pendientes.append(respuesta)
+            self.__escritor.write(json.dumps(solicitud, ensure_ascii=False).encode("utf-8") + b"\n")
+            await self.__escritor.drain()
+            return await respuesta
+        finally:
+            self.__en_vuelo.release()
+
+    async def __recibir(self) -> None:
+        """Asocia cada línea recibida con la solicitud pendiente más antigua."""
+        try:
+            while linea := await self.__lector.readline():
+                respuesta = self.__pendientes.popleft()
+                if not respuesta.done():   # Puede haberse cancelado la espera
+                    respuesta.set_result(json.loads(linea))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            while self.__pendientes:
+                respuesta = self.__pendientes.popleft()
+                if not respuesta.done():
+                    respuesta.set_exception(ConnectionError("La conexión con el servidor se cerró"))
+
+    async def cerrar(self) -> None:
+        """Cierra la conexión."""
+        self.__escritor.close()
+        try:
+            await self.__escritor.wait_closed()
+        except ConnectionError:
+            pass
+        await self.__receptor
+
+
+async def prueba_de_carga(host: str, puerto: int, clientes: int = 10, solicitudes: int = 1000) -> dict:
+    """
+    Registra pacientes desde varias conexiones simultáneas y mide el ritmo.
+
+    Cada cliente usa DNIs propios, por lo que todas las solicitudes deberían
+    resultar exitosas sobre una clínica sin esos pacientes.
+
+    Args:
+        host (str): Dirección del servidor
+        puerto (int): Puerto del servidor
+        clientes (int): Conexiones simultáneas
+        solicitudes (int): Solicitudes por conexión
+
+    Returns:
+        dict: solicitudes, errores, segundos y solicitudes_por_segundo
+    """
+    conexiones = [await ClienteClinica.conectar_tcp(host, puerto) for _ in range(clientes)]
+
+    async def registrar(numero: int, cliente: ClienteClinica):
+        return await asyncio.gather(*(
+            cliente.enviar("agregar_paciente", nombre=f"Paciente {numero}-{i}",
+                           dni=f"9{numero:03d}{i:07d}", fecha_nacimiento="15/03/1985")
+            for i in range(solicitudes)
+        ))
+
+    inicio = time.perf_counter()
+    respuestas = await asyncio.gather(*(registrar(n, c) for n, c in enumerate(conexiones)))
+    segundos = time.perf_counter() - inicio
+    for cliente in conexiones:
+        await cliente.cerrar()
+
+    total = clientes * solicitudes
+    return {
+        "solicitudes": total,
+        "errores": sum(not r["ok"] for lote in respuestas for r in lote),
+        "segundos": segundos,
+        "solicitudes_por_segundo": total / segundos if segundos else 0.0,
+    }
+
+
+def main(argv=None):
+    """Ejecuta la prueba de carga contra un servidor en ejecución."""
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor de la clínica")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, required=True)
+    parser.add_argument("--clientes", type=int, default=10)
+    parser.add_argument("--solicitudes", type=int, default=1000, help="solicitudes por cliente")
+    argumentos = parser.parse_args(argv)
+    resultado = asyncio.run(prueba_de_carga(
+        argumentos.host, argumentos.puerto, argumentos.clientes, argumentos.solicitudes
+    ))
+    print(f"{resultado['solicitudes']} solicitudes, {resultado['errores']} con error, "
+          f"{resultado['solicitudes_por_segundo']:.0f} solicitudes/s")
+
+
+if __name__ == "__main__":
+    main()
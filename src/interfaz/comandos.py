@@ -0,0 +1,242 @@
+"""
+Ejecución de operaciones de la clínica descriptas como registros planos (dict).
+
+Es la capa común de las interfaces no interactivas (por ejemplo, el
+servidor): cada solicitud indica un comando y sus datos, y la respuesta es
+otro registro apto para JSON.
+
+Solicitud:  {"id": 1, "comando": "agendar_turno", "datos": {...}}
+Respuesta:  {"id": 1, "ok": true, "resultado": ...}
+            {"id": 1, "ok": false, "error": "TurnoOcupadoException", "mensaje": "..."}
+
+El campo "id" es opcional y se devuelve tal cual, para asociar respuestas y
+solicitudes cuando se envían varias sin esperar.
+
+La duración de los turnos ("duracion") va en minutos tanto en las
+solicitudes como en las respuestas, así un turno listado puede reenviarse
+sin cambios; si no es un número entero de minutos se responde con decimales.
+"""
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import DURACION_POR_DEFECTO
+from src.modelo.excepciones import (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    DatosInvalidosException,
+    EspecialidadDuplicadaException
+)
+from src.persistencia.serializacion import (
+    serializar_paciente,
+    serializar_medico,
+    serializar_turno,
+    serializar_receta
+)
+
+
+# Errores que se informan al cliente en lugar de propagarse
+ERRORES_INFORMADOS = (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    DatosInvalidosException,
+    EspecialidadDuplicadaException,
+    ValueError,
+)
+
+
+def _campo(datos: dict, nombre: str, tipo: type = str):
+    """Devuelve un campo obligatorio de los datos de una solicitud, verificando su tipo."""
+    if not isinstance(datos, dict) or nombre not in datos:
+        raise DatosInvalidosException(f"Falta el campo '{nombre}'")
+    valor = datos[nombre]
+    if not isinstance(valor, tipo):
+        raise DatosInvalidosException(f"El campo '{nombre}' no tiene el tipo esperado")
+    return valor
+
+
+_MINUTO = timedelta(minutes=1)
+
+
+def _duracion(datos: dict) -> timedelta:
+    """Lee el campo "duracion" de una solicitud, en minutos."""
+    try:
+        return timedelta(minutes=_campo(datos, "duracion", (int, float)))
+    except (ValueError, OverflowError):
+        raise DatosInvalidosException("La duración no es un número de minutos válido")
+
+
+def _serializar_turno(turno) -> dict:
+    """Como serializar_turno, con la duración en minutos, igual que en las solicitudes."""
+    datos = serializar_turno(turno)
+    minutos = turno.obtener_duracion() / _MINUTO
+    datos["duracion"] = int(minutos) if minutos.is_integer() else minutos
+    return datos
+
+
+def _lista_de_textos(datos: dict, nombre: str) -> list[str]:
+    """Devuelve un campo obligatorio que debe ser una lista de cadenas."""
+    valor = _campo(datos, nombre, list)
+    if not all(isinstance(elemento, str) for elemento in valor):
+        raise DatosInvalidosException(f"El campo '{nombre}' debe ser una lista de textos")
+    return valor
+
+
+class DespachadorComandos:
+    """
+    Traduce solicitudes en llamadas a Clinica y resultados en respuestas.
+
+    Atributos privados:
+        __clinica (Clinica): Clínica sobre la que se opera
+        __comandos (dict): Nombre del comando -> método que lo ejecuta
+    """
+
+    def __init__(self, clinica: Clinica):
+        """
+        Inicializa el despachador.
+
+        Args:
+            clinica (Clinica): Clínica sobre la que se ejecutan los comandos
+        """
+        self.__clinica = clinica
+        self.__comandos = {
+            "agregar_paciente": self.__agregar_paciente,
+            "agregar_medico": self.__agregar_medico,
+            "agregar_especialidad": self.__agregar_especialidad,
+            "agendar_turno": self.__agendar_turno,
+            "cancelar_turno": self.__cancelar_turno,
+            "reprogramar_turno": self.__reprogramar_turno,
+            "emitir_receta": self.__emitir_receta,
+            "obtener_historia_clinica": self.__obtener_historia_clinica,
+            "listar_pacientes": self.__listar_pacientes,
+            "listar_medicos": self.__listar_medicos,
+            "listar_turnos": self.__listar_turnos,
+        }
+
+    def obtener_comandos(self) -> list[str]:
+        """
+        Devuelve los nombres de los comandos disponibles.
+
+        Returns:
+            list[str]: Nombres de comandos
+        """
+        return list(self.__comandos)
+
+    def ejecutar(self, solicitud) -> dict:
+        """
+        Ejecuta una solicitud y arma su respuesta.
+
+        Los errores de validación y de negocio no se propagan: se devuelven
+        como respuesta con "ok" en False.
+
+        Args:
+            solicitud (dict): Registro con "comando", "datos" e "id" opcionales
+
+        Returns:
+            dict: Respuesta a la solicitud
+        """
+        respuesta = {}
+        if isinstance(solicitud, dict) and "id" in solicitud:
+            respuesta["id"] = solicitud["id"]
+        try:
+            if not isinstance(solicitud, dict):
+                raise DatosInvalidosException("La solicitud debe ser un objeto JSON")
+            comando = self.__comandos.get(solicitud.get("comando"))
+            if comando is None:
+                raise DatosInvalidosException(f"Comando desconocido: {solicitud.get('comando')}")
+            datos = solicitud.get("datos", {})
+            if not isinstance(datos, dict):
+                raise DatosInvalidosException("Los datos de la solicitud deben ser un objeto JSON")
+            respuesta["resultado"] = comando(datos)
+            respuesta["ok"] = True
+        except ERRORES_INFORMADOS as e:
+            respuesta["ok"] = False
+            respuesta["error"] = type(e).__name__
+            respuesta["mensaje"] = str(e)
+        return respuesta
+
+    def __agregar_paciente(self, datos: dict):
+        paciente = Paciente(_campo(datos, "nombre"), _campo(datos, "dni"), _campo(datos, "fecha_nacimiento"))
+        self.__clinica.agregar_paciente(paciente)
+        return serializar_paciente(paciente)
+
+    def __agregar_medico(self, datos: dict):
+        medico = Medico(_campo(datos, "nombre"), _campo(datos, "matricula"))
+        for especialidad in datos.get("especialidades") or []:
+            medico.agregar_especialidad(
+                Especialidad(_campo(especialidad, "tipo"), _lista_de_textos(especialidad, "dias"))
+            )
+        self.__clinica.agregar_medico(medico)
+        return serializar_medico(medico)
+
+    def __agregar_especialidad(self, datos: dict):
+        medico = self.__clinica.obtener_medico_por_matricula(_campo(datos, "matricula"))
+        medico.agregar_especialidad(Especialidad(_campo(datos, "tipo"), _lista_de_textos(datos, "dias")))
+        return serializar_medico(medico)
+
+    @staticmethod
+    def __fecha_hora(datos: dict) -> datetime:
+        try:
+            return datetime.fromisoformat(_campo(datos, "fecha_hora"))
+        except ValueError:
+            raise DatosInvalidosException("La fecha y hora deben estar en formato ISO 8601")
+
+    def __agendar_turno(self, datos: dict):
+        fecha_hora = self.__fecha_hora(datos)
+        duracion = DURACION_POR_DEFECTO
+        if datos.get("duracion") is not None:
+            duracion = _duracion(datos)
+        dni, matricula = _campo(datos, "dni"), _campo(datos, "matricula")
+        id_turno = self.__clinica.agendar_turno(dni, matricula, _campo(datos, "especialidad"), fecha_hora, duracion)
+        return {"id": id_turno, "dni": dni, "matricula": matricula, "fecha_hora": fecha_hora.isoformat()}
+
+    def __cancelar_turno(self, datos: dict):
+        return _serializar_turno(self.__clinica.cancelar_turno(_campo(datos, "id", int)))
+
+    def __reprogramar_turno(self, datos: dict):
+        duracion = None
+        if datos.get("duracion") is not None:
+            duracion = _duracion(datos)
+        turno = self.__clinica.reprogramar_turno(_campo(datos, "id", int), self.__fecha_hora(datos), duracion)
+        return _serializar_turno(turno)
+
+    def __emitir_receta(self, datos: dict):
+        medicamentos = _lista_de_textos(datos, "medicamentos")
+        self.__clinica.emitir_receta(_campo(datos, "dni"), _campo(datos, "matricula"), medicamentos)
+        return None
+
+    def __obtener_historia_clinica(self, datos: dict):
+        dni = _campo(datos, "dni")
+        historia = self.__clinica.obtener_historia_clinica(dni)
+        return {
+            "paciente": serializar_paciente(self.__clinica.obtener_paciente_por_dni(dni)),
+            "turnos": [_serializar_turno(turno) for turno in historia.obtener_turnos()],
+            "recetas": [serializar_receta(receta) for receta in historia.obtener_recetas()],
+        }
+
+    @staticmethod
+    def __pagina(datos: dict) -> tuple:
+        """Lee los campos opcionales de paginación "offset" y "limite"."""
+        offset = _campo(datos, "offset", int) if "offset" in datos else 0
+        limite = _campo(datos, "limite", int) if datos.get("limite") is not None else None
+        return offset, limite
+
+    def __listar_pacientes(self, datos: dict):
+        pacientes = self.__clinica.iter_pacientes(*self.__pagina(datos))
+        return [serializar_paciente(paciente) for paciente in pacientes]
+
+    def __listar_medicos(self, datos: dict):
+        medicos = self.__clinica.iter_medicos(*self.__pagina(datos))
+        return [serializar_medico(medico) for medico in medicos]
+
+    def __listar_turnos(self, datos: dict):
+        turnos = self.__clinica.iter_turnos(None, None, *self.__pagina(datos))
+        return [_serializar_turno(turno) for turno in turnos]
@@ -0,0 +1,158 @@
+"""
+Ejecución no interactiva de un script de comandos sobre la clínica.
+
+El script es un archivo (o la entrada estándar) con una solicitud JSON por
+línea, en el mismo formato que el servidor (ver comandos.py). Cada solicitud
+se ejecuta directamente contra Clinica, sin menús, preguntas ni pausas. Las
+respuestas se escriben como líneas JSON en bloques, y al terminar se informa
+el ritmo de ejecución y los errores de cada comando con su número de línea.
+"""
+import json
+import time
+from typing import NamedTuple
+
+from src.modelo.clinica import Clinica
+from src.interfaz.comandos import DespachadorComandos
+
+
+# Respuestas acumuladas antes de cada escritura en la salida
+TAMANO_BUFFER = 1_000
+
+
+class ErrorComando(NamedTuple):
+    """Comando del script que terminó con error."""
+    linea: int
+    comando: str
+    error: str
+    mensaje: str
+
+
+class ResultadoLote:
+    """
+    Resumen de la ejecución de un script.
+
+    Atributos:
+        procesados (int): Comandos leídos del script
+        exitosos (int): Comandos ejecutados sin error
+        errores (list[ErrorComando]): Comandos con error y el motivo
+        por_comando (dict[str, list[int]]): Comando -> [exitosos, con error]
+        segundos (float): Duración de la ejecución
+    """
+
+    def __init__(self):
+        self.procesados = 0
+        self.exitosos = 0
+        self.errores = []
+        self.por_comando = {}
+        self.segundos = 0.0
+
+    def comandos_por_segundo(self) -> float:
+        """
+        Devuelve el ritmo de ejecución del script.
+
+        Returns:
+            float: Comandos procesados por segundo
+        """
+        return self.procesados / self.segundos if self.segundos else 0.0
+
+    def informe(self, maximo_errores: int = 20) -> str:
+        """
+        Arma el informe final: totales, conteo por comando y los primeros errores.
+
+        Args:
+            maximo_errores (int): Errores a detallar
+
+        Returns:
+            str: Informe de varias líneas
+        """
+        lineas = [str(self)]
+        for comando, (exitosos, fallidos) in sorted(self.por_comando.items()):
+            lineas.append(f"  {comando}: {exitosos} ok, {fallidos} con errores")
+        for error in self.errores[:maximo_errores]:
+            lineas.append(f"  línea {error.linea} ({error.comando}): {error.error}: {error.mensaje}")
+        if len(self.errores) > maximo_errores:
+            lineas.append(f"  ... y {len(self.errores) - maximo_errores} errores más")
+        return "\n".join(lineas)
+
+    def __str__(self) -> str:
+        return (f"{self.exitosos}/{self.procesados} comandos ejecutados, "
+                f"{len(self.errores)} con errores en {self.segundos:.2f} s "
+                f"({self.comandos_por_segundo():.0f} comandos/s)")
+
+
+class EjecutorLote:
+    """
+    Ejecuta scripts de comandos JSON sobre una clínica.
+
+    Atributos privados:
+        __despachador (DespachadorComandos): Ejecuta cada solicitud
+        __salida: Archivo de texto donde escribir las respuestas (None las descarta)
+    """
+
+    def __init__(self, clinica: Clinica, salida=None):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            clinica (Clinica): Clínica sobre la que se ejecutan los comandos
+            salida: Archivo de texto para las respuestas, o None para descartarlas
+        """
+        self.__despachador = DespachadorComandos(clinica)
+        self.__salida = salida
+
+    def ejecutar(self, lineas) -> ResultadoLote:
+        """
+        Ejecuta un script línea por línea; un comando con error no detiene a los siguientes.
+
+        Args:
+            lineas (Iterable[str]): Líneas del script (por ejemplo, un archivo abierto)
+
+        Returns:
+            ResultadoLote: Resumen de la ejecución
+        """
+        resultado = ResultadoLote()
+        buffer = []
+        inicio = time.perf_counter()
+        for numero, linea in enumerate(lineas, 1):
+            if not linea.strip():
+                continue
+            comando, respuesta = self.__procesar(linea)
+            resultado.procesados += 1
+            conteo = resultado.por_comando.setdefault(comando, [0, 0])
+            if respuesta["ok"]:
+                resultado.exitosos += 1
+                conteo[0] += 1
+            else:
+                conteo[1] += 1
+                resultado.errores.append(ErrorComando(numero, comando, respuesta["error"], respuesta["mensaje"]))
+
+            if self.__salida is not None:
+                buffer.append(json.dumps(respuesta, ensure_ascii=False))
+                if len(buffer) >= TAMANO_BUFFER:
+                    self.__escribir(buffer)
+        if buffer:
+            self.__escribir(buffer)
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    def __procesar(self, linea: str) -> tuple:
+        """Interpreta y ejecuta una línea; devuelve (nombre del comando, respuesta)."""
+        try:
+            solicitud = json.loads(linea)
+        except ValueError:
+            return "?", {"ok": False, "error": "DatosInvalidosException", "mensaje": "La línea no es JSON válido"}
+        comando = solicitud.get("comando") if isinstance(solicitud, dict) else None
+        comando = comando if isinstance(comando, str) else "?"
+        try:
+            return comando, self.__despachador.ejecutar(solicitud)
+        except Exception as e:
+            # Como en el servidor: un error inesperado no corta el script
+            respuesta = {"ok": False, "error": type(e).__name__, "mensaje": str(e)}
+            if isinstance(solicitud, dict) and "id" in solicitud:
+                respuesta["id"] = solicitud["id"]
+            return comando, respuesta
+
+    def __escribir(self, buffer: list) -> None:
+        """Escribe las respuestas acumuladas de una sola vez y vacía el buffer."""
+        self.__salida.write("\n".join(buffer) + "\n")
+        buffer.clear()
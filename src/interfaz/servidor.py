@@ -0,0 +1,139 @@
+"""
+Servidor asyncio que expone las operaciones de la clínica por un socket.
+
+Protocolo: líneas JSON (una solicitud por línea, una respuesta por línea,
+ver comandos.py). Un único proceso atiende muchas conexiones a la vez:
+
+- Pipelining: el cliente puede enviar varias solicitudes sin esperar las
+  respuestas; cada conexión las procesa en orden y responde en el mismo
+  orden.
+- Backpressure: si un cliente no lee sus respuestas, el servidor deja de
+  leer sus solicitudes hasta que el buffer de salida baje, y el control de
+  flujo de TCP frena al cliente.
+
+Las operaciones sobre la clínica se ejecutan en el hilo del event loop, una
+por vez, por lo que no hace falta el modo concurrente de Clinica.
+"""
+import asyncio
+import json
+import os
+
+from src.modelo.clinica import Clinica
+from src.interfaz.comandos import DespachadorComandos
+
+
+# Largo máximo de una solicitud, en bytes
+LIMITE_LINEA = 1024 * 1024
+# Buffer de salida por conexión a partir del cual se deja de leer solicitudes
+LIMITE_BUFFER_SALIDA = 256 * 1024
+
+
+class ServidorClinica:
+    """
+    Servidor de líneas JSON sobre TCP o socket Unix.
+
+    Atributos privados:
+        __despachador (DespachadorComandos): Ejecuta las solicitudes
+        __servidor (asyncio.Server | None): Servidor en escucha
+    """
+
+    def __init__(self, clinica: Clinica):
+        """
+        Inicializa el servidor (todavía sin escuchar).
+
+        Args:
+            clinica (Clinica): Clínica a exponer
+        """
+        self.__despachador = DespachadorComandos(clinica)
+        self.__servidor = None
+
+    async def iniciar_tcp(self, host: str = "127.0.0.1", puerto: int = 0) -> tuple:
+        """
+        Comienza a escuchar en un puerto TCP.
+
+        Args:
+            host (str): Dirección donde escuchar
+            puerto (int): Puerto (0 elige uno libre)
+
+        Returns:
+            tuple: (host, puerto) efectivos
+        """
+        self.__servidor = await asyncio.start_server(self.__atender, host, puerto, limit=LIMITE_LINEA)
+        return self.__servidor.sockets[0].getsockname()[:2]
+
+    async def iniciar_unix(self, ruta: str) -> str:
+        """
+        Comienza a escuchar en un socket Unix.
+
+        Args:
+            ruta (str): Archivo del socket (se reemplaza si ya existe)
+
+        Returns:
+            str: Ruta del socket
+        """
+        if os.path.exists(ruta):
+            os.unlink(ruta)
+        self.__servidor = await asyncio.start_unix_server(self.__atender, ruta, limit=LIMITE_LINEA)
+        return ruta
+
+    async def servir(self) -> None:
+        """Atiende conexiones hasta que se cancele la tarea o se cierre el servidor."""
+        async with self.__servidor:
+            await self.__servidor.serve_forever()
+
+    async def cerrar(self) -> None:
+        """Deja de aceptar conexiones."""
+        if self.__servidor is not None:
+            self.__servidor.close()
+            await self.__servidor.wait_closed()
+
+    async def __atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Procesa las solicitudes de una conexión en orden hasta que el cliente cierre."""
+        escritor.transport.set_write_buffer_limits(high=LIMITE_BUFFER_SALIDA)
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except ValueError:
+                    # Línea más larga que LIMITE_LINEA: no se puede resincronizar
+                    escritor.write(self.__codificar(self.__error("DatosInvalidosException",
+                                                                 "La solicitud es demasiado larga")))
+                    break
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                escritor.write(self.__codificar(self.__procesar(linea)))
+                # Sólo espera si el cliente no está leyendo (buffer sobre el límite)
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    def __procesar(self, linea: bytes) -> dict:
+        """Interpreta y ejecuta una solicitud."""
+        try:
+            solicitud = json.loads(linea)
+        except ValueError:
+            return self.__error("DatosInvalidosException", "La solicitud no es JSON válido")
+        try:
+            return self.__despachador.ejecutar(solicitud)
+        except Exception as e:
+            # Un error inesperado no debe cortar la conexión ni el servidor
+            respuesta = self.__error(type(e).__name__, str(e))
+            if isinstance(solicitud, dict) and "id" in solicitud:
+                respuesta["id"] = solicitud["id"]
+            return respuesta
+
+    @staticmethod
+    def __error(error: str, mensaje: str) -> dict:
+        return {"ok": False, "error": error, "mensaje": mensaje}
+
+    @staticmethod
+    def __codificar(respuesta: dict) -> bytes:
+        return json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
@@ -0,0 +1,98 @@
+"""
+Clase AgendaMedico para el sistema de gestión de clínica.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from .turno import Turno
+
+
+class AgendaMedico:
+    """
+    Agenda de un médico con sus turnos ordenados por horario de inicio.
+
+    Los turnos de una agenda nunca se superponen, por lo que los horarios de
+    fin quedan ordenados igual que los de inicio y alcanza con comparar un
+    intervalo nuevo contra su vecino inmediato (búsqueda binaria).
+
+    Atributos privados:
+        __inicios (list[datetime]): Horarios de inicio ordenados
+        __fines (list[datetime]): Horarios de fin, alineados con __inicios
+        __turnos (list[Turno]): Turnos, alineados con __inicios
+    """
+
+    def __init__(self):
+        """Inicializa una agenda vacía."""
+        self.__inicios = []
+        self.__fines = []
+        self.__turnos = []
+
+    def esta_libre(self, inicio: datetime, fin: datetime) -> bool:
+        """
+        Verifica si el intervalo [inicio, fin) no se superpone con ningún turno.
+
+        Args:
+            inicio (datetime): Comienzo del intervalo
+            fin (datetime): Final del intervalo (excluido)
+
+        Returns:
+            bool: True si el intervalo está libre, False en caso contrario
+        """
+        # Último turno que empieza antes de que termine el intervalo
+        i = bisect_left(self.__inicios, fin)
+        return i == 0 or self.__fines[i - 1] <= inicio
+
+    def agregar(self, turno: Turno) -> None:
+        """
+        Inserta un turno manteniendo el orden por horario de inicio.
+
+        La verificación de superposición queda a cargo de quien llama
+        (ver esta_libre).
+
+        Args:
+            turno (Turno): Turno a insertar
+        """
+        inicio = turno.obtener_fecha_hora()
+        i = bisect_right(self.__inicios, inicio)
+        self.__inicios.insert(i, inicio)
+        self.__fines.insert(i, turno.obtener_fecha_hora_fin())
+        self.__turnos.insert(i, turno)
+
+    def agregar_lote(self, turnos: list[Turno]) -> None:
+        """
+        Inserta varios turnos de una vez, reordenando la agenda una sola vez.
+
+        Args:
+            turnos (list[Turno]): Turnos a insertar, sin superposiciones entre sí
+        """
+        filas = sorted(
+            list(zip(self.__inicios, self.__fines, self.__turnos)) +
+            [(t.obtener_fecha_hora(), t.obtener_fecha_hora_fin(), t) for t in turnos],
+            key=lambda fila: fila[0],
+        )
+        self.__inicios = [fila[0] for fila in filas]
+        self.__fines = [fila[1] for fila in filas]
+        self.__turnos = [fila[2] for fila in filas]
+
+    def obtener_turnos_entre(self, desde: datetime, hasta: datetime) -> list[Turno]:
+        """
+        Devuelve los turnos que comienzan en el rango [desde, hasta).
+
+        Args:
+            desde (datetime): Inicio del rango (incluido)
+            hasta (datetime): Fin del rango (excluido)
+
+        Returns:
+            list[Turno]: Turnos del rango ordenados por horario
+        """
+        i = bisect_left(self.__inicios, desde)
+        j = bisect_left(self.__inicios, hasta)
+        return self.__turnos[i:j]
+
+    def __len__(self) -> int:
+        """
+        Cantidad de turnos en la agenda.
+
+        Returns:
+            int: Número de turnos agendados
+        """
+        return len(self.__turnos)
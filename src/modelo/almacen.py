@@ -0,0 +1,514 @@
+"""
+Almacenamiento de los datos de la clínica.
+
+Clinica delega el guardado y las consultas indexadas en un objeto Almacen.
+AlmacenMemoria, la implementación por defecto, mantiene todo en diccionarios
+y listas; otras implementaciones (por ejemplo, SQLite) ofrecen la misma
+interfaz sin exigir que todos los datos estén en memoria.
+"""
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterator, Mapping
+from datetime import datetime, timedelta
+from itertools import islice
+from types import MappingProxyType
+from .paciente import Paciente
+from .medico import Medico
+from .especialidad import Especialidad
+from .turno import Turno
+from .receta import Receta
+from .recurrencia import TurnoRecurrente
+from .historia_clinica import HistoriaClinica
+from .tabla_turnos import TablaTurnos, a_microsegundos, desde_microsegundos
+from .medicamentos import CATALOGO_MEDICAMENTOS
+
+
+class Almacen(ABC):
+    """
+    Interfaz de almacenamiento usada por Clinica.
+
+    Las validaciones de negocio (duplicados, disponibilidad, existencia)
+    las hace Clinica antes de llamar a los métodos de escritura.
+    """
+
+    @abstractmethod
+    def agregar_paciente(self, paciente: Paciente) -> None:
+        """Guarda un paciente nuevo junto con su historia clínica vacía."""
+
+    def agregar_pacientes(self, pacientes: list[Paciente]) -> None:
+        """Guarda varios pacientes nuevos; las implementaciones pueden hacerlo en bloque."""
+        for paciente in pacientes:
+            self.agregar_paciente(paciente)
+
+    @abstractmethod
+    def existe_paciente(self, dni: str) -> bool:
+        """Indica si hay un paciente con ese DNI."""
+
+    @abstractmethod
+    def obtener_paciente(self, dni: str) -> Paciente:
+        """Devuelve el paciente con ese DNI (debe existir)."""
+
+    @abstractmethod
+    def listar_pacientes(self) -> list[Paciente]:
+        """Devuelve todos los pacientes en orden de registro."""
+
+    def iterar_pacientes(self, offset: int = 0, limite: int | None = None) -> Iterator[Paciente]:
+        """Genera una página de pacientes en orden de registro."""
+        return islice(self.listar_pacientes(), offset, None if limite is None else offset + limite)
+
+    def vista_pacientes(self) -> Mapping[str, Paciente]:
+        """Devuelve un mapeo de sólo lectura DNI -> Paciente."""
+        return MappingProxyType({paciente.obtener_dni(): paciente for paciente in self.listar_pacientes()})
+
+    @abstractmethod
+    def agregar_medico(self, medico: Medico) -> None:
+        """Guarda un médico nuevo con sus especialidades actuales."""
+
+    @abstractmethod
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None:
+        """Registra una especialidad agregada a un médico ya guardado."""
+
+    @abstractmethod
+    def existe_medico(self, matricula: str) -> bool:
+        """Indica si hay un médico con esa matrícula."""
+
+    @abstractmethod
+    def obtener_medico(self, matricula: str) -> Medico:
+        """Devuelve el médico con esa matrícula (debe existir)."""
+
+    @abstractmethod
+    def listar_medicos(self) -> list[Medico]:
+        """Devuelve todos los médicos en orden de registro."""
+
+    def iterar_medicos(self, offset: int = 0, limite: int | None = None) -> Iterator[Medico]:
+        """Genera una página de médicos en orden de registro."""
+        return islice(self.listar_medicos(), offset, None if limite is None else offset + limite)
+
+    def vista_medicos(self) -> Mapping[str, Medico]:
+        """Devuelve un mapeo de sólo lectura matrícula -> Medico."""
+        return MappingProxyType({medico.obtener_matricula(): medico for medico in self.listar_medicos()})
+
+    @abstractmethod
+    def agregar_turno(self, turno: Turno) -> int:
+        """Guarda un turno, lo agrega a la historia clínica de su paciente y devuelve su id."""
+
+    @abstractmethod
+    def siguiente_id_turno(self) -> int:
+        """Devuelve el id que recibirá el próximo turno guardado."""
+
+    @abstractmethod
+    def avanzar_id_turno(self, siguiente: int) -> None:
+        """
+        Hace que el próximo turno guardado reciba el id 'siguiente' (al restaurar turnos con su id).
+
+        Raises:
+            ValueError: Si ese id ya fue asignado
+        """
+
+    def agregar_turnos(self, turnos: list[Turno]) -> None:
+        """Guarda varios turnos; las implementaciones pueden actualizar los índices en bloque."""
+        for turno in turnos:
+            self.agregar_turno(turno)
+
+    def agregar_turnos_columnas(self, pacientes: list[Paciente], medicos: list[Medico],
+                                especialidades: list[str], inicios: array, duraciones: array) -> None:
+        """Como agregar_turnos, con los turnos por columnas (inicios y duraciones en microsegundos)."""
+        self.agregar_turnos([
+            Turno.restaurar(paciente, medico, desde_microsegundos(inicio), especialidad,
+                            timedelta(microseconds=duracion))
+            for paciente, medico, especialidad, inicio, duracion
+            in zip(pacientes, medicos, especialidades, inicios, duraciones)
+        ])
+
+    @abstractmethod
+    def listar_turnos(self) -> list[Turno]:
+        """Devuelve todos los turnos en orden de registro."""
+
+    @abstractmethod
+    def iterar_turnos_con_id(self) -> Iterator[tuple[int, Turno]]:
+        """Genera (id, turno) de los turnos vigentes en orden de id."""
+
+    def iterar_columnas_turnos(self, tamano: int) -> Iterator[tuple]:
+        """
+        Genera los turnos en orden de id por columnas, de a 'tamano'.
+
+        Yields:
+            tuple: (ids, DNI, matrículas, especialidades, inicios y duraciones en microsegundos)
+        """
+        turnos_con_id = iter(self.iterar_turnos_con_id())
+        while bloque_con_id := list(islice(turnos_con_id, tamano)):
+            bloque = [turno for _, turno in bloque_con_id]
+            yield (
+                array("q", [id_turno for id_turno, _ in bloque_con_id]),
+                [turno.obtener_paciente().obtener_dni() for turno in bloque],
+                [turno.obtener_medico().obtener_matricula() for turno in bloque],
+                [turno.obtener_especialidad() for turno in bloque],
+                array("q", [a_microsegundos(turno.obtener_fecha_hora()) for turno in bloque]),
+                array("q", [turno.obtener_duracion() // timedelta(microseconds=1) for turno in bloque]),
+            )
+
+    def iterar_turnos(self, desde: datetime | None = None, hasta: datetime | None = None,
+                      offset: int = 0, limite: int | None = None) -> Iterator[Turno]:
+        """Genera una página de los turnos que comienzan en [desde, hasta), en orden de registro."""
+        turnos = (
+            turno for turno in self.listar_turnos()
+            if (desde is None or turno.obtener_fecha_hora() >= desde)
+            and (hasta is None or turno.obtener_fecha_hora() < hasta)
+        )
+        return islice(turnos, offset, None if limite is None else offset + limite)
+
+    @abstractmethod
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        """Indica si el médico tiene un turno que empieza exactamente en fecha_hora."""
+
+    @abstractmethod
+    def esta_libre(self, matricula: str, inicio: datetime, fin: datetime,
+                   excluir: int | None = None) -> bool:
+        """
+        Indica si el médico no tiene turnos ni sesiones recurrentes que se superpongan con [inicio, fin).
+
+        El turno con id 'excluir' (por ejemplo, el que se reprograma) no cuenta como ocupado.
+        """
+
+    @abstractmethod
+    def buscar_turno(self, matricula: str, fecha_hora: datetime) -> int | None:
+        """Devuelve el id del turno vigente del médico que empieza en fecha_hora, o None."""
+
+    @abstractmethod
+    def obtener_turno(self, id_turno: int) -> Turno | None:
+        """Devuelve el turno vigente con ese id, o None si no existe o fue cancelado."""
+
+    @abstractmethod
+    def cancelar_turno(self, id_turno: int) -> None:
+        """Cancela un turno vigente y lo quita de la historia clínica de su paciente."""
+
+    @abstractmethod
+    def reprogramar_turno(self, id_turno: int, fecha_hora: datetime, duracion: timedelta) -> None:
+        """Mueve un turno vigente a otro horario conservando su id."""
+
+    @abstractmethod
+    def obtener_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        """Devuelve los turnos del médico que comienzan en [desde, hasta), en orden."""
+
+    def contar_turnos(self, matricula: str | None = None, especialidad: str | None = None,
+                      desde: datetime | None = None, hasta: datetime | None = None) -> int:
+        """Cuenta los turnos que cumplen los filtros indicados (None no filtra)."""
+        especialidad = especialidad.strip().lower() if especialidad is not None else None
+        return sum(
+            1 for turno in self.listar_turnos()
+            if (matricula is None or turno.obtener_medico().obtener_matricula() == matricula)
+            and (especialidad is None or turno.obtener_especialidad().lower() == especialidad)
+            and (desde is None or turno.obtener_fecha_hora() >= desde)
+            and (hasta is None or turno.obtener_fecha_hora() < hasta)
+        )
+
+    @abstractmethod
+    def agregar_recurrencia(self, recurrencia: TurnoRecurrente) -> None:
+        """Guarda una serie de turnos recurrentes y la agrega a la historia clínica de su paciente."""
+
+    @abstractmethod
+    def listar_recurrencias(self) -> list[TurnoRecurrente]:
+        """Devuelve todas las series de turnos recurrentes en orden de registro."""
+
+    @abstractmethod
+    def obtener_recurrencias_medico(self, matricula: str) -> list[TurnoRecurrente]:
+        """Devuelve las series de turnos recurrentes del médico."""
+
+    @abstractmethod
+    def cancelar_sesion(self, recurrencia: TurnoRecurrente, fecha_hora: datetime) -> None:
+        """Cancela una sesión de una serie guardada (debe estar vigente)."""
+
+    @abstractmethod
+    def agregar_receta(self, receta: Receta) -> None:
+        """Guarda una receta en la historia clínica de su paciente."""
+
+    def iterar_recetas(self) -> Iterator[Receta]:
+        """Genera todas las recetas, agrupadas por paciente y en orden de registro."""
+        for paciente in self.iterar_pacientes():
+            yield from self.obtener_registros_paciente(paciente.obtener_dni())[1]
+
+    def obtener_recetas_con_medicamento(self, nombre: str) -> list[Receta]:
+        """Devuelve las recetas que incluyen el medicamento (sin distinguir mayúsculas), por fecha."""
+        ids = set(CATALOGO_MEDICAMENTOS.buscar(nombre))
+        if not ids:
+            return []
+        recetas = [
+            receta for paciente in self.listar_pacientes()
+            for receta in self.obtener_historia_clinica(paciente.obtener_dni()).obtener_recetas()
+            if not ids.isdisjoint(receta.obtener_ids_medicamentos())
+        ]
+        recetas.sort(key=Receta.obtener_fecha)
+        return recetas
+
+    @abstractmethod
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        """Devuelve la historia clínica del paciente (debe existir)."""
+
+    def obtener_historia_en_cache(self, dni: str) -> HistoriaClinica | None:
+        """Devuelve la historia clínica del paciente si ya está armada, sin armarla."""
+        return None
+
+    @abstractmethod
+    def obtener_registros_paciente(self, dni: str) -> tuple[list[Turno], list[Receta], list[TurnoRecurrente]]:
+        """Devuelve turnos, recetas y series del paciente en orden de registro, sin armar su historia."""
+
+    def obtener_registros_columnares(self, dni: str) -> tuple[tuple, list[Receta], list[TurnoRecurrente]]:
+        """
+        Como obtener_registros_paciente, pero con los turnos por columnas.
+
+        Returns:
+            tuple: ((matrículas, especialidades, inicios y duraciones en microsegundos), recetas, series)
+        """
+        turnos, recetas, recurrencias = self.obtener_registros_paciente(dni)
+        columnas = (
+            [turno.obtener_medico().obtener_matricula() for turno in turnos],
+            [turno.obtener_especialidad() for turno in turnos],
+            array("q", [a_microsegundos(turno.obtener_fecha_hora()) for turno in turnos]),
+            array("q", [turno.obtener_duracion() // timedelta(microseconds=1) for turno in turnos]),
+        )
+        return columnas, recetas, recurrencias
+
+
+class AlmacenMemoria(Almacen):
+    """
+    Almacenamiento en memoria con diccionarios y una tabla columnar de turnos.
+
+    Los turnos se guardan en una TablaTurnos (unas decenas de bytes por
+    turno) que también resuelve las consultas por médico; el número de
+    fila es el id del turno. Las historias
+    clínicas se arman al consultarlas por primera vez y desde entonces se
+    mantienen actualizadas. Un índice invertido por id de medicamento
+    responde qué recetas incluyen un medicamento sin recorrer las historias.
+    Las series de turnos recurrentes se guardan como reglas, agrupadas por
+    médico para las consultas de disponibilidad.
+
+    Atributos privados:
+        __pacientes (dict[str, Paciente]): DNI -> Paciente
+        __medicos (dict[str, Medico]): Matrícula -> Medico
+        __turnos (TablaTurnos): Turnos en orden de registro
+        __recetas (dict[str, list[Receta]]): DNI -> recetas del paciente
+        __recetas_por_medicamento (dict[int, list[Receta]]): Id de medicamento -> recetas que lo incluyen
+        __recurrencias (list[TurnoRecurrente]): Series en orden de registro
+        __recurrencias_medico (dict[str, list[TurnoRecurrente]]): Matrícula -> series del médico
+        __recurrencias_paciente (dict[str, list[TurnoRecurrente]]): DNI -> series del paciente
+        __historias_clinicas (dict[str, HistoriaClinica]): DNI -> historia ya consultada
+    """
+
+    def __init__(self):
+        """Inicializa un almacenamiento vacío."""
+        self.__pacientes = {}
+        self.__medicos = {}
+        self.__turnos = TablaTurnos()
+        self.__recetas = {}
+        self.__recetas_por_medicamento = {}
+        self.__recurrencias = []
+        self.__recurrencias_medico = {}
+        self.__recurrencias_paciente = {}
+        self.__historias_clinicas = {}
+
+    def agregar_paciente(self, paciente: Paciente) -> None:
+        self.__pacientes[paciente.obtener_dni()] = paciente
+
+    def agregar_pacientes(self, pacientes: list[Paciente]) -> None:
+        self.__pacientes.update((paciente.obtener_dni(), paciente) for paciente in pacientes)
+
+    def existe_paciente(self, dni: str) -> bool:
+        return dni in self.__pacientes
+
+    def obtener_paciente(self, dni: str) -> Paciente:
+        return self.__pacientes[dni]
+
+    def listar_pacientes(self) -> list[Paciente]:
+        return list(self.__pacientes.values())
+
+    def iterar_pacientes(self, offset: int = 0, limite: int | None = None) -> Iterator[Paciente]:
+        return islice(self.__pacientes.values(), offset, None if limite is None else offset + limite)
+
+    def vista_pacientes(self) -> Mapping[str, Paciente]:
+        return MappingProxyType(self.__pacientes)
+
+    def agregar_medico(self, medico: Medico) -> None:
+        self.__medicos[medico.obtener_matricula()] = medico
+
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None:
+        # El médico en memoria es el mismo objeto: no hay nada que actualizar
+        pass
+
+    def existe_medico(self, matricula: str) -> bool:
+        return matricula in self.__medicos
+
+    def obtener_medico(self, matricula: str) -> Medico:
+        return self.__medicos[matricula]
+
+    def listar_medicos(self) -> list[Medico]:
+        return list(self.__medicos.values())
+
+    def iterar_medicos(self, offset: int = 0, limite: int | None = None) -> Iterator[Medico]:
+        return islice(self.__medicos.values(), offset, None if limite is None else offset + limite)
+
+    def vista_medicos(self) -> Mapping[str, Medico]:
+        return MappingProxyType(self.__medicos)
+
+    def agregar_turno(self, turno: Turno) -> int:
+        fila = self.__turnos.agregar(turno)
+        historia = self.__historias_clinicas.get(turno.obtener_paciente().obtener_dni())
+        if historia is not None:
+            historia.agregar_turno(turno)
+        return fila
+
+    def siguiente_id_turno(self) -> int:
+        return self.__turnos.cantidad_filas()
+
+    def avanzar_id_turno(self, siguiente: int) -> None:
+        self.__turnos.anular_hasta(siguiente)
+
+    def agregar_turnos(self, turnos: list[Turno]) -> None:
+        self.__turnos.agregar_lote(turnos)
+        for turno in turnos:
+            historia = self.__historias_clinicas.get(turno.obtener_paciente().obtener_dni())
+            if historia is not None:
+                historia.agregar_turno(turno)
+
+    def agregar_turnos_columnas(self, pacientes: list[Paciente], medicos: list[Medico],
+                                especialidades: list[str], inicios: array, duraciones: array) -> None:
+        filas = self.__turnos.agregar_columnas(pacientes, medicos, especialidades, inicios, duraciones)
+        if self.__historias_clinicas:
+            for fila, paciente in zip(filas, pacientes):
+                historia = self.__historias_clinicas.get(paciente.obtener_dni())
+                if historia is not None:
+                    historia.agregar_turno(self.__turnos.obtener(fila))
+
+    def listar_turnos(self) -> list[Turno]:
+        return list(self.__turnos)
+
+    def iterar_turnos_con_id(self) -> Iterator[tuple[int, Turno]]:
+        return ((fila, self.__turnos.obtener(fila)) for fila in self.__turnos.iterar_filas())
+
+    def iterar_columnas_turnos(self, tamano: int) -> Iterator[tuple]:
+        return self.__turnos.bloques_columnas(tamano)
+
+    def iterar_turnos(self, desde: datetime | None = None, hasta: datetime | None = None,
+                      offset: int = 0, limite: int | None = None) -> Iterator[Turno]:
+        if desde is None and hasta is None and len(self.__turnos) == self.__turnos.cantidad_filas():
+            # Sin filtros ni cancelados la página es un rango de filas: no hace falta recorrer las anteriores
+            filas = range(len(self.__turnos))[offset:None if limite is None else offset + limite]
+        else:
+            filas = islice(self.__turnos.iterar_filas(desde=desde, hasta=hasta),
+                           offset, None if limite is None else offset + limite)
+        return map(self.__turnos.obtener, filas)
+
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        return self.__turnos.existe(matricula, fecha_hora)
+
+    def esta_libre(self, matricula: str, inicio: datetime, fin: datetime,
+                   excluir: int | None = None) -> bool:
+        if not self.__turnos.esta_libre(matricula, inicio, fin, excluir):
+            return False
+        return not any(r.se_superpone(inicio, fin) for r in self.__recurrencias_medico.get(matricula, ()))
+
+    def buscar_turno(self, matricula: str, fecha_hora: datetime) -> int | None:
+        return self.__turnos.buscar(matricula, fecha_hora)
+
+    def obtener_turno(self, id_turno: int) -> Turno | None:
+        return self.__turnos.obtener(id_turno) if self.__turnos.es_vigente(id_turno) else None
+
+    def cancelar_turno(self, id_turno: int) -> None:
+        self.__quitar_de_historia(id_turno)
+        self.__turnos.cancelar(id_turno)
+
+    def reprogramar_turno(self, id_turno: int, fecha_hora: datetime, duracion: timedelta) -> None:
+        historia = self.__quitar_de_historia(id_turno)
+        self.__turnos.reprogramar(id_turno, fecha_hora, duracion)
+        if historia is not None:
+            historia.agregar_turno(self.__turnos.obtener(id_turno))
+
+    def __quitar_de_historia(self, id_turno: int) -> HistoriaClinica | None:
+        """Quita el turno de la historia ya consultada de su paciente y la devuelve."""
+        turno = self.__turnos.obtener(id_turno)
+        historia = self.__historias_clinicas.get(turno.obtener_paciente().obtener_dni())
+        if historia is not None:
+            historia.quitar_turno(turno)
+        return historia
+
+    def obtener_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        return [self.__turnos.obtener(fila) for fila in self.__turnos.filas(matricula, desde=desde, hasta=hasta)]
+
+    def contar_turnos(self, matricula: str | None = None, especialidad: str | None = None,
+                      desde: datetime | None = None, hasta: datetime | None = None) -> int:
+        return self.__turnos.contar(matricula, especialidad, desde, hasta)
+
+    def agregar_recurrencia(self, recurrencia: TurnoRecurrente) -> None:
+        self.__recurrencias.append(recurrencia)
+        matricula = recurrencia.obtener_medico().obtener_matricula()
+        self.__recurrencias_medico.setdefault(matricula, []).append(recurrencia)
+        dni = recurrencia.obtener_paciente().obtener_dni()
+        self.__recurrencias_paciente.setdefault(dni, []).append(recurrencia)
+        historia = self.__historias_clinicas.get(dni)
+        if historia is not None:
+            historia.agregar_recurrencia(recurrencia)
+
+    def listar_recurrencias(self) -> list[TurnoRecurrente]:
+        return self.__recurrencias.copy()
+
+    def obtener_recurrencias_medico(self, matricula: str) -> list[TurnoRecurrente]:
+        return self.__recurrencias_medico.get(matricula, []).copy()
+
+    def cancelar_sesion(self, recurrencia: TurnoRecurrente, fecha_hora: datetime) -> None:
+        # La historia clínica comparte la misma regla: ve la cancelación sin actualizarla
+        recurrencia.cancelar_sesion(fecha_hora)
+
+    def agregar_receta(self, receta: Receta) -> None:
+        dni = receta.obtener_paciente().obtener_dni()
+        self.__recetas.setdefault(dni, []).append(receta)
+        for id_medicamento in set(receta.obtener_ids_medicamentos()):
+            self.__recetas_por_medicamento.setdefault(id_medicamento, []).append(receta)
+        historia = self.__historias_clinicas.get(dni)
+        if historia is not None:
+            historia.agregar_receta(receta)
+
+    def iterar_recetas(self) -> Iterator[Receta]:
+        for recetas in self.__recetas.values():
+            yield from recetas
+
+    def obtener_recetas_con_medicamento(self, nombre: str) -> list[Receta]:
+        listas = [self.__recetas_por_medicamento.get(i, []) for i in CATALOGO_MEDICAMENTOS.buscar(nombre)]
+        if len(listas) == 1:
+            recetas = listas[0].copy()
+        else:
+            # Varias grafías del mismo nombre: una receta puede figurar en más de una lista
+            recetas = list({id(receta): receta for lista in listas for receta in lista}.values())
+        recetas.sort(key=Receta.obtener_fecha)
+        return recetas
+
+    def obtener_historia_en_cache(self, dni: str) -> HistoriaClinica | None:
+        return self.__historias_clinicas.get(dni)
+
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        historia = self.__historias_clinicas.get(dni)
+        if historia is None:
+            historia = HistoriaClinica(self.__pacientes[dni])
+            turnos, recetas, recurrencias = self.obtener_registros_paciente(dni)
+            for turno in turnos:
+                historia.agregar_turno(turno)
+            for receta in recetas:
+                historia.agregar_receta(receta)
+            for recurrencia in recurrencias:
+                historia.agregar_recurrencia(recurrencia)
+            self.__historias_clinicas[dni] = historia
+        return historia
+
+    def obtener_registros_paciente(self, dni: str) -> tuple[list[Turno], list[Receta], list[TurnoRecurrente]]:
+        obtener = self.__turnos.obtener
+        return (
+            [obtener(fila) for fila in self.__turnos.filas_paciente(dni)],
+            list(self.__recetas.get(dni, ())),
+            list(self.__recurrencias_paciente.get(dni, ())),
+        )
+
+    def obtener_registros_columnares(self, dni: str) -> tuple[tuple, list[Receta], list[TurnoRecurrente]]:
+        # Se leen las columnas de la tabla sin crear objetos Turno
+        return (
+            self.__turnos.columnas(self.__turnos.filas_paciente(dni))[1:],
+            list(self.__recetas.get(dni, ())),
+            list(self.__recurrencias_paciente.get(dni, ())),
+        )
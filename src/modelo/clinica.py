@@ -1,28 +1,113 @@
-from datetime import datetime
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timedelta, time
+from heapq import merge
+from itertools import islice
 from .paciente import Paciente
 from .medico import Medico
-from .turno import Turno
+from .turno import Turno, DURACION_POR_DEFECTO
 from .receta import Receta
-from .historia_clinica import HistoriaClinica
-from .especialidad import Especialidad
+from .recurrencia import TurnoRecurrente, SEMANA, repeticiones_hasta
+from .almacen import Almacen, AlmacenMemoria
+from .especialidad import Especialidad, DIAS_SEMANA, INDICE_DIA_SEMANA
+from .concurrencia import BloqueosPorClave, SinBloqueos, FRANJAS_POR_DEFECTO
+from .metricas import Metricas, instrumentar
 from .excepciones import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
-    RecetaInvalidaException
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    DatosInvalidosException
+)
+
+
+# Franja horaria en la que se ofrecen turnos libres
+HORA_APERTURA = time(8, 0)
+HORA_CIERRE = time(20, 0)
+
+# Métodos que se miden al activar las métricas (ver establecer_metricas)
+OPERACIONES_INSTRUMENTADAS = (
+    "agregar_paciente",
+    "agregar_pacientes_lote",
+    "agregar_medico",
+    "agendar_turno",
+    "agendar_turnos_lote",
+    "agendar_turno_recurrente",
+    "cancelar_turno",
+    "reprogramar_turno",
+    "emitir_receta",
+    "obtener_historia_clinica",
 )
 
 
 class Clinica:
     """
     Clase principal que representa el sistema de gestión de la clínica.
+    
+    Los datos y sus índices viven en un Almacen (en memoria por defecto);
+    la clínica aplica las reglas de negocio antes de escribir en él.
+    
+    Con concurrente=True la clínica puede usarse desde varios hilos: cada
+    médico queda protegido por uno de 'franjas' locks (lock striping), así
+    que los turnos de médicos distintos se agendan en paralelo y la
+    verificación de disponibilidad y el alta de un turno son atómicas. Un
+    lock general, tomado sólo durante la escritura en el almacén, protege
+    las estructuras compartidas (pacientes, historias clínicas, diario).
+    El orden de adquisición es siempre lock del médico -> lock general.
+    La conexión de AlmacenSQLite sólo puede usarse desde el hilo que la abrió.
     """
     
-    def __init__(self):
-        self.__pacientes = {}  # DNI -> Paciente
-        self.__medicos = {}    # Matrícula -> Medico
-        self.__turnos = []     # Lista de turnos
-        self.__historias_clinicas = {}  # DNI -> HistoriaClinica
+    def __init__(self, almacen: Almacen | None = None, concurrente: bool = False,
+                 franjas: int = FRANJAS_POR_DEFECTO):
+        self.__almacen = almacen if almacen is not None else AlmacenMemoria()
+        self.__diario = None   # Registro de operaciones (ver establecer_diario)
+        self.__metricas = None  # Métricas de las operaciones (ver establecer_metricas)
+        if concurrente:
+            self.__bloqueos_medico = BloqueosPorClave(franjas)
+            self.__bloqueo_general = threading.Lock()
+        else:
+            self.__bloqueos_medico = SinBloqueos()
+            self.__bloqueo_general = nullcontext()
+        
+        # Médicos que ya estaban guardados en el almacén
+        for medico in self.__almacen.listar_medicos():
+            medico.establecer_observador(self.__al_agregar_especialidad)
+        
+    def establecer_diario(self, diario):
+        """
+        Registra el objeto que recibe cada operación que modifica la clínica.
+        
+        El diario debe ofrecer registrar(operacion, *objetos); se lo invoca
+        después de que la operación se aplicó con éxito. None lo desactiva.
+        """
+        self.__diario = diario
+        
+    def establecer_metricas(self, metricas: Metricas | None):
+        """
+        Activa la medición de las operaciones principales sobre un registro de métricas.
+        
+        Se cuentan llamadas, latencias y excepciones por tipo de cada método
+        de OPERACIONES_INSTRUMENTADAS. None la desactiva: los métodos vuelven
+        a ser los de la clase, sin costo adicional.
+        """
+        instrumentar(self, metricas, OPERACIONES_INSTRUMENTADAS)
+        self.__metricas = metricas
+        
+    def obtener_metricas(self) -> Metricas | None:
+        """Devuelve el registro de métricas activo, o None si la medición está desactivada."""
+        return self.__metricas
+        
+    def __notificar(self, operacion: str, *objetos):
+        """Informa una operación aplicada al diario, si hay uno configurado."""
+        if self.__diario is not None:
+            self.__diario.registrar(operacion, *objetos)
+            
+    def __al_agregar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        """Observador de los médicos registrados: guarda e informa nuevas especialidades."""
+        with self.__bloqueo_general:
+            self.__almacen.agregar_especialidad(medico, especialidad)
+            self.__notificar("agregar_especialidad", medico, especialidad)
         
     def agregar_paciente(self, paciente: Paciente):
         """Registra un paciente y crea su historia clínica."""
@@ -30,11 +115,36 @@ class Clinica:
             raise ValueError("El parámetro debe ser una instancia de Paciente")
         
         dni = paciente.obtener_dni()
-        if dni in self.__pacientes:
-            raise ValueError(f"Ya existe un paciente con DNI {dni}")
+        with self.__bloqueo_general:
+            if self.__almacen.existe_paciente(dni):
+                raise ValueError(f"Ya existe un paciente con DNI {dni}")
+            
+            self.__almacen.agregar_paciente(paciente)
+            self.__notificar("agregar_paciente", paciente)
+        
+    def agregar_pacientes_lote(self, pacientes: list[Paciente]):
+        """
+        Registra varios pacientes con una sola actualización del almacén.
         
-        self.__pacientes[dni] = paciente
-        self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+        Se valida el lote completo antes de escribir: si algún elemento no es
+        un Paciente o repite un DNI (en el lote o ya registrado) no se agrega
+        ninguno.
+        """
+        for paciente in pacientes:
+            if not isinstance(paciente, Paciente):
+                raise ValueError("El parámetro debe ser una instancia de Paciente")
+        
+        with self.__bloqueo_general:
+            vistos = set()
+            for paciente in pacientes:
+                dni = paciente.obtener_dni()
+                if dni in vistos or self.__almacen.existe_paciente(dni):
+                    raise ValueError(f"Ya existe un paciente con DNI {dni}")
+                vistos.add(dni)
+            
+            self.__almacen.agregar_pacientes(pacientes)
+            for paciente in pacientes:
+                self.__notificar("agregar_paciente", paciente)
         
     def agregar_medico(self, medico: Medico):
         """Registra un médico."""
@@ -42,53 +152,561 @@ class Clinica:
             raise ValueError("El parámetro debe ser una instancia de Medico")
         
         matricula = medico.obtener_matricula()
-        if matricula in self.__medicos:
-            raise ValueError(f"Ya existe un médico con matrícula {matricula}")
-        
-        self.__medicos[matricula] = medico
+        with self.__bloqueo_general:
+            if self.__almacen.existe_medico(matricula):
+                raise ValueError(f"Ya existe un médico con matrícula {matricula}")
+            
+            self.__almacen.agregar_medico(medico)
+            medico.establecer_observador(self.__al_agregar_especialidad)
+            self.__notificar("agregar_medico", medico)
         
     def obtener_pacientes(self):
         """Devuelve todos los pacientes registrados."""
-        return list(self.__pacientes.values())
+        return self.__almacen.listar_pacientes()
         
     def obtener_medicos(self):
         """Devuelve todos los médicos registrados."""
-        return list(self.__medicos.values())
+        return self.__almacen.listar_medicos()
+        
+    def iter_pacientes(self, offset: int = 0, limite: int | None = None):
+        """
+        Genera una página de pacientes en orden de registro, sin copiar la colección.
+        
+        Args:
+            offset (int): Cantidad de pacientes a saltear
+            limite (int | None): Máximo de pacientes a generar (None: hasta el final)
+        """
+        self.__validar_pagina(offset, limite)
+        return self.__almacen.iterar_pacientes(offset, limite)
+        
+    def iter_medicos(self, offset: int = 0, limite: int | None = None):
+        """Genera una página de médicos en orden de registro (ver iter_pacientes)."""
+        self.__validar_pagina(offset, limite)
+        return self.__almacen.iterar_medicos(offset, limite)
+        
+    def vista_pacientes(self):
+        """Devuelve un mapeo de sólo lectura DNI -> Paciente que refleja los cambios posteriores."""
+        return self.__almacen.vista_pacientes()
+        
+    def vista_medicos(self):
+        """Devuelve un mapeo de sólo lectura matrícula -> Medico que refleja los cambios posteriores."""
+        return self.__almacen.vista_medicos()
+        
+    def __validar_pagina(self, offset: int, limite: int | None):
+        """Verifica los parámetros de paginación."""
+        if not isinstance(offset, int):
+            raise DatosInvalidosException("El offset debe ser un número entero")
+        if offset < 0:
+            raise DatosInvalidosException("El offset no puede ser negativo")
+        if limite is not None and not isinstance(limite, int):
+            raise DatosInvalidosException("El límite debe ser un número entero")
+        if limite is not None and limite < 0:
+            raise DatosInvalidosException("El límite no puede ser negativo")
+        
+    def existe_paciente(self, dni: str) -> bool:
+        """Indica si hay un paciente registrado con ese DNI."""
+        return self.__almacen.existe_paciente(dni)
+        
+    def existe_medico(self, matricula: str) -> bool:
+        """Indica si hay un médico registrado con esa matrícula."""
+        return self.__almacen.existe_medico(matricula)
+        
+    def obtener_paciente_por_dni(self, dni: str):
+        """Devuelve un paciente por su DNI."""
+        self.validar_existencia_paciente(dni)
+        return self.__almacen.obtener_paciente(dni)
         
     def obtener_medico_por_matricula(self, matricula: str):
         """Devuelve un médico por su matrícula."""
-        if matricula not in self.__medicos:
+        if not self.__almacen.existe_medico(matricula):
             raise MedicoNoDisponibleException(f"No existe médico con matrícula {matricula}")
-        return self.__medicos[matricula]
+        return self.__almacen.obtener_medico(matricula)
         
-    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime):
-        """Agenda un turno si se cumplen todas las condiciones."""
+    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime,
+                      duracion: timedelta = DURACION_POR_DEFECTO) -> int:
+        """Agenda un turno si se cumplen todas las condiciones y devuelve su id."""
         # Validar existencia de paciente y médico
         self.validar_existencia_paciente(dni)
         self.validar_existencia_medico(matricula)
         
-        paciente = self.__pacientes[dni]
-        medico = self.__medicos[matricula]
+        paciente = self.__almacen.obtener_paciente(dni)
+        medico = self.__almacen.obtener_medico(matricula)
         
-        # Validar que no haya turno duplicado
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
+        # Validar especialidad en día (índice de weekday, sin pasar por el nombre)
+        self.validar_especialidad_en_indice_dia(medico, especialidad, fecha_hora.weekday())
         
-        # Obtener día de la semana
-        dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
+        turno = Turno(paciente, medico, fecha_hora, especialidad, duracion)
         
-        # Validar especialidad en día
-        self.validar_especialidad_en_dia(medico, especialidad, dia_semana)
+        # Verificar disponibilidad y agendar sin que otro hilo tome el horario en el medio
+        with self.__bloqueos_medico.para(matricula):
+            self.validar_turno_no_duplicado(matricula, fecha_hora, duracion)
+            with self.__bloqueo_general:
+                id_turno = self.__almacen.agregar_turno(turno)
+                self.__notificar("agendar_turno", turno, id_turno)
+        return id_turno
         
-        # Crear y agendar turno
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos.append(turno)
+    def obtener_turno(self, id_turno: int) -> Turno:
+        """Devuelve el turno vigente con ese id."""
+        turno = self.__almacen.obtener_turno(id_turno)
+        if turno is None:
+            raise TurnoNoEncontradoException(f"No existe un turno vigente con id {id_turno}")
+        return turno
         
-        # Agregar a historia clínica
-        self.__historias_clinicas[dni].agregar_turno(turno)
+    def buscar_turno(self, matricula: str, fecha_hora: datetime) -> int:
+        """Devuelve el id del turno del médico que empieza en fecha_hora."""
+        id_turno = self.__almacen.buscar_turno(matricula, fecha_hora)
+        if id_turno is None:
+            raise TurnoNoEncontradoException(f"El médico {matricula} no tiene un turno el {fecha_hora}")
+        return id_turno
+        
+    def cancelar_turno(self, id_turno: int) -> Turno:
+        """
+        Cancela un turno; su horario queda libre para agendar otro de inmediato.
+        
+        El id no se reutiliza. El índice del médico y la historia clínica del
+        paciente se actualizan con búsquedas binarias, sin recorrer los turnos.
+        
+        Returns:
+            Turno: Turno cancelado
+        """
+        turno = self.obtener_turno(id_turno)
+        with self.__bloqueos_medico.para(turno.obtener_medico().obtener_matricula()):
+            # Otro hilo pudo cancelarlo mientras se esperaba el lock
+            turno = self.obtener_turno(id_turno)
+            with self.__bloqueo_general:
+                self.__almacen.cancelar_turno(id_turno)
+                self.__notificar("cancelar_turno", turno)
+        return turno
+        
+    def reprogramar_turno(self, id_turno: int, fecha_hora: datetime,
+                          duracion: timedelta | None = None) -> Turno:
+        """
+        Mueve un turno a otro horario del mismo médico, conservando su id.
+        
+        Se aplican las mismas validaciones que al agendar; el horario
+        anterior del turno no cuenta como ocupado. Sin duración se conserva
+        la que tenía.
+        
+        Returns:
+            Turno: Turno con el nuevo horario
+        """
+        anterior = self.obtener_turno(id_turno)
+        medico = anterior.obtener_medico()
+        matricula = medico.obtener_matricula()
+        especialidad = anterior.obtener_especialidad()
+        if duracion is None:
+            duracion = anterior.obtener_duracion()
+        
+        self.validar_especialidad_en_indice_dia(medico, especialidad, fecha_hora.weekday())
+        turno = Turno(anterior.obtener_paciente(), medico, fecha_hora, especialidad, duracion)
+        
+        with self.__bloqueos_medico.para(matricula):
+            anterior = self.obtener_turno(id_turno)
+            if not self.__almacen.esta_libre(matricula, fecha_hora, fecha_hora + duracion, excluir=id_turno):
+                raise TurnoOcupadoException(
+                    f"El turno de {fecha_hora} se superpone con otro turno del médico"
+                )
+            with self.__bloqueo_general:
+                self.__almacen.reprogramar_turno(id_turno, fecha_hora, duracion)
+                self.__notificar("reprogramar_turno", anterior, turno)
+        return turno
+        
+    def restaurar_reprogramacion(self, id_turno: int, fecha_hora: datetime, duracion: timedelta):
+        """
+        Mueve un turno ya reprogramado (por ejemplo, al reproducir el diario).
+        
+        No revisa superposiciones ni fechas pasadas y no se informa al diario.
+        """
+        turno = self.obtener_turno(id_turno)
+        with self.__bloqueos_medico.para(turno.obtener_medico().obtener_matricula()), self.__bloqueo_general:
+            self.__almacen.reprogramar_turno(id_turno, fecha_hora, duracion)
+        
+    def agendar_turnos_lote(self, solicitudes: list[tuple]) -> list[Turno]:
+        """
+        Agenda varios turnos (por ejemplo, una serie de sesiones): todos o ninguno.
+        
+        Cada solicitud es una tupla (dni, matricula, especialidad, fecha_hora)
+        con la duración como quinto elemento opcional. Se valida el lote
+        completo antes de escribir: existencia, especialidad del día y
+        superposición con los turnos guardados y con los del mismo lote. Si
+        algún turno falla se lanza su excepción, indicando la posición en el
+        lote, y no se agenda ninguno. Pacientes y médicos se buscan una vez
+        por lote y el almacén se actualiza una sola vez.
+        
+        Returns:
+            list[Turno]: Turnos agendados, en el orden de las solicitudes
+        """
+        pacientes, medicos = {}, {}
+        turnos = []
+        for numero, solicitud in enumerate(solicitudes, 1):
+            try:
+                if len(solicitud) not in (4, 5):
+                    raise DatosInvalidosException(
+                        "Cada turno debe indicar dni, matrícula, especialidad, fecha y hora y, opcionalmente, duración"
+                    )
+                dni, matricula, especialidad, fecha_hora = solicitud[:4]
+                duracion = solicitud[4] if len(solicitud) == 5 else DURACION_POR_DEFECTO
+                paciente = pacientes.get(dni)
+                if paciente is None:
+                    self.validar_existencia_paciente(dni)
+                    paciente = pacientes[dni] = self.__almacen.obtener_paciente(dni)
+                medico = medicos.get(matricula)
+                if medico is None:
+                    self.validar_existencia_medico(matricula)
+                    medico = medicos[matricula] = self.__almacen.obtener_medico(matricula)
+                self.validar_especialidad_en_indice_dia(medico, especialidad, fecha_hora.weekday())
+                turnos.append(Turno(paciente, medico, fecha_hora, especialidad, duracion))
+            except (PacienteNoEncontradoException, MedicoNoDisponibleException, DatosInvalidosException) as e:
+                raise type(e)(f"Turno {numero} del lote: {e}") from e
+        
+        # Superposiciones dentro del lote: por médico, ordenados por inicio, cada turno
+        # debe terminar antes de que empiece el siguiente
+        por_medico = {}
+        for numero, turno in enumerate(turnos, 1):
+            por_medico.setdefault(turno.obtener_medico().obtener_matricula(), []).append(
+                (turno.obtener_fecha_hora(), turno.obtener_fecha_hora_fin(), numero)
+            )
+        for intervalos in por_medico.values():
+            intervalos.sort()
+            for anterior, siguiente in zip(intervalos, intervalos[1:]):
+                if anterior[1] > siguiente[0]:
+                    numero = max(anterior[2], siguiente[2])
+                    raise TurnoOcupadoException(
+                        f"Turno {numero} del lote: El turno de {turnos[numero - 1].obtener_fecha_hora()} "
+                        "se superpone con otro turno del lote"
+                    )
+        
+        # Los locks de todos los médicos del lote, para que nadie tome un horario en el medio
+        with self.__bloqueos_medico.para_varias(medicos):
+            esta_libre = self.__almacen.esta_libre
+            for numero, turno in enumerate(turnos, 1):
+                matricula = turno.obtener_medico().obtener_matricula()
+                inicio = turno.obtener_fecha_hora()
+                if not esta_libre(matricula, inicio, turno.obtener_fecha_hora_fin()):
+                    try:
+                        # Sólo para informar el motivo con el mismo mensaje que agendar_turno
+                        self.validar_turno_no_duplicado(matricula, inicio, turno.obtener_duracion())
+                    except TurnoOcupadoException as e:
+                        raise TurnoOcupadoException(f"Turno {numero} del lote: {e}") from e
+            
+            with self.__bloqueo_general:
+                # Los turnos de un lote reciben ids consecutivos
+                primero = self.__almacen.siguiente_id_turno()
+                self.__almacen.agregar_turnos(turnos)
+                for id_turno, turno in enumerate(turnos, primero):
+                    self.__notificar("agendar_turno", turno, id_turno)
+        return turnos
+        
+    def restaurar_turno(self, turno: Turno, id_turno: int | None = None) -> int:
+        """
+        Incorpora un turno ya validado (por ejemplo, al recuperar datos guardados).
+        
+        Sólo exige que el paciente y el médico estén registrados; no revisa
+        superposiciones ni fechas pasadas y no se informa al diario.
+        
+        Args:
+            turno (Turno): Turno a incorporar
+            id_turno (int | None): Id que tenía al guardarse, para que los clientes puedan
+                seguir usándolo; debe ser mayor que los ya asignados
+        
+        Returns:
+            int: Id del turno
+        """
+        self.validar_existencia_paciente(turno.obtener_paciente().obtener_dni())
+        matricula = turno.obtener_medico().obtener_matricula()
+        self.validar_existencia_medico(matricula)
+        with self.__bloqueos_medico.para(matricula), self.__bloqueo_general:
+            if id_turno is not None:
+                self.__almacen.avanzar_id_turno(id_turno)
+            return self.__almacen.agregar_turno(turno)
+        
+    def restaurar_turnos(self, turnos: list[Turno]):
+        """
+        Versión en lote de restaurar_turno: actualiza los índices una sola vez.
+        
+        En modo concurrente escribe bajo el lock general pero sin los locks
+        por médico: pensado para cargas sin agendamientos simultáneos.
+        """
+        for turno in turnos:
+            self.validar_existencia_paciente(turno.obtener_paciente().obtener_dni())
+            self.validar_existencia_medico(turno.obtener_medico().obtener_matricula())
+        with self.__bloqueo_general:
+            self.__almacen.agregar_turnos(turnos)
+        
+    def importar_turnos_lote(self, turnos: list[Turno]) -> list[int]:
+        """
+        Incorpora turnos ya validados por un importador e informa cada uno al diario.
+        
+        Como restaurar_turnos, no revisa superposiciones ni fechas pasadas,
+        pero los turnos quedan en el diario con su id, igual que en
+        agendar_turnos_lote, para que sobrevivan a un reinicio.
+        
+        Returns:
+            list[int]: Id de cada turno, en el orden del lote
+        """
+        for turno in turnos:
+            self.validar_existencia_paciente(turno.obtener_paciente().obtener_dni())
+            self.validar_existencia_medico(turno.obtener_medico().obtener_matricula())
+        medicos = {turno.obtener_medico().obtener_matricula() for turno in turnos}
+        with self.__bloqueos_medico.para_varias(medicos), self.__bloqueo_general:
+            primero = self.__almacen.siguiente_id_turno()
+            self.__almacen.agregar_turnos(turnos)
+            for id_turno, turno in enumerate(turnos, primero):
+                self.__notificar("agendar_turno", turno, id_turno)
+        return list(range(primero, primero + len(turnos)))
+        
+    def restaurar_turnos_columnas(self, pacientes: list[Paciente], medicos: list[Medico],
+                                  especialidades: list[str], inicios, duraciones, ids=None):
+        """
+        Como restaurar_turnos, con los turnos por columnas y sin crear objetos Turno.
+        
+        Pensado para cargas masivas desde almacenamiento (ver persistencia/binario.py).
+        
+        Args:
+            pacientes (list[Paciente]): Paciente de cada turno
+            medicos (list[Medico]): Médico de cada turno
+            especialidades (list[str]): Especialidad de cada turno
+            inicios (array): Inicio de cada turno, en microsegundos desde EPOCA
+            duraciones (array): Duración de cada turno, en microsegundos
+            ids (array | None): Id de cada turno, en orden creciente (ver restaurar_turno)
+        """
+        if not len(pacientes) == len(medicos) == len(especialidades) == len(inicios) == len(duraciones):
+            raise ValueError("Las columnas de turnos deben tener el mismo largo")
+        if ids is not None and len(ids) != len(inicios):
+            raise ValueError("Las columnas de turnos deben tener el mismo largo")
+        # Cada objeto repetido se valida una sola vez
+        for paciente in set(pacientes):
+            self.validar_existencia_paciente(paciente.obtener_dni())
+        for medico in set(medicos):
+            self.validar_existencia_medico(medico.obtener_matricula())
+        with self.__bloqueo_general:
+            if ids is None:
+                self.__almacen.agregar_turnos_columnas(pacientes, medicos, especialidades, inicios, duraciones)
+                return
+            if len(ids) and ids[-1] - ids[0] == len(ids) - 1:
+                # Bloque sin huecos (el caso habitual): un solo tramo
+                self.__almacen.avanzar_id_turno(ids[0])
+                self.__almacen.agregar_turnos_columnas(pacientes, medicos, especialidades, inicios, duraciones)
+                return
+            # Cada tramo de ids consecutivos se agrega de una vez (los huecos son turnos cancelados)
+            desde = 0
+            for hasta in range(1, len(ids) + 1):
+                if hasta < len(ids) and ids[hasta] == ids[hasta - 1] + 1:
+                    continue
+                self.__almacen.avanzar_id_turno(ids[desde])
+                self.__almacen.agregar_turnos_columnas(pacientes[desde:hasta], medicos[desde:hasta],
+                                                       especialidades[desde:hasta], inicios[desde:hasta],
+                                                       duraciones[desde:hasta])
+                desde = hasta
+        
+    def iter_columnas_turnos(self, tamano: int = 65_536):
+        """
+        Genera los turnos vigentes en orden de id por columnas, sin crear objetos Turno.
+        
+        Yields:
+            tuple: (ids, DNI, matrículas, especialidades, inicios y duraciones en microsegundos)
+        """
+        return self.__almacen.iterar_columnas_turnos(tamano)
+        
+    def iter_turnos_con_id(self):
+        """Genera (id, turno) de los turnos vigentes en orden de id."""
+        return self.__almacen.iterar_turnos_con_id()
+        
+    def obtener_siguiente_id_turno(self) -> int:
+        """Devuelve el id que recibirá el próximo turno."""
+        return self.__almacen.siguiente_id_turno()
+        
+    def avanzar_id_turno(self, siguiente: int):
+        """
+        Hace que el próximo turno reciba el id 'siguiente'.
+        
+        Al recuperar datos guardados evita que un turno nuevo reciba el id de
+        uno cancelado antes de guardarlos.
+        
+        Raises:
+            ValueError: Si ese id ya fue asignado
+        """
+        with self.__bloqueo_general:
+            self.__almacen.avanzar_id_turno(siguiente)
+        
+    def agendar_turno_recurrente(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime,
+                                 repeticiones: int | None = None, hasta: datetime | None = None,
+                                 intervalo: timedelta = SEMANA,
+                                 duracion: timedelta = DURACION_POR_DEFECTO) -> TurnoRecurrente:
+        """
+        Agenda una serie de sesiones periódicas (por ejemplo, todos los lunes a las 10).
+        
+        Se guarda la regla, no un turno por sesión. La serie termina tras
+        'repeticiones' sesiones o antes de la fecha 'hasta' (se indica
+        exactamente uno de los dos). Todas las sesiones deben caer en días en
+        que el médico atiende la especialidad y no superponerse con sus
+        turnos ni con otras series; si alguna falla no se agenda ninguna.
+        
+        Returns:
+            TurnoRecurrente: Serie agendada
+        """
+        if (repeticiones is None) == (hasta is None):
+            raise DatosInvalidosException("Debe indicar la cantidad de sesiones o la fecha de fin, no ambas")
+        if repeticiones is None:
+            if intervalo <= timedelta(0):
+                raise DatosInvalidosException("El intervalo debe ser una cantidad entera de días")
+            repeticiones = repeticiones_hasta(fecha_hora, intervalo, hasta)
+        
+        self.validar_existencia_paciente(dni)
+        self.validar_existencia_medico(matricula)
+        paciente = self.__almacen.obtener_paciente(dni)
+        medico = self.__almacen.obtener_medico(matricula)
+        recurrencia = TurnoRecurrente(paciente, medico, fecha_hora, especialidad, repeticiones, intervalo, duracion)
+        
+        # El intervalo es de días enteros: los días de la semana se repiten cada 7 sesiones
+        for sesion in islice(recurrencia.sesiones(), 7):
+            self.validar_especialidad_en_indice_dia(medico, especialidad, sesion.weekday())
+        
+        with self.__bloqueos_medico.para(matricula):
+            esta_libre = self.__almacen.esta_libre
+            for sesion in recurrencia.sesiones():
+                if not esta_libre(matricula, sesion, sesion + duracion):
+                    raise TurnoOcupadoException(
+                        f"La sesión de {sesion} se superpone con otro turno del médico"
+                    )
+            with self.__bloqueo_general:
+                self.__almacen.agregar_recurrencia(recurrencia)
+                self.__notificar("agendar_turno_recurrente", recurrencia)
+        return recurrencia
+        
+    def cancelar_sesion(self, matricula: str, fecha_hora: datetime):
+        """
+        Cancela la sesión recurrente del médico que empieza en fecha_hora.
+        
+        El resto de la serie se mantiene y el horario queda libre para otro turno.
+        """
+        self.validar_existencia_medico(matricula)
+        with self.__bloqueos_medico.para(matricula):
+            for recurrencia in self.__almacen.obtener_recurrencias_medico(matricula):
+                if recurrencia.es_sesion(fecha_hora):
+                    break
+            else:
+                raise DatosInvalidosException(
+                    f"El médico no tiene una sesión recurrente vigente el {fecha_hora}"
+                )
+            with self.__bloqueo_general:
+                self.__almacen.cancelar_sesion(recurrencia, fecha_hora)
+                self.__notificar("cancelar_sesion", recurrencia, fecha_hora)
+        
+    def restaurar_recurrencia(self, recurrencia: TurnoRecurrente):
+        """
+        Incorpora una serie de turnos recurrentes ya validada (ver restaurar_turno).
+        """
+        self.validar_existencia_paciente(recurrencia.obtener_paciente().obtener_dni())
+        matricula = recurrencia.obtener_medico().obtener_matricula()
+        self.validar_existencia_medico(matricula)
+        with self.__bloqueos_medico.para(matricula), self.__bloqueo_general:
+            self.__almacen.agregar_recurrencia(recurrencia)
+        
+    def obtener_recurrencias(self) -> list[TurnoRecurrente]:
+        """Devuelve todas las series de turnos recurrentes."""
+        return self.__almacen.listar_recurrencias()
+        
+    def obtener_sesiones(self, desde: datetime, hasta: datetime,
+                         matricula: str | None = None) -> list[Turno]:
+        """
+        Devuelve como turnos las sesiones recurrentes que comienzan en [desde, hasta), en orden.
+        
+        Sólo se calculan las sesiones del rango pedido; con matrícula, sólo
+        las de las series de ese médico.
+        """
+        if matricula is None:
+            recurrencias = self.__almacen.listar_recurrencias()
+        else:
+            self.validar_existencia_medico(matricula)
+            recurrencias = self.__almacen.obtener_recurrencias_medico(matricula)
+        return list(merge(
+            *(recurrencia.materializar(desde, hasta) for recurrencia in recurrencias),
+            key=Turno.obtener_fecha_hora,
+        ))
         
     def obtener_turnos(self):
         """Devuelve todos los turnos agendados."""
-        return self.__turnos.copy()
+        return self.__almacen.listar_turnos()
+        
+    def iter_turnos(self, desde: datetime | None = None, hasta: datetime | None = None,
+                    offset: int = 0, limite: int | None = None):
+        """
+        Genera una página de turnos en orden de registro, sin copiar la colección.
+        
+        Args:
+            desde (datetime | None): Sólo turnos que comienzan en o después de esta fecha
+            hasta (datetime | None): Sólo turnos que comienzan antes de esta fecha
+            offset (int): Cantidad de turnos (ya filtrados) a saltear
+            limite (int | None): Máximo de turnos a generar (None: hasta el final)
+        """
+        self.__validar_pagina(offset, limite)
+        return self.__almacen.iterar_turnos(desde, hasta, offset, limite)
+        
+    def obtener_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime):
+        """Devuelve los turnos de un médico que comienzan en [desde, hasta), en orden."""
+        self.validar_existencia_medico(matricula)
+        return self.__almacen.obtener_turnos_medico(matricula, desde, hasta)
+        
+    def contar_turnos(self, matricula: str | None = None, especialidad: str | None = None,
+                      desde: datetime | None = None, hasta: datetime | None = None) -> int:
+        """
+        Cuenta los turnos que cumplen todos los filtros indicados, sin crear los objetos Turno.
+        
+        La especialidad se compara sin distinguir mayúsculas; el rango de
+        fechas es [desde, hasta) sobre el inicio del turno.
+        """
+        return self.__almacen.contar_turnos(matricula, especialidad, desde, hasta)
+        
+    def buscar_turnos_libres(self, especialidad: str, desde: datetime, hasta: datetime,
+                             duracion: timedelta = DURACION_POR_DEFECTO, limite: int | None = None):
+        """
+        Genera los turnos libres de una especialidad entre todos sus médicos.
+        
+        Los horarios se producen en orden cronológico como tuplas
+        (fecha_hora, matrícula), sin armar el calendario completo: cada médico
+        aporta un generador perezoso y se combinan con un heap. Los turnos
+        ofrecidos comienzan en [desde, hasta), se alinean a múltiplos de la
+        duración desde HORA_APERTURA y terminan antes de HORA_CIERRE.
+        """
+        if not especialidad or not especialidad.strip():
+            raise DatosInvalidosException("La especialidad no puede estar vacía")
+        if duracion <= timedelta(0):
+            raise DatosInvalidosException("La duración del turno debe ser positiva")
+        self.__validar_pagina(0, limite)
+        
+        especialidad = especialidad.strip().lower()
+        desde = max(desde, datetime.now())
+        generadores = []
+        for medico in self.__almacen.listar_medicos():
+            dias = frozenset(
+                indice for indice in range(7)
+                if (medico.obtener_especialidad_para_indice_dia(indice) or "").lower() == especialidad
+            )
+            if dias:
+                generadores.append(
+                    self.__generar_huecos(medico.obtener_matricula(), dias, desde, hasta, duracion)
+                )
+        
+        return islice(merge(*generadores), limite)
+        
+    def __generar_huecos(self, matricula: str, dias: frozenset, desde: datetime,
+                         hasta: datetime, duracion: timedelta):
+        """Genera en orden los huecos libres de un médico en los días indicados."""
+        esta_libre = self.__almacen.esta_libre
+        dia = desde.date()
+        while datetime.combine(dia, HORA_APERTURA) < hasta:
+            if dia.weekday() in dias:
+                inicio = datetime.combine(dia, HORA_APERTURA)
+                cierre = datetime.combine(dia, HORA_CIERRE)
+                if inicio < desde:
+                    # Primer múltiplo de la duración que no empiece antes de 'desde'
+                    inicio += -((inicio - desde) // duracion) * duracion
+                while inicio + duracion <= cierre and inicio < hasta:
+                    if esta_libre(matricula, inicio, inicio + duracion):
+                        yield inicio, matricula
+                    inicio += duracion
+            dia += timedelta(days=1)
         
     def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]):
         """Emite una receta para un paciente."""
@@ -99,49 +717,95 @@ class Clinica:
         self.validar_existencia_paciente(dni)
         self.validar_existencia_medico(matricula)
         
-        paciente = self.__pacientes[dni]
-        medico = self.__medicos[matricula]
+        paciente = self.__almacen.obtener_paciente(dni)
+        medico = self.__almacen.obtener_medico(matricula)
         
         # Crear receta
         receta = Receta(paciente, medico, medicamentos)
         
         # Agregar a historia clínica
-        self.__historias_clinicas[dni].agregar_receta(receta)
+        with self.__bloqueo_general:
+            self.__almacen.agregar_receta(receta)
+            self.__notificar("emitir_receta", receta)
+        
+    def restaurar_receta(self, receta: Receta):
+        """Incorpora una receta ya emitida a la historia clínica de su paciente."""
+        dni = receta.obtener_paciente().obtener_dni()
+        self.validar_existencia_paciente(dni)
+        with self.__bloqueo_general:
+            self.__almacen.agregar_receta(receta)
         
     def obtener_historia_clinica(self, dni: str):
         """Devuelve la historia clínica completa de un paciente."""
         self.validar_existencia_paciente(dni)
-        return self.__historias_clinicas[dni]
+        historia = self.__almacen.obtener_historia_en_cache(dni)
+        if historia is None:
+            # Se arma bajo el lock general: un turno agendado entre la lectura de los
+            # registros y el guardado en caché quedaría fuera de la historia
+            with self.__bloqueo_general:
+                historia = self.__almacen.obtener_historia_clinica(dni)
+        return historia
+        
+    def obtener_registros_paciente(self, dni: str) -> tuple[list[Turno], list[Receta], list[TurnoRecurrente]]:
+        """
+        Devuelve turnos, recetas y series del paciente sin armar (ni renderizar) su historia.
+        
+        Returns:
+            tuple: (turnos, recetas, series), cada uno en orden de registro
+        """
+        self.validar_existencia_paciente(dni)
+        return self.__almacen.obtener_registros_paciente(dni)
+        
+    def obtener_registros_columnares(self, dni: str) -> tuple[tuple, list[Receta], list[TurnoRecurrente]]:
+        """
+        Como obtener_registros_paciente, pero con los turnos por columnas y sin crear objetos Turno.
+        
+        Returns:
+            tuple: ((matrículas, especialidades, inicios y duraciones en microsegundos), recetas, series)
+        """
+        self.validar_existencia_paciente(dni)
+        return self.__almacen.obtener_registros_columnares(dni)
+        
+    def iter_recetas(self):
+        """Genera todas las recetas, agrupadas por paciente."""
+        return self.__almacen.iterar_recetas()
+        
+    def obtener_recetas_con_medicamento(self, nombre: str) -> list[Receta]:
+        """Devuelve las recetas que incluyen un medicamento (sin distinguir mayúsculas), por fecha."""
+        return self.__almacen.obtener_recetas_con_medicamento(nombre)
+        
+    def obtener_pacientes_con_medicamento(self, nombre: str) -> list[Paciente]:
+        """Devuelve los pacientes a los que se les recetó un medicamento, por fecha de la primera receta."""
+        pacientes = {}
+        for receta in self.__almacen.obtener_recetas_con_medicamento(nombre):
+            paciente = receta.obtener_paciente()
+            pacientes.setdefault(paciente.obtener_dni(), paciente)
+        return list(pacientes.values())
         
     def validar_existencia_paciente(self, dni: str):
         """Verifica si un paciente está registrado."""
-        if dni not in self.__pacientes:
+        if not self.__almacen.existe_paciente(dni):
             raise PacienteNoEncontradoException(f"No existe paciente con DNI {dni}")
             
     def validar_existencia_medico(self, matricula: str):
         """Verifica si un médico está registrado."""
-        if matricula not in self.__medicos:
+        if not self.__almacen.existe_medico(matricula):
             raise MedicoNoDisponibleException(f"No existe médico con matrícula {matricula}")
             
-    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime):
-        """Verifica que no haya un turno duplicado."""
-        for turno in self.__turnos:
-            if (turno.obtener_medico().obtener_matricula() == matricula and 
-                turno.obtener_fecha_hora() == fecha_hora):
-                raise TurnoOcupadoException(f"El médico ya tiene un turno agendado para {fecha_hora}")
+    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime,
+                                   duracion: timedelta = DURACION_POR_DEFECTO):
+        """Verifica que el turno no coincida ni se superponga con otro del mismo médico."""
+        if self.__almacen.existe_turno(matricula, fecha_hora):
+            raise TurnoOcupadoException(f"El médico ya tiene un turno agendado para {fecha_hora}")
+        
+        if not self.__almacen.esta_libre(matricula, fecha_hora, fecha_hora + duracion):
+            raise TurnoOcupadoException(
+                f"El turno de {fecha_hora} se superpone con otro turno del médico"
+            )
                 
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
         """Traduce un objeto datetime al día de la semana en español."""
-        dias = {
-            0: 'lunes',
-            1: 'martes', 
-            2: 'miércoles',
-            3: 'jueves',
-            4: 'viernes',
-            5: 'sábado',
-            6: 'domingo'
-        }
-        return dias[fecha_hora.weekday()]
+        return DIAS_SEMANA[fecha_hora.weekday()]
         
     def obtener_especialidad_disponible(self, medico: Medico, dia_semana: str) -> str:
         """Obtiene la especialidad disponible para un médico en un día."""
@@ -149,13 +813,20 @@ class Clinica:
         
     def validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada: str, dia_semana: str):
         """Verifica que el médico atienda esa especialidad ese día."""
-        especialidad_disponible = medico.obtener_especialidad_para_dia(dia_semana)
+        indice = INDICE_DIA_SEMANA.get(dia_semana.lower().strip())
+        if indice is None:
+            raise MedicoNoDisponibleException(f"El médico no atiende los días {dia_semana}")
+        self.validar_especialidad_en_indice_dia(medico, especialidad_solicitada, indice)
+        
+    def validar_especialidad_en_indice_dia(self, medico: Medico, especialidad_solicitada: str, indice_dia: int):
+        """Verifica que el médico atienda esa especialidad el día dado por datetime.weekday()."""
+        especialidad_disponible = medico.obtener_especialidad_para_indice_dia(indice_dia)
         
         if especialidad_disponible is None:
-            raise MedicoNoDisponibleException(f"El médico no atiende los días {dia_semana}")
+            raise MedicoNoDisponibleException(f"El médico no atiende los días {DIAS_SEMANA[indice_dia]}")
             
         if especialidad_disponible.lower() != especialidad_solicitada.lower():
             raise MedicoNoDisponibleException(
-                f"El médico no atiende {especialidad_solicitada} los días {dia_semana}. "
+                f"El médico no atiende {especialidad_solicitada} los días {DIAS_SEMANA[indice_dia]}. "
                 f"Atiende {especialidad_disponible}"
             )
\ No newline at end of file
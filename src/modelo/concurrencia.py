@@ -0,0 +1,87 @@
+"""
+Bloqueos para usar la clínica desde varios hilos.
+"""
+import threading
+from contextlib import ExitStack, nullcontext
+
+
+# Cantidad de locks entre los que se reparten los médicos
+FRANJAS_POR_DEFECTO = 64
+
+
+class BloqueosPorClave:
+    """
+    Conjunto fijo de locks repartidos por hash de la clave (lock striping).
+
+    Dos claves comparten lock sólo si caen en la misma franja, de modo que
+    las operaciones sobre claves distintas casi nunca se esperan entre sí y
+    la memoria usada no crece con la cantidad de claves.
+
+    Atributos privados:
+        __locks (list[threading.Lock]): Un lock por franja
+    """
+
+    def __init__(self, franjas: int = FRANJAS_POR_DEFECTO):
+        """
+        Crea los locks.
+
+        Args:
+            franjas (int): Cantidad de locks
+
+        Raises:
+            ValueError: Si la cantidad de franjas no es positiva
+        """
+        if franjas < 1:
+            raise ValueError("La cantidad de franjas debe ser positiva")
+        self.__locks = [threading.Lock() for _ in range(franjas)]
+
+    def para(self, clave: str) -> threading.Lock:
+        """
+        Devuelve el lock que protege una clave.
+
+        Args:
+            clave (str): Clave a proteger (por ejemplo, una matrícula)
+
+        Returns:
+            threading.Lock: Lock de la franja de la clave
+        """
+        return self.__locks[hash(clave) % len(self.__locks)]
+
+    def para_varias(self, claves) -> ExitStack:
+        """
+        Toma los locks de varias claves y los devuelve como un único contexto.
+
+        Cada franja se toma una sola vez y siempre en el mismo orden (por
+        número de franja), así dos hilos que piden conjuntos superpuestos no
+        se bloquean mutuamente.
+
+        Args:
+            claves (Iterable[str]): Claves a proteger
+
+        Returns:
+            ExitStack: Contexto que libera los locks al salir
+        """
+        franjas = sorted({hash(clave) % len(self.__locks) for clave in claves})
+        pila = ExitStack()
+        try:
+            for franja in franjas:
+                pila.enter_context(self.__locks[franja])
+        except BaseException:
+            pila.close()
+            raise
+        return pila
+
+
+class SinBloqueos:
+    """Reemplazo de BloqueosPorClave para el uso desde un único hilo: no bloquea."""
+
+    def __init__(self):
+        self.__contexto = nullcontext()
+
+    def para(self, clave: str) -> nullcontext:
+        """Devuelve un contexto vacío para cualquier clave."""
+        return self.__contexto
+
+    def para_varias(self, claves) -> nullcontext:
+        """Devuelve un contexto vacío para cualquier conjunto de claves."""
+        return self.__contexto
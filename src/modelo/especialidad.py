@@ -4,6 +4,11 @@ Clase Especialidad para el sistema de gestión de clínica.
 from .excepciones import DatosInvalidosException
 
 
+# Días de atención indexados igual que datetime.weekday() (lunes = 0)
+DIAS_SEMANA = ('lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo')
+INDICE_DIA_SEMANA = {dia: indice for indice, dia in enumerate(DIAS_SEMANA)}
+
+
 class Especialidad:
     """
     Representa una especialidad médica junto con los días de atención.
@@ -11,8 +16,11 @@ class Especialidad:
     Atributos privados:
         __tipo (str): Nombre de la especialidad
         __dias (list[str]): Lista de días de atención en minúsculas
+        __indices_dias (tuple[int]): Días de atención como índices de weekday()
     """
     
+    __slots__ = ("__tipo", "__dias", "__indices_dias")
+    
     def __init__(self, tipo: str, dias: list[str]):
         """
         Inicializa una nueva especialidad.
@@ -27,6 +35,7 @@ class Especialidad:
         self._validar_datos(tipo, dias)
         self.__tipo = tipo.strip()
         self.__dias = [dia.lower().strip() for dia in dias]
+        self.__indices_dias = tuple(INDICE_DIA_SEMANA[dia] for dia in self.__dias)
     
     def _validar_datos(self, tipo: str, dias: list[str]) -> None:
         """
@@ -45,9 +54,8 @@ class Especialidad:
         if not dias or len(dias) == 0:
             raise DatosInvalidosException("Debe especificar al menos un día de atención")
         
-        dias_validos = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
         for dia in dias:
-            if dia.lower().strip() not in dias_validos:
+            if dia.lower().strip() not in INDICE_DIA_SEMANA:
                 raise DatosInvalidosException(f"'{dia}' no es un día válido")
         
         # Verificar que no haya días duplicados
@@ -64,6 +72,15 @@ class Especialidad:
         """
         return self.__tipo
     
+    def obtener_dias(self) -> list[str]:
+        """
+        Devuelve una copia de los días de atención.
+        
+        Returns:
+            list[str]: Días de atención en minúsculas
+        """
+        return self.__dias.copy()
+    
     def verificar_dia(self, dia: str) -> bool:
         """
         Verifica si la especialidad está disponible en el día proporcionado.
@@ -76,6 +93,15 @@ class Especialidad:
         """
         return dia.lower().strip() in self.__dias
     
+    def obtener_indices_dias(self) -> tuple[int, ...]:
+        """
+        Devuelve los días de atención como índices de datetime.weekday().
+        
+        Returns:
+            tuple[int, ...]: Índices de los días (lunes = 0, domingo = 6)
+        """
+        return self.__indices_dias
+    
     def __str__(self) -> str:
         """
         Representación legible de la especialidad.
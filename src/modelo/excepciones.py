@@ -23,6 +23,11 @@ class TurnoOcupadoException(Exception):
     pass
 
 
+class TurnoNoEncontradoException(Exception):
+    """Excepción lanzada cuando un turno no existe o fue cancelado."""
+    pass
+
+
 class RecetaInvalidaException(Exception):
     """Excepción lanzada cuando los datos de una receta son inválidos."""
     pass
@@ -1,9 +1,13 @@
 """
 Clase HistoriaClinica para el sistema de gestión de clínica.
 """
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from heapq import merge
 from .paciente import Paciente
 from .turno import Turno
 from .receta import Receta
+from .recurrencia import TurnoRecurrente
 from .excepciones import DatosInvalidosException
 
 
@@ -11,12 +15,38 @@ class HistoriaClinica:
     """
     Almacena la información médica de un paciente: turnos y recetas.
     
+    El texto de cada turno y receta se genera una sola vez, al agregarlo,
+    y se guarda sin numerar; mostrar la historia sólo une esas líneas.
+    
+    Turnos y recetas se mantienen ordenados por fecha (a igual fecha, en
+    orden de registro), junto con una lista paralela de fechas sobre la que
+    las consultas por rango usan búsqueda binaria.
+    
+    Las series de turnos recurrentes se guardan como reglas: sus sesiones
+    se calculan sólo para el rango que se consulta (ver obtener_agenda).
+    
     Atributos privados:
         __paciente (Paciente): Paciente al que pertenece la historia clínica
-        __turnos (list[Turno]): Lista de turnos agendados del paciente
-        __recetas (list[Receta]): Lista de recetas emitidas para el paciente
+        __turnos (list[Turno]): Turnos del paciente, ordenados por fecha y hora
+        __recetas (list[Receta]): Recetas del paciente, ordenadas por fecha
+        __fechas_turnos (list[datetime]): Fecha y hora de cada turno, alineada con __turnos
+        __fechas_recetas (list[datetime]): Fecha de cada receta, alineada con __recetas
+        __lineas_turnos (list[str]): Texto de cada turno, alineado con __turnos
+        __lineas_recetas (list[str]): Texto de cada receta, alineado con __recetas
+        __recurrencias (list[TurnoRecurrente]): Series de turnos recurrentes del paciente
     """
     
+    __slots__ = (
+        "__paciente",
+        "__turnos",
+        "__recetas",
+        "__fechas_turnos",
+        "__fechas_recetas",
+        "__lineas_turnos",
+        "__lineas_recetas",
+        "__recurrencias",
+    )
+    
     def __init__(self, paciente: Paciente):
         """
         Inicializa una nueva historia clínica.
@@ -33,10 +63,15 @@ class HistoriaClinica:
         self.__paciente = paciente
         self.__turnos = []
         self.__recetas = []
+        self.__fechas_turnos = []
+        self.__fechas_recetas = []
+        self.__lineas_turnos = []
+        self.__lineas_recetas = []
+        self.__recurrencias = []
     
     def agregar_turno(self, turno: Turno) -> None:
         """
-        Agrega un nuevo turno a la historia clínica.
+        Agrega un nuevo turno a la historia clínica, en su lugar según la fecha.
         
         Args:
             turno (Turno): Turno a agregar
@@ -47,11 +82,40 @@ class HistoriaClinica:
         if turno is None:
             raise DatosInvalidosException("El turno no puede ser None")
         
-        self.__turnos.append(turno)
+        fecha_hora = turno.obtener_fecha_hora()
+        i = bisect_right(self.__fechas_turnos, fecha_hora)
+        self.__fechas_turnos.insert(i, fecha_hora)
+        self.__turnos.insert(i, turno)
+        self.__lineas_turnos.insert(i, str(turno))
+    
+    def quitar_turno(self, turno: Turno) -> None:
+        """
+        Quita un turno (cancelado o reprogramado) de la historia clínica.
+        
+        El turno se busca por su fecha y hora y su médico, con búsqueda
+        binaria sobre las fechas: no hace falta que sea el mismo objeto.
+        
+        Args:
+            turno (Turno): Turno a quitar
+            
+        Raises:
+            DatosInvalidosException: Si el turno no está en la historia clínica
+        """
+        fecha_hora = turno.obtener_fecha_hora()
+        matricula = turno.obtener_medico().obtener_matricula()
+        i = bisect_left(self.__fechas_turnos, fecha_hora)
+        j = bisect_right(self.__fechas_turnos, fecha_hora, i)
+        for k in range(i, j):
+            if self.__turnos[k].obtener_medico().obtener_matricula() == matricula:
+                del self.__fechas_turnos[k]
+                del self.__turnos[k]
+                del self.__lineas_turnos[k]
+                return
+        raise DatosInvalidosException(f"La historia clínica no tiene un turno el {fecha_hora}")
     
     def agregar_receta(self, receta: Receta) -> None:
         """
-        Agrega una receta médica a la historia clínica.
+        Agrega una receta médica a la historia clínica, en su lugar según la fecha.
         
         Args:
             receta (Receta): Receta a agregar
@@ -62,47 +126,213 @@ class HistoriaClinica:
         if receta is None:
             raise DatosInvalidosException("La receta no puede ser None")
         
-        self.__recetas.append(receta)
+        fecha = receta.obtener_fecha()
+        i = bisect_right(self.__fechas_recetas, fecha)
+        self.__fechas_recetas.insert(i, fecha)
+        self.__recetas.insert(i, receta)
+        self.__lineas_recetas.insert(i, str(receta))
+    
+    def agregar_recurrencia(self, recurrencia: TurnoRecurrente) -> None:
+        """
+        Agrega una serie de turnos recurrentes a la historia clínica.
+        
+        Args:
+            recurrencia (TurnoRecurrente): Serie a agregar
+            
+        Raises:
+            DatosInvalidosException: Si la serie es None
+        """
+        if recurrencia is None:
+            raise DatosInvalidosException("La serie de turnos no puede ser None")
+        
+        self.__recurrencias.append(recurrencia)
+    
+    def obtener_paciente(self) -> Paciente:
+        """
+        Devuelve el paciente dueño de la historia clínica.
+        
+        Returns:
+            Paciente: Paciente de la historia clínica
+        """
+        return self.__paciente
     
     def obtener_turnos(self) -> list[Turno]:
         """
         Devuelve una copia de la lista de turnos del paciente.
         
         Returns:
-            list[Turno]: Copia de la lista de turnos
+            list[Turno]: Copia de la lista de turnos, ordenada por fecha y hora
         """
         return self.__turnos.copy()
     
+    def obtener_turnos_entre(self, desde: datetime | None = None,
+                             hasta: datetime | None = None) -> list[Turno]:
+        """
+        Devuelve los turnos que comienzan dentro de un rango de fechas.
+        
+        Args:
+            desde (datetime | None): Incluir turnos de esta fecha en adelante (sin límite si es None)
+            hasta (datetime | None): Incluir turnos anteriores a esta fecha (sin límite si es None)
+            
+        Returns:
+            list[Turno]: Turnos del rango, ordenados por fecha y hora
+        """
+        return self.__turnos[slice(*self.__rango(self.__fechas_turnos, desde, hasta))]
+    
+    def obtener_ultimos_turnos(self, cantidad: int) -> list[Turno]:
+        """
+        Devuelve los turnos más recientes según su fecha y hora.
+        
+        Args:
+            cantidad (int): Cantidad máxima de turnos a devolver
+            
+        Returns:
+            list[Turno]: Últimos turnos, del más antiguo al más reciente
+            
+        Raises:
+            DatosInvalidosException: Si cantidad es negativa
+        """
+        return self.__turnos[self.__desde_ultimos(len(self.__turnos), cantidad):]
+    
+    def obtener_recurrencias(self) -> list[TurnoRecurrente]:
+        """
+        Devuelve una copia de la lista de series de turnos recurrentes del paciente.
+        
+        Returns:
+            list[TurnoRecurrente]: Series en orden de registro
+        """
+        return self.__recurrencias.copy()
+    
+    def obtener_agenda(self, desde: datetime, hasta: datetime) -> list[Turno]:
+        """
+        Devuelve los turnos del rango, incluidas las sesiones de las series recurrentes.
+        
+        Las sesiones se crean como objetos Turno sólo para el rango pedido.
+        
+        Args:
+            desde (datetime): Incluir turnos de esta fecha en adelante
+            hasta (datetime): Incluir turnos anteriores a esta fecha
+            
+        Returns:
+            list[Turno]: Turnos y sesiones del rango, ordenados por fecha y hora
+        """
+        return list(merge(
+            self.obtener_turnos_entre(desde, hasta),
+            *(recurrencia.materializar(desde, hasta) for recurrencia in self.__recurrencias),
+            key=Turno.obtener_fecha_hora,
+        ))
+    
     def obtener_recetas(self) -> list[Receta]:
         """
         Devuelve una copia de la lista de recetas del paciente.
         
         Returns:
-            list[Receta]: Copia de la lista de recetas
+            list[Receta]: Copia de la lista de recetas, ordenada por fecha
         """
         return self.__recetas.copy()
     
-    def __str__(self) -> str:
+    def obtener_recetas_entre(self, desde: datetime | None = None,
+                              hasta: datetime | None = None) -> list[Receta]:
         """
-        Representación textual de la historia clínica.
+        Devuelve las recetas emitidas dentro de un rango de fechas.
         
+        Args:
+            desde (datetime | None): Incluir recetas de esta fecha en adelante (sin límite si es None)
+            hasta (datetime | None): Incluir recetas anteriores a esta fecha (sin límite si es None)
+            
         Returns:
-            str: Historia clínica completa incluyendo turnos y recetas
+            list[Receta]: Recetas del rango, ordenadas por fecha
         """
-        resultado = f"=== Historia Clínica de {self.__paciente} ===\n\n"
+        return self.__recetas[slice(*self.__rango(self.__fechas_recetas, desde, hasta))]
+    
+    def obtener_ultimas_recetas(self, cantidad: int) -> list[Receta]:
+        """
+        Devuelve las recetas más recientes según su fecha.
         
-        resultado += f"TURNOS ({len(self.__turnos)}):\n"
-        if self.__turnos:
-            for i, turno in enumerate(self.__turnos, 1):
-                resultado += f"{i}. {turno}\n"
-        else:
-            resultado += "No hay turnos registrados.\n"
+        Args:
+            cantidad (int): Cantidad máxima de recetas a devolver
+            
+        Returns:
+            list[Receta]: Últimas recetas, de la más antigua a la más reciente
+            
+        Raises:
+            DatosInvalidosException: Si cantidad es negativa
+        """
+        return self.__recetas[self.__desde_ultimos(len(self.__recetas), cantidad):]
+    
+    @staticmethod
+    def __rango(fechas: list, desde: datetime | None, hasta: datetime | None) -> tuple:
+        """Devuelve los índices (i, j) de las fechas en [desde, hasta)."""
+        i = 0 if desde is None else bisect_left(fechas, desde)
+        j = len(fechas) if hasta is None else bisect_left(fechas, hasta)
+        return i, max(i, j)
+    
+    @staticmethod
+    def __desde_ultimos(total: int, cantidad: int) -> int:
+        """Devuelve el índice del primero de los últimos 'cantidad' registros."""
+        if cantidad < 0:
+            raise DatosInvalidosException("La cantidad de registros no puede ser negativa")
+        return max(0, total - cantidad)
+    
+    def renderizar(self, ultimos: int | None = None, desde: datetime | None = None,
+                   hasta: datetime | None = None) -> str:
+        """
+        Representación textual de la historia clínica, completa o parcial.
+        
+        Los filtros se aplican a cada sección por separado; los registros
+        conservan el número (orden cronológico) que tienen en la historia completa.
+        
+        Args:
+            ultimos (int | None): Mostrar sólo los últimos N turnos y N recetas
+            desde (datetime | None): Mostrar sólo registros de esta fecha en adelante
+            hasta (datetime | None): Mostrar sólo registros anteriores a esta fecha
+            
+        Returns:
+            str: Historia clínica con los turnos y recetas seleccionados
+            
+        Raises:
+            DatosInvalidosException: Si ultimos es negativo
+        """
+        partes = [f"=== Historia Clínica de {self.__paciente} ===\n\n"]
+        self.__renderizar_seccion(
+            partes, "TURNOS", "No hay turnos registrados.", self.__lineas_turnos,
+            self.__fechas_turnos, ultimos, desde, hasta
+        )
+        partes.append("\n")
+        self.__renderizar_seccion(
+            partes, "RECETAS", "No hay recetas registradas.", self.__lineas_recetas,
+            self.__fechas_recetas, ultimos, desde, hasta
+        )
+        if self.__recurrencias:
+            # Las series se muestran completas (pocas y con cancelaciones que cambian su texto)
+            partes.append(f"\nTURNOS RECURRENTES ({len(self.__recurrencias)}):\n")
+            partes.extend(f"{i}. {recurrencia}\n" for i, recurrencia in enumerate(self.__recurrencias, 1))
+        return "".join(partes)
+    
+    @classmethod
+    def __renderizar_seccion(cls, partes: list, titulo: str, vacia: str, lineas: list, fechas: list,
+                             ultimos: int | None, desde: datetime | None,
+                             hasta: datetime | None) -> None:
+        """Agrega a partes el encabezado y las líneas seleccionadas de una sección."""
+        i, j = cls.__rango(fechas, desde, hasta)
+        if ultimos is not None:
+            i = max(i, cls.__desde_ultimos(j, ultimos))
+        indices = range(i, j)
         
-        resultado += f"\nRECETAS ({len(self.__recetas)}):\n"
-        if self.__recetas:
-            for i, receta in enumerate(self.__recetas, 1):
-                resultado += f"{i}. {receta}\n"
+        if len(indices) == len(lineas):
+            partes.append(f"{titulo} ({len(lineas)}):\n")
         else:
-            resultado += "No hay recetas registradas.\n"
+            partes.append(f"{titulo} ({len(indices)} de {len(lineas)}):\n")
+        if indices:
+            partes.extend(f"{i + 1}. {lineas[i]}\n" for i in indices)
+        else:
+            partes.append(f"{vacia}\n")
+    
+    def __str__(self) -> str:
+        """
+        Representación textual de la historia clínica.
         
-        return resultado
\ No newline at end of file
+        Returns:
+            str: Historia clínica completa incluyendo turnos y recetas
+        """
+        return self.renderizar()
@@ -0,0 +1,83 @@
+"""
+Catálogo de medicamentos para el sistema de gestión de clínica.
+
+Cada nombre de medicamento se guarda una sola vez y se identifica con un
+entero pequeño; las recetas guardan esos enteros en lugar de una lista de
+cadenas propia, y los índices por medicamento usan el mismo id.
+"""
+import threading
+from .tabla_simbolos import TablaSimbolos
+
+
+class CatalogoMedicamentos:
+    """
+    Nombres de medicamentos internados (nombre -> id entero).
+
+    Los nombres se guardan tal como se recetaron (sin espacios al borde); las
+    búsquedas por nombre no distinguen mayúsculas, por lo que un mismo
+    nombre puede corresponder a varios ids ("Aspirina" y "aspirina").
+
+    Atributos privados:
+        __simbolos (TablaSimbolos): Nombre -> id
+        __por_clave (dict[str, list[int]]): Nombre en minúsculas -> ids
+        __bloqueo (threading.Lock): Serializa el alta de nombres nuevos
+    """
+
+    __slots__ = ("__simbolos", "__por_clave", "__bloqueo")
+
+    def __init__(self):
+        """Inicializa un catálogo vacío."""
+        self.__simbolos = TablaSimbolos()
+        self.__por_clave = {}
+        self.__bloqueo = threading.Lock()
+
+    def internar(self, nombre: str) -> int:
+        """
+        Devuelve el id del medicamento, registrándolo si es nuevo.
+
+        Args:
+            nombre (str): Nombre del medicamento, ya sin espacios al borde
+
+        Returns:
+            int: Id del medicamento
+        """
+        id_medicamento = self.__simbolos.obtener_id(nombre)
+        if id_medicamento is None:
+            with self.__bloqueo:
+                nuevo = len(self.__simbolos)
+                id_medicamento = self.__simbolos.internar(nombre)
+                if id_medicamento == nuevo:
+                    self.__por_clave.setdefault(nombre.lower(), []).append(id_medicamento)
+        return id_medicamento
+
+    def obtener_nombre(self, id_medicamento: int) -> str:
+        """
+        Devuelve el nombre de un medicamento.
+
+        Args:
+            id_medicamento (int): Id del medicamento
+
+        Returns:
+            str: Nombre registrado
+        """
+        return self.__simbolos.obtener(id_medicamento)
+
+    def buscar(self, nombre: str) -> list[int]:
+        """
+        Devuelve los ids de los medicamentos con ese nombre, sin distinguir mayúsculas.
+
+        Args:
+            nombre (str): Nombre a buscar
+
+        Returns:
+            list[int]: Ids encontrados (vacía si nunca se recetó)
+        """
+        return list(self.__por_clave.get(nombre.strip().lower(), ()))
+
+    def __len__(self) -> int:
+        """Cantidad de nombres registrados."""
+        return len(self.__simbolos)
+
+
+# Catálogo compartido por todas las recetas del proceso
+CATALOGO_MEDICAMENTOS = CatalogoMedicamentos()
@@ -1,7 +1,7 @@
 """
 Clase Medico para el sistema de gestión de clínica.
 """
-from .especialidad import Especialidad
+from .especialidad import Especialidad, INDICE_DIA_SEMANA
 from .excepciones import DatosInvalidosException, EspecialidadDuplicadaException
 
 
@@ -13,8 +13,19 @@ class Medico:
         __nombre (str): Nombre completo del médico
         __matricula (str): Matrícula profesional (clave única)
         __especialidades (list[Especialidad]): Lista de especialidades
+        __especialidad_por_dia (list[str | None]): Especialidad que atiende cada
+            día, indexada por datetime.weekday()
+        __observador (callable | None): Función notificada al agregar una especialidad
     """
     
+    __slots__ = (
+        "__nombre",
+        "__matricula",
+        "__especialidades",
+        "__especialidad_por_dia",
+        "__observador",
+    )
+    
     def __init__(self, nombre: str, matricula: str):
         """
         Inicializa un nuevo médico.
@@ -30,6 +41,8 @@ class Medico:
         self.__nombre = nombre.strip()
         self.__matricula = matricula.strip()
         self.__especialidades = []
+        self.__especialidad_por_dia = [None] * 7
+        self.__observador = None
     
     def _validar_datos(self, nombre: str, matricula: str) -> None:
         """
@@ -70,6 +83,25 @@ class Medico:
                 )
         
         self.__especialidades.append(especialidad)
+        
+        # Si dos especialidades comparten un día, vale la agregada primero
+        nombre = especialidad.obtener_especialidad()
+        for indice in especialidad.obtener_indices_dias():
+            if self.__especialidad_por_dia[indice] is None:
+                self.__especialidad_por_dia[indice] = nombre
+        
+        if self.__observador is not None:
+            self.__observador(self, especialidad)
+    
+    def establecer_observador(self, observador) -> None:
+        """
+        Registra la función a notificar cada vez que se agrega una especialidad.
+        
+        Args:
+            observador (callable | None): Función que recibe (medico, especialidad),
+                o None para dejar de notificar
+        """
+        self.__observador = observador
     
     def obtener_matricula(self) -> str:
         """
@@ -80,6 +112,24 @@ class Medico:
         """
         return self.__matricula
     
+    def obtener_nombre(self) -> str:
+        """
+        Devuelve el nombre completo del médico.
+        
+        Returns:
+            str: Nombre del médico
+        """
+        return self.__nombre
+    
+    def obtener_especialidades(self) -> list[Especialidad]:
+        """
+        Devuelve una copia de la lista de especialidades del médico.
+        
+        Returns:
+            list[Especialidad]: Especialidades en el orden en que se agregaron
+        """
+        return self.__especialidades.copy()
+    
     def obtener_especialidad_para_dia(self, dia: str) -> str | None:
         """
         Devuelve el nombre de la especialidad disponible en el día especificado.
@@ -90,10 +140,22 @@ class Medico:
         Returns:
             str | None: Nombre de la especialidad o None si no atiende ese día
         """
-        for especialidad in self.__especialidades:
-            if especialidad.verificar_dia(dia):
-                return especialidad.obtener_especialidad()
-        return None
+        indice = INDICE_DIA_SEMANA.get(dia.lower().strip())
+        if indice is None:
+            return None
+        return self.__especialidad_por_dia[indice]
+    
+    def obtener_especialidad_para_indice_dia(self, indice: int) -> str | None:
+        """
+        Devuelve la especialidad disponible para un día dado por su índice.
+        
+        Args:
+            indice (int): Día de la semana según datetime.weekday() (lunes = 0)
+            
+        Returns:
+            str | None: Nombre de la especialidad o None si no atiende ese día
+        """
+        return self.__especialidad_por_dia[indice]
     
     def __str__(self) -> str:
         """
@@ -0,0 +1,208 @@
+"""
+Métricas de las operaciones de la clínica: llamadas, latencias y errores.
+
+La instrumentación es opcional. Mientras está desactivada los métodos de la
+clínica son los de la clase, sin ningún envoltorio ni verificación. Al
+activarla, instrumentar() reemplaza en la instancia cada método indicado por
+una envoltura que mide su duración y cuenta las excepciones por tipo.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+
+# Límites superiores (en segundos) de los intervalos del histograma de latencias
+LIMITES_LATENCIA = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class _MetricasOperacion:
+    """Acumuladores de una operación: histograma, suma de latencias y errores por tipo."""
+
+    __slots__ = ("cubetas", "segundos", "errores")
+
+    def __init__(self):
+        # Una cubeta por límite más la de +Inf
+        self.cubetas = [0] * (len(LIMITES_LATENCIA) + 1)
+        self.segundos = 0.0
+        self.errores = {}
+
+
+class Metricas:
+    """
+    Registro de métricas por operación, seguro para usar desde varios hilos.
+
+    Atributos privados:
+        __operaciones (dict[str, _MetricasOperacion]): Operación -> acumuladores
+        __bloqueo (threading.Lock): Protege las actualizaciones
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self.__operaciones = {}
+        self.__bloqueo = threading.Lock()
+
+    def registrar(self, operacion: str, segundos: float, error: BaseException | None = None) -> None:
+        """
+        Registra una llamada a una operación.
+
+        Args:
+            operacion (str): Nombre de la operación
+            segundos (float): Duración de la llamada
+            error (BaseException | None): Excepción que lanzó, si falló
+        """
+        cubeta = bisect_left(LIMITES_LATENCIA, segundos)
+        with self.__bloqueo:
+            metricas = self.__operaciones.get(operacion)
+            if metricas is None:
+                metricas = self.__operaciones[operacion] = _MetricasOperacion()
+            metricas.cubetas[cubeta] += 1
+            metricas.segundos += segundos
+            if error is not None:
+                tipo = type(error).__name__
+                metricas.errores[tipo] = metricas.errores.get(tipo, 0) + 1
+
+    @contextmanager
+    def medir(self, operacion: str):
+        """
+        Contexto que registra la duración del bloque y, si lanza, el tipo de excepción.
+
+        Args:
+            operacion (str): Nombre con el que se registra el bloque
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self.registrar(operacion, time.perf_counter() - inicio, e)
+            raise
+        self.registrar(operacion, time.perf_counter() - inicio)
+
+    def envolver(self, operacion: str, funcion):
+        """
+        Devuelve una versión de la función que registra cada llamada como 'operacion'.
+
+        Args:
+            operacion (str): Nombre de la operación
+            funcion (callable): Función o método ligado a medir
+
+        Returns:
+            callable: Envoltura con la misma firma
+        """
+        registrar = self.registrar
+        reloj = time.perf_counter
+
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = funcion(*args, **kwargs)
+            except BaseException as e:
+                registrar(operacion, reloj() - inicio, e)
+                raise
+            registrar(operacion, reloj() - inicio)
+            return resultado
+
+        return envoltura
+
+    def instantanea(self) -> dict:
+        """
+        Devuelve una copia de las métricas acumuladas.
+
+        Returns:
+            dict: Operación -> {"llamadas", "errores", "segundos_total",
+                  "errores_por_tipo", "histograma"}, donde el histograma es una
+                  lista de (límite en segundos, llamadas acumuladas hasta ese límite)
+                  que termina en (inf, llamadas)
+        """
+        with self.__bloqueo:
+            copia = {
+                operacion: (list(m.cubetas), m.segundos, dict(m.errores))
+                for operacion, m in self.__operaciones.items()
+            }
+        resultado = {}
+        for operacion, (cubetas, segundos, errores) in sorted(copia.items()):
+            acumulado, histograma = 0, []
+            for limite, cantidad in zip(LIMITES_LATENCIA + (float("inf"),), cubetas):
+                acumulado += cantidad
+                histograma.append((limite, acumulado))
+            resultado[operacion] = {
+                "llamadas": acumulado,
+                "errores": sum(errores.values()),
+                "segundos_total": segundos,
+                "errores_por_tipo": errores,
+                "histograma": histograma,
+            }
+        return resultado
+
+    def reiniciar(self) -> None:
+        """Descarta las métricas acumuladas."""
+        with self.__bloqueo:
+            self.__operaciones = {}
+
+    def exportar_prometheus(self) -> str:
+        """
+        Devuelve las métricas en el formato de texto de Prometheus.
+
+        Returns:
+            str: Histograma clinica_operacion_segundos y contadores de llamadas y errores
+        """
+        instantanea = self.instantanea()
+        lineas = [
+            "# HELP clinica_operacion_segundos Duración de las operaciones de la clínica.",
+            "# TYPE clinica_operacion_segundos histogram",
+        ]
+        for operacion, datos in instantanea.items():
+            for limite, acumulado in datos["histograma"]:
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                lineas.append(f'clinica_operacion_segundos_bucket{{operacion="{operacion}",le="{le}"}} {acumulado}')
+            lineas.append(f'clinica_operacion_segundos_sum{{operacion="{operacion}"}} {datos["segundos_total"]!r}')
+            lineas.append(f'clinica_operacion_segundos_count{{operacion="{operacion}"}} {datos["llamadas"]}')
+        lineas += [
+            "# HELP clinica_operacion_errores_total Operaciones que terminaron con una excepción, por tipo.",
+            "# TYPE clinica_operacion_errores_total counter",
+        ]
+        for operacion, datos in instantanea.items():
+            for tipo, cantidad in sorted(datos["errores_por_tipo"].items()):
+                lineas.append(
+                    f'clinica_operacion_errores_total{{operacion="{operacion}",excepcion="{tipo}"}} {cantidad}'
+                )
+        return "\n".join(lineas) + "\n"
+
+    def guardar_prometheus(self, ruta: str) -> None:
+        """
+        Escribe las métricas en formato Prometheus en un archivo local.
+
+        El archivo se reemplaza de forma atómica, así que un recolector
+        (por ejemplo, el textfile collector de node_exporter) nunca lee uno a medias.
+
+        Args:
+            ruta (str): Archivo de destino
+        """
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.exportar_prometheus())
+        os.replace(temporal, ruta)
+
+
+def instrumentar(objeto, metricas: Metricas | None, operaciones) -> None:
+    """
+    Activa o desactiva la medición de los métodos indicados de un objeto.
+
+    Con métricas, cada método se reemplaza en la instancia por su envoltura;
+    con None se quitan las envolturas y vuelven a usarse los de la clase.
+
+    Args:
+        objeto: Instancia cuyos métodos se miden
+        metricas (Metricas | None): Registro destino, o None para desactivar
+        operaciones (Iterable[str]): Nombres de los métodos a medir
+    """
+    for nombre in operaciones:
+        vars(objeto).pop(nombre, None)
+        if metricas is not None:
+            setattr(objeto, nombre, metricas.envolver(nombre, getattr(objeto, nombre)))
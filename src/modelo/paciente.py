@@ -1,10 +1,55 @@
 """
 Clase Paciente para el sistema de gestión de clínica.
 """
-from datetime import datetime
+import re
+from datetime import date
 from .excepciones import DatosInvalidosException
 
 
+# dd/mm/aaaa; como strptime("%d/%m/%Y"), acepta día y mes de un solo dígito
+_PATRON_FECHA = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})")
+
+
+def parsear_fecha_nacimiento(texto: str) -> date:
+    """
+    Convierte una fecha en formato dd/mm/aaaa en un objeto date.
+    
+    Reemplaza a datetime.strptime, que es lento y toma un lock de locale:
+    una expresión regular separa los campos y date() valida el calendario
+    (meses, días por mes y años bisiestos).
+    
+    Args:
+        texto (str): Fecha en formato dd/mm/aaaa
+        
+    Returns:
+        date: Fecha interpretada
+        
+    Raises:
+        DatosInvalidosException: Si el texto no es una fecha válida
+    """
+    coincidencia = _PATRON_FECHA.fullmatch(texto.strip())
+    if coincidencia is not None:
+        dia, mes, anio = coincidencia.groups()
+        try:
+            return date(int(anio), int(mes), int(dia))
+        except ValueError:
+            pass
+    raise DatosInvalidosException("La fecha de nacimiento debe estar en formato dd/mm/aaaa")
+
+
+def formatear_fecha_nacimiento(fecha: date) -> str:
+    """
+    Devuelve una fecha en formato dd/mm/aaaa.
+    
+    Args:
+        fecha (date): Fecha a formatear
+        
+    Returns:
+        str: Fecha en formato dd/mm/aaaa
+    """
+    return f"{fecha.day:02d}/{fecha.month:02d}/{fecha.year:04d}"
+
+
 class Paciente:
     """
     Representa a un paciente de la clínica.
@@ -12,9 +57,11 @@ class Paciente:
     Atributos privados:
         __nombre (str): Nombre completo del paciente
         __dni (str): DNI del paciente (identificador único)
-        __fecha_nacimiento (str): Fecha de nacimiento en formato dd/mm/aaaa
+        __fecha_nacimiento (date): Fecha de nacimiento
     """
     
+    __slots__ = ("__nombre", "__dni", "__fecha_nacimiento")
+    
     def __init__(self, nombre: str, dni: str, fecha_nacimiento: str):
         """
         Inicializa un nuevo paciente.
@@ -27,12 +74,33 @@ class Paciente:
         Raises:
             DatosInvalidosException: Si algún dato es inválido
         """
-        self._validar_datos(nombre, dni, fecha_nacimiento)
+        self.__fecha_nacimiento = self._validar_datos(nombre, dni, fecha_nacimiento)
         self.__nombre = nombre.strip()
         self.__dni = dni.strip()
-        self.__fecha_nacimiento = fecha_nacimiento.strip()
     
-    def _validar_datos(self, nombre: str, dni: str, fecha_nacimiento: str) -> None:
+    @classmethod
+    def restaurar(cls, nombre: str, dni: str, fecha_nacimiento: date) -> "Paciente":
+        """
+        Construye un paciente con datos ya validados, sin volver a validarlos.
+        
+        Pensado para cargas masivas cuyas filas ya pasaron por un validador
+        por lotes y para datos leídos de almacenamiento.
+        
+        Args:
+            nombre (str): Nombre completo, sin espacios sobrantes
+            dni (str): DNI, sin espacios sobrantes
+            fecha_nacimiento (date): Fecha de nacimiento ya interpretada
+            
+        Returns:
+            Paciente: Paciente con los datos indicados
+        """
+        paciente = cls.__new__(cls)
+        paciente.__nombre = nombre
+        paciente.__dni = dni
+        paciente.__fecha_nacimiento = fecha_nacimiento
+        return paciente
+    
+    def _validar_datos(self, nombre: str, dni: str, fecha_nacimiento: str) -> date:
         """
         Valida los datos del paciente.
         
@@ -41,6 +109,9 @@ class Paciente:
             dni (str): DNI a validar
             fecha_nacimiento (str): Fecha de nacimiento a validar
             
+        Returns:
+            date: Fecha de nacimiento interpretada
+            
         Raises:
             DatosInvalidosException: Si algún dato es inválido
         """
@@ -54,10 +125,7 @@ class Paciente:
             raise DatosInvalidosException("La fecha de nacimiento no puede estar vacía")
         
         # Validar formato de fecha dd/mm/aaaa
-        try:
-            datetime.strptime(fecha_nacimiento.strip(), "%d/%m/%Y")
-        except ValueError:
-            raise DatosInvalidosException("La fecha de nacimiento debe estar en formato dd/mm/aaaa")
+        return parsear_fecha_nacimiento(fecha_nacimiento)
     
     def obtener_dni(self) -> str:
         """
@@ -68,11 +136,48 @@ class Paciente:
         """
         return self.__dni
     
+    def obtener_nombre(self) -> str:
+        """
+        Devuelve el nombre completo del paciente.
+        
+        Returns:
+            str: Nombre del paciente
+        """
+        return self.__nombre
+    
+    def obtener_fecha_nacimiento(self) -> date:
+        """
+        Devuelve la fecha de nacimiento del paciente.
+        
+        Returns:
+            date: Fecha de nacimiento
+        """
+        return self.__fecha_nacimiento
+    
+    def obtener_edad(self, referencia: date | None = None) -> int:
+        """
+        Calcula la edad del paciente en años cumplidos.
+        
+        Args:
+            referencia (date | None): Fecha a la que se calcula la edad (hoy por defecto)
+            
+        Returns:
+            int: Edad en años
+        """
+        referencia = referencia or date.today()
+        nacimiento = self.__fecha_nacimiento
+        cumplio = (referencia.month, referencia.day) >= (nacimiento.month, nacimiento.day)
+        return referencia.year - nacimiento.year - (0 if cumplio else 1)
+    
     def __str__(self) -> str:
         """
         Representación en texto del paciente.
         
+        La fecha de nacimiento se muestra normalizada a dd/mm/aaaa (con día y
+        mes de dos dígitos), no como se escribió al registrar al paciente.
+        
         Returns:
             str: Representación legible del paciente
         """
-        return f"Paciente: {self.__nombre} (DNI: {self.__dni}, Nacimiento: {self.__fecha_nacimiento})"
\ No newline at end of file
+        nacimiento = formatear_fecha_nacimiento(self.__fecha_nacimiento)
+        return f"Paciente: {self.__nombre} (DNI: {self.__dni}, Nacimiento: {nacimiento})"
\ No newline at end of file
@@ -4,20 +4,32 @@ Clase Receta para el sistema de gestión de clínica.
 from datetime import datetime
 from .paciente import Paciente
 from .medico import Medico
+from .medicamentos import CATALOGO_MEDICAMENTOS
 from .excepciones import DatosInvalidosException, RecetaInvalidaException
 
 
+def _internar(medicamentos) -> tuple[int, ...]:
+    """Convierte nombres de medicamentos en ids del catálogo."""
+    return tuple(map(CATALOGO_MEDICAMENTOS.internar, medicamentos))
+
+
 class Receta:
     """
     Representa una receta médica emitida por un médico a un paciente.
     
+    Los medicamentos se guardan como ids del catálogo compartido
+    (CATALOGO_MEDICAMENTOS), de modo que cada nombre existe una sola vez
+    en memoria aunque se recete millones de veces.
+    
     Atributos privados:
         __paciente (Paciente): Paciente al que se le emite la receta
         __medico (Medico): Médico que emite la receta
-        __medicamentos (list[str]): Lista de medicamentos recetados
+        __medicamentos (tuple[int, ...]): Ids de los medicamentos recetados
         __fecha (datetime): Fecha de emisión de la receta
     """
     
+    __slots__ = ("__paciente", "__medico", "__medicamentos", "__fecha")
+    
     def __init__(self, paciente: Paciente, medico: Medico, medicamentos: list[str]):
         """
         Inicializa una nueva receta.
@@ -33,7 +45,7 @@ class Receta:
         self._validar_datos(paciente, medico, medicamentos)
         self.__paciente = paciente
         self.__medico = medico
-        self.__medicamentos = [med.strip() for med in medicamentos if med.strip()]
+        self.__medicamentos = _internar(med.strip() for med in medicamentos if med.strip())
         self.__fecha = datetime.now()
     
     def _validar_datos(self, paciente: Paciente, medico: Medico, 
@@ -63,6 +75,67 @@ class Receta:
         if len(medicamentos_validos) == 0:
             raise RecetaInvalidaException("Debe especificar al menos un medicamento válido")
     
+    @classmethod
+    def restaurar(cls, paciente: Paciente, medico: Medico, medicamentos: list[str],
+                  fecha: datetime) -> "Receta":
+        """
+        Reconstruye una receta ya emitida conservando su fecha original.
+        
+        Returns:
+            Receta: Receta con los datos indicados
+        """
+        receta = cls.__new__(cls)
+        receta.__paciente = paciente
+        receta.__medico = medico
+        receta.__medicamentos = _internar(medicamentos)
+        receta.__fecha = fecha
+        return receta
+    
+    def obtener_paciente(self) -> Paciente:
+        """
+        Devuelve el paciente de la receta.
+        
+        Returns:
+            Paciente: Paciente al que se emitió la receta
+        """
+        return self.__paciente
+    
+    def obtener_medico(self) -> Medico:
+        """
+        Devuelve el médico que emitió la receta.
+        
+        Returns:
+            Medico: Médico de la receta
+        """
+        return self.__medico
+    
+    def obtener_medicamentos(self) -> list[str]:
+        """
+        Devuelve una copia de los medicamentos recetados.
+        
+        Returns:
+            list[str]: Medicamentos de la receta
+        """
+        return [CATALOGO_MEDICAMENTOS.obtener_nombre(id_medicamento) for id_medicamento in self.__medicamentos]
+    
+    def obtener_ids_medicamentos(self) -> tuple[int, ...]:
+        """
+        Devuelve los ids de catálogo de los medicamentos recetados.
+        
+        Returns:
+            tuple[int, ...]: Ids en CATALOGO_MEDICAMENTOS, en el orden de la receta
+        """
+        return self.__medicamentos
+    
+    def obtener_fecha(self) -> datetime:
+        """
+        Devuelve la fecha de emisión de la receta.
+        
+        Returns:
+            datetime: Fecha de emisión
+        """
+        return self.__fecha
+    
     def __str__(self) -> str:
         """
         Representación en cadena de la receta.
@@ -71,7 +144,7 @@ class Receta:
             str: Representación legible de la receta
         """
         fecha_str = self.__fecha.strftime("%d/%m/%Y %H:%M")
-        medicamentos_str = ", ".join(self.__medicamentos)
+        medicamentos_str = ", ".join(self.obtener_medicamentos())
         
         return (f"Receta para {self.__paciente.obtener_dni()} "
                 f"por Dr./Dra. {self.__medico.obtener_matricula()} "
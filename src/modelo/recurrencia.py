@@ -0,0 +1,301 @@
+"""
+Clase TurnoRecurrente para el sistema de gestión de clínica.
+"""
+from datetime import datetime, timedelta
+from .paciente import Paciente
+from .medico import Medico
+from .turno import Turno, DURACION_POR_DEFECTO
+from .excepciones import DatosInvalidosException
+
+
+SEMANA = timedelta(days=7)
+_DIA = timedelta(days=1)
+
+
+def repeticiones_hasta(inicio: datetime, intervalo: timedelta, hasta: datetime) -> int:
+    """Cantidad de sesiones, cada 'intervalo' desde 'inicio', que comienzan antes de 'hasta'."""
+    if hasta <= inicio:
+        return 0
+    return -((inicio - hasta) // intervalo)
+
+
+class TurnoRecurrente:
+    """
+    Regla de turnos periódicos: una sesión cada 'intervalo' desde el inicio.
+
+    Se guarda sólo la regla (unos pocos campos) y las sesiones canceladas;
+    las sesiones se calculan al consultarlas, por lo que una serie de meses
+    no crea un Turno por sesión. Las sesiones de una misma regla no se
+    superponen entre sí (el intervalo no es menor que la duración).
+
+    Atributos privados:
+        __paciente (Paciente): Paciente que asiste a las sesiones
+        __medico (Medico): Médico asignado
+        __inicio (datetime): Fecha y hora de la primera sesión
+        __especialidad (str): Especialidad médica de las sesiones
+        __repeticiones (int): Cantidad total de sesiones, canceladas incluidas
+        __intervalo (timedelta): Tiempo entre el inicio de dos sesiones (días enteros)
+        __duracion (timedelta): Duración de cada sesión
+        __canceladas (set[datetime]): Inicio de las sesiones canceladas
+    """
+
+    __slots__ = (
+        "__paciente",
+        "__medico",
+        "__inicio",
+        "__especialidad",
+        "__repeticiones",
+        "__intervalo",
+        "__duracion",
+        "__canceladas",
+    )
+
+    def __init__(self, paciente: Paciente, medico: Medico, inicio: datetime, especialidad: str,
+                 repeticiones: int, intervalo: timedelta = SEMANA,
+                 duracion: timedelta = DURACION_POR_DEFECTO):
+        """
+        Inicializa una nueva regla de turnos recurrentes.
+
+        Args:
+            paciente (Paciente): Paciente de las sesiones
+            medico (Medico): Médico de las sesiones
+            inicio (datetime): Fecha y hora de la primera sesión
+            especialidad (str): Especialidad médica
+            repeticiones (int): Cantidad de sesiones
+            intervalo (timedelta): Tiempo entre sesiones (una semana por defecto)
+            duracion (timedelta): Duración de cada sesión (30 minutos por defecto)
+
+        Raises:
+            DatosInvalidosException: Si los datos son inválidos
+        """
+        # La primera sesión se valida como un turno común
+        Turno(paciente, medico, inicio, especialidad, duracion)
+        if repeticiones < 1:
+            raise DatosInvalidosException("La cantidad de sesiones debe ser positiva")
+        if intervalo <= timedelta(0) or intervalo % _DIA:
+            raise DatosInvalidosException("El intervalo debe ser una cantidad entera de días")
+        if intervalo < duracion:
+            raise DatosInvalidosException("El intervalo no puede ser menor que la duración de la sesión")
+
+        self.__paciente = paciente
+        self.__medico = medico
+        self.__inicio = inicio
+        self.__especialidad = especialidad.strip()
+        self.__repeticiones = repeticiones
+        self.__intervalo = intervalo
+        self.__duracion = duracion
+        self.__canceladas = set()
+
+    @classmethod
+    def restaurar(cls, paciente: Paciente, medico: Medico, inicio: datetime, especialidad: str,
+                  repeticiones: int, intervalo: timedelta = SEMANA,
+                  duracion: timedelta = DURACION_POR_DEFECTO,
+                  canceladas=()) -> "TurnoRecurrente":
+        """
+        Reconstruye una regla ya validada (por ejemplo, leída de almacenamiento).
+
+        No vuelve a validar los datos: la serie puede haber empezado en el pasado.
+
+        Returns:
+            TurnoRecurrente: Regla con los datos y sesiones canceladas indicados
+        """
+        recurrencia = cls.__new__(cls)
+        recurrencia.__paciente = paciente
+        recurrencia.__medico = medico
+        recurrencia.__inicio = inicio
+        recurrencia.__especialidad = especialidad
+        recurrencia.__repeticiones = repeticiones
+        recurrencia.__intervalo = intervalo
+        recurrencia.__duracion = duracion
+        recurrencia.__canceladas = set(canceladas)
+        return recurrencia
+
+    def obtener_paciente(self) -> Paciente:
+        """
+        Devuelve el paciente de las sesiones.
+
+        Returns:
+            Paciente: Paciente de la regla
+        """
+        return self.__paciente
+
+    def obtener_medico(self) -> Medico:
+        """
+        Devuelve el médico de las sesiones.
+
+        Returns:
+            Medico: Médico de la regla
+        """
+        return self.__medico
+
+    def obtener_fecha_hora_inicio(self) -> datetime:
+        """
+        Devuelve la fecha y hora de la primera sesión.
+
+        Returns:
+            datetime: Inicio de la serie
+        """
+        return self.__inicio
+
+    def obtener_fecha_hora_fin(self) -> datetime:
+        """
+        Devuelve la fecha y hora en que termina la última sesión.
+
+        Returns:
+            datetime: Fin de la serie
+        """
+        return self.__inicio + (self.__repeticiones - 1) * self.__intervalo + self.__duracion
+
+    def obtener_especialidad(self) -> str:
+        """
+        Devuelve la especialidad de las sesiones.
+
+        Returns:
+            str: Especialidad médica
+        """
+        return self.__especialidad
+
+    def obtener_repeticiones(self) -> int:
+        """
+        Devuelve la cantidad total de sesiones, canceladas incluidas.
+
+        Returns:
+            int: Cantidad de sesiones de la serie
+        """
+        return self.__repeticiones
+
+    def obtener_intervalo(self) -> timedelta:
+        """
+        Devuelve el tiempo entre el inicio de dos sesiones consecutivas.
+
+        Returns:
+            timedelta: Intervalo de la serie
+        """
+        return self.__intervalo
+
+    def obtener_duracion(self) -> timedelta:
+        """
+        Devuelve la duración de cada sesión.
+
+        Returns:
+            timedelta: Duración de una sesión
+        """
+        return self.__duracion
+
+    def obtener_canceladas(self) -> list[datetime]:
+        """
+        Devuelve el inicio de las sesiones canceladas.
+
+        Returns:
+            list[datetime]: Sesiones canceladas, en orden
+        """
+        return sorted(self.__canceladas)
+
+    def contar_sesiones(self) -> int:
+        """
+        Cantidad de sesiones vigentes (sin las canceladas).
+
+        Returns:
+            int: Sesiones que siguen agendadas
+        """
+        return self.__repeticiones - len(self.__canceladas)
+
+    def __indice(self, fecha_hora: datetime) -> int | None:
+        """Número de sesión que empieza en fecha_hora, o None si no hay ninguna."""
+        if fecha_hora < self.__inicio:
+            return None
+        indice, resto = divmod(fecha_hora - self.__inicio, self.__intervalo)
+        return indice if not resto and indice < self.__repeticiones else None
+
+    def es_sesion(self, fecha_hora: datetime) -> bool:
+        """
+        Indica si hay una sesión vigente que empieza en fecha_hora.
+
+        Args:
+            fecha_hora (datetime): Inicio a consultar
+
+        Returns:
+            bool: True si la serie tiene una sesión no cancelada en ese horario
+        """
+        return self.__indice(fecha_hora) is not None and fecha_hora not in self.__canceladas
+
+    def sesiones(self, desde: datetime | None = None, hasta: datetime | None = None):
+        """
+        Genera en orden el inicio de las sesiones vigentes que comienzan en [desde, hasta).
+
+        Las sesiones se calculan a medida que se piden: el costo depende del
+        tamaño del rango, no de la cantidad de sesiones de la serie.
+
+        Args:
+            desde (datetime | None): Desde esta fecha (sin límite si es None)
+            hasta (datetime | None): Antes de esta fecha (sin límite si es None)
+
+        Returns:
+            Iterator[datetime]: Inicio de cada sesión
+        """
+        primera = 0 if desde is None or desde <= self.__inicio else -((self.__inicio - desde) // self.__intervalo)
+        ultima = self.__repeticiones
+        if hasta is not None:
+            ultima = min(ultima, repeticiones_hasta(self.__inicio, self.__intervalo, hasta))
+        canceladas = self.__canceladas
+        for indice in range(primera, ultima):
+            fecha_hora = self.__inicio + indice * self.__intervalo
+            if fecha_hora not in canceladas:
+                yield fecha_hora
+
+    def materializar(self, desde: datetime | None = None, hasta: datetime | None = None):
+        """
+        Genera como objetos Turno las sesiones vigentes que comienzan en [desde, hasta).
+
+        Returns:
+            Iterator[Turno]: Un turno por sesión, en orden
+        """
+        for fecha_hora in self.sesiones(desde, hasta):
+            yield Turno.restaurar(self.__paciente, self.__medico, fecha_hora,
+                                  self.__especialidad, self.__duracion)
+
+    def se_superpone(self, inicio: datetime, fin: datetime) -> bool:
+        """
+        Indica si alguna sesión vigente se superpone con el intervalo [inicio, fin).
+
+        Args:
+            inicio (datetime): Comienzo del intervalo
+            fin (datetime): Final del intervalo (excluido)
+
+        Returns:
+            bool: True si hay superposición
+        """
+        # Sesiones que empiezan en (inicio - duración, fin)
+        for fecha_hora in self.sesiones(inicio - self.__duracion, fin):
+            if fecha_hora + self.__duracion > inicio:
+                return True
+        return False
+
+    def cancelar_sesion(self, fecha_hora: datetime) -> None:
+        """
+        Cancela una sesión de la serie; su horario queda libre.
+
+        Args:
+            fecha_hora (datetime): Inicio de la sesión a cancelar
+
+        Raises:
+            DatosInvalidosException: Si no hay una sesión vigente en ese horario
+        """
+        if not self.es_sesion(fecha_hora):
+            raise DatosInvalidosException(f"La serie no tiene una sesión vigente el {fecha_hora}")
+        self.__canceladas.add(fecha_hora)
+
+    def __str__(self) -> str:
+        """
+        Representación legible de la serie.
+
+        Returns:
+            str: Paciente, médico, especialidad, frecuencia y cantidad de sesiones
+        """
+        inicio_str = self.__inicio.strftime("%d/%m/%Y %H:%M")
+        canceladas = len(self.__canceladas)
+        detalle = f" ({canceladas} canceladas)" if canceladas else ""
+        return (f"Turno recurrente: {self.__paciente.obtener_dni()} con "
+                f"Dr./Dra. {self.__medico.obtener_matricula()} "
+                f"({self.__especialidad}) - cada {self.__intervalo.days} días desde {inicio_str}, "
+                f"{self.__repeticiones} sesiones{detalle}")
@@ -0,0 +1,52 @@
+"""
+Tabla de símbolos (internado de claves) para el sistema de gestión de clínica.
+"""
+
+
+class TablaSimbolos:
+    """
+    Asigna a cada clave un id entero consecutivo (internado).
+
+    Atributos privados:
+        __ids (dict): Clave -> id
+        __valores (list): Id -> valor asociado a la clave
+    """
+
+    __slots__ = ("__ids", "__valores")
+
+    def __init__(self):
+        """Inicializa una tabla vacía."""
+        self.__ids = {}
+        self.__valores = []
+
+    def internar(self, clave, valor=None) -> int:
+        """
+        Devuelve el id de la clave, asignándole uno nuevo si no lo tenía.
+
+        Args:
+            clave: Clave a internar
+            valor: Valor asociado (la clave misma por defecto); se ignora si la clave ya existía
+
+        Returns:
+            int: Id de la clave
+        """
+        id_clave = self.__ids.get(clave)
+        if id_clave is None:
+            id_clave = self.__ids[clave] = len(self.__valores)
+            self.__valores.append(clave if valor is None else valor)
+        return id_clave
+
+    def obtener_id(self, clave) -> int | None:
+        """Devuelve el id de la clave, o None si nunca se internó."""
+        return self.__ids.get(clave)
+
+    def obtener(self, id_clave: int):
+        """Devuelve el valor asociado a un id."""
+        return self.__valores[id_clave]
+
+    def claves(self):
+        """Devuelve las claves internadas."""
+        return self.__ids.keys()
+
+    def __len__(self) -> int:
+        return len(self.__valores)
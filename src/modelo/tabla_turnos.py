@@ -0,0 +1,503 @@
+"""
+Tabla columnar de turnos para el sistema de gestión de clínica.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from itertools import compress, islice, repeat
+from operator import add, and_, le, gt
+from .turno import Turno
+from .tabla_simbolos import TablaSimbolos
+
+
+EPOCA = datetime(1970, 1, 1)
+_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+def a_microsegundos(fecha_hora: datetime) -> int:
+    """Convierte una fecha y hora en microsegundos desde EPOCA."""
+    return (fecha_hora - EPOCA) // _MICROSEGUNDO
+
+
+def desde_microsegundos(valor: int) -> datetime:
+    """Convierte microsegundos desde EPOCA en una fecha y hora."""
+    return EPOCA + timedelta(microseconds=valor)
+
+
+class _Ids(dict):
+    """
+    Caché objeto -> id para internar columnas enteras con map.
+
+    Los objetos repetidos (el mismo Paciente en muchos turnos) se resuelven
+    con una búsqueda en el diccionario; sólo los nuevos llegan a la tabla.
+    """
+
+    __slots__ = ("tabla", "clave")
+
+    def __init__(self, tabla: TablaSimbolos, clave: str | None = None):
+        super().__init__()
+        self.tabla = tabla
+        self.clave = clave
+
+    def __missing__(self, objeto) -> int:
+        clave = objeto if self.clave is None else getattr(objeto, self.clave)()
+        id_objeto = self[objeto] = self.tabla.internar(clave, objeto)
+        return id_objeto
+
+
+class _IndiceMedico:
+    """Turnos de un médico ordenados por inicio (los intervalos no se superponen)."""
+
+    __slots__ = ("inicios", "fines", "filas")
+
+    def __init__(self):
+        self.inicios = array("q")
+        self.fines = array("q")
+        self.filas = array("i")
+
+
+class TablaTurnos:
+    """
+    Turnos guardados por columnas en arreglos compactos (módulo array).
+
+    Cada turno es una fila: id de paciente, id de médico, id de
+    especialidad, inicio y duración (en microsegundos). Pacientes, médicos y
+    especialidades se internan en tablas de símbolos, de modo que una fila
+    ocupa unas decenas de bytes en lugar de un objeto Turno con sus fechas.
+    El número de fila es estable y sirve como id del turno: cancelar un
+    turno lo marca como anulado en una columna (tombstone) y lo quita del
+    índice de su médico, y reprogramarlo actualiza la fila en su lugar.
+
+    Los objetos Turno se crean sólo al pedirlos (vistas): dos pedidos de la
+    misma fila devuelven objetos distintos con los mismos datos.
+
+    Los conteos y filtros recorren las columnas con map/compress, sin crear
+    objetos por turno; por médico se usa un índice ordenado por inicio.
+
+    Atributos privados:
+        __pacientes (TablaSimbolos): DNI -> Paciente
+        __medicos (TablaSimbolos): Matrícula -> Medico
+        __especialidades (TablaSimbolos): Nombre de especialidad
+        __columna_paciente (array): Id de paciente por fila
+        __columna_medico (array): Id de médico por fila
+        __columna_especialidad (array): Id de especialidad por fila
+        __columna_inicio (array): Inicio por fila, en microsegundos desde EPOCA
+        __columna_duracion (array): Duración por fila, en microsegundos
+        __columna_vigente (bytearray): 1 por fila vigente, 0 por fila cancelada
+        __cancelados (int): Cantidad de filas canceladas
+        __indices_medico (list[_IndiceMedico]): Id de médico -> turnos ordenados
+        __filas_paciente (list[array]): Id de paciente -> filas en orden de registro
+    """
+
+    __slots__ = (
+        "__pacientes",
+        "__medicos",
+        "__especialidades",
+        "__columna_paciente",
+        "__columna_medico",
+        "__columna_especialidad",
+        "__columna_inicio",
+        "__columna_duracion",
+        "__columna_vigente",
+        "__cancelados",
+        "__indices_medico",
+        "__filas_paciente",
+    )
+
+    def __init__(self):
+        """Inicializa una tabla vacía."""
+        self.__pacientes = TablaSimbolos()
+        self.__medicos = TablaSimbolos()
+        self.__especialidades = TablaSimbolos()
+        self.__columna_paciente = array("i")
+        self.__columna_medico = array("i")
+        self.__columna_especialidad = array("i")
+        self.__columna_inicio = array("q")
+        self.__columna_duracion = array("q")
+        self.__columna_vigente = bytearray()
+        self.__cancelados = 0
+        self.__indices_medico = []
+        self.__filas_paciente = []
+
+    @staticmethod
+    def __partes(turno: Turno) -> tuple:
+        """Devuelve (paciente, médico, especialidad, inicio, duración) de un turno, en microsegundos."""
+        return (turno.obtener_paciente(), turno.obtener_medico(), turno.obtener_especialidad(),
+                a_microsegundos(turno.obtener_fecha_hora()), turno.obtener_duracion() // _MICROSEGUNDO)
+
+    def __agregar_fila(self, paciente, medico, especialidad: str, inicio: int, duracion: int) -> tuple:
+        """Agrega las columnas de un turno; devuelve (fila, id de médico, inicio, fin)."""
+        id_paciente = self.__pacientes.internar(paciente.obtener_dni(), paciente)
+        if id_paciente == len(self.__filas_paciente):
+            self.__filas_paciente.append(array("i"))
+        id_medico = self.__medicos.internar(medico.obtener_matricula(), medico)
+        if id_medico == len(self.__indices_medico):
+            self.__indices_medico.append(_IndiceMedico())
+
+        fila = len(self.__columna_inicio)
+        self.__columna_paciente.append(id_paciente)
+        self.__columna_medico.append(id_medico)
+        self.__columna_especialidad.append(self.__especialidades.internar(especialidad))
+        self.__columna_inicio.append(inicio)
+        self.__columna_duracion.append(duracion)
+        self.__columna_vigente.append(1)
+        self.__filas_paciente[id_paciente].append(fila)
+        return fila, id_medico, inicio, inicio + duracion
+
+    def agregar(self, turno: Turno) -> int:
+        """
+        Agrega un turno; la verificación de superposición queda a cargo de quien llama.
+
+        Args:
+            turno (Turno): Turno a agregar
+
+        Returns:
+            int: Número de fila (id) del turno
+        """
+        fila, id_medico, inicio, fin = self.__agregar_fila(*self.__partes(turno))
+        self.__indexar(id_medico, inicio, fin, fila)
+        return fila
+
+    def __indexar(self, id_medico: int, inicio: int, fin: int, fila: int) -> None:
+        """Inserta una fila en el índice de su médico, manteniendo el orden por inicio."""
+        indice = self.__indices_medico[id_medico]
+        i = bisect_right(indice.inicios, inicio)
+        indice.inicios.insert(i, inicio)
+        indice.fines.insert(i, fin)
+        indice.filas.insert(i, fila)
+
+    def __desindexar(self, fila: int) -> None:
+        """Quita una fila del índice de su médico (búsqueda binaria por su inicio)."""
+        indice = self.__indices_medico[self.__columna_medico[fila]]
+        i = bisect_left(indice.inicios, self.__columna_inicio[fila])
+        # Los turnos de un médico no se superponen: el inicio identifica la fila
+        while indice.filas[i] != fila:
+            i += 1
+        del indice.inicios[i]
+        del indice.fines[i]
+        del indice.filas[i]
+
+    def es_vigente(self, fila: int) -> bool:
+        """Indica si la fila existe y su turno no fue cancelado."""
+        return 0 <= fila < len(self.__columna_vigente) and self.__columna_vigente[fila] == 1
+
+    def cancelar(self, fila: int) -> None:
+        """
+        Cancela un turno vigente: queda anulado y su horario, libre.
+
+        Args:
+            fila (int): Número de fila (id) del turno
+        """
+        self.__desindexar(fila)
+        self.__columna_vigente[fila] = 0
+        self.__cancelados += 1
+
+    def reprogramar(self, fila: int, fecha_hora: datetime, duracion: timedelta) -> None:
+        """
+        Mueve un turno vigente a otro horario conservando su número de fila.
+
+        La verificación de superposición queda a cargo de quien llama
+        (ver esta_libre con excluir).
+
+        Args:
+            fila (int): Número de fila (id) del turno
+            fecha_hora (datetime): Nuevo inicio
+            duracion (timedelta): Nueva duración
+        """
+        self.__desindexar(fila)
+        inicio = a_microsegundos(fecha_hora)
+        duracion = duracion // _MICROSEGUNDO
+        self.__columna_inicio[fila] = inicio
+        self.__columna_duracion[fila] = duracion
+        self.__indexar(self.__columna_medico[fila], inicio, inicio + duracion, fila)
+
+    def agregar_lote(self, turnos: list[Turno]) -> range:
+        """
+        Agrega varios turnos reordenando el índice de cada médico una sola vez.
+
+        Si un médico recibe pocos turnos en relación a los que ya tiene, se
+        insertan uno por uno (búsqueda binaria) en lugar de reordenar.
+
+        Args:
+            turnos (list[Turno]): Turnos a agregar, sin superposiciones entre sí
+
+        Returns:
+            range: Filas asignadas, en el orden de la lista
+        """
+        primera = len(self.__columna_inicio)
+        por_medico = {}
+        for turno in turnos:
+            fila, id_medico, _, _ = self.__agregar_fila(*self.__partes(turno))
+            por_medico.setdefault(id_medico, []).append(fila)
+        self.__indexar_lote(por_medico)
+        return range(primera, len(self.__columna_inicio))
+
+    def agregar_columnas(self, pacientes: list, medicos: list, especialidades: list[str],
+                         inicios: array, duraciones: array) -> range:
+        """
+        Como agregar_lote, pero con los turnos por columnas y sin crear objetos Turno.
+
+        Args:
+            pacientes (list[Paciente]): Paciente de cada turno
+            medicos (list[Medico]): Médico de cada turno
+            especialidades (list[str]): Especialidad de cada turno
+            inicios (array): Inicio de cada turno, en microsegundos desde EPOCA
+            duraciones (array): Duración de cada turno, en microsegundos
+
+        Returns:
+            range: Filas asignadas, en el orden de las columnas
+        """
+        primera = len(self.__columna_inicio)
+        filas = range(primera, primera + len(inicios))
+        ids_pacientes = array("i", map(_Ids(self.__pacientes, "obtener_dni").__getitem__, pacientes))
+        ids_medicos = array("i", map(_Ids(self.__medicos, "obtener_matricula").__getitem__, medicos))
+        ids_especialidades = array("i", map(_Ids(self.__especialidades).__getitem__, especialidades))
+        self.__filas_paciente.extend(array("i") for _ in range(len(self.__pacientes) - len(self.__filas_paciente)))
+        self.__indices_medico.extend(_IndiceMedico() for _ in range(len(self.__medicos) - len(self.__indices_medico)))
+
+        self.__columna_paciente.extend(ids_pacientes)
+        self.__columna_medico.extend(ids_medicos)
+        self.__columna_especialidad.extend(ids_especialidades)
+        self.__columna_inicio.extend(inicios)
+        self.__columna_duracion.extend(duraciones)
+        self.__columna_vigente.extend(repeat(1, len(filas)))
+        filas_paciente = self.__filas_paciente
+        for fila, id_paciente in zip(filas, ids_pacientes):
+            filas_paciente[id_paciente].append(fila)
+        por_medico = {}
+        for fila, id_medico in zip(filas, ids_medicos):
+            por_medico.setdefault(id_medico, []).append(fila)
+        self.__indexar_lote(por_medico)
+        return filas
+
+    def __indexar_lote(self, por_medico: dict) -> None:
+        """Agrega al índice de cada médico sus filas nuevas (ya cargadas en las columnas)."""
+        inicio_de = self.__columna_inicio.__getitem__
+        duracion_de = self.__columna_duracion.__getitem__
+        for id_medico, nuevas in por_medico.items():
+            indice = self.__indices_medico[id_medico]
+            # Los turnos vigentes de un médico no se superponen: basta ordenar por inicio
+            nuevas.sort(key=inicio_de)
+            if not indice.inicios or inicio_de(nuevas[0]) >= indice.inicios[-1]:
+                # Todas las filas nuevas van después de las existentes (el caso de una carga)
+                inicios = array("q", map(inicio_de, nuevas))
+                indice.filas.extend(array("i", nuevas))
+                indice.fines.extend(map(add, inicios, map(duracion_de, nuevas)))
+                indice.inicios.extend(inicios)
+            elif len(nuevas) * 8 < len(indice.inicios):
+                # Pocos turnos sobre un índice grande: insertar cuesta menos que reordenar todo
+                for fila in nuevas:
+                    self.__indexar(id_medico, inicio_de(fila), inicio_de(fila) + duracion_de(fila), fila)
+            else:
+                filas = sorted(indice.filas.tolist() + nuevas, key=inicio_de)
+                indice.filas = array("i", filas)
+                indice.inicios = array("q", map(inicio_de, filas))
+                indice.fines = array("q", map(add, indice.inicios, map(duracion_de, filas)))
+
+    def anular_hasta(self, fila: int) -> None:
+        """
+        Agrega filas ya canceladas hasta que la próxima fila sea 'fila'.
+
+        Al restaurar turnos guardados permite que cada uno conserve su número
+        de fila (su id), aunque los cancelados no se hayan guardado.
+
+        Raises:
+            ValueError: Si 'fila' ya está ocupada
+        """
+        faltan = fila - len(self.__columna_inicio)
+        if faltan < 0:
+            raise ValueError(f"El id de turno {fila} ya está en uso")
+        # Las filas anuladas no tienen paciente, médico ni especialidad: nunca se leen
+        self.__columna_paciente.extend(repeat(-1, faltan))
+        self.__columna_medico.extend(repeat(-1, faltan))
+        self.__columna_especialidad.extend(repeat(-1, faltan))
+        self.__columna_inicio.extend(repeat(0, faltan))
+        self.__columna_duracion.extend(repeat(0, faltan))
+        self.__columna_vigente.extend(bytes(faltan))
+        self.__cancelados += faltan
+
+    def __len__(self) -> int:
+        """Cantidad de turnos vigentes."""
+        return len(self.__columna_inicio) - self.__cancelados
+
+    def cantidad_filas(self) -> int:
+        """Cantidad de filas, incluidas las de turnos cancelados."""
+        return len(self.__columna_inicio)
+
+    def obtener(self, fila: int) -> Turno:
+        """
+        Crea la vista Turno de una fila.
+
+        Args:
+            fila (int): Número de fila
+
+        Returns:
+            Turno: Turno con los datos de la fila
+        """
+        return Turno.restaurar(
+            self.__pacientes.obtener(self.__columna_paciente[fila]),
+            self.__medicos.obtener(self.__columna_medico[fila]),
+            desde_microsegundos(self.__columna_inicio[fila]),
+            self.__especialidades.obtener(self.__columna_especialidad[fila]),
+            timedelta(microseconds=self.__columna_duracion[fila]),
+        )
+
+    def columnas(self, filas) -> tuple[list[str], list[str], list[str], array, array]:
+        """
+        Devuelve los datos de las filas por columnas, sin crear objetos Turno ni fechas.
+
+        Args:
+            filas (Iterable[int]): Números de fila
+
+        Returns:
+            tuple: (DNI, matrículas, especialidades, inicios y duraciones en microsegundos)
+        """
+        filas = list(filas)
+        pacientes, medicos, especialidades = self.__pacientes, self.__medicos, self.__especialidades
+        return (
+            [pacientes.obtener(self.__columna_paciente[fila]).obtener_dni() for fila in filas],
+            [medicos.obtener(self.__columna_medico[fila]).obtener_matricula() for fila in filas],
+            [especialidades.obtener(self.__columna_especialidad[fila]) for fila in filas],
+            array("q", [self.__columna_inicio[fila] for fila in filas]),
+            array("q", [self.__columna_duracion[fila] for fila in filas]),
+        )
+
+    def bloques_columnas(self, tamano: int):
+        """
+        Genera los turnos vigentes en orden de registro, por columnas y de a 'tamano' filas.
+
+        Yields:
+            tuple: Filas (ids) de cada bloque seguidas de sus columnas (ver columnas)
+        """
+        filas = iter(range(len(self.__columna_inicio)) if not self.__cancelados else self.iterar_filas())
+        while bloque := list(islice(filas, tamano)):
+            yield (array("q", bloque), *self.columnas(bloque))
+
+    def __iter__(self):
+        """Genera las vistas de todos los turnos vigentes en orden de registro."""
+        return map(self.obtener, self.iterar_filas())
+
+    def buscar(self, matricula: str, fecha_hora: datetime) -> int | None:
+        """Devuelve la fila del turno del médico que empieza exactamente en fecha_hora, o None."""
+        id_medico = self.__medicos.obtener_id(matricula)
+        if id_medico is None:
+            return None
+        indice = self.__indices_medico[id_medico]
+        inicio = a_microsegundos(fecha_hora)
+        i = bisect_left(indice.inicios, inicio)
+        return indice.filas[i] if i < len(indice.inicios) and indice.inicios[i] == inicio else None
+
+    def existe(self, matricula: str, fecha_hora: datetime) -> bool:
+        """Indica si el médico tiene un turno que empieza exactamente en fecha_hora."""
+        return self.buscar(matricula, fecha_hora) is not None
+
+    def esta_libre(self, matricula: str, inicio: datetime, fin: datetime,
+                   excluir: int | None = None) -> bool:
+        """
+        Indica si el médico no tiene turnos que se superpongan con [inicio, fin).
+
+        Args:
+            matricula (str): Matrícula del médico
+            inicio (datetime): Comienzo del intervalo
+            fin (datetime): Final del intervalo (excluido)
+            excluir (int | None): Fila que no cuenta como ocupada (el turno que se reprograma)
+        """
+        id_medico = self.__medicos.obtener_id(matricula)
+        if id_medico is None:
+            return True
+        indice = self.__indices_medico[id_medico]
+        # Último turno que empieza antes de que termine el intervalo
+        i = bisect_left(indice.inicios, a_microsegundos(fin))
+        if i and indice.filas[i - 1] == excluir:
+            i -= 1
+        return i == 0 or indice.fines[i - 1] <= a_microsegundos(inicio)
+
+    def filas_paciente(self, dni: str) -> array:
+        """Devuelve las filas de los turnos vigentes del paciente en orden de registro."""
+        id_paciente = self.__pacientes.obtener_id(dni)
+        if id_paciente is None:
+            return array("i")
+        filas = self.__filas_paciente[id_paciente]
+        if not self.__cancelados:
+            return filas[:]
+        vigente = self.__columna_vigente
+        return array("i", (fila for fila in filas if vigente[fila]))
+
+    def iterar_filas(self, matricula: str | None = None, especialidad: str | None = None,
+                     desde: datetime | None = None, hasta: datetime | None = None):
+        """
+        Genera las filas que cumplen todos los filtros indicados, sin armar una lista.
+
+        Con matrícula las filas salen del índice del médico, ordenadas por
+        inicio; sin ella se recorren las columnas y salen en orden de registro.
+        Las filas de turnos cancelados no se generan.
+
+        Args:
+            matricula (str | None): Sólo turnos de este médico
+            especialidad (str | None): Sólo turnos de esta especialidad (sin distinguir mayúsculas)
+            desde (datetime | None): Sólo turnos que comienzan en o después de esta fecha
+            hasta (datetime | None): Sólo turnos que comienzan antes de esta fecha
+
+        Returns:
+            Iterator[int]: Números de fila
+        """
+        ids_especialidad = None
+        if especialidad is not None:
+            buscada = especialidad.strip().lower()
+            ids_especialidad = {
+                self.__especialidades.obtener_id(nombre)
+                for nombre in self.__especialidades.claves() if nombre.lower() == buscada
+            }
+            if not ids_especialidad:
+                return iter(())
+
+        if matricula is not None:
+            id_medico = self.__medicos.obtener_id(matricula)
+            if id_medico is None:
+                return iter(())
+            indice = self.__indices_medico[id_medico]
+            i = 0 if desde is None else bisect_left(indice.inicios, a_microsegundos(desde))
+            j = len(indice.inicios) if hasta is None else bisect_left(indice.inicios, a_microsegundos(hasta))
+            candidatas = indice.filas[i:j]
+            if ids_especialidad is None:
+                return iter(candidatas)
+            columna = self.__columna_especialidad
+            return (fila for fila in candidatas if columna[fila] in ids_especialidad)
+
+        # Sin médico: máscaras sobre columnas completas, evaluadas en C por map
+        mascaras = []
+        if desde is not None:
+            mascaras.append(map(le, repeat(a_microsegundos(desde)), self.__columna_inicio))
+        if hasta is not None:
+            mascaras.append(map(gt, repeat(a_microsegundos(hasta)), self.__columna_inicio))
+        if ids_especialidad is not None:
+            mascaras.append(map(ids_especialidad.__contains__, self.__columna_especialidad))
+        if self.__cancelados:
+            mascaras.append(self.__columna_vigente)
+        total = range(len(self.__columna_inicio))
+        if not mascaras:
+            return iter(total)
+        mascara = mascaras[0]
+        for otra in mascaras[1:]:
+            mascara = map(and_, mascara, otra)
+        return compress(total, mascara)
+
+    def filas(self, matricula: str | None = None, especialidad: str | None = None,
+              desde: datetime | None = None, hasta: datetime | None = None) -> list[int]:
+        """Devuelve en una lista las filas que cumplen los filtros (ver iterar_filas)."""
+        return list(self.iterar_filas(matricula, especialidad, desde, hasta))
+
+    def contar(self, matricula: str | None = None, especialidad: str | None = None,
+               desde: datetime | None = None, hasta: datetime | None = None) -> int:
+        """Cuenta los turnos que cumplen los filtros (ver filas)."""
+        if especialidad is None and matricula is not None:
+            id_medico = self.__medicos.obtener_id(matricula)
+            if id_medico is None:
+                return 0
+            inicios = self.__indices_medico[id_medico].inicios
+            i = 0 if desde is None else bisect_left(inicios, a_microsegundos(desde))
+            j = len(inicios) if hasta is None else bisect_left(inicios, a_microsegundos(hasta))
+            return max(0, j - i)
+        if especialidad is None and desde is None and hasta is None:
+            return len(self)
+        return sum(1 for _ in self.iterar_filas(matricula, especialidad, desde, hasta))
@@ -1,12 +1,15 @@
 """
 Clase Turno para el sistema de gestión de clínica.
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from .paciente import Paciente
 from .medico import Medico
 from .excepciones import DatosInvalidosException
 
 
+DURACION_POR_DEFECTO = timedelta(minutes=30)
+
+
 class Turno:
     """
     Representa un turno médico entre un paciente y un médico.
@@ -16,9 +19,13 @@ class Turno:
         __medico (Medico): Médico asignado al turno
         __fecha_hora (datetime): Fecha y hora del turno
         __especialidad (str): Especialidad médica del turno
+        __duracion (timedelta): Duración del turno
     """
     
-    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str):
+    __slots__ = ("__paciente", "__medico", "__fecha_hora", "__especialidad", "__duracion")
+    
+    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str,
+                 duracion: timedelta = DURACION_POR_DEFECTO):
         """
         Inicializa un nuevo turno.
         
@@ -27,18 +34,20 @@ class Turno:
             medico (Medico): Médico del turno
             fecha_hora (datetime): Fecha y hora del turno
             especialidad (str): Especialidad médica
+            duracion (timedelta): Duración del turno (30 minutos por defecto)
             
         Raises:
             DatosInvalidosException: Si los datos son inválidos
         """
-        self._validar_datos(paciente, medico, fecha_hora, especialidad)
+        self._validar_datos(paciente, medico, fecha_hora, especialidad, duracion)
         self.__paciente = paciente
         self.__medico = medico
         self.__fecha_hora = fecha_hora
         self.__especialidad = especialidad.strip()
+        self.__duracion = duracion
     
     def _validar_datos(self, paciente: Paciente, medico: Medico, 
-                      fecha_hora: datetime, especialidad: str) -> None:
+                      fecha_hora: datetime, especialidad: str, duracion: timedelta) -> None:
         """
         Valida los datos del turno.
         
@@ -47,6 +56,7 @@ class Turno:
             medico (Medico): Médico a validar
             fecha_hora (datetime): Fecha y hora a validar
             especialidad (str): Especialidad a validar
+            duracion (timedelta): Duración a validar
             
         Raises:
             DatosInvalidosException: Si algún dato es inválido
@@ -63,10 +73,42 @@ class Turno:
         if not especialidad or not especialidad.strip():
             raise DatosInvalidosException("La especialidad no puede estar vacía")
         
+        if duracion is None or duracion <= timedelta(0):
+            raise DatosInvalidosException("La duración del turno debe ser positiva")
+        
         # Validar que la fecha no sea en el pasado
         if fecha_hora < datetime.now():
             raise DatosInvalidosException("No se pueden agendar turnos en el pasado")
     
+    @classmethod
+    def restaurar(cls, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str,
+                  duracion: timedelta = DURACION_POR_DEFECTO) -> "Turno":
+        """
+        Reconstruye un turno ya validado (por ejemplo, leído de almacenamiento).
+        
+        No vuelve a validar los datos: un turno guardado puede haber quedado
+        en el pasado y aun así forma parte de la historia del paciente.
+        
+        Returns:
+            Turno: Turno con los datos indicados
+        """
+        turno = cls.__new__(cls)
+        turno.__paciente = paciente
+        turno.__medico = medico
+        turno.__fecha_hora = fecha_hora
+        turno.__especialidad = especialidad
+        turno.__duracion = duracion
+        return turno
+    
+    def obtener_paciente(self) -> Paciente:
+        """
+        Devuelve el paciente del turno.
+        
+        Returns:
+            Paciente: Paciente del turno
+        """
+        return self.__paciente
+    
     def obtener_medico(self) -> Medico:
         """
         Devuelve el médico asignado al turno.
@@ -85,6 +127,33 @@ class Turno:
         """
         return self.__fecha_hora
     
+    def obtener_especialidad(self) -> str:
+        """
+        Devuelve la especialidad del turno.
+        
+        Returns:
+            str: Especialidad médica del turno
+        """
+        return self.__especialidad
+    
+    def obtener_duracion(self) -> timedelta:
+        """
+        Devuelve la duración del turno.
+        
+        Returns:
+            timedelta: Duración del turno
+        """
+        return self.__duracion
+    
+    def obtener_fecha_hora_fin(self) -> datetime:
+        """
+        Devuelve la fecha y hora en que termina el turno.
+        
+        Returns:
+            datetime: Fecha y hora de inicio más la duración
+        """
+        return self.__fecha_hora + self.__duracion
+    
     def __str__(self) -> str:
         """
         Representación legible del turno.
@@ -0,0 +1,554 @@
+"""
+Almacenamiento de la clínica en una base SQLite.
+
+Pacientes, turnos y recetas quedan en disco y se leen con consultas
+indexadas; sólo los médicos (pocos y consultados en cada turno) se mantienen
+en memoria. La base usa journal WAL, de modo que las lecturas no bloquean a
+las escrituras.
+"""
+import json
+import sqlite3
+from collections.abc import Iterator, Mapping
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+
+from src.modelo.almacen import Almacen
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import Turno
+from src.modelo.receta import Receta
+from src.modelo.recurrencia import TurnoRecurrente
+from src.modelo.historia_clinica import HistoriaClinica
+
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL  -- aaaa-mm-dd
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    tipo TEXT NOT NULL,
+    dias TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_especialidades_matricula ON especialidades (matricula);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- los ids de turnos cancelados no se reutilizan
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    fecha_hora TEXT NOT NULL,
+    fin TEXT NOT NULL,
+    especialidad TEXT NOT NULL,
+    duracion INTEGER NOT NULL  -- microsegundos
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_turnos_matricula_fecha ON turnos (matricula, fecha_hora);
+CREATE INDEX IF NOT EXISTS idx_turnos_dni ON turnos (dni);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    fecha TEXT NOT NULL,
+    medicamentos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_dni ON recetas (dni);
+-- Un registro por medicamento distinto de cada receta, para buscar recetas por medicamento
+CREATE TABLE IF NOT EXISTS receta_medicamentos (
+    receta_id INTEGER NOT NULL REFERENCES recetas (id),
+    nombre_clave TEXT NOT NULL  -- nombre en minúsculas con str.lower (lower() de SQLite sólo convierte ASCII)
+);
+CREATE INDEX IF NOT EXISTS idx_receta_medicamentos_clave ON receta_medicamentos (nombre_clave, receta_id);
+CREATE TABLE IF NOT EXISTS recurrencias (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    inicio TEXT NOT NULL,
+    especialidad TEXT NOT NULL,
+    repeticiones INTEGER NOT NULL,
+    intervalo INTEGER NOT NULL,  -- días
+    duracion INTEGER NOT NULL,   -- microsegundos
+    canceladas TEXT NOT NULL     -- lista JSON de fechas ISO
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_recurrencias_matricula_inicio ON recurrencias (matricula, inicio);
+"""
+
+# Las consultas son constantes: sqlite3 reutiliza la sentencia preparada
+_INSERTAR_PACIENTE = "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+_EXISTE_PACIENTE = "SELECT 1 FROM pacientes WHERE dni = ?"
+_OBTENER_PACIENTE = "SELECT nombre, dni, fecha_nacimiento FROM pacientes WHERE dni = ?"
+_LISTAR_PACIENTES = "SELECT nombre, dni, fecha_nacimiento FROM pacientes ORDER BY rowid"
+_PAGINA_PACIENTES = _LISTAR_PACIENTES + " LIMIT ? OFFSET ?"
+_DNIS_PACIENTES = "SELECT dni FROM pacientes ORDER BY rowid"
+_CONTAR_PACIENTES = "SELECT COUNT(*) FROM pacientes"
+_INSERTAR_MEDICO = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+_INSERTAR_ESPECIALIDAD = "INSERT INTO especialidades (matricula, tipo, dias) VALUES (?, ?, ?)"
+_LISTAR_MEDICOS = "SELECT matricula, nombre FROM medicos ORDER BY rowid"
+_LISTAR_ESPECIALIDADES = "SELECT matricula, tipo, dias FROM especialidades ORDER BY id"
+_INSERTAR_TURNO = (
+    "INSERT INTO turnos (dni, matricula, fecha_hora, fin, especialidad, duracion) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_COLUMNAS_TURNO = "t.dni, t.matricula, t.fecha_hora, t.especialidad, t.duracion"
+_INSERTAR_TURNO_CON_ID = (
+    "INSERT INTO turnos (id, dni, matricula, fecha_hora, fin, especialidad, duracion) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_LISTAR_TURNOS = f"SELECT {_COLUMNAS_TURNO} FROM turnos t ORDER BY t.id"
+_LISTAR_TURNOS_CON_ID = f"SELECT t.id, {_COLUMNAS_TURNO} FROM turnos t ORDER BY t.id"
+# Mayor id de turno asignado alguna vez (AUTOINCREMENT lo guarda aunque la fila se haya borrado)
+_ULTIMO_ID_TURNO = "SELECT seq FROM sqlite_sequence WHERE name = 'turnos'"
+_ACTUALIZAR_ULTIMO_ID_TURNO = "UPDATE sqlite_sequence SET seq = ? WHERE name = 'turnos'"
+_INSERTAR_ULTIMO_ID_TURNO = "INSERT INTO sqlite_sequence (name, seq) VALUES ('turnos', ?)"
+_PAGINA_TURNOS = (
+    f"SELECT {_COLUMNAS_TURNO} FROM turnos t WHERE t.fecha_hora >= ? AND t.fecha_hora < ? "
+    "ORDER BY t.id LIMIT ? OFFSET ?"
+)
+_BUSCAR_TURNO = "SELECT id FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+_OBTENER_TURNO = f"SELECT {_COLUMNAS_TURNO} FROM turnos t WHERE t.id = ?"
+_CANCELAR_TURNO = "DELETE FROM turnos WHERE id = ?"
+_REPROGRAMAR_TURNO = "UPDATE turnos SET fecha_hora = ?, fin = ?, duracion = ? WHERE id = ?"
+# Turno anterior que empieza antes del fin del intervalo (los turnos no se superponen)
+_TURNO_PREVIO = (
+    "SELECT fin FROM turnos WHERE matricula = ? AND fecha_hora < ? "
+    "ORDER BY fecha_hora DESC LIMIT 1"
+)
+_TURNO_PREVIO_EXCLUYENDO = (
+    "SELECT fin FROM turnos WHERE matricula = ? AND fecha_hora < ? AND id != ? "
+    "ORDER BY fecha_hora DESC LIMIT 1"
+)
+_TURNOS_MEDICO = (
+    f"SELECT {_COLUMNAS_TURNO} FROM turnos t "
+    "WHERE t.matricula = ? AND t.fecha_hora >= ? AND t.fecha_hora < ? ORDER BY t.fecha_hora"
+)
+_CONTAR_TURNOS = "SELECT COUNT(*) FROM turnos"
+_TURNOS_PACIENTE = f"SELECT {_COLUMNAS_TURNO} FROM turnos t WHERE t.dni = ? ORDER BY t.id"
+_INSERTAR_RECETA = "INSERT INTO recetas (dni, matricula, fecha, medicamentos) VALUES (?, ?, ?, ?)"
+_RECETAS_PACIENTE = "SELECT matricula, fecha, medicamentos FROM recetas WHERE dni = ? ORDER BY id"
+_INSERTAR_RECURRENCIA = (
+    "INSERT INTO recurrencias (dni, matricula, inicio, especialidad, repeticiones, intervalo, duracion, canceladas) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_LISTAR_RECURRENCIAS = (
+    "SELECT dni, matricula, inicio, especialidad, repeticiones, intervalo, duracion, canceladas "
+    "FROM recurrencias ORDER BY id"
+)
+_CANCELAR_SESION = "UPDATE recurrencias SET canceladas = ? WHERE matricula = ? AND inicio = ?"
+_INSERTAR_MEDICAMENTO_RECETA = "INSERT INTO receta_medicamentos (receta_id, nombre_clave) VALUES (?, ?)"
+_LISTAR_MEDICAMENTOS_RECETAS = "SELECT id, medicamentos FROM recetas"
+_RECETAS_CON_MEDICAMENTO = (
+    "SELECT r.dni, r.matricula, r.fecha, r.medicamentos FROM recetas r "
+    "WHERE r.id IN (SELECT receta_id FROM receta_medicamentos WHERE nombre_clave = ?) "
+    "ORDER BY r.fecha, r.id"
+)
+
+# Versión del esquema (PRAGMA user_version); __migrar actualiza las bases anteriores
+# 1: tabla receta_medicamentos; 2: duraciones en microsegundos (antes, en segundos)
+VERSION_ESQUEMA = 2
+_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+def _claves_medicamentos(medicamentos: list[str]) -> list[str]:
+    """Devuelve las claves de búsqueda de los medicamentos de una receta, sin repetir."""
+    # Igual que CatalogoMedicamentos.buscar, sin distinguir mayúsculas
+    return list(dict.fromkeys(nombre.lower() for nombre in medicamentos))
+
+
+class _VistaPacientes(Mapping):
+    """Mapeo de sólo lectura DNI -> Paciente que consulta la base en cada acceso."""
+
+    def __init__(self, almacen: "AlmacenSQLite", conexion: sqlite3.Connection):
+        self.__almacen = almacen
+        self.__conexion = conexion
+
+    def __getitem__(self, dni: str) -> Paciente:
+        if not self.__almacen.existe_paciente(dni):
+            raise KeyError(dni)
+        return self.__almacen.obtener_paciente(dni)
+
+    def __contains__(self, dni) -> bool:
+        return self.__almacen.existe_paciente(dni)
+
+    def __iter__(self):
+        return (fila[0] for fila in self.__conexion.execute(_DNIS_PACIENTES))
+
+    def __len__(self) -> int:
+        return self.__conexion.execute(_CONTAR_PACIENTES).fetchone()[0]
+
+
+class AlmacenSQLite(Almacen):
+    """
+    Almacén respaldado por SQLite con índices por DNI, matrícula y
+    (matrícula, fecha_hora).
+
+    Las series de turnos recurrentes son reglas pequeñas: se cargan al abrir
+    junto con los médicos y las consultas de disponibilidad las resuelven en
+    memoria. Las historias clínicas se arman bajo demanda a partir de las consultas
+    por DNI: modificar el objeto devuelto no cambia lo guardado. El id de un
+    turno es su rowid; cancelarlo borra la fila (AUTOINCREMENT evita que el
+    id se reutilice) y reprogramarlo la actualiza en su lugar.
+
+    Atributos privados:
+        __conexion (sqlite3.Connection): Conexión a la base
+        __medicos (dict[str, Medico]): Matrícula -> Medico, cargados al abrir
+        __recurrencias (list[TurnoRecurrente]): Series de turnos recurrentes, cargadas al abrir
+        __recurrencias_medico (dict[str, list[TurnoRecurrente]]): Matrícula -> series del médico
+        __id_pendiente (int | None): Id para el próximo turno indicado con avanzar_id_turno
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Abre (o crea) la base de datos.
+
+        Args:
+            ruta (str): Archivo de la base, o ":memory:" para una base temporal
+        """
+        self.__conexion = sqlite3.connect(ruta)
+        self.__conexion.execute("PRAGMA journal_mode = WAL")
+        self.__conexion.execute("PRAGMA synchronous = NORMAL")
+        self.__conexion.executescript(_ESQUEMA)
+        self.__migrar()
+        self.__medicos = self.__cargar_medicos()
+        self.__recurrencias = []
+        self.__recurrencias_medico = {}
+        self.__id_pendiente = None
+        self.__cargar_recurrencias()
+
+    def __migrar(self) -> None:
+        """Lleva una base creada con una versión anterior del esquema a VERSION_ESQUEMA."""
+        version = self.__conexion.execute("PRAGMA user_version").fetchone()[0]
+        if version >= VERSION_ESQUEMA:
+            return
+        with self.__conexion:
+            if version < 1:
+                self.__conexion.executemany(_INSERTAR_MEDICAMENTO_RECETA, [
+                    (id_receta, clave)
+                    for id_receta, medicamentos in self.__conexion.execute(_LISTAR_MEDICAMENTOS_RECETAS).fetchall()
+                    for clave in _claves_medicamentos(json.loads(medicamentos))
+                ])
+            if version < 2:
+                self.__conexion.execute("UPDATE turnos SET duracion = duracion * 1000000")
+                self.__conexion.execute("UPDATE recurrencias SET duracion = duracion * 1000000")
+            self.__conexion.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+
+    def __cargar_medicos(self) -> dict:
+        medicos = {
+            matricula: Medico(nombre, matricula)
+            for matricula, nombre in self.__conexion.execute(_LISTAR_MEDICOS)
+        }
+        for matricula, tipo, dias in self.__conexion.execute(_LISTAR_ESPECIALIDADES):
+            medicos[matricula].agregar_especialidad(Especialidad(tipo, json.loads(dias)))
+        return medicos
+
+    def __cargar_recurrencias(self) -> None:
+        pacientes = {}
+        for (dni, matricula, inicio, especialidad, repeticiones,
+             intervalo, duracion, canceladas) in self.__conexion.execute(_LISTAR_RECURRENCIAS).fetchall():
+            paciente = pacientes.get(dni)
+            if paciente is None:
+                paciente = pacientes[dni] = self.obtener_paciente(dni)
+            self.__indexar_recurrencia(TurnoRecurrente.restaurar(
+                paciente,
+                self.__medicos[matricula],
+                datetime.fromisoformat(inicio),
+                especialidad,
+                repeticiones,
+                timedelta(days=intervalo),
+                timedelta(microseconds=duracion),
+                map(datetime.fromisoformat, json.loads(canceladas)),
+            ))
+
+    def __indexar_recurrencia(self, recurrencia: TurnoRecurrente) -> None:
+        self.__recurrencias.append(recurrencia)
+        matricula = recurrencia.obtener_medico().obtener_matricula()
+        self.__recurrencias_medico.setdefault(matricula, []).append(recurrencia)
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base."""
+        self.__conexion.close()
+
+    def agregar_paciente(self, paciente: Paciente) -> None:
+        with self.__conexion:
+            self.__conexion.execute(_INSERTAR_PACIENTE, (
+                paciente.obtener_dni(), paciente.obtener_nombre(), paciente.obtener_fecha_nacimiento().isoformat()
+            ))
+
+    def agregar_pacientes(self, pacientes: list[Paciente]) -> None:
+        with self.__conexion:
+            self.__conexion.executemany(_INSERTAR_PACIENTE, [
+                (p.obtener_dni(), p.obtener_nombre(), p.obtener_fecha_nacimiento().isoformat())
+                for p in pacientes
+            ])
+
+    def existe_paciente(self, dni: str) -> bool:
+        return self.__conexion.execute(_EXISTE_PACIENTE, (dni,)).fetchone() is not None
+
+    @staticmethod
+    def __construir_paciente(nombre: str, dni: str, fecha_nacimiento: str) -> Paciente:
+        # Lo guardado ya fue validado al registrarlo
+        return Paciente.restaurar(nombre, dni, date.fromisoformat(fecha_nacimiento))
+
+    def obtener_paciente(self, dni: str) -> Paciente:
+        return self.__construir_paciente(*self.__conexion.execute(_OBTENER_PACIENTE, (dni,)).fetchone())
+
+    def listar_pacientes(self) -> list[Paciente]:
+        return [self.__construir_paciente(*fila) for fila in self.__conexion.execute(_LISTAR_PACIENTES)]
+
+    def iterar_pacientes(self, offset: int = 0, limite: int | None = None) -> Iterator[Paciente]:
+        filas = self.__conexion.execute(_PAGINA_PACIENTES, (-1 if limite is None else limite, offset))
+        return (self.__construir_paciente(*fila) for fila in filas)
+
+    def vista_pacientes(self) -> Mapping[str, Paciente]:
+        return _VistaPacientes(self, self.__conexion)
+
+    def agregar_medico(self, medico: Medico) -> None:
+        matricula = medico.obtener_matricula()
+        with self.__conexion:
+            self.__conexion.execute(_INSERTAR_MEDICO, (matricula, medico.obtener_nombre()))
+            self.__conexion.executemany(_INSERTAR_ESPECIALIDAD, [
+                (matricula, esp.obtener_especialidad(), json.dumps(esp.obtener_dias()))
+                for esp in medico.obtener_especialidades()
+            ])
+        self.__medicos[matricula] = medico
+
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad) -> None:
+        with self.__conexion:
+            self.__conexion.execute(_INSERTAR_ESPECIALIDAD, (
+                medico.obtener_matricula(),
+                especialidad.obtener_especialidad(),
+                json.dumps(especialidad.obtener_dias()),
+            ))
+
+    def existe_medico(self, matricula: str) -> bool:
+        return matricula in self.__medicos
+
+    def obtener_medico(self, matricula: str) -> Medico:
+        return self.__medicos[matricula]
+
+    def listar_medicos(self) -> list[Medico]:
+        return list(self.__medicos.values())
+
+    def vista_medicos(self) -> Mapping[str, Medico]:
+        return MappingProxyType(self.__medicos)
+
+    @staticmethod
+    def __fila_turno(turno: Turno) -> tuple:
+        return (
+            turno.obtener_paciente().obtener_dni(),
+            turno.obtener_medico().obtener_matricula(),
+            turno.obtener_fecha_hora().isoformat(),
+            turno.obtener_fecha_hora_fin().isoformat(),
+            turno.obtener_especialidad(),
+            turno.obtener_duracion() // _MICROSEGUNDO,
+        )
+
+    def agregar_turno(self, turno: Turno) -> int:
+        with self.__conexion:
+            if self.__id_pendiente is not None:
+                id_turno, self.__id_pendiente = self.__id_pendiente, None
+                self.__conexion.execute(_INSERTAR_TURNO_CON_ID, (id_turno, *self.__fila_turno(turno)))
+                return id_turno
+            return self.__conexion.execute(_INSERTAR_TURNO, self.__fila_turno(turno)).lastrowid
+
+    def agregar_turnos(self, turnos: list[Turno]) -> None:
+        with self.__conexion:
+            if self.__id_pendiente is not None:
+                # Con ids explícitos AUTOINCREMENT sigue a partir del mayor
+                primero, self.__id_pendiente = self.__id_pendiente, None
+                self.__conexion.executemany(_INSERTAR_TURNO_CON_ID, [
+                    (id_turno, *self.__fila_turno(turno)) for id_turno, turno in enumerate(turnos, primero)
+                ])
+                return
+            self.__conexion.executemany(_INSERTAR_TURNO, [self.__fila_turno(turno) for turno in turnos])
+
+    def __ultimo_id_turno(self) -> int | None:
+        """Devuelve el mayor id de turno asignado alguna vez, o None si nunca se guardó uno."""
+        fila = self.__conexion.execute(_ULTIMO_ID_TURNO).fetchone()
+        return None if fila is None else fila[0]
+
+    def siguiente_id_turno(self) -> int:
+        if self.__id_pendiente is not None:
+            return self.__id_pendiente
+        ultimo = self.__ultimo_id_turno()
+        return 1 if ultimo is None else ultimo + 1
+
+    def avanzar_id_turno(self, siguiente: int) -> None:
+        ultimo = self.__ultimo_id_turno()
+        if ultimo is not None and siguiente <= ultimo:
+            raise ValueError(f"El id de turno {siguiente} ya está en uso")
+        self.__id_pendiente = siguiente
+        if siguiente > 0:
+            # Se guarda también en la base, por si no se agregan más turnos antes de cerrarla
+            with self.__conexion:
+                if self.__conexion.execute(_ACTUALIZAR_ULTIMO_ID_TURNO, (siguiente - 1,)).rowcount == 0:
+                    self.__conexion.execute(_INSERTAR_ULTIMO_ID_TURNO, (siguiente - 1,))
+
+    def __construir_turnos(self, filas, pacientes: dict | None = None) -> list[Turno]:
+        """Convierte filas de turnos en objetos, leyendo cada paciente una sola vez."""
+        pacientes = {} if pacientes is None else pacientes
+        turnos = []
+        for dni, matricula, fecha_hora, especialidad, duracion in filas:
+            paciente = pacientes.get(dni)
+            if paciente is None:
+                paciente = pacientes[dni] = self.obtener_paciente(dni)
+            turnos.append(Turno.restaurar(
+                paciente,
+                self.__medicos[matricula],
+                datetime.fromisoformat(fecha_hora),
+                especialidad,
+                timedelta(microseconds=duracion),
+            ))
+        return turnos
+
+    def listar_turnos(self) -> list[Turno]:
+        return self.__construir_turnos(self.__conexion.execute(_LISTAR_TURNOS))
+
+    def iterar_turnos_con_id(self) -> Iterator[tuple[int, Turno]]:
+        filas = self.__conexion.execute(_LISTAR_TURNOS_CON_ID).fetchall()
+        return zip([fila[0] for fila in filas], self.__construir_turnos(fila[1:] for fila in filas))
+
+    def iterar_turnos(self, desde: datetime | None = None, hasta: datetime | None = None,
+                      offset: int = 0, limite: int | None = None) -> Iterator[Turno]:
+        # Los extremos abiertos se reemplazan por cotas que toda fecha ISO cumple
+        filas = self.__conexion.execute(_PAGINA_TURNOS, (
+            "" if desde is None else desde.isoformat(),
+            "\uffff" if hasta is None else hasta.isoformat(),
+            -1 if limite is None else limite,
+            offset,
+        ))
+        return iter(self.__construir_turnos(filas))
+
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        return self.buscar_turno(matricula, fecha_hora) is not None
+
+    def buscar_turno(self, matricula: str, fecha_hora: datetime) -> int | None:
+        fila = self.__conexion.execute(_BUSCAR_TURNO, (matricula, fecha_hora.isoformat())).fetchone()
+        return None if fila is None else fila[0]
+
+    def obtener_turno(self, id_turno: int) -> Turno | None:
+        turnos = self.__construir_turnos(self.__conexion.execute(_OBTENER_TURNO, (id_turno,)))
+        return turnos[0] if turnos else None
+
+    def cancelar_turno(self, id_turno: int) -> None:
+        with self.__conexion:
+            self.__conexion.execute(_CANCELAR_TURNO, (id_turno,))
+
+    def reprogramar_turno(self, id_turno: int, fecha_hora: datetime, duracion: timedelta) -> None:
+        with self.__conexion:
+            self.__conexion.execute(_REPROGRAMAR_TURNO, (
+                fecha_hora.isoformat(), (fecha_hora + duracion).isoformat(),
+                duracion // _MICROSEGUNDO, id_turno,
+            ))
+
+    def esta_libre(self, matricula: str, inicio: datetime, fin: datetime,
+                   excluir: int | None = None) -> bool:
+        if excluir is None:
+            fila = self.__conexion.execute(_TURNO_PREVIO, (matricula, fin.isoformat())).fetchone()
+        else:
+            fila = self.__conexion.execute(_TURNO_PREVIO_EXCLUYENDO, (matricula, fin.isoformat(), excluir)).fetchone()
+        if fila is not None and datetime.fromisoformat(fila[0]) > inicio:
+            return False
+        return not any(r.se_superpone(inicio, fin) for r in self.__recurrencias_medico.get(matricula, ()))
+
+    def obtener_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        filas = self.__conexion.execute(_TURNOS_MEDICO, (matricula, desde.isoformat(), hasta.isoformat()))
+        return self.__construir_turnos(filas)
+
+    def contar_turnos(self, matricula: str | None = None, especialidad: str | None = None,
+                      desde: datetime | None = None, hasta: datetime | None = None) -> int:
+        condiciones, parametros = [], []
+        if matricula is not None:
+            condiciones.append("matricula = ?")
+            parametros.append(matricula)
+        if especialidad is not None:
+            condiciones.append("lower(especialidad) = ?")
+            parametros.append(especialidad.strip().lower())
+        if desde is not None:
+            condiciones.append("fecha_hora >= ?")
+            parametros.append(desde.isoformat())
+        if hasta is not None:
+            condiciones.append("fecha_hora < ?")
+            parametros.append(hasta.isoformat())
+        consulta = _CONTAR_TURNOS + (" WHERE " + " AND ".join(condiciones) if condiciones else "")
+        return self.__conexion.execute(consulta, parametros).fetchone()[0]
+
+    def agregar_recurrencia(self, recurrencia: TurnoRecurrente) -> None:
+        with self.__conexion:
+            self.__conexion.execute(_INSERTAR_RECURRENCIA, (
+                recurrencia.obtener_paciente().obtener_dni(),
+                recurrencia.obtener_medico().obtener_matricula(),
+                recurrencia.obtener_fecha_hora_inicio().isoformat(),
+                recurrencia.obtener_especialidad(),
+                recurrencia.obtener_repeticiones(),
+                recurrencia.obtener_intervalo().days,
+                recurrencia.obtener_duracion() // _MICROSEGUNDO,
+                json.dumps([fecha.isoformat() for fecha in recurrencia.obtener_canceladas()]),
+            ))
+        self.__indexar_recurrencia(recurrencia)
+
+    def listar_recurrencias(self) -> list[TurnoRecurrente]:
+        return self.__recurrencias.copy()
+
+    def obtener_recurrencias_medico(self, matricula: str) -> list[TurnoRecurrente]:
+        return self.__recurrencias_medico.get(matricula, []).copy()
+
+    def cancelar_sesion(self, recurrencia: TurnoRecurrente, fecha_hora: datetime) -> None:
+        recurrencia.cancelar_sesion(fecha_hora)
+        with self.__conexion:
+            self.__conexion.execute(_CANCELAR_SESION, (
+                json.dumps([fecha.isoformat() for fecha in recurrencia.obtener_canceladas()]),
+                recurrencia.obtener_medico().obtener_matricula(),
+                recurrencia.obtener_fecha_hora_inicio().isoformat(),
+            ))
+
+    def agregar_receta(self, receta: Receta) -> None:
+        with self.__conexion:
+            id_receta = self.__conexion.execute(_INSERTAR_RECETA, (
+                receta.obtener_paciente().obtener_dni(),
+                receta.obtener_medico().obtener_matricula(),
+                receta.obtener_fecha().isoformat(),
+                json.dumps(receta.obtener_medicamentos(), ensure_ascii=False),
+            )).lastrowid
+            self.__conexion.executemany(_INSERTAR_MEDICAMENTO_RECETA, [
+                (id_receta, clave) for clave in _claves_medicamentos(receta.obtener_medicamentos())
+            ])
+
+    def obtener_recetas_con_medicamento(self, nombre: str) -> list[Receta]:
+        pacientes = {}
+        recetas = []
+        for dni, matricula, fecha, medicamentos in self.__conexion.execute(
+            _RECETAS_CON_MEDICAMENTO, (nombre.strip().lower(),)
+        ):
+            paciente = pacientes.get(dni)
+            if paciente is None:
+                paciente = pacientes[dni] = self.obtener_paciente(dni)
+            recetas.append(Receta.restaurar(
+                paciente, self.__medicos[matricula], json.loads(medicamentos), datetime.fromisoformat(fecha)
+            ))
+        return recetas
+
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        historia = HistoriaClinica(self.obtener_paciente(dni))
+        turnos, recetas, recurrencias = self.obtener_registros_paciente(dni)
+        for turno in turnos:
+            historia.agregar_turno(turno)
+        for receta in recetas:
+            historia.agregar_receta(receta)
+        for recurrencia in recurrencias:
+            historia.agregar_recurrencia(recurrencia)
+        return historia
+
+    def obtener_registros_paciente(self, dni: str) -> tuple[list[Turno], list[Receta], list[TurnoRecurrente]]:
+        paciente = self.obtener_paciente(dni)
+        turnos = self.__construir_turnos(self.__conexion.execute(_TURNOS_PACIENTE, (dni,)), {dni: paciente})
+        recetas = [
+            Receta.restaurar(paciente, self.__medicos[matricula], json.loads(medicamentos), datetime.fromisoformat(fecha))
+            for matricula, fecha, medicamentos in self.__conexion.execute(_RECETAS_PACIENTE, (dni,))
+        ]
+        recurrencias = [r for r in self.__recurrencias if r.obtener_paciente().obtener_dni() == dni]
+        return turnos, recetas, recurrencias
@@ -0,0 +1,502 @@
+"""
+Formato binario compacto para guardar y cargar una clínica completa.
+
+A diferencia del snapshot JSON (que repite DNI, matrícula y especialidad en
+cada turno) o de pickle (que recorre el grafo de objetos), el archivo guarda
+cada texto una sola vez en un pool de cadenas y se refiere a pacientes,
+médicos, especialidades y medicamentos por número.
+
+Estructura (little-endian):
+
+    encabezado   "CLNB", versión (u16), 10 bytes de relleno       16 bytes
+    secciones    tipo (u8), 3 de relleno, cantidad (u32), largo (u64) + datos
+
+Cada sección ocupa un múltiplo de 8 bytes, así que los datos de todas
+quedan alineados y el archivo puede mapearse en memoria (mmap) y leerse sin
+copiar (ver VistaBinaria). Tipos de sección:
+
+    CADENAS       cantidad+1 desplazamientos u32 y los textos en UTF-8; se
+                  agregan al pool antes de la primera sección que los usa
+    PACIENTES     por paciente "<IIi": nombre, DNI (cadenas) y fecha de
+                  nacimiento (ordinal); los ids siguen el orden del archivo
+    MEDICOS       por médico "<IIH": nombre, matrícula y cantidad de
+                  especialidades, y por cada una "<IB": tipo y días (bits,
+                  lunes = bit 0)
+    TURNOS        un bloque de turnos por columnas: ids e inicios y
+                  duraciones (i64, microsegundos) y pacientes, médicos y
+                  especialidades (u32), cada columna contigua
+    RECETAS       por receta "<IIqH": paciente, médico, fecha (microsegundos)
+                  y cantidad de medicamentos, seguido de sus cadenas (u32)
+    RECURRENCIAS  por serie "<IIIqIIqI": paciente, médico, especialidad,
+                  inicio, repeticiones, días de intervalo, duración y cantidad
+                  de sesiones canceladas, seguido de sus fechas (i64)
+    SIGUIENTE_TURNO  id del próximo turno "<q", para no reusar los ids de
+                  los turnos cancelados al final
+    FIN           cierra el archivo
+
+La escritura y la lectura son en streaming: se procesan bloques de
+TAMANO_BLOQUE turnos sin tener el archivo completo en memoria, y los turnos
+se leen y se cargan por columnas, sin crear un objeto Turno por fila.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date, timedelta
+from itertools import islice
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad, DIAS_SEMANA, INDICE_DIA_SEMANA
+from src.modelo.receta import Receta
+from src.modelo.recurrencia import TurnoRecurrente
+from src.modelo.tabla_turnos import a_microsegundos, desde_microsegundos
+
+
+MAGICO = b"CLNB"
+VERSION_BINARIO = 2  # 2: turnos con su id y sección SIGUIENTE_TURNO
+# Turnos por sección TURNOS (y pacientes o recetas por sección de su tipo)
+TAMANO_BLOQUE = 65_536
+
+FIN, CADENAS, PACIENTES, MEDICOS, TURNOS, RECETAS, RECURRENCIAS, SIGUIENTE_TURNO = range(8)
+
+_ENCABEZADO = struct.Struct("<4sH10x")
+_SECCION = struct.Struct("<B3xIQ")
+_PACIENTE = struct.Struct("<IIi")
+_MEDICO = struct.Struct("<IIH")
+_ESPECIALIDAD = struct.Struct("<IB")
+_RECETA = struct.Struct("<IIqH")
+_RECURRENCIA = struct.Struct("<IIIqIIqI")
+_SIGUIENTE_TURNO = struct.Struct("<q")
+_MICROSEGUNDO = timedelta(microseconds=1)
+# Los arreglos se escriben en little-endian aunque la máquina no lo sea
+_INVERTIR = sys.byteorder == "big"
+
+
+def _a_bytes(arreglo: array) -> bytes:
+    """Devuelve el contenido del arreglo en little-endian."""
+    if _INVERTIR:
+        arreglo = array(arreglo.typecode, arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _desde_bytes(tipo: str, datos) -> array:
+    """Crea un arreglo a partir de bytes en little-endian."""
+    arreglo = array(tipo)
+    arreglo.frombytes(datos)
+    if _INVERTIR:
+        arreglo.byteswap()
+    return arreglo
+
+
+def _dias_a_bits(dias: list[str]) -> int:
+    """Convierte días de atención en una máscara de bits (lunes = bit 0)."""
+    bits = 0
+    for dia in dias:
+        bits |= 1 << INDICE_DIA_SEMANA[dia]
+    return bits
+
+
+def _bits_a_dias(bits: int) -> list[str]:
+    """Convierte una máscara de bits en los días de atención."""
+    return [dia for i, dia in enumerate(DIAS_SEMANA) if bits >> i & 1]
+
+
+class EscritorBinario:
+    """
+    Escribe una clínica en formato binario, sección por sección.
+
+    Los textos nuevos se acumulan y se escriben como sección CADENAS justo
+    antes de la sección que los usa, así que no hace falta conocer el pool
+    completo de antemano.
+
+    Atributos privados:
+        __archivo: Archivo binario abierto para escritura
+        __cadenas (dict[str, int]): Texto -> id en el pool
+        __nuevas (list[str]): Textos todavía no escritos
+        __pacientes (dict[str, int]): DNI -> id de paciente
+        __medicos (dict[str, int]): Matrícula -> id de médico
+    """
+
+    def __init__(self, archivo):
+        """
+        Escribe el encabezado.
+
+        Args:
+            archivo: Archivo binario abierto para escritura (no necesita ser seekable)
+        """
+        self.__archivo = archivo
+        self.__cadenas = {}
+        self.__nuevas = []
+        self.__pacientes = {}
+        self.__medicos = {}
+        archivo.write(_ENCABEZADO.pack(MAGICO, VERSION_BINARIO))
+
+    def __cadena(self, texto: str) -> int:
+        """Devuelve el id del texto en el pool, agregándolo si es nuevo."""
+        id_cadena = self.__cadenas.get(texto)
+        if id_cadena is None:
+            id_cadena = self.__cadenas[texto] = len(self.__cadenas)
+            self.__nuevas.append(texto)
+        return id_cadena
+
+    def __seccion(self, tipo: int, cantidad: int, partes: list) -> None:
+        """Escribe las cadenas pendientes y luego una sección, completando hasta múltiplo de 8."""
+        if self.__nuevas and tipo != CADENAS:
+            nuevas, self.__nuevas = self.__nuevas, []
+            codificadas = [texto.encode("utf-8") for texto in nuevas]
+            desplazamientos, total = array("I", [0]), 0
+            for texto in codificadas:
+                total += len(texto)
+                desplazamientos.append(total)
+            self.__seccion(CADENAS, len(nuevas), [_a_bytes(desplazamientos), *codificadas])
+        largo = sum(map(len, partes))
+        relleno = -largo % 8
+        self.__archivo.write(_SECCION.pack(tipo, cantidad, largo + relleno))
+        self.__archivo.writelines(partes)
+        self.__archivo.write(b"\0" * relleno)
+
+    def escribir_pacientes(self, pacientes: list[Paciente]) -> None:
+        """Escribe una sección de pacientes; los turnos y recetas sólo pueden referirse a pacientes ya escritos."""
+        cadena, ids = self.__cadena, self.__pacientes
+        datos = bytearray()
+        for paciente in pacientes:
+            dni = paciente.obtener_dni()
+            ids[dni] = len(ids)
+            datos += _PACIENTE.pack(cadena(paciente.obtener_nombre()), cadena(dni),
+                                    paciente.obtener_fecha_nacimiento().toordinal())
+        self.__seccion(PACIENTES, len(pacientes), [datos])
+
+    def escribir_medicos(self, medicos: list[Medico]) -> None:
+        """Escribe una sección de médicos con sus especialidades."""
+        cadena, ids = self.__cadena, self.__medicos
+        datos = bytearray()
+        for medico in medicos:
+            matricula = medico.obtener_matricula()
+            ids[matricula] = len(ids)
+            especialidades = medico.obtener_especialidades()
+            datos += _MEDICO.pack(cadena(medico.obtener_nombre()), cadena(matricula), len(especialidades))
+            for especialidad in especialidades:
+                datos += _ESPECIALIDAD.pack(cadena(especialidad.obtener_especialidad()),
+                                            _dias_a_bits(especialidad.obtener_dias()))
+        self.__seccion(MEDICOS, len(medicos), [datos])
+
+    def escribir_turnos(self, ids: array, dnis: list[str], matriculas: list[str], especialidades: list[str],
+                        inicios: array, duraciones: array) -> None:
+        """Escribe un bloque de turnos dados por columnas (ver Clinica.iter_columnas_turnos)."""
+        columna_pacientes = array("I", map(self.__pacientes.__getitem__, dnis))
+        columna_medicos = array("I", map(self.__medicos.__getitem__, matriculas))
+        columna_especialidades = array("I", map(self.__cadena, especialidades))
+        self.__seccion(TURNOS, len(dnis), [
+            _a_bytes(array("q", ids)), _a_bytes(array("q", inicios)), _a_bytes(array("q", duraciones)),
+            _a_bytes(columna_pacientes), _a_bytes(columna_medicos), _a_bytes(columna_especialidades),
+        ])
+
+    def escribir_recetas(self, recetas: list[Receta]) -> None:
+        """Escribe una sección de recetas."""
+        cadena = self.__cadena
+        datos = bytearray()
+        for receta in recetas:
+            medicamentos = receta.obtener_medicamentos()
+            datos += _RECETA.pack(self.__pacientes[receta.obtener_paciente().obtener_dni()],
+                                  self.__medicos[receta.obtener_medico().obtener_matricula()],
+                                  a_microsegundos(receta.obtener_fecha()), len(medicamentos))
+            datos += struct.pack(f"<{len(medicamentos)}I", *map(cadena, medicamentos))
+        self.__seccion(RECETAS, len(recetas), [datos])
+
+    def escribir_recurrencias(self, recurrencias: list[TurnoRecurrente]) -> None:
+        """Escribe una sección de series de turnos recurrentes."""
+        datos = bytearray()
+        for serie in recurrencias:
+            canceladas = serie.obtener_canceladas()
+            datos += _RECURRENCIA.pack(
+                self.__pacientes[serie.obtener_paciente().obtener_dni()],
+                self.__medicos[serie.obtener_medico().obtener_matricula()],
+                self.__cadena(serie.obtener_especialidad()),
+                a_microsegundos(serie.obtener_fecha_hora_inicio()),
+                serie.obtener_repeticiones(),
+                serie.obtener_intervalo().days,
+                serie.obtener_duracion() // _MICROSEGUNDO,
+                len(canceladas),
+            )
+            datos += struct.pack(f"<{len(canceladas)}q", *map(a_microsegundos, canceladas))
+        self.__seccion(RECURRENCIAS, len(recurrencias), [datos])
+
+    def escribir_siguiente_turno(self, siguiente: int) -> None:
+        """Escribe el id que recibirá el próximo turno agendado."""
+        self.__seccion(SIGUIENTE_TURNO, 1, [_SIGUIENTE_TURNO.pack(siguiente)])
+
+    def cerrar(self) -> None:
+        """Escribe la sección final; el archivo queda a cargo de quien lo abrió."""
+        self.__seccion(FIN, 0, [])
+
+
+def escribir_clinica(clinica: Clinica, archivo, tamano_bloque: int = TAMANO_BLOQUE) -> None:
+    """
+    Escribe la clínica completa en un archivo binario abierto (por ejemplo, un pipe).
+
+    Args:
+        clinica (Clinica): Clínica a guardar
+        archivo: Archivo binario abierto para escritura
+        tamano_bloque (int): Turnos, pacientes o recetas por sección
+    """
+    escritor = EscritorBinario(archivo)
+    escritor.escribir_medicos(clinica.obtener_medicos())
+    pacientes = iter(clinica.iter_pacientes())
+    while lote := list(islice(pacientes, tamano_bloque)):
+        escritor.escribir_pacientes(lote)
+    for columnas in clinica.iter_columnas_turnos(tamano_bloque):
+        escritor.escribir_turnos(*columnas)
+    recetas = iter(clinica.iter_recetas())
+    while lote := list(islice(recetas, tamano_bloque)):
+        escritor.escribir_recetas(lote)
+    recurrencias = clinica.obtener_recurrencias()
+    if recurrencias:
+        escritor.escribir_recurrencias(recurrencias)
+    escritor.escribir_siguiente_turno(clinica.obtener_siguiente_id_turno())
+    escritor.cerrar()
+
+
+def guardar_binario(clinica: Clinica, ruta: str) -> None:
+    """
+    Guarda la clínica en un archivo binario, reemplazándolo de forma atómica.
+
+    Args:
+        clinica (Clinica): Clínica a guardar
+        ruta (str): Archivo de destino
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        escribir_clinica(clinica, archivo)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+def leer_secciones(archivo):
+    """
+    Genera las secciones de un archivo binario abierto (o de un mmap), hasta la de FIN.
+
+    Yields:
+        tuple: (tipo, cantidad, datos en bytes)
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato o la versión esperados, o está truncado
+    """
+    magico, version = _ENCABEZADO.unpack(archivo.read(_ENCABEZADO.size))
+    if magico != MAGICO or version != VERSION_BINARIO:
+        raise ValueError("El archivo no es una clínica en formato binario compatible")
+    while True:
+        encabezado = archivo.read(_SECCION.size)
+        if len(encabezado) < _SECCION.size:
+            raise ValueError("El archivo binario está truncado")
+        tipo, cantidad, largo = _SECCION.unpack(encabezado)
+        if tipo == FIN:
+            return
+        datos = archivo.read(largo)
+        if len(datos) < largo:
+            raise ValueError("El archivo binario está truncado")
+        yield tipo, cantidad, datos
+
+
+def _decodificar_cadenas(cantidad: int, datos) -> list[str]:
+    """Decodifica una sección CADENAS."""
+    desplazamientos = _desde_bytes("I", datos[:4 * (cantidad + 1)])
+    textos = bytes(datos[4 * (cantidad + 1):])
+    return [textos[desplazamientos[i]:desplazamientos[i + 1]].decode("utf-8") for i in range(cantidad)]
+
+
+def _columnas_turnos(cantidad: int, datos) -> tuple[array, array, array, array, array, array]:
+    """Separa las columnas de una sección TURNOS: ids, inicios, duraciones, pacientes, médicos, especialidades."""
+    largos = (8 * cantidad, 8 * cantidad, 8 * cantidad, 4 * cantidad, 4 * cantidad, 4 * cantidad)
+    columnas, desde = [], 0
+    for tipo, largo in zip("qqqIII", largos):
+        columnas.append(_desde_bytes(tipo, datos[desde:desde + largo]))
+        desde += largo
+    return tuple(columnas)
+
+
+def leer_clinica(archivo, clinica: Clinica | None = None) -> Clinica:
+    """
+    Carga una clínica desde un archivo binario abierto, sección por sección.
+
+    Args:
+        archivo: Archivo binario abierto para lectura (también un pipe o un mmap)
+        clinica (Clinica | None): Clínica vacía donde cargar; por defecto, una nueva en memoria
+
+    Returns:
+        Clinica: Clínica con los datos del archivo
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado
+    """
+    clinica = Clinica() if clinica is None else clinica
+    cadenas, pacientes, medicos = [], [], []
+    for tipo, cantidad, datos in leer_secciones(archivo):
+        if tipo == CADENAS:
+            cadenas.extend(_decodificar_cadenas(cantidad, datos))
+        elif tipo == PACIENTES:
+            lote = [
+                Paciente.restaurar(cadenas[nombre], cadenas[dni], date.fromordinal(nacimiento))
+                for nombre, dni, nacimiento in _PACIENTE.iter_unpack(datos[:_PACIENTE.size * cantidad])
+            ]
+            clinica.agregar_pacientes_lote(lote)
+            pacientes.extend(lote)
+        elif tipo == MEDICOS:
+            desde = 0
+            for _ in range(cantidad):
+                nombre, matricula, especialidades = _MEDICO.unpack_from(datos, desde)
+                desde += _MEDICO.size
+                medico = Medico(cadenas[nombre], cadenas[matricula])
+                for _ in range(especialidades):
+                    tipo_especialidad, dias = _ESPECIALIDAD.unpack_from(datos, desde)
+                    desde += _ESPECIALIDAD.size
+                    medico.agregar_especialidad(Especialidad(cadenas[tipo_especialidad], _bits_a_dias(dias)))
+                clinica.agregar_medico(medico)
+                medicos.append(medico)
+        elif tipo == TURNOS:
+            ids, inicios, duraciones, ids_pacientes, ids_medicos, ids_especialidades = _columnas_turnos(cantidad, datos)
+            clinica.restaurar_turnos_columnas(
+                [pacientes[i] for i in ids_pacientes],
+                [medicos[i] for i in ids_medicos],
+                [cadenas[i] for i in ids_especialidades],
+                inicios,
+                duraciones,
+                ids,
+            )
+        elif tipo == RECETAS:
+            desde = 0
+            for _ in range(cantidad):
+                paciente, medico, fecha, cantidad_medicamentos = _RECETA.unpack_from(datos, desde)
+                desde += _RECETA.size
+                ids = struct.unpack_from(f"<{cantidad_medicamentos}I", datos, desde)
+                desde += 4 * cantidad_medicamentos
+                clinica.restaurar_receta(Receta.restaurar(
+                    pacientes[paciente], medicos[medico], [cadenas[i] for i in ids], desde_microsegundos(fecha)
+                ))
+        elif tipo == RECURRENCIAS:
+            desde = 0
+            for _ in range(cantidad):
+                (paciente, medico, especialidad, inicio, repeticiones, intervalo, duracion,
+                 cantidad_canceladas) = _RECURRENCIA.unpack_from(datos, desde)
+                desde += _RECURRENCIA.size
+                canceladas = struct.unpack_from(f"<{cantidad_canceladas}q", datos, desde)
+                desde += 8 * cantidad_canceladas
+                clinica.restaurar_recurrencia(TurnoRecurrente.restaurar(
+                    pacientes[paciente], medicos[medico], desde_microsegundos(inicio), cadenas[especialidad],
+                    repeticiones, timedelta(days=intervalo), timedelta(microseconds=duracion),
+                    map(desde_microsegundos, canceladas),
+                ))
+        elif tipo == SIGUIENTE_TURNO:
+            siguiente, = _SIGUIENTE_TURNO.unpack_from(datos)
+            if siguiente > clinica.obtener_siguiente_id_turno():
+                clinica.avanzar_id_turno(siguiente)
+        # Las secciones de tipos desconocidos se ignoran
+    return clinica
+
+
+def cargar_binario(ruta: str, clinica: Clinica | None = None) -> Clinica:
+    """
+    Carga una clínica desde un archivo binario, leyéndolo a través de un mmap.
+
+    Args:
+        ruta (str): Archivo a cargar
+        clinica (Clinica | None): Clínica vacía donde cargar; por defecto, una nueva en memoria
+
+    Returns:
+        Clinica: Clínica con los datos del archivo
+    """
+    with open(ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        return leer_clinica(mapa, clinica)
+
+
+class VistaBinaria:
+    """
+    Acceso de sólo lectura a un archivo binario mapeado en memoria, sin cargar la clínica.
+
+    Al abrirla se recorren sólo los encabezados de sección; los turnos se
+    leen como columnas que apuntan directamente al archivo mapeado.
+
+    Atributos privados:
+        __archivo: Archivo abierto
+        __mapa (mmap.mmap): Archivo mapeado en memoria
+        __secciones (list[tuple[int, int, int, int]]): (tipo, cantidad, desplazamiento, largo) de cada sección
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Mapea el archivo e indexa sus secciones.
+
+        Args:
+            ruta (str): Archivo binario
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        self.__archivo = open(ruta, "rb")
+        self.__mapa = mmap.mmap(self.__archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__secciones = []
+        magico, version = _ENCABEZADO.unpack_from(self.__mapa, 0)
+        if magico != MAGICO or version != VERSION_BINARIO:
+            self.cerrar()
+            raise ValueError("El archivo no es una clínica en formato binario compatible")
+        desde = _ENCABEZADO.size
+        while True:
+            tipo, cantidad, largo = _SECCION.unpack_from(self.__mapa, desde)
+            desde += _SECCION.size
+            if tipo == FIN:
+                break
+            self.__secciones.append((tipo, cantidad, desde, largo))
+            desde += largo
+
+    def contar(self, tipo: int) -> int:
+        """
+        Devuelve la cantidad de registros de un tipo de sección (por ejemplo, TURNOS).
+
+        Returns:
+            int: Suma de las cantidades de las secciones de ese tipo
+        """
+        return sum(cantidad for t, cantidad, _, _ in self.__secciones if t == tipo)
+
+    def cadenas(self) -> list[str]:
+        """Devuelve el pool de cadenas completo."""
+        cadenas = []
+        for tipo, cantidad, desde, largo in self.__secciones:
+            if tipo == CADENAS:
+                cadenas.extend(_decodificar_cadenas(cantidad, self.__mapa[desde:desde + largo]))
+        return cadenas
+
+    def columnas_turnos(self) -> list[tuple[memoryview, ...]]:
+        """
+        Devuelve cada bloque de turnos como columnas que apuntan al archivo, sin copiarlo.
+
+        Las columnas deben liberarse (o descartarse) antes de cerrar la vista.
+
+        Returns:
+            list[tuple[memoryview, ...]]: Por bloque, ids, inicios y duraciones (i64) y
+                pacientes, médicos y especialidades (u32), en el orden del archivo (little-endian)
+        """
+        bloques = []
+        for tipo, cantidad, desde, _ in self.__secciones:
+            if tipo != TURNOS:
+                continue
+            columnas = []
+            for formato, ancho in (("q", 8), ("q", 8), ("q", 8), ("I", 4), ("I", 4), ("I", 4)):
+                columnas.append(memoryview(self.__mapa)[desde:desde + ancho * cantidad].cast(formato))
+                desde += ancho * cantidad
+            bloques.append(tuple(columnas))
+        return bloques
+
+    def cerrar(self) -> None:
+        """Libera el mapeo y cierra el archivo."""
+        self.__mapa.close()
+        self.__archivo.close()
+
+    def __enter__(self) -> "VistaBinaria":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
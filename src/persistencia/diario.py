@@ -0,0 +1,327 @@
+"""
+Persistencia de la clínica mediante un registro de escritura anticipada (WAL)
+y snapshots periódicos.
+
+Cada operación que modifica la clínica se agrega como una línea JSON a un
+archivo de log que sólo crece. Cada cierta cantidad de registros el estado
+completo se compacta en un snapshot y el log se vacía, de modo que al
+reiniciar sólo hace falta cargar el snapshot y reproducir la cola del log.
+"""
+import json
+import os
+from datetime import datetime
+
+from src.modelo.clinica import Clinica
+from src.persistencia.serializacion import (
+    serializar_paciente, deserializar_paciente,
+    serializar_medico, deserializar_medico,
+    serializar_especialidad, deserializar_especialidad,
+    serializar_turno, deserializar_turno,
+    serializar_receta, deserializar_receta,
+    serializar_recurrencia, deserializar_recurrencia,
+    serializar_duracion, deserializar_duracion,
+)
+
+
+VERSION_SNAPSHOT = 3  # 2: turnos con su id y siguiente_id_turno; 3: duraciones en microsegundos
+
+
+def _serializar_especialidad_agregada(medico, especialidad) -> dict:
+    return {
+        "matricula": medico.obtener_matricula(),
+        "especialidad": serializar_especialidad(especialidad),
+    }
+
+
+def _aplicar_especialidad_agregada(clinica: Clinica, datos: dict) -> None:
+    medico = clinica.obtener_medico_por_matricula(datos["matricula"])
+    medico.agregar_especialidad(deserializar_especialidad(datos["especialidad"]))
+
+
+def _serializar_sesion_cancelada(recurrencia, fecha_hora) -> dict:
+    return {
+        "matricula": recurrencia.obtener_medico().obtener_matricula(),
+        "fecha_hora": fecha_hora.isoformat(),
+    }
+
+
+def _aplicar_sesion_cancelada(clinica: Clinica, datos: dict) -> None:
+    clinica.cancelar_sesion(datos["matricula"], datetime.fromisoformat(datos["fecha_hora"]))
+
+
+def _serializar_turno_agendado(turno, id_turno: int) -> dict:
+    return {"id": id_turno, **serializar_turno(turno, exacta=True)}
+
+
+def _aplicar_turno_agendado(clinica: Clinica, datos: dict) -> None:
+    # Los registros anteriores a que se guardara el id se numeran en orden, como al agendarlos
+    clinica.restaurar_turno(deserializar_turno(datos, clinica), datos.get("id"))
+
+
+def _serializar_turno_cancelado(turno) -> dict:
+    # El turno se identifica por médico y horario, que no dependen del almacén
+    return {
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+    }
+
+
+def _aplicar_turno_cancelado(clinica: Clinica, datos: dict) -> None:
+    clinica.cancelar_turno(clinica.buscar_turno(datos["matricula"], datetime.fromisoformat(datos["fecha_hora"])))
+
+
+def _serializar_reprogramacion(anterior, turno) -> dict:
+    return {
+        **_serializar_turno_cancelado(anterior),
+        "nueva_fecha_hora": turno.obtener_fecha_hora().isoformat(),
+        **serializar_duracion(turno.obtener_duracion()),
+    }
+
+
+def _aplicar_reprogramacion(clinica: Clinica, datos: dict) -> None:
+    clinica.restaurar_reprogramacion(
+        clinica.buscar_turno(datos["matricula"], datetime.fromisoformat(datos["fecha_hora"])),
+        datetime.fromisoformat(datos["nueva_fecha_hora"]),
+        deserializar_duracion(datos),
+    )
+
+
+# Operación -> función que arma el registro a partir de los objetos notificados
+_SERIALIZADORES = {
+    "agregar_paciente": serializar_paciente,
+    "agregar_medico": serializar_medico,
+    "agregar_especialidad": _serializar_especialidad_agregada,
+    "agendar_turno": _serializar_turno_agendado,
+    "emitir_receta": serializar_receta,
+    "agendar_turno_recurrente": serializar_recurrencia,
+    "cancelar_sesion": _serializar_sesion_cancelada,
+    "cancelar_turno": _serializar_turno_cancelado,
+    "reprogramar_turno": _serializar_reprogramacion,
+}
+
+# Operación -> función que vuelve a aplicar el registro sobre una clínica
+_APLICADORES = {
+    "agregar_paciente": lambda clinica, datos: clinica.agregar_paciente(deserializar_paciente(datos)),
+    "agregar_medico": lambda clinica, datos: clinica.agregar_medico(deserializar_medico(datos)),
+    "agregar_especialidad": _aplicar_especialidad_agregada,
+    "agendar_turno": _aplicar_turno_agendado,
+    "emitir_receta": lambda clinica, datos: clinica.restaurar_receta(deserializar_receta(datos, clinica)),
+    "agendar_turno_recurrente": lambda clinica, datos: clinica.restaurar_recurrencia(
+        deserializar_recurrencia(datos, clinica)
+    ),
+    "cancelar_sesion": _aplicar_sesion_cancelada,
+    "cancelar_turno": _aplicar_turno_cancelado,
+    "reprogramar_turno": _aplicar_reprogramacion,
+}
+
+
+class DiarioClinica:
+    """
+    Diario persistente de una clínica: log de operaciones más snapshot.
+
+    Los registros se escriben (flush) apenas ocurren, pero el fsync se hace
+    por lotes: ante un corte de energía se pueden perder, como máximo, los
+    últimos lote_sincronizacion - 1 registros. Cada registro lleva un número
+    de secuencia y el snapshot recuerda el último que incluye, así que una
+    caída entre escribir el snapshot y vaciar el log no duplica operaciones.
+
+    Atributos privados:
+        __directorio (str): Carpeta donde se guardan log y snapshot
+        __lote_sincronizacion (int): Registros escritos entre cada fsync
+        __umbral_compactacion (int): Registros en el log que disparan un snapshot
+        __clinica (Clinica | None): Clínica abierta por este diario
+        __archivo: Log abierto en modo append
+        __secuencia (int): Número del último registro escrito
+        __pendientes (int): Registros escritos desde el último fsync
+        __registros_en_log (int): Registros acumulados desde el último snapshot
+    """
+
+    ARCHIVO_LOG = "clinica.log"
+    ARCHIVO_SNAPSHOT = "clinica.snapshot.json"
+
+    def __init__(self, directorio: str, lote_sincronizacion: int = 64,
+                 umbral_compactacion: int = 10_000):
+        """
+        Inicializa el diario sin abrir ningún archivo.
+
+        Args:
+            directorio (str): Carpeta de datos (se crea si no existe)
+            lote_sincronizacion (int): Registros entre cada fsync
+            umbral_compactacion (int): Registros del log que disparan un snapshot
+
+        Raises:
+            ValueError: Si los tamaños de lote o umbral no son positivos
+        """
+        if lote_sincronizacion < 1 or umbral_compactacion < 1:
+            raise ValueError("El lote de sincronización y el umbral de compactación deben ser positivos")
+
+        self.__directorio = directorio
+        self.__lote_sincronizacion = lote_sincronizacion
+        self.__umbral_compactacion = umbral_compactacion
+        self.__clinica = None
+        self.__archivo = None
+        self.__secuencia = 0
+        self.__pendientes = 0
+        self.__registros_en_log = 0
+
+    def __ruta(self, nombre: str) -> str:
+        return os.path.join(self.__directorio, nombre)
+
+    def abrir(self) -> Clinica:
+        """
+        Recupera la clínica (snapshot más cola del log) y empieza a registrarla.
+
+        Returns:
+            Clinica: Clínica recuperada, con este diario ya conectado
+
+        Raises:
+            RuntimeError: Si el diario ya estaba abierto
+            ValueError: Si el log contiene un registro corrupto
+        """
+        if self.__clinica is not None:
+            raise RuntimeError("El diario ya está abierto")
+
+        os.makedirs(self.__directorio, exist_ok=True)
+        clinica = Clinica()
+        self.__secuencia = self.__cargar_snapshot(clinica)
+        self.__reproducir_log(clinica)
+
+        self.__archivo = open(self.__ruta(self.ARCHIVO_LOG), "a", encoding="utf-8")
+        self.__clinica = clinica
+        clinica.establecer_diario(self)
+        return clinica
+
+    def __cargar_snapshot(self, clinica: Clinica) -> int:
+        """Carga el snapshot, si existe, y devuelve la secuencia que cubre."""
+        ruta = self.__ruta(self.ARCHIVO_SNAPSHOT)
+        if not os.path.exists(ruta):
+            return 0
+
+        with open(ruta, encoding="utf-8") as archivo:
+            estado = json.load(archivo)
+
+        for datos in estado["pacientes"]:
+            clinica.agregar_paciente(deserializar_paciente(datos))
+        for datos in estado["medicos"]:
+            clinica.agregar_medico(deserializar_medico(datos))
+        # Cada turno conserva su id, y los nuevos no reciben los de turnos cancelados
+        for datos in estado["turnos"]:
+            clinica.restaurar_turno(deserializar_turno(datos, clinica), datos.get("id"))
+        if "siguiente_id_turno" in estado:
+            clinica.avanzar_id_turno(estado["siguiente_id_turno"])
+        for datos in estado["recetas"]:
+            clinica.restaurar_receta(deserializar_receta(datos, clinica))
+        for datos in estado.get("recurrencias", ()):
+            clinica.restaurar_recurrencia(deserializar_recurrencia(datos, clinica))
+        return estado["secuencia"]
+
+    def __reproducir_log(self, clinica: Clinica) -> None:
+        """Aplica los registros posteriores al snapshot y descarta una escritura trunca."""
+        ruta = self.__ruta(self.ARCHIVO_LOG)
+        if not os.path.exists(ruta):
+            return
+
+        valido_hasta = 0
+        with open(ruta, "rb") as archivo:
+            for numero, linea in enumerate(archivo, 1):
+                if not linea.endswith(b"\n"):
+                    # Escritura interrumpida: se descarta y se trunca el archivo
+                    break
+                try:
+                    registro = json.loads(linea)
+                except ValueError:
+                    raise ValueError(f"Registro corrupto en la línea {numero} del log")
+
+                valido_hasta += len(linea)
+                if registro["seq"] <= self.__secuencia:
+                    continue
+                _APLICADORES[registro["op"]](clinica, registro["datos"])
+                self.__secuencia = registro["seq"]
+                self.__registros_en_log += 1
+
+        if valido_hasta < os.path.getsize(ruta):
+            with open(ruta, "r+b") as archivo:
+                archivo.truncate(valido_hasta)
+
+    def registrar(self, operacion: str, *objetos) -> None:
+        """
+        Agrega una operación al log (lo invoca la clínica tras aplicarla).
+
+        Args:
+            operacion (str): Nombre de la operación de Clinica/Medico
+            *objetos: Objetos del modelo involucrados en la operación
+        """
+        self.__secuencia += 1
+        registro = {"seq": self.__secuencia, "op": operacion, "datos": _SERIALIZADORES[operacion](*objetos)}
+        self.__archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.__archivo.flush()
+
+        self.__pendientes += 1
+        self.__registros_en_log += 1
+        if self.__pendientes >= self.__lote_sincronizacion:
+            self.sincronizar()
+        if self.__registros_en_log >= self.__umbral_compactacion:
+            self.compactar()
+
+    def sincronizar(self) -> None:
+        """Fuerza a disco (fsync) los registros escritos hasta el momento."""
+        if self.__archivo is not None and self.__pendientes:
+            self.__archivo.flush()
+            os.fsync(self.__archivo.fileno())
+            self.__pendientes = 0
+
+    def compactar(self) -> None:
+        """
+        Guarda el estado completo en un snapshot y vacía el log.
+
+        El snapshot se escribe en un archivo temporal y se reemplaza de forma
+        atómica, por lo que siempre queda un snapshot válido en disco.
+
+        Raises:
+            RuntimeError: Si el diario no está abierto
+        """
+        if self.__clinica is None:
+            raise RuntimeError("El diario no está abierto")
+
+        self.sincronizar()
+        clinica = self.__clinica
+        # Se recorren los iteradores de la clínica, sin armar la historia de cada paciente
+        estado = {
+            "version": VERSION_SNAPSHOT,
+            "secuencia": self.__secuencia,
+            "pacientes": [serializar_paciente(p) for p in clinica.iter_pacientes()],
+            "medicos": [serializar_medico(m) for m in clinica.obtener_medicos()],
+            "turnos": [_serializar_turno_agendado(t, id_turno) for id_turno, t in clinica.iter_turnos_con_id()],
+            "siguiente_id_turno": clinica.obtener_siguiente_id_turno(),
+            "recetas": [serializar_receta(receta) for receta in clinica.iter_recetas()],
+            "recurrencias": [serializar_recurrencia(r) for r in clinica.obtener_recurrencias()],
+        }
+
+        ruta = self.__ruta(self.ARCHIVO_SNAPSHOT)
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(estado, archivo, ensure_ascii=False)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+
+        # Todo lo del log ya está en el snapshot
+        self.__archivo.close()
+        self.__archivo = open(self.__ruta(self.ARCHIVO_LOG), "w", encoding="utf-8")
+        self.__registros_en_log = 0
+
+    def cerrar(self) -> None:
+        """Sincroniza el log, lo cierra y desconecta el diario de la clínica."""
+        if self.__clinica is None:
+            return
+        self.sincronizar()
+        self.__archivo.close()
+        self.__archivo = None
+        self.__clinica.establecer_diario(None)
+        self.__clinica = None
+
+    def __enter__(self) -> Clinica:
+        return self.abrir()
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
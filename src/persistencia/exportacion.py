@@ -0,0 +1,275 @@
+"""
+Exportación en paralelo de las historias clínicas de todos los pacientes.
+
+Armar y renderizar una historia es trabajo de CPU (sobre todo el formateo
+de fechas de cada turno y receta), así que se reparte entre procesos con
+un ProcessPoolExecutor. El proceso principal sólo recorre los pacientes y
+arma, por lotes, registros compactos: los turnos van por columnas (arreglos
+de inicios y duraciones en microsegundos, leídos de la tabla sin crear
+objetos Turno ni fechas) y paciente y médico como DNI y matrícula en lugar
+de objetos. Cada proceso reconstruye con ellos la historia y la renderiza
+igual que str(historia).
+
+El resultado es un archivo por paciente (historia_<dni>.txt, con los
+caracteres del DNI que no sean letras, dígitos o "_.-~" escritos como %XX
+para que el nombre no pueda salir del directorio) en un directorio, o un único archivo con todas las historias separadas por una
+línea en blanco, en el orden de registro de los pacientes.
+"""
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from urllib.parse import quote
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.turno import Turno
+from src.modelo.receta import Receta
+from src.modelo.recurrencia import TurnoRecurrente
+from src.modelo.historia_clinica import HistoriaClinica
+from src.modelo.tabla_turnos import desde_microsegundos
+
+
+# Pacientes por lote enviado a cada proceso
+TAMANO_LOTE = 500
+
+_MICROSEGUNDO = timedelta(microseconds=1)
+
+# Médicos (matrícula -> Medico) de cada proceso del pool; los carga _iniciar_proceso
+_medicos = {}
+
+
+def registro_paciente(clinica: Clinica, paciente: Paciente) -> tuple:
+    """
+    Arma el registro compacto con todo lo necesario para renderizar la historia del paciente.
+
+    Returns:
+        tuple: (nombre, dni, fecha de nacimiento, turnos, recetas, series), donde
+               turnos = (matrículas, especialidades, inicios y duraciones en microsegundos),
+               receta = (fecha, matrícula, medicamentos) y
+               serie = (inicio, matrícula, especialidad, repeticiones, días de intervalo,
+                        microsegundos de duración, sesiones canceladas)
+    """
+    dni = paciente.obtener_dni()
+    turnos, recetas, series = clinica.obtener_registros_columnares(dni)
+    return (
+        paciente.obtener_nombre(),
+        dni,
+        paciente.obtener_fecha_nacimiento(),
+        turnos,
+        [
+            (r.obtener_fecha(), r.obtener_medico().obtener_matricula(), r.obtener_medicamentos())
+            for r in recetas
+        ],
+        [
+            (s.obtener_fecha_hora_inicio(), s.obtener_medico().obtener_matricula(), s.obtener_especialidad(),
+             s.obtener_repeticiones(), s.obtener_intervalo().days, s.obtener_duracion() // _MICROSEGUNDO,
+             s.obtener_canceladas())
+            for s in series
+        ],
+    )
+
+
+def historia_desde_registro(registro: tuple, medicos: dict[str, Medico] | None = None) -> HistoriaClinica:
+    """
+    Reconstruye la historia clínica de un registro compacto (ver registro_paciente).
+
+    Args:
+        registro (tuple): Registro del paciente
+        medicos (dict[str, Medico] | None): Médicos por matrícula; por defecto, los del proceso del pool
+
+    Returns:
+        HistoriaClinica: Historia con los mismos turnos, recetas y series
+    """
+    medicos = _medicos if medicos is None else medicos
+    nombre, dni, fecha_nacimiento, turnos, recetas, series = registro
+    paciente = Paciente.restaurar(nombre, dni, fecha_nacimiento)
+    historia = HistoriaClinica(paciente)
+    matriculas, especialidades, inicios, duraciones = turnos
+    for matricula, especialidad, inicio, duracion in zip(matriculas, especialidades, inicios, duraciones):
+        historia.agregar_turno(Turno.restaurar(
+            paciente, medicos[matricula], desde_microsegundos(inicio), especialidad,
+            timedelta(microseconds=duracion)
+        ))
+    for fecha, matricula, medicamentos in recetas:
+        historia.agregar_receta(Receta.restaurar(paciente, medicos[matricula], medicamentos, fecha))
+    for inicio, matricula, especialidad, repeticiones, intervalo, duracion, canceladas in series:
+        historia.agregar_recurrencia(TurnoRecurrente.restaurar(
+            paciente, medicos[matricula], inicio, especialidad, repeticiones,
+            timedelta(days=intervalo), timedelta(microseconds=duracion), canceladas
+        ))
+    return historia
+
+
+def _mapa_medicos(medicos: list[tuple[str, str]]) -> dict[str, Medico]:
+    """Arma los médicos por matrícula, dados como (nombre, matrícula)."""
+    return {matricula: Medico(nombre, matricula) for nombre, matricula in medicos}
+
+
+def _iniciar_proceso(medicos: list[tuple[str, str]]) -> None:
+    """Carga en un proceso del pool los médicos, dados como (nombre, matrícula)."""
+    global _medicos
+    _medicos = _mapa_medicos(medicos)
+
+
+def nombre_archivo(dni: str) -> str:
+    """
+    Devuelve el nombre del archivo de la historia de un paciente.
+
+    El DNI se escapa como en una URL (por ejemplo, "/" queda "%2F"), así que el
+    nombre nunca incluye separadores de ruta y dos DNI distintos no comparten archivo.
+
+    Returns:
+        str: historia_<dni escapado>.txt
+    """
+    return f"historia_{quote(dni, safe='')}.txt"
+
+
+def _renderizar_lote(registros: list[tuple], directorio: str | None,
+                     medicos: dict[str, Medico] | None = None) -> list[str] | int:
+    """
+    Renderiza un lote de historias.
+
+    Args:
+        registros (list[tuple]): Registros de los pacientes
+        directorio (str | None): Carpeta de destino, o None para devolver los textos
+        medicos (dict[str, Medico] | None): Médicos por matrícula; por defecto, los del proceso del pool
+
+    Returns:
+        list[str] | int: Los textos, o con directorio la cantidad de archivos escritos
+    """
+    if directorio is None:
+        return [historia_desde_registro(registro, medicos).renderizar() for registro in registros]
+    for registro in registros:
+        ruta = os.path.join(directorio, nombre_archivo(registro[1]))
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(historia_desde_registro(registro, medicos).renderizar())
+    return len(registros)
+
+
+class ResultadoExportacion:
+    """
+    Resumen de una exportación.
+
+    Atributos:
+        historias (int): Historias exportadas
+        procesos (int): Procesos que las renderizaron
+        segundos (float): Duración de la exportación
+    """
+
+    def __init__(self, procesos: int):
+        self.historias = 0
+        self.procesos = procesos
+        self.segundos = 0.0
+
+    def historias_por_segundo(self) -> float:
+        """
+        Devuelve el ritmo de la exportación.
+
+        Returns:
+            float: Historias exportadas por segundo
+        """
+        return self.historias / self.segundos if self.segundos else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.historias} historias exportadas en {self.segundos:.2f} s con {self.procesos} "
+                f"procesos ({self.historias_por_segundo():.0f} historias/s)")
+
+
+class ExportadorHistorias:
+    """
+    Exporta las historias clínicas de todos los pacientes repartiéndolas entre procesos.
+
+    Atributos privados:
+        __clinica (Clinica): Clínica de la que se exporta
+        __procesos (int): Procesos que renderizan (con 1 se renderiza en este proceso)
+        __tamano_lote (int): Pacientes por lote enviado a un proceso
+    """
+
+    def __init__(self, clinica: Clinica, procesos: int | None = None, tamano_lote: int = TAMANO_LOTE):
+        """
+        Inicializa el exportador.
+
+        Args:
+            clinica (Clinica): Clínica de la que se exporta
+            procesos (int | None): Procesos a usar; por defecto, uno por núcleo
+            tamano_lote (int): Pacientes por lote
+
+        Raises:
+            ValueError: Si procesos o tamano_lote no son positivos
+        """
+        procesos = procesos or os.cpu_count() or 1
+        if procesos < 1 or tamano_lote < 1:
+            raise ValueError("La cantidad de procesos y el tamaño de lote deben ser positivos")
+        self.__clinica = clinica
+        self.__procesos = procesos
+        self.__tamano_lote = tamano_lote
+
+    def exportar_directorio(self, directorio: str) -> ResultadoExportacion:
+        """
+        Escribe la historia de cada paciente en directorio/historia_<dni>.txt (ver nombre_archivo).
+
+        Args:
+            directorio (str): Carpeta de destino; se crea si no existe
+
+        Returns:
+            ResultadoExportacion: Resumen de la exportación
+        """
+        os.makedirs(directorio, exist_ok=True)
+        resultado = ResultadoExportacion(self.__procesos)
+        inicio = time.perf_counter()
+        for escritos in self.__renderizar(directorio):
+            resultado.historias += escritos
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    def exportar_archivo(self, salida) -> ResultadoExportacion:
+        """
+        Escribe todas las historias en un archivo de texto, separadas por una línea en blanco.
+
+        Args:
+            salida: Archivo de texto abierto para escritura
+
+        Returns:
+            ResultadoExportacion: Resumen de la exportación
+        """
+        resultado = ResultadoExportacion(self.__procesos)
+        inicio = time.perf_counter()
+        for textos in self.__renderizar(None):
+            salida.write("\n".join(textos) + "\n")
+            resultado.historias += len(textos)
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    def __lotes(self):
+        """Genera los registros compactos de los pacientes, de a tamano_lote."""
+        lote = []
+        for paciente in self.__clinica.iter_pacientes():
+            lote.append(registro_paciente(self.__clinica, paciente))
+            if len(lote) == self.__tamano_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+    def __renderizar(self, directorio: str | None):
+        """Genera, en el orden de los pacientes, el resultado de _renderizar_lote para cada lote."""
+        medicos = [(m.obtener_nombre(), m.obtener_matricula()) for m in self.__clinica.iter_medicos()]
+        if self.__procesos == 1:
+            # Sin pool los médicos se pasan a cada lote; _medicos es sólo de los procesos del pool
+            mapa = _mapa_medicos(medicos)
+            for lote in self.__lotes():
+                yield _renderizar_lote(lote, directorio, mapa)
+            return
+
+        with ProcessPoolExecutor(self.__procesos, initializer=_iniciar_proceso, initargs=(medicos,)) as ejecutor:
+            # Se limitan los lotes en vuelo para no tener todos los registros en memoria a la vez
+            pendientes = deque()
+            for lote in self.__lotes():
+                pendientes.append(ejecutor.submit(_renderizar_lote, lote, directorio))
+                if len(pendientes) >= 2 * self.__procesos:
+                    yield pendientes.popleft().result()
+            while pendientes:
+                yield pendientes.popleft().result()
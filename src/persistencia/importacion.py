@@ -0,0 +1,339 @@
+"""
+Importación masiva de pacientes, médicos y turnos desde archivos CSV o JSONL.
+
+Los archivos se leen en forma de stream y se procesan por lotes: cada fila
+se valida por separado (un error no aborta la importación, queda registrado
+con su número de fila) y las filas válidas de un lote se insertan en la
+clínica con una única actualización de índices.
+
+Formatos (el tipo se deduce de la extensión, .csv o .jsonl):
+    pacientes: nombre, dni, fecha_nacimiento (dd/mm/aaaa)
+    medicos:   nombre, matricula, especialidades
+               (CSV: "Cardiología:lunes|miércoles;Pediatría:martes";
+                JSONL: lista de {"tipo": ..., "dias": [...]})
+    turnos:    dni, matricula, especialidad, fecha_hora (ISO 8601),
+               duracion (minutos, opcional)
+"""
+import csv
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import NamedTuple
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente, parsear_fecha_nacimiento
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import Turno, DURACION_POR_DEFECTO
+from src.modelo.agenda import AgendaMedico
+from src.modelo.excepciones import (
+    DatosInvalidosException,
+    EspecialidadDuplicadaException,
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException
+)
+
+
+TAMANO_LOTE = 5_000
+
+
+class ErrorImportacion(NamedTuple):
+    """Error de validación de una fila del archivo importado."""
+    fila: int
+    mensaje: str
+
+
+class ResultadoImportacion:
+    """
+    Resumen de una importación.
+
+    Atributos:
+        procesadas (int): Filas leídas del archivo
+        importadas (int): Filas incorporadas a la clínica
+        errores (list[ErrorImportacion]): Filas rechazadas y el motivo
+        segundos (float): Duración de la importación
+    """
+
+    def __init__(self):
+        self.procesadas = 0
+        self.importadas = 0
+        self.errores = []
+        self.segundos = 0.0
+
+    def filas_por_segundo(self) -> float:
+        """
+        Devuelve el ritmo de procesamiento de la importación.
+
+        Returns:
+            float: Filas procesadas por segundo
+        """
+        return self.procesadas / self.segundos if self.segundos else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.importadas}/{self.procesadas} filas importadas, "
+                f"{len(self.errores)} con errores ({self.filas_por_segundo():.0f} filas/s)")
+
+
+def leer_filas(ruta: str):
+    """
+    Genera las filas de un archivo CSV o JSONL como (número de fila, dict).
+
+    En CSV la fila 1 es el encabezado, así que los datos empiezan en la 2.
+
+    Raises:
+        ValueError: Si la extensión del archivo no es .csv ni .jsonl
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            yield from enumerate(csv.DictReader(archivo), 2)
+    elif extension == ".jsonl":
+        with open(ruta, encoding="utf-8") as archivo:
+            for numero, linea in enumerate(archivo, 1):
+                if linea.strip():
+                    try:
+                        yield numero, json.loads(linea)
+                    except ValueError:
+                        yield numero, None
+    else:
+        raise ValueError(f"Formato no soportado: {ruta} (se espera .csv o .jsonl)")
+
+
+def _lotes(filas, tamano: int):
+    """Agrupa un iterable de filas en listas de hasta 'tamano' elementos."""
+    while True:
+        lote = list(islice(filas, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+def _validar_fila(datos) -> dict:
+    """Verifica que la fila sea un objeto (las líneas JSONL pueden ser cualquier valor JSON)."""
+    if datos is None:
+        raise DatosInvalidosException("La fila no es JSON válido")
+    if not isinstance(datos, dict):
+        raise DatosInvalidosException("La fila debe ser un objeto JSON")
+    return datos
+
+
+def _campo(datos: dict, nombre: str, lista: bool = False):
+    """
+    Devuelve un campo obligatorio de la fila (los números de JSONL pasan a texto).
+
+    Args:
+        datos (dict): Fila
+        nombre (str): Campo
+        lista (bool): Si el campo también puede ser una lista (JSONL)
+
+    Raises:
+        DatosInvalidosException: Si falta el campo o no es un valor simple (o lista, si se admite)
+    """
+    valor = datos.get(nombre)
+    if valor is None:
+        raise DatosInvalidosException(f"Falta el campo '{nombre}'")
+    if isinstance(valor, list) and lista:
+        return valor
+    if isinstance(valor, (list, dict)):
+        raise DatosInvalidosException(f"El campo '{nombre}' debe ser un valor simple")
+    return valor if isinstance(valor, str) else str(valor)
+
+
+def _validar_paciente(datos: dict) -> tuple:
+    """
+    Valida una fila de paciente y devuelve (nombre, dni, fecha_nacimiento).
+
+    Aplica las mismas reglas que el constructor de Paciente.
+    """
+    nombre = _campo(datos, "nombre").strip()
+    if not nombre:
+        raise DatosInvalidosException("El nombre del paciente no puede estar vacío")
+    dni = _campo(datos, "dni").strip()
+    if not dni:
+        raise DatosInvalidosException("El DNI del paciente no puede estar vacío")
+    return nombre, dni, parsear_fecha_nacimiento(_campo(datos, "fecha_nacimiento"))
+
+
+class ImportadorClinica:
+    """
+    Carga masiva de datos en una clínica existente.
+
+    Atributos privados:
+        __clinica (Clinica): Clínica destino
+        __tamano_lote (int): Filas validadas e insertadas por lote
+    """
+
+    def __init__(self, clinica: Clinica, tamano_lote: int = TAMANO_LOTE):
+        """
+        Inicializa el importador.
+
+        Args:
+            clinica (Clinica): Clínica donde insertar los datos
+            tamano_lote (int): Filas por lote
+
+        Raises:
+            ValueError: Si el tamaño de lote no es positivo
+        """
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser positivo")
+        self.__clinica = clinica
+        self.__tamano_lote = tamano_lote
+
+    def __importar(self, ruta: str, procesar_lote) -> ResultadoImportacion:
+        """Recorre el archivo por lotes aplicando procesar_lote a cada uno."""
+        resultado = ResultadoImportacion()
+        inicio = time.perf_counter()
+        for lote in _lotes(leer_filas(ruta), self.__tamano_lote):
+            resultado.procesadas += len(lote)
+            resultado.importadas += procesar_lote(lote, resultado.errores)
+        resultado.segundos = time.perf_counter() - inicio
+        return resultado
+
+    def importar_pacientes(self, ruta: str) -> ResultadoImportacion:
+        """
+        Importa pacientes; los DNI repetidos (en el archivo o ya registrados) se rechazan.
+
+        Args:
+            ruta (str): Archivo CSV o JSONL
+
+        Returns:
+            ResultadoImportacion: Resumen con los errores por fila
+        """
+        vistos = set()
+
+        def procesar_lote(lote, errores):
+            pacientes = []
+            for numero, datos in lote:
+                try:
+                    nombre, dni, fecha_nacimiento = _validar_paciente(_validar_fila(datos))
+                    if dni in vistos or self.__clinica.existe_paciente(dni):
+                        raise DatosInvalidosException(f"Ya existe un paciente con DNI {dni}")
+                except (DatosInvalidosException, TypeError) as e:
+                    errores.append(ErrorImportacion(numero, str(e)))
+                    continue
+                vistos.add(dni)
+                # La fila ya está validada: se evita repetir la validación del constructor
+                pacientes.append(Paciente.restaurar(nombre, dni, fecha_nacimiento))
+            self.__clinica.agregar_pacientes_lote(pacientes)
+            return len(pacientes)
+
+        return self.__importar(ruta, procesar_lote)
+
+    def importar_medicos(self, ruta: str) -> ResultadoImportacion:
+        """
+        Importa médicos con sus especialidades.
+
+        Args:
+            ruta (str): Archivo CSV o JSONL
+
+        Returns:
+            ResultadoImportacion: Resumen con los errores por fila
+        """
+        def procesar_lote(lote, errores):
+            importados = 0
+            for numero, datos in lote:
+                try:
+                    _validar_fila(datos)
+                    medico = Medico(_campo(datos, "nombre"), _campo(datos, "matricula"))
+                    for especialidad in self.__leer_especialidades(_campo(datos, "especialidades", lista=True)):
+                        medico.agregar_especialidad(especialidad)
+                    self.__clinica.agregar_medico(medico)
+                except (DatosInvalidosException, EspecialidadDuplicadaException, ValueError, TypeError) as e:
+                    errores.append(ErrorImportacion(numero, str(e)))
+                    continue
+                importados += 1
+            return importados
+
+        return self.__importar(ruta, procesar_lote)
+
+    @staticmethod
+    def __leer_especialidades(valor) -> list[Especialidad]:
+        """Interpreta las especialidades de una fila (texto CSV o lista JSONL)."""
+        if isinstance(valor, list):
+            return [
+                Especialidad(_campo(esp, "tipo"), _campo(esp, "dias", lista=True))
+                for esp in map(_validar_fila, valor)
+            ]
+
+        especialidades = []
+        for parte in filter(None, (p.strip() for p in valor.split(";"))):
+            tipo, separador, dias = parte.partition(":")
+            if not separador:
+                raise DatosInvalidosException(f"Especialidad sin días de atención: '{parte}'")
+            especialidades.append(Especialidad(tipo, dias.split("|")))
+        return especialidades
+
+    def importar_turnos(self, ruta: str, confiable: bool = False) -> ResultadoImportacion:
+        """
+        Importa turnos, incluso históricos (ya pasados).
+
+        Cada turno debe referir a un paciente y un médico registrados, caer en
+        un día en que el médico atiende esa especialidad (como en
+        agendar_turno) y no superponerse con otro turno del médico, ya sea
+        existente o del mismo archivo.
+
+        Args:
+            ruta (str): Archivo CSV o JSONL
+            confiable (bool): Si el archivo proviene de la propia clínica (por ejemplo,
+                una exportación) y no hace falta verificar especialidad y día
+
+        Returns:
+            ResultadoImportacion: Resumen con los errores por fila
+        """
+        clinica = self.__clinica
+
+        def procesar_lote(lote, errores):
+            turnos = []
+            agendas_lote = {}  # Matrícula -> AgendaMedico con los turnos de este lote
+            for numero, datos in lote:
+                try:
+                    turno = self.__leer_turno(_validar_fila(datos))
+                    medico = turno.obtener_medico()
+                    matricula = medico.obtener_matricula()
+                    inicio, fin = turno.obtener_fecha_hora(), turno.obtener_fecha_hora_fin()
+                    if not confiable:
+                        clinica.validar_especialidad_en_indice_dia(medico, turno.obtener_especialidad(),
+                                                                   inicio.weekday())
+                    agenda = agendas_lote.setdefault(matricula, AgendaMedico())
+                    if not agenda.esta_libre(inicio, fin):
+                        raise DatosInvalidosException(f"El turno de {inicio} se superpone con otro del archivo")
+                    clinica.validar_turno_no_duplicado(matricula, inicio, turno.obtener_duracion())
+                except (DatosInvalidosException, PacienteNoEncontradoException,
+                        MedicoNoDisponibleException, TurnoOcupadoException, TypeError) as e:
+                    errores.append(ErrorImportacion(numero, str(e)))
+                    continue
+                agenda.agregar(turno)
+                turnos.append(turno)
+            clinica.importar_turnos_lote(turnos)
+            return len(turnos)
+
+        return self.__importar(ruta, procesar_lote)
+
+    def __leer_turno(self, datos: dict) -> Turno:
+        """Construye un turno a partir de una fila, sin exigir que sea futuro."""
+        paciente = self.__clinica.obtener_paciente_por_dni(_campo(datos, "dni"))
+        medico = self.__clinica.obtener_medico_por_matricula(_campo(datos, "matricula"))
+        especialidad = _campo(datos, "especialidad").strip()
+        if not especialidad:
+            raise DatosInvalidosException("La especialidad no puede estar vacía")
+        try:
+            fecha_hora = datetime.fromisoformat(_campo(datos, "fecha_hora"))
+        except ValueError:
+            raise DatosInvalidosException("La fecha y hora deben estar en formato ISO 8601")
+        if fecha_hora.tzinfo is not None:
+            # Los turnos se guardan en hora local sin zona, como los que se agendan desde la CLI
+            raise DatosInvalidosException("La fecha y hora no deben incluir zona horaria")
+
+        duracion = DURACION_POR_DEFECTO
+        if datos.get("duracion") not in (None, ""):
+            try:
+                duracion = timedelta(minutes=int(datos["duracion"]))
+            except (ValueError, TypeError):
+                raise DatosInvalidosException("La duración debe ser un número entero de minutos")
+            if duracion <= timedelta(0):
+                raise DatosInvalidosException("La duración del turno debe ser positiva")
+
+        return Turno.restaurar(paciente, medico, fecha_hora, especialidad, duracion)
@@ -0,0 +1,154 @@
+"""
+Conversión entre los objetos del modelo y registros planos (dict) aptos para JSON.
+
+Los turnos y las recetas no repiten los datos del paciente ni del médico:
+guardan sólo el DNI y la matrícula, que se resuelven contra la clínica al
+reconstruirlos.
+"""
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente, parsear_fecha_nacimiento, formatear_fecha_nacimiento
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.turno import Turno
+from src.modelo.receta import Receta
+from src.modelo.recurrencia import TurnoRecurrente
+
+
+_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+def serializar_paciente(paciente: Paciente) -> dict:
+    """Convierte un paciente en un registro plano."""
+    return {
+        "nombre": paciente.obtener_nombre(),
+        "dni": paciente.obtener_dni(),
+        "fecha_nacimiento": formatear_fecha_nacimiento(paciente.obtener_fecha_nacimiento()),
+    }
+
+
+def deserializar_paciente(datos: dict) -> Paciente:
+    """Reconstruye un paciente a partir de su registro."""
+    return Paciente.restaurar(datos["nombre"], datos["dni"], parsear_fecha_nacimiento(datos["fecha_nacimiento"]))
+
+
+def serializar_especialidad(especialidad: Especialidad) -> dict:
+    """Convierte una especialidad en un registro plano."""
+    return {
+        "tipo": especialidad.obtener_especialidad(),
+        "dias": especialidad.obtener_dias(),
+    }
+
+
+def deserializar_especialidad(datos: dict) -> Especialidad:
+    """Reconstruye una especialidad a partir de su registro."""
+    return Especialidad(datos["tipo"], datos["dias"])
+
+
+def serializar_medico(medico: Medico) -> dict:
+    """Convierte un médico, con sus especialidades, en un registro plano."""
+    return {
+        "nombre": medico.obtener_nombre(),
+        "matricula": medico.obtener_matricula(),
+        "especialidades": [serializar_especialidad(esp) for esp in medico.obtener_especialidades()],
+    }
+
+
+def deserializar_medico(datos: dict) -> Medico:
+    """Reconstruye un médico y sus especialidades a partir de su registro."""
+    medico = Medico(datos["nombre"], datos["matricula"])
+    for especialidad in datos["especialidades"]:
+        medico.agregar_especialidad(deserializar_especialidad(especialidad))
+    return medico
+
+
+def serializar_duracion(duracion: timedelta) -> dict:
+    """Convierte una duración en un campo exacto, en microsegundos (como el formato binario)."""
+    return {"duracion_us": duracion // _MICROSEGUNDO}
+
+
+def deserializar_duracion(datos: dict) -> timedelta:
+    """Lee la duración de un registro: en microsegundos o, si es anterior a ese campo, en segundos."""
+    if "duracion_us" in datos:
+        return timedelta(microseconds=datos["duracion_us"])
+    return timedelta(seconds=datos["duracion"])
+
+
+def serializar_turno(turno: Turno, exacta: bool = False) -> dict:
+    """
+    Convierte un turno en un registro plano.
+
+    Por defecto la duración va en segundos, como la muestran los comandos;
+    con exacta=True va en microsegundos (ver serializar_duracion).
+    """
+    datos = {
+        "dni": turno.obtener_paciente().obtener_dni(),
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+        "especialidad": turno.obtener_especialidad(),
+    }
+    if exacta:
+        datos.update(serializar_duracion(turno.obtener_duracion()))
+    else:
+        datos["duracion"] = int(turno.obtener_duracion().total_seconds())
+    return datos
+
+
+def deserializar_turno(datos: dict, clinica: Clinica) -> Turno:
+    """Reconstruye un turno resolviendo paciente y médico en la clínica."""
+    return Turno.restaurar(
+        clinica.obtener_paciente_por_dni(datos["dni"]),
+        clinica.obtener_medico_por_matricula(datos["matricula"]),
+        datetime.fromisoformat(datos["fecha_hora"]),
+        datos["especialidad"],
+        deserializar_duracion(datos),
+    )
+
+
+def serializar_receta(receta: Receta) -> dict:
+    """Convierte una receta en un registro plano."""
+    return {
+        "dni": receta.obtener_paciente().obtener_dni(),
+        "matricula": receta.obtener_medico().obtener_matricula(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "fecha": receta.obtener_fecha().isoformat(),
+    }
+
+
+def deserializar_receta(datos: dict, clinica: Clinica) -> Receta:
+    """Reconstruye una receta resolviendo paciente y médico en la clínica."""
+    return Receta.restaurar(
+        clinica.obtener_paciente_por_dni(datos["dni"]),
+        clinica.obtener_medico_por_matricula(datos["matricula"]),
+        datos["medicamentos"],
+        datetime.fromisoformat(datos["fecha"]),
+    )
+
+
+def serializar_recurrencia(recurrencia: TurnoRecurrente) -> dict:
+    """Convierte una serie de turnos recurrentes, con sus sesiones canceladas, en un registro plano."""
+    return {
+        "dni": recurrencia.obtener_paciente().obtener_dni(),
+        "matricula": recurrencia.obtener_medico().obtener_matricula(),
+        "inicio": recurrencia.obtener_fecha_hora_inicio().isoformat(),
+        "especialidad": recurrencia.obtener_especialidad(),
+        "repeticiones": recurrencia.obtener_repeticiones(),
+        "intervalo": recurrencia.obtener_intervalo().days,
+        **serializar_duracion(recurrencia.obtener_duracion()),
+        "canceladas": [fecha.isoformat() for fecha in recurrencia.obtener_canceladas()],
+    }
+
+
+def deserializar_recurrencia(datos: dict, clinica: Clinica) -> TurnoRecurrente:
+    """Reconstruye una serie de turnos recurrentes resolviendo paciente y médico en la clínica."""
+    return TurnoRecurrente.restaurar(
+        clinica.obtener_paciente_por_dni(datos["dni"]),
+        clinica.obtener_medico_por_matricula(datos["matricula"]),
+        datetime.fromisoformat(datos["inicio"]),
+        datos["especialidad"],
+        datos["repeticiones"],
+        timedelta(days=datos["intervalo"]),
+        deserializar_duracion(datos),
+        map(datetime.fromisoformat, datos["canceladas"]),
+    )
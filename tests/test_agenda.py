@@ -0,0 +1,55 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.turno import Turno
+from src.modelo.agenda import AgendaMedico
+
+
+class TestAgendaMedico(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.agenda = AgendaMedico()
+        self.paciente = Paciente("Juan Pérez", "12345678", "15/03/1985")
+        self.medico = Medico("Dr. García", "MED001")
+
+    def _turno(self, fecha_hora, minutos=30):
+        return Turno(self.paciente, self.medico, fecha_hora, "Cardiología", timedelta(minutes=minutos))
+
+    def test_agenda_vacia_esta_libre(self):
+        """Test para verificar que una agenda vacía no tiene conflictos"""
+        inicio = datetime(2030, 6, 3, 10, 0)
+        self.assertTrue(self.agenda.esta_libre(inicio, inicio + timedelta(minutes=30)))
+        self.assertEqual(len(self.agenda), 0)
+
+    def test_superposicion_con_vecinos(self):
+        """Test para verificar la detección de superposición contra turnos vecinos"""
+        self.agenda.agregar(self._turno(datetime(2030, 6, 3, 10, 0)))
+        self.agenda.agregar(self._turno(datetime(2030, 6, 3, 11, 0)))
+
+        def libre(h, m, minutos=30):
+            inicio = datetime(2030, 6, 3, h, m)
+            return self.agenda.esta_libre(inicio, inicio + timedelta(minutes=minutos))
+
+        self.assertFalse(libre(10, 15))
+        self.assertFalse(libre(9, 45))
+        self.assertFalse(libre(10, 0))
+        self.assertFalse(libre(10, 30, 60))
+        self.assertTrue(libre(10, 30))
+        self.assertTrue(libre(9, 30))
+        self.assertTrue(libre(11, 30))
+
+    def test_turnos_entre_ordenados(self):
+        """Test para verificar la consulta por rango sobre la agenda ordenada"""
+        for hora in (12, 9, 15, 10):
+            self.agenda.agregar(self._turno(datetime(2030, 6, 3, hora, 0)))
+
+        turnos = self.agenda.obtener_turnos_entre(datetime(2030, 6, 3, 10, 0), datetime(2030, 6, 3, 15, 0))
+        horas = [t.obtener_fecha_hora().hour for t in turnos]
+        self.assertEqual(horas, [10, 12])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import os
+import sqlite3
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.excepciones import (
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException
+)
+from src.persistencia.almacen_sqlite import AlmacenSQLite
+
+
+class TestAlmacenSQLite(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "clinica.db")
+        self.almacen = AlmacenSQLite(self.ruta)
+        self.clinica = Clinica(self.almacen)
+
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+        self.clinica.agregar_paciente(Paciente("María González", "87654321", "22/07/1990"))
+
+    def tearDown(self):
+        self.almacen.cerrar()
+        shutil.rmtree(self.directorio)
+
+    def test_turnos_y_superposicion(self):
+        """Test para verificar las validaciones de turnos sobre consultas indexadas"""
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 15))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología",
+                                       datetime(2030, 6, 3, 9, 45), timedelta(minutes=20))
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.agendar_turno("99999999", "MED001", "Cardiología", datetime(2030, 6, 3, 12, 0))
+
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 30))
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 5, 10, 30))
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 3)
+        turnos = self.clinica.obtener_turnos_medico("MED001", datetime(2030, 6, 3), datetime(2030, 6, 4))
+        self.assertEqual([t.obtener_fecha_hora().minute for t in turnos], [0, 30])
+        self.assertEqual(self.clinica.contar_turnos(matricula="MED001", desde=datetime(2030, 6, 4)), 1)
+        self.assertEqual(self.clinica.contar_turnos(especialidad="cardiología"), 3)
+
+    def test_datos_persisten_al_reabrir(self):
+        """Test para verificar que los datos se leen de la base al reabrirla"""
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+        self.clinica.emitir_receta("12345678", "MED001", ["Aspirina 100mg", "Atorvastatina 20mg"])
+        self.clinica.obtener_medico_por_matricula("MED001").agregar_especialidad(
+            Especialidad("Clínica", ["viernes"])
+        )
+        self.almacen.cerrar()
+
+        self.almacen = AlmacenSQLite(self.ruta)
+        clinica = Clinica(self.almacen)
+
+        self.assertEqual(len(clinica.obtener_pacientes()), 2)
+        medico = clinica.obtener_medico_por_matricula("MED001")
+        self.assertEqual(medico.obtener_especialidad_para_indice_dia(4), "Clínica")
+
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(),
+                         ["Aspirina 100mg", "Atorvastatina 20mg"])
+
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+        with self.assertRaises(MedicoNoDisponibleException):
+            clinica.obtener_medico_por_matricula("MED999")
+        with self.assertRaises(ValueError):
+            clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+
+
+    def test_paginas_y_vistas(self):
+        """Test para verificar la paginación y las vistas sobre la base"""
+        for dia in (3, 5, 10):
+            self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, dia, 10, 0))
+
+        turnos = list(self.clinica.iter_turnos(desde=datetime(2030, 6, 4), limite=1))
+        self.assertEqual([t.obtener_fecha_hora().day for t in turnos], [5])
+        self.assertEqual(len(list(self.clinica.iter_turnos(offset=1))), 2)
+
+        self.assertEqual([p.obtener_dni() for p in self.clinica.iter_pacientes(1)], ["87654321"])
+        vista = self.clinica.vista_pacientes()
+        self.assertEqual(len(vista), 2)
+        self.assertEqual(vista["87654321"].obtener_nombre(), "María González")
+        self.assertNotIn("99999999", vista)
+        self.assertEqual(list(vista), ["12345678", "87654321"])
+
+    def test_recetas_por_medicamento(self):
+        """Test para verificar la consulta de recetas por medicamento en la base"""
+        self.clinica.emitir_receta("12345678", "MED001", ["Aspirina 100mg", "Atorvastatina 20mg"])
+        self.clinica.emitir_receta("87654321", "MED001", ["aspirina 100MG"])
+
+        recetas = self.clinica.obtener_recetas_con_medicamento("Aspirina 100mg")
+        self.assertEqual(len(recetas), 2)
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Aspirina 100mg", "Atorvastatina 20mg"])
+        pacientes = self.clinica.obtener_pacientes_con_medicamento("atorvastatina 20mg")
+        self.assertEqual([paciente.obtener_dni() for paciente in pacientes], ["12345678"])
+
+    def test_recetas_por_medicamento_con_acentos(self):
+        """Test para verificar que la base y la memoria encuentran las mismas recetas con nombres acentuados"""
+        memoria = Clinica()
+        memoria.agregar_medico(self.clinica.obtener_medico_por_matricula("MED001"))
+        for paciente in self.clinica.obtener_pacientes():
+            memoria.agregar_paciente(paciente)
+        for clinica in (memoria, self.clinica):
+            clinica.emitir_receta("12345678", "MED001", ["LOSARTÁN 50MG", "Ñandú"])
+            clinica.emitir_receta("87654321", "MED001", ["losartán 50mg", "Losartán 50mg"])
+
+        for nombre in ("losartán 50mg", "LOSARTÁN 50MG", "ñandú", "losartan 50mg"):
+            with self.subTest(nombre=nombre):
+                self.assertEqual(
+                    [str(receta) for receta in self.clinica.obtener_recetas_con_medicamento(nombre)],
+                    [str(receta) for receta in memoria.obtener_recetas_con_medicamento(nombre)],
+                )
+        self.assertEqual(len(self.clinica.obtener_recetas_con_medicamento("losartán 50mg")), 2)
+
+    def test_base_anterior_se_migra(self):
+        """Test para verificar que al abrir una base sin la tabla de medicamentos por receta se completa"""
+        self.clinica.emitir_receta("12345678", "MED001", ["ÁCIDO FÓLICO 5mg"])
+        self.almacen.cerrar()
+        conexion = sqlite3.connect(self.ruta)
+        with conexion:
+            conexion.execute("DROP TABLE receta_medicamentos")
+            conexion.execute("PRAGMA user_version = 0")
+        conexion.close()
+
+        self.almacen = AlmacenSQLite(self.ruta)
+        recetas = Clinica(self.almacen).obtener_recetas_con_medicamento("ácido fólico 5mg")
+        self.assertEqual([receta.obtener_medicamentos() for receta in recetas], [["ÁCIDO FÓLICO 5mg"]])
+
+    def test_duraciones_exactas_como_en_memoria(self):
+        """Test para verificar que la base conserva duraciones con fracciones de segundo, igual que la memoria"""
+        duracion = timedelta(minutes=30, microseconds=500_000)
+        memoria = Clinica()
+        memoria.agregar_medico(self.clinica.obtener_medico_por_matricula("MED001"))
+        for paciente in self.clinica.obtener_pacientes():
+            memoria.agregar_paciente(paciente)
+        for clinica in (memoria, self.clinica):
+            clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0), duracion)
+            id_turno = clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 11, 0))
+            clinica.reprogramar_turno(id_turno, datetime(2030, 6, 5, 11, 0), duracion + duracion)
+            clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", datetime(2030, 7, 1, 9, 0),
+                                             repeticiones=2, duracion=duracion)
+        self.almacen.cerrar()
+        self.almacen = AlmacenSQLite(self.ruta)
+        reabierta = Clinica(self.almacen)
+
+        esperadas = [turno.obtener_duracion() for turno in memoria.obtener_turnos()]
+        self.assertEqual(esperadas, [duracion, duracion + duracion])
+        self.assertEqual([turno.obtener_duracion() for turno in reabierta.obtener_turnos()], esperadas)
+        self.assertEqual(reabierta.obtener_recurrencias()[0].obtener_duracion(), duracion)
+        # El fin guardado coincide con la duración: el horario justo después sigue libre
+        reabierta.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0) + duracion)
+
+    def test_duraciones_en_segundos_se_migran(self):
+        """Test para verificar que al abrir una base con duraciones en segundos se pasan a microsegundos"""
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0),
+                                   timedelta(minutes=20))
+        self.almacen.cerrar()
+        conexion = sqlite3.connect(self.ruta)
+        with conexion:
+            conexion.execute("UPDATE turnos SET duracion = 1200")
+            conexion.execute("PRAGMA user_version = 1")
+        conexion.close()
+
+        self.almacen = AlmacenSQLite(self.ruta)
+        turno = Clinica(self.almacen).obtener_turnos()[0]
+        self.assertEqual(turno.obtener_duracion(), timedelta(minutes=20))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(RAIZ, "main.py")
+
+
+def modulos_importados(argumentos, entrada=""):
+    """Ejecuta main.py con -X importtime y devuelve los nombres de los módulos importados."""
+    proceso = subprocess.run([sys.executable, "-X", "importtime", MAIN, *argumentos],
+                             input=entrada, capture_output=True, text=True)
+    return {
+        linea.split("|")[-1].strip()
+        for linea in proceso.stderr.splitlines() if linea.startswith("import time:")
+    }
+
+
+class TestArranque(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_menu_no_carga_modelo_ni_almacenamiento(self):
+        """Test para verificar que el menú aparece sin importar Clinica ni abrir la base"""
+        base = os.path.join(self.directorio, "clinica.db")
+        modulos = modulos_importados(["--sqlite", base], "0\n")
+        self.assertIn("src.interfaz.cli", modulos)
+        for modulo in ("src.modelo.clinica", "src.persistencia.almacen_sqlite", "sqlite3", "asyncio"):
+            self.assertNotIn(modulo, modulos)
+        self.assertFalse(os.path.exists(base))
+
+    def test_script_solo_importa_lo_necesario(self):
+        """Test para verificar que el modo script no importa la CLI, el servidor ni la persistencia"""
+        modulos = modulos_importados(["--script", "-"])
+        self.assertIn("src.interfaz.lote", modulos)
+        for modulo in ("src.interfaz.cli", "src.interfaz.servidor", "asyncio", "src.persistencia.diario", "csv"):
+            self.assertNotIn(modulo, modulos)
+
+    def test_menu_abre_la_clinica_al_usarla(self):
+        """Test para verificar que la primera opción del menú abre la clínica persistida"""
+        base = os.path.join(self.directorio, "clinica.db")
+        proceso = subprocess.run([sys.executable, MAIN, "--sqlite", base],
+                                 input="9\n\n0\n", capture_output=True, text=True)
+        self.assertEqual(proceso.returncode, 0, proceso.stdout)
+        self.assertTrue(os.path.exists(base))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.tabla_turnos import a_microsegundos
+from src.persistencia.almacen_sqlite import AlmacenSQLite
+from src.persistencia.binario import (
+    CADENAS, TURNOS, VistaBinaria, escribir_clinica, leer_clinica, leer_secciones,
+    guardar_binario, cargar_binario,
+)
+
+
+class TestBinarioMemoria(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+        self.clinica = self._crear_clinica()
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        medico.agregar_especialidad(Especialidad("Clínica Médica", ["viernes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2030, 6, 3, 8, 0)
+        for i in range(7):
+            self.clinica.agregar_paciente(Paciente(f"Paciente Ñandú {i}", f"{i + 1:08d}", "15/03/1985"))
+        for i in range(20):
+            self.clinica.agendar_turno(f"{i % 6 + 1:08d}", "MED001", "Cardiología",
+                                       self.lunes + timedelta(weeks=i // 10, minutes=30 * (i % 10)),
+                                       timedelta(minutes=15 + i % 15))
+        self.clinica.cancelar_turno(self.clinica.buscar_turno("MED001", self.lunes))
+        self.clinica.emitir_receta("00000002", "MED001", ["Aspirina 100mg", "Omeprazol 20mg"])
+        self.clinica.emitir_receta("00000004", "MED001", ["Aspirina 100mg"])
+        self.clinica.agendar_turno_recurrente("00000003", "MED001", "Clínica Médica",
+                                              self.lunes + timedelta(days=4), repeticiones=4)
+        self.clinica.cancelar_sesion("MED001", self.lunes + timedelta(days=11))
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _crear_clinica(self):
+        return Clinica()
+
+    def _clinica_vacia(self):
+        return Clinica()
+
+    def _historias(self, clinica):
+        return [str(clinica.obtener_historia_clinica(p.obtener_dni())) for p in clinica.iter_pacientes()]
+
+    def test_ida_y_vuelta(self):
+        """Test para verificar que guardar y cargar conserva pacientes, médicos, turnos, recetas y series"""
+        ruta = os.path.join(self.directorio, "clinica.bin")
+        guardar_binario(self.clinica, ruta)
+        cargada = cargar_binario(ruta)
+        self.assertEqual(cargada.contar_turnos(), 19)
+        self.assertEqual(self._historias(cargada), self._historias(self.clinica))
+        medico = cargada.obtener_medico_por_matricula("MED001")
+        self.assertEqual(str(medico), str(self.clinica.obtener_medico_por_matricula("MED001")))
+        serie = cargada.obtener_recurrencias()[0]
+        self.assertEqual(serie.obtener_canceladas(), [self.lunes + timedelta(days=11)])
+        self.assertFalse(os.path.exists(ruta + ".tmp"))
+
+    def test_bloques_y_pipe(self):
+        """Test para verificar la lectura en streaming con varias secciones de cadenas y turnos"""
+        salida = io.BytesIO()
+        escribir_clinica(self.clinica, salida, tamano_bloque=3)
+        secciones = list(leer_secciones(io.BytesIO(salida.getvalue())))
+        self.assertGreater(sum(1 for tipo, _, _ in secciones if tipo == CADENAS), 1)
+        self.assertEqual(sum(cantidad for tipo, cantidad, _ in secciones if tipo == TURNOS), 19)
+        cargada = leer_clinica(io.BytesIO(salida.getvalue()))
+        self.assertEqual(self._historias(cargada), self._historias(self.clinica))
+
+    def test_vista_mapeada(self):
+        """Test para verificar las columnas de turnos leídas del archivo sin cargar la clínica"""
+        ruta = os.path.join(self.directorio, "clinica.bin")
+        guardar_binario(self.clinica, ruta)
+        with VistaBinaria(ruta) as vista:
+            self.assertEqual(vista.contar(TURNOS), 19)
+            bloque = vista.columnas_turnos()[0]
+            cadenas = vista.cadenas()
+            self.assertEqual(bloque[1][0], a_microsegundos(self.lunes + timedelta(minutes=30)))
+            self.assertEqual(bloque[2][0], 16 * 60 * 1_000_000)
+            self.assertEqual(cadenas[bloque[5][0]], "Cardiología")
+            del bloque
+
+    def test_ids_de_turnos_se_conservan(self):
+        """Test para verificar que los turnos conservan su id y que no se reusan los de turnos cancelados"""
+        ultimo = self.clinica.agendar_turno("00000001", "MED001", "Cardiología", self.lunes + timedelta(weeks=3))
+        self.clinica.cancelar_turno(ultimo)
+        ids = dict(self.clinica.iter_turnos_con_id())
+        salida = io.BytesIO()
+        escribir_clinica(self.clinica, salida, tamano_bloque=4)
+        cargada = leer_clinica(io.BytesIO(salida.getvalue()), self._clinica_vacia())
+        self.assertEqual({id_turno: str(turno) for id_turno, turno in cargada.iter_turnos_con_id()},
+                         {id_turno: str(turno) for id_turno, turno in ids.items()})
+        self.assertEqual(cargada.obtener_siguiente_id_turno(), ultimo + 1)
+
+    def test_archivo_invalido(self):
+        """Test para verificar que se rechaza un archivo que no es una clínica binaria o está truncado"""
+        with self.assertRaises(ValueError):
+            leer_clinica(io.BytesIO(b"no es una clinica"))
+        salida = io.BytesIO()
+        escribir_clinica(self.clinica, salida)
+        with self.assertRaises(ValueError):
+            leer_clinica(io.BytesIO(salida.getvalue()[:-20]))
+
+
+class TestBinarioSQLite(TestBinarioMemoria):
+
+    def _crear_clinica(self):
+        self.almacen = AlmacenSQLite(os.path.join(self.directorio, "clinica.db"))
+        return Clinica(self.almacen)
+
+    def _clinica_vacia(self):
+        self.otro_almacen = AlmacenSQLite(os.path.join(self.directorio, "cargada.db"))
+        return Clinica(self.otro_almacen)
+
+    def tearDown(self):
+        self.almacen.cerrar()
+        if hasattr(self, "otro_almacen"):
+            self.otro_almacen.cerrar()
+        super().tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.excepciones import (
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException
+)
+from src.persistencia.almacen_sqlite import AlmacenSQLite
+from src.persistencia.diario import DiarioClinica
+
+
+def cargar_datos(clinica):
+    medico = Medico("Dr. García", "MED001")
+    medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+    clinica.agregar_medico(medico)
+    clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+    clinica.agregar_paciente(Paciente("María González", "87654321", "22/07/1990"))
+
+
+class TestCancelacionMemoria(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = self._crear_clinica()
+        cargar_datos(self.clinica)
+        self.lunes = datetime(2030, 6, 3, 10, 0)
+
+    def _crear_clinica(self):
+        return Clinica()
+
+    def test_cancelar_libera_horario(self):
+        """Test para verificar que un turno cancelado libera su horario y su id no se reutiliza"""
+        id_turno = self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+
+        cancelado = self.clinica.cancelar_turno(id_turno)
+        self.assertEqual(cancelado.obtener_fecha_hora(), self.lunes)
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(self.clinica.contar_turnos(), 0)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 0)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno(id_turno)
+
+        nuevo = self.clinica.agendar_turno("87654321", "MED001", "Cardiología", self.lunes)
+        self.assertNotEqual(nuevo, id_turno)
+        self.assertEqual(self.clinica.buscar_turno("MED001", self.lunes), nuevo)
+        self.assertEqual(self.clinica.obtener_turno(nuevo).obtener_paciente().obtener_dni(), "87654321")
+
+    def test_reprogramar_conserva_id(self):
+        """Test para verificar que reprogramar mueve el turno sin cambiar su id"""
+        id_turno = self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes)
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", self.lunes + timedelta(hours=1))
+        self.clinica.obtener_historia_clinica("12345678")
+
+        # Superponerse con su propio horario anterior está permitido
+        turno = self.clinica.reprogramar_turno(id_turno, self.lunes + timedelta(minutes=15))
+        self.assertEqual(turno.obtener_fecha_hora(), self.lunes + timedelta(minutes=15))
+        self.assertEqual(self.clinica.obtener_turno(id_turno).obtener_fecha_hora(), self.lunes + timedelta(minutes=15))
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", self.lunes - timedelta(minutes=15))
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno(id_turno, self.lunes + timedelta(minutes=45))
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.reprogramar_turno(id_turno, self.lunes + timedelta(days=1))
+
+        self.clinica.reprogramar_turno(id_turno, self.lunes + timedelta(days=2), timedelta(minutes=45))
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual([t.obtener_fecha_hora() for t in historia.obtener_turnos()], [self.lunes + timedelta(days=2)])
+        self.assertEqual(historia.obtener_turnos()[0].obtener_duracion(), timedelta(minutes=45))
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.buscar_turno("MED001", self.lunes + timedelta(minutes=15))
+
+    def test_listados_omiten_cancelados(self):
+        """Test para verificar que listados, páginas y conteos omiten los turnos cancelados"""
+        ids = [
+            self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes + timedelta(days=7 * i))
+            for i in range(4)
+        ]
+        self.clinica.cancelar_turno(ids[1])
+        fechas = [t.obtener_fecha_hora() for t in self.clinica.iter_turnos(offset=1)]
+        self.assertEqual(fechas, [self.lunes + timedelta(days=14), self.lunes + timedelta(days=21)])
+        self.assertEqual(self.clinica.contar_turnos(especialidad="cardiología"), 3)
+        self.assertEqual(self.clinica.contar_turnos(desde=self.lunes + timedelta(days=1)), 2)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 3)
+
+
+class TestCancelacionSQLite(TestCancelacionMemoria):
+
+    def _crear_clinica(self):
+        self.directorio = tempfile.mkdtemp()
+        self.almacen = AlmacenSQLite(f"{self.directorio}/clinica.db")
+        return Clinica(self.almacen)
+
+    def tearDown(self):
+        self.almacen.cerrar()
+        shutil.rmtree(self.directorio)
+
+
+class TestCancelacionDiario(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_reproducir_cancelaciones(self):
+        """Test para verificar que el diario reproduce cancelaciones y reprogramaciones"""
+        lunes = datetime(2030, 6, 3, 10, 0)
+        with DiarioClinica(self.directorio) as clinica:
+            cargar_datos(clinica)
+            cancelado = clinica.agendar_turno("12345678", "MED001", "Cardiología", lunes)
+            movido = clinica.agendar_turno("87654321", "MED001", "Cardiología", lunes + timedelta(hours=1))
+            clinica.cancelar_turno(cancelado)
+            clinica.reprogramar_turno(movido, lunes + timedelta(days=2))
+
+        with DiarioClinica(self.directorio) as clinica:
+            turno, = clinica.obtener_turnos()
+            self.assertEqual(turno.obtener_fecha_hora(), lunes + timedelta(days=2))
+            clinica.agendar_turno("12345678", "MED001", "Cardiología", lunes)
+
+
+if __name__ == '__main__':
+    unittest.main()
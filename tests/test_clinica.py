@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 import sys
 import os
 
@@ -17,7 +17,8 @@ from src.modelo.excepciones import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
-    RecetaInvalidaException
+    RecetaInvalidaException,
+    DatosInvalidosException
 )
 
 
@@ -243,6 +244,25 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(RecetaInvalidaException):
             self.clinica.emitir_receta("12345678", "MED001", [])
     
+    def test_recetas_y_pacientes_por_medicamento(self):
+        """Test para verificar las consultas por medicamento con el índice invertido"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        
+        self.clinica.emitir_receta("12345678", "MED001", ["Losartán 50mg", "Aspirina 100mg"])
+        self.clinica.emitir_receta("87654321", "MED001", ["losartán 50MG"])
+        self.clinica.emitir_receta("12345678", "MED001", ["Losartán 50mg"])
+        
+        recetas = self.clinica.obtener_recetas_con_medicamento("LOSARTÁN 50mg")
+        self.assertEqual(len(recetas), 3)
+        self.assertEqual([r.obtener_paciente().obtener_dni() for r in recetas],
+                         ["12345678", "87654321", "12345678"])
+        self.assertEqual(self.clinica.obtener_pacientes_con_medicamento("losartán 50mg"),
+                         [self.paciente1, self.paciente2])
+        self.assertEqual(self.clinica.obtener_pacientes_con_medicamento("Aspirina 100mg"), [self.paciente1])
+        self.assertEqual(self.clinica.obtener_recetas_con_medicamento("Enalapril"), [])
+    
     def test_obtener_historia_clinica_paciente_inexistente(self):
         """Test para verificar error al obtener historia clínica de paciente inexistente"""
         with self.assertRaises(PacienteNoEncontradoException):
@@ -265,6 +285,205 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(TurnoOcupadoException):
             self.clinica.validar_turno_no_duplicado("MED001", fecha_turno)
 
+    def test_indice_turnos_consistente(self):
+        """Test para verificar que el índice de turnos acompaña a la lista y a la historia clínica"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+
+        fecha_lunes = datetime(2030, 6, 3, 10, 0)  # Lunes
+        fecha_martes = datetime(2030, 6, 4, 10, 0)  # Martes
+
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", fecha_lunes)
+        self.clinica.agendar_turno("87654321", "MED002", "Pediatría", fecha_martes)
+
+        # Mismo horario con otro médico no es conflicto
+        self.clinica.validar_turno_no_duplicado("MED002", fecha_lunes)
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología", fecha_lunes)
+
+        # El intento fallido no debe dejar rastros
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 1)
+
+    def test_agendar_turno_superpuesto(self):
+        """Test para verificar que se rechazan turnos que se superponen en el tiempo"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 15))
+
+        # Un turno largo que empieza antes también se superpone
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología",
+                                       datetime(2030, 6, 3, 9, 0), timedelta(hours=1, minutes=1))
+
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 30))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_agendar_turnos_lote(self):
+        """Test para verificar el alta de una serie de turnos en un solo lote"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+
+        serie = [("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0) + timedelta(weeks=i))
+                 for i in range(10)]
+        serie.append(("12345678", "MED002", "Pediatría", datetime(2030, 6, 4, 9, 0), timedelta(minutes=45)))
+        turnos = self.clinica.agendar_turnos_lote(serie)
+
+        self.assertEqual(len(turnos), 11)
+        self.assertEqual(turnos[-1].obtener_duracion(), timedelta(minutes=45))
+        self.assertEqual(self.clinica.contar_turnos(matricula="MED001"), 10)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 11)
+        self.assertEqual(self.clinica.agendar_turnos_lote([]), [])
+
+    def test_agendar_turnos_lote_todo_o_nada(self):
+        """Test para verificar que un lote con un turno inválido no agenda ninguno"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2030, 6, 10, 10, 0))
+
+        lunes = datetime(2030, 6, 3, 10, 0)
+        lotes = [
+            # Superposición dentro del mismo lote
+            ([("12345678", "MED001", "Cardiología", lunes),
+              ("87654321", "MED001", "Cardiología", lunes + timedelta(minutes=15))], TurnoOcupadoException),
+            # Superposición con un turno ya agendado
+            ([("12345678", "MED001", "Cardiología", lunes + timedelta(weeks=i)) for i in range(3)],
+             TurnoOcupadoException),
+            # Día en que el médico no atiende
+            ([("12345678", "MED001", "Cardiología", lunes),
+              ("12345678", "MED001", "Cardiología", lunes + timedelta(days=1))], MedicoNoDisponibleException),
+            ([("12345678", "MED001", "Cardiología", lunes), ("99999999", "MED001", "Cardiología", lunes)],
+             PacienteNoEncontradoException),
+        ]
+        for lote, excepcion in lotes:
+            with self.subTest(excepcion=excepcion.__name__):
+                with self.assertRaisesRegex(excepcion, "Turno 2 del lote"):
+                    self.clinica.agendar_turnos_lote(lote)
+                self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+                self.assertEqual(self.clinica.obtener_historia_clinica("12345678").obtener_turnos(), [])
+
+    def test_obtener_turnos_medico_por_rango(self):
+        """Test para verificar la consulta de turnos de un médico entre dos fechas"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 5, 9, 0))
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 9, 0))
+        self.clinica.agendar_turno("12345678", "MED002", "Pediatría", datetime(2030, 6, 4, 9, 0))
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 7, 9, 0))
+
+        turnos = self.clinica.obtener_turnos_medico("MED001", datetime(2030, 6, 3), datetime(2030, 6, 6))
+        fechas = [t.obtener_fecha_hora() for t in turnos]
+        self.assertEqual(fechas, [datetime(2030, 6, 3, 9, 0), datetime(2030, 6, 5, 9, 0)])
+
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.obtener_turnos_medico("MED999", datetime(2030, 6, 3), datetime(2030, 6, 6))
+
+    def test_buscar_turnos_libres(self):
+        """Test para verificar la búsqueda de turnos libres entre los médicos de una especialidad"""
+        medico3 = Medico("Dr. Ruiz", "MED003")
+        medico3.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        self.clinica.agregar_medico(medico3)
+
+        # Ocupar el primer turno del lunes de MED001
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 8, 0))
+
+        libres = list(self.clinica.buscar_turnos_libres(
+            "cardiología", datetime(2030, 6, 3, 19, 10), datetime(2030, 6, 5), limite=4
+        ))
+        self.assertEqual(libres, [
+            (datetime(2030, 6, 3, 19, 30), "MED001"),
+            (datetime(2030, 6, 4, 8, 0), "MED003"),
+            (datetime(2030, 6, 4, 8, 30), "MED003"),
+            (datetime(2030, 6, 4, 9, 0), "MED003"),
+        ])
+
+        primero = next(self.clinica.buscar_turnos_libres(
+            "Cardiología", datetime(2030, 6, 3, 7, 0), datetime(2030, 6, 4)
+        ))
+        self.assertEqual(primero, (datetime(2030, 6, 3, 8, 30), "MED001"))
+
+        # Cada turno ofrecido se puede agendar
+        fecha, matricula = primero
+        self.clinica.agendar_turno("12345678", matricula, "Cardiología", fecha)
+
+        self.assertEqual(list(self.clinica.buscar_turnos_libres(
+            "Neurología", datetime(2030, 6, 3), datetime(2030, 6, 10)
+        )), [])
+
+    def test_buscar_turnos_libres_limite_invalido(self):
+        """Test para verificar que un límite negativo o no entero se rechaza como dato inválido"""
+        self.clinica.agregar_medico(self.medico1)
+        for limite in (-1, 2.5, "3"):
+            with self.subTest(limite=limite):
+                with self.assertRaises(DatosInvalidosException):
+                    self.clinica.buscar_turnos_libres("Cardiología", datetime(2030, 6, 3), datetime(2030, 6, 5),
+                                                      limite=limite)
+        self.assertEqual(list(self.clinica.buscar_turnos_libres(
+            "Cardiología", datetime(2030, 6, 3), datetime(2030, 6, 5), limite=0
+        )), [])
+
+
+    def test_contar_turnos(self):
+        """Test para verificar el conteo de turnos con filtros"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 10, 10, 0))
+        self.clinica.agendar_turno("12345678", "MED002", "Pediatría", datetime(2030, 6, 4, 10, 0))
+
+        self.assertEqual(self.clinica.contar_turnos(), 3)
+        self.assertEqual(self.clinica.contar_turnos(matricula="MED001"), 2)
+        self.assertEqual(self.clinica.contar_turnos(especialidad="pediatría"), 1)
+        self.assertEqual(self.clinica.contar_turnos(desde=datetime(2030, 6, 4), hasta=datetime(2030, 6, 11)), 2)
+
+
+    def test_iter_turnos_paginado(self):
+        """Test para verificar la paginación de turnos con filtro de fechas"""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        fechas = [datetime(2030, 6, 3, 8, 0) + timedelta(days=7 * i) for i in range(5)]
+        for fecha in fechas:
+            self.clinica.agendar_turno("12345678", "MED001", "Cardiología", fecha)
+
+        pagina = list(self.clinica.iter_turnos(offset=1, limite=2))
+        self.assertEqual([t.obtener_fecha_hora() for t in pagina], fechas[1:3])
+        pagina = list(self.clinica.iter_turnos(desde=fechas[2], offset=1))
+        self.assertEqual([t.obtener_fecha_hora() for t in pagina], fechas[3:])
+        self.assertEqual(list(self.clinica.iter_turnos(offset=10)), [])
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.iter_turnos(offset=-1)
+
+    def test_vistas_de_solo_lectura(self):
+        """Test para verificar que las vistas reflejan los cambios y no se pueden modificar"""
+        vista = self.clinica.vista_pacientes()
+        self.clinica.agregar_paciente(self.paciente1)
+        self.assertIs(vista["12345678"], self.paciente1)
+        with self.assertRaises(TypeError):
+            vista["87654321"] = self.paciente2
+
+        self.clinica.agregar_paciente(self.paciente2)
+        self.assertEqual(list(self.clinica.iter_pacientes(1, 5)), [self.paciente2])
+        self.clinica.agregar_medico(self.medico1)
+        self.assertEqual(list(self.clinica.iter_medicos(limite=1)), [self.medico1])
+        self.assertEqual(len(self.clinica.vista_medicos()), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+import unittest
+from datetime import timedelta
+
+from src.modelo.clinica import Clinica
+from src.interfaz.comandos import DespachadorComandos
+
+
+class TestDespachadorComandos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica()
+        self.despachador = DespachadorComandos(self.clinica)
+        self.despachador.ejecutar({"comando": "agregar_medico", "datos": {
+            "nombre": "Dr. García", "matricula": "MED001",
+            "especialidades": [{"tipo": "Cardiología", "dias": ["lunes"]}],
+        }})
+        self.despachador.ejecutar({"comando": "agregar_paciente", "datos": {
+            "nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "15/03/1985",
+        }})
+
+    def test_agendar_y_obtener_historia(self):
+        """Test para verificar que los comandos operan sobre la clínica"""
+        respuesta = self.despachador.ejecutar({"id": 7, "comando": "agendar_turno", "datos": {
+            "dni": "12345678", "matricula": "MED001", "especialidad": "Cardiología",
+            "fecha_hora": "2030-06-03T10:00:00", "duracion": 45,
+        }})
+        self.assertEqual(respuesta["id"], 7)
+        self.assertTrue(respuesta["ok"])
+
+        self.despachador.ejecutar({"comando": "emitir_receta", "datos": {
+            "dni": "12345678", "matricula": "MED001", "medicamentos": ["Aspirina 100mg"],
+        }})
+        historia = self.despachador.ejecutar({"comando": "obtener_historia_clinica", "datos": {"dni": "12345678"}})
+        self.assertTrue(historia["ok"])
+        self.assertEqual(historia["resultado"]["turnos"][0]["duracion"], 45)
+        self.assertEqual(historia["resultado"]["recetas"][0]["medicamentos"], ["Aspirina 100mg"])
+
+    def test_duracion_listada_se_puede_reenviar(self):
+        """Test para verificar que la duración usa la misma unidad en solicitudes y respuestas"""
+        for duracion in (45, 22.5):
+            with self.subTest(duracion=duracion):
+                self.setUp()
+                agendado = self.despachador.ejecutar({"comando": "agendar_turno", "datos": {
+                    "dni": "12345678", "matricula": "MED001", "especialidad": "Cardiología",
+                    "fecha_hora": "2030-06-03T10:00:00", "duracion": duracion,
+                }})
+                listado = self.despachador.ejecutar({"comando": "listar_turnos", "datos": {}})["resultado"][0]
+                self.assertEqual(listado["duracion"], duracion)
+
+                respuesta = self.despachador.ejecutar({"comando": "reprogramar_turno", "datos": {
+                    "id": agendado["resultado"]["id"], "fecha_hora": "2030-06-10T10:00:00",
+                    "duracion": listado["duracion"],
+                }})
+                self.assertEqual(respuesta["resultado"]["duracion"], duracion)
+                turno = self.clinica.obtener_turno(agendado["resultado"]["id"])
+                self.assertEqual(turno.obtener_duracion(), timedelta(minutes=duracion))
+
+    def test_errores_de_negocio(self):
+        """Test para verificar que los errores se devuelven como respuesta"""
+        datos = {"dni": "12345678", "matricula": "MED001", "especialidad": "Cardiología",
+                 "fecha_hora": "2030-06-03T10:00:00"}
+        self.despachador.ejecutar({"comando": "agendar_turno", "datos": datos})
+        respuesta = self.despachador.ejecutar({"comando": "agendar_turno", "datos": datos})
+        self.assertFalse(respuesta["ok"])
+        self.assertEqual(respuesta["error"], "TurnoOcupadoException")
+
+        respuesta = self.despachador.ejecutar({"comando": "obtener_historia_clinica", "datos": {"dni": "0"}})
+        self.assertEqual(respuesta["error"], "PacienteNoEncontradoException")
+
+    def test_solicitudes_invalidas(self):
+        """Test para verificar que las solicitudes mal formadas no lanzan excepciones"""
+        solicitudes = [
+            [],
+            {"comando": "inexistente"},
+            {"comando": "agregar_paciente", "datos": []},
+            {"comando": "agregar_paciente", "datos": {"nombre": "Ana"}},
+            {"comando": "agregar_paciente", "datos": {"nombre": "Ana", "dni": 1, "fecha_nacimiento": "01/01/2000"}},
+            {"comando": "emitir_receta", "datos": {"dni": "12345678", "matricula": "MED001", "medicamentos": [1]}},
+            {"comando": "agendar_turno", "datos": {"dni": "12345678", "matricula": "MED001",
+                                                   "especialidad": "Cardiología", "fecha_hora": "mañana"}},
+        ]
+        for solicitud in solicitudes:
+            with self.subTest(solicitud=solicitud):
+                respuesta = self.despachador.ejecutar(solicitud)
+                self.assertFalse(respuesta["ok"])
+                self.assertEqual(respuesta["error"], "DatosInvalidosException")
+
+
+    def test_listados_paginados(self):
+        """Test para verificar los campos offset y limite de los listados"""
+        self.despachador.ejecutar({"comando": "agregar_paciente", "datos": {
+            "nombre": "María González", "dni": "87654321", "fecha_nacimiento": "22/07/1990",
+        }})
+        respuesta = self.despachador.ejecutar({"comando": "listar_pacientes", "datos": {"offset": 1, "limite": 5}})
+        self.assertEqual([p["dni"] for p in respuesta["resultado"]], ["87654321"])
+        respuesta = self.despachador.ejecutar({"comando": "listar_pacientes", "datos": {"offset": -1}})
+        self.assertEqual(respuesta["error"], "DatosInvalidosException")
+
+
+if __name__ == '__main__':
+    unittest.main()
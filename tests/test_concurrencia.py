@@ -0,0 +1,166 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.almacen import AlmacenMemoria
+from src.modelo.concurrencia import BloqueosPorClave
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.excepciones import TurnoOcupadoException
+
+
+class AlmacenConPausa(AlmacenMemoria):
+    """Cede el procesador entre la verificación y el alta para provocar carreras."""
+
+    def esta_libre(self, matricula, inicio, fin):
+        libre = super().esta_libre(matricula, inicio, fin)
+        time.sleep(0)
+        return libre
+
+
+class AlmacenConPausaEnHistoria(AlmacenMemoria):
+    """Cede el procesador después de leer los registros de un paciente para armar su historia."""
+
+    def __init__(self):
+        super().__init__()
+        self.leido = threading.Event()
+
+    def obtener_registros_paciente(self, dni):
+        registros = super().obtener_registros_paciente(dni)
+        self.leido.set()
+        time.sleep(0.05)
+        return registros
+
+
+class TestConcurrencia(unittest.TestCase):
+
+    HILOS = 16
+    MEDICOS = 4
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica(AlmacenConPausa(), concurrente=True, franjas=8)
+        for i in range(self.MEDICOS):
+            medico = Medico(f"Dr. {i}", f"MED{i:03d}")
+            medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+        for i in range(self.HILOS):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{i:08d}", "15/03/1985"))
+
+    def test_sin_turnos_duplicados(self):
+        """Test para verificar que varios hilos no reservan dos veces el mismo horario"""
+        # Todos los hilos intentan los mismos horarios (algunos superpuestos) en el mismo orden
+        horarios = [datetime(2030, 6, 3, 8, 0) + timedelta(minutes=15 * i) for i in range(40)]
+        barrera = threading.Barrier(self.HILOS)
+        errores = []
+
+        def reservar(numero):
+            dni = f"{numero:08d}"
+            barrera.wait()
+            try:
+                for fecha_hora in horarios:
+                    for m in range(self.MEDICOS):
+                        try:
+                            self.clinica.agendar_turno(dni, f"MED{m:03d}", "Cardiología", fecha_hora)
+                        except TurnoOcupadoException:
+                            pass
+            except Exception as e:  # pragma: no cover - se informa en el assert
+                errores.append(e)
+
+        hilos = [threading.Thread(target=reservar, args=(n,)) for n in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(errores, [])
+        # Turnos de 30 minutos cada 15: sólo entra uno de cada dos horarios por médico
+        self.assertEqual(len(self.clinica.obtener_turnos()), self.MEDICOS * len(horarios) // 2)
+        for m in range(self.MEDICOS):
+            turnos = self.clinica.obtener_turnos_medico(f"MED{m:03d}", horarios[0], horarios[-1] + timedelta(hours=1))
+            for anterior, siguiente in zip(turnos, turnos[1:]):
+                self.assertLessEqual(anterior.obtener_fecha_hora_fin(), siguiente.obtener_fecha_hora())
+
+    def test_pacientes_duplicados_concurrentes(self):
+        """Test para verificar que un DNI se registra una sola vez aunque compitan varios hilos"""
+        barrera = threading.Barrier(self.HILOS)
+        registrados = []
+
+        def registrar():
+            barrera.wait()
+            try:
+                self.clinica.agregar_paciente(Paciente("María González", "87654321", "22/07/1990"))
+                registrados.append(True)
+            except ValueError:
+                pass
+
+        hilos = [threading.Thread(target=registrar) for _ in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(len(registrados), 1)
+
+    def test_lotes_concurrentes(self):
+        """Test para verificar que lotes que compiten por los mismos horarios se agendan completos o no se agendan"""
+        horarios = [datetime(2030, 6, 3, 8, 0) + timedelta(minutes=30 * i) for i in range(4)]
+        barrera = threading.Barrier(self.HILOS)
+        agendados = []
+
+        def reservar(numero):
+            # Cada hilo recorre los médicos en distinto orden para cruzar los pedidos de locks
+            medicos = [f"MED{(numero + m) % self.MEDICOS:03d}" for m in range(self.MEDICOS)]
+            lote = [(f"{numero:08d}", matricula, "Cardiología", horarios[numero % len(horarios)])
+                    for matricula in medicos]
+            barrera.wait()
+            try:
+                agendados.append(self.clinica.agendar_turnos_lote(lote))
+            except TurnoOcupadoException:
+                pass
+
+        hilos = [threading.Thread(target=reservar, args=(n,)) for n in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        # Un lote por horario: cada uno ocupa ese horario en todos los médicos
+        self.assertEqual(len(agendados), len(horarios))
+        self.assertEqual(len(self.clinica.obtener_turnos()), len(horarios) * self.MEDICOS)
+
+    def test_historia_con_turno_concurrente(self):
+        """Test para verificar que un turno agendado mientras se arma la historia queda en ella"""
+        almacen = AlmacenConPausaEnHistoria()
+        clinica = Clinica(almacen, concurrente=True)
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+
+        historias = []
+        hilo = threading.Thread(target=lambda: historias.append(clinica.obtener_historia_clinica("12345678")))
+        hilo.start()
+        almacen.leido.wait()
+        clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 8, 0))
+        hilo.join()
+
+        self.assertEqual(len(clinica.obtener_turnos()), 1)
+        self.assertEqual(len(historias[0].obtener_turnos()), 1)
+
+    def test_bloqueos_por_clave(self):
+        """Test para verificar que una clave siempre usa el mismo lock"""
+        bloqueos = BloqueosPorClave(4)
+        self.assertIs(bloqueos.para("MED001"), bloqueos.para("MED001"))
+        # Claves de una misma franja no deben tomar dos veces el mismo lock
+        with BloqueosPorClave(1).para_varias(["MED001", "MED002"]):
+            pass
+        with self.assertRaises(ValueError):
+            BloqueosPorClave(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.excepciones import TurnoOcupadoException
+from src.persistencia.diario import DiarioClinica
+
+
+class TestDiarioClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _cargar_datos(self, clinica):
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+        # Especialidad agregada después del registro: también se registra
+        medico.agregar_especialidad(Especialidad("Clínica", ["martes"]))
+        clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 0))
+        clinica.agendar_turno("12345678", "MED001", "Clínica", datetime(2030, 6, 4, 10, 0))
+        clinica.emitir_receta("12345678", "MED001", ["Aspirina 100mg"])
+
+    def _verificar_datos(self, clinica):
+        self.assertEqual(len(clinica.obtener_pacientes()), 1)
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+        medico = clinica.obtener_medico_por_matricula("MED001")
+        self.assertEqual(medico.obtener_especialidad_para_indice_dia(1), "Clínica")
+
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 2)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Aspirina 100mg"])
+
+        # Los índices se reconstruyen: el horario sigue ocupado
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 15))
+
+    def test_recuperar_desde_log(self):
+        """Test para verificar que la clínica se recupera reproduciendo el log"""
+        with DiarioClinica(self.directorio) as clinica:
+            self._cargar_datos(clinica)
+
+        with DiarioClinica(self.directorio) as clinica:
+            self._verificar_datos(clinica)
+
+    def test_compactacion_por_umbral(self):
+        """Test para verificar que el log se compacta en un snapshot al superar el umbral"""
+        with DiarioClinica(self.directorio, lote_sincronizacion=2, umbral_compactacion=4) as clinica:
+            self._cargar_datos(clinica)
+
+        self.assertTrue(os.path.exists(os.path.join(self.directorio, DiarioClinica.ARCHIVO_SNAPSHOT)))
+        with open(os.path.join(self.directorio, DiarioClinica.ARCHIVO_LOG), encoding="utf-8") as log:
+            self.assertEqual(len(log.readlines()), 2)
+
+        with DiarioClinica(self.directorio) as clinica:
+            self._verificar_datos(clinica)
+
+    def test_escritura_trunca_se_descarta(self):
+        """Test para verificar que una última línea incompleta no impide recuperar"""
+        with DiarioClinica(self.directorio) as clinica:
+            self._cargar_datos(clinica)
+
+        with open(os.path.join(self.directorio, DiarioClinica.ARCHIVO_LOG), "a", encoding="utf-8") as log:
+            log.write('{"seq": 99, "op": "agregar_pac')
+
+        with DiarioClinica(self.directorio) as clinica:
+            self._verificar_datos(clinica)
+            clinica.agregar_paciente(Paciente("María González", "87654321", "22/07/1990"))
+
+        with DiarioClinica(self.directorio) as clinica:
+            self.assertEqual(len(clinica.obtener_pacientes()), 2)
+
+    def test_snapshot_sin_vaciar_log_no_duplica(self):
+        """Test para verificar que los registros ya incluidos en el snapshot no se reaplican"""
+        diario = DiarioClinica(self.directorio)
+        clinica = diario.abrir()
+        self._cargar_datos(clinica)
+        diario.sincronizar()
+        with open(os.path.join(self.directorio, DiarioClinica.ARCHIVO_LOG), encoding="utf-8") as log:
+            contenido = log.read()
+        diario.compactar()
+        diario.cerrar()
+
+        # Simular una caída entre el snapshot y el vaciado del log
+        with open(os.path.join(self.directorio, DiarioClinica.ARCHIVO_LOG), "w", encoding="utf-8") as log:
+            log.write(contenido)
+
+        with DiarioClinica(self.directorio) as clinica:
+            self._verificar_datos(clinica)
+
+    def test_ids_de_turnos_se_conservan(self):
+        """Test para verificar que los turnos conservan su id tras compactar y que no se reusan los cancelados"""
+        lunes = datetime(2030, 6, 3, 10, 0)
+        with DiarioClinica(self.directorio) as clinica:
+            self._cargar_datos(clinica)
+            ids = [clinica.agendar_turno("12345678", "MED001", "Cardiología", lunes.replace(hour=hora))
+                   for hora in (11, 12, 13)]
+            clinica.cancelar_turno(clinica.buscar_turno("MED001", lunes))
+            clinica.cancelar_turno(ids[-1])
+            siguiente = clinica.obtener_siguiente_id_turno()
+
+        for compactar in (False, True):
+            diario = DiarioClinica(self.directorio)
+            clinica = diario.abrir()
+            if compactar:
+                diario.compactar()
+                diario.cerrar()
+                clinica = diario.abrir()
+            self.assertEqual([clinica.buscar_turno("MED001", lunes.replace(hour=hora)) for hora in (11, 12)],
+                             ids[:2])
+            self.assertEqual(clinica.obtener_siguiente_id_turno(), siguiente)
+            diario.cerrar()
+
+        with DiarioClinica(self.directorio) as clinica:
+            self.assertEqual(clinica.agendar_turno("12345678", "MED001", "Cardiología", lunes), siguiente)
+
+    def test_duraciones_exactas(self):
+        """Test para verificar que las duraciones con fracciones de segundo se conservan en el log y el snapshot"""
+        duracion = timedelta(minutes=20, microseconds=250)
+        lunes = datetime(2030, 6, 3, 10, 0)
+        with DiarioClinica(self.directorio) as clinica:
+            self._cargar_datos(clinica)
+            clinica.agendar_turno("12345678", "MED001", "Cardiología", lunes.replace(hour=11), duracion)
+            clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", datetime(2030, 7, 1, 9, 0),
+                                             repeticiones=2, duracion=duracion)
+            clinica.agendar_turno("12345678", "MED001", "Cardiología", lunes.replace(hour=12))
+            clinica.reprogramar_turno(clinica.buscar_turno("MED001", lunes.replace(hour=12)),
+                                      lunes.replace(hour=13), duracion)
+
+        for compactar in (False, True):
+            diario = DiarioClinica(self.directorio)
+            clinica = diario.abrir()
+            if compactar:
+                diario.compactar()
+                diario.cerrar()
+                clinica = diario.abrir()
+            for hora in (11, 13):
+                turno = clinica.obtener_turno(clinica.buscar_turno("MED001", lunes.replace(hour=hora)))
+                self.assertEqual(turno.obtener_duracion(), duracion)
+            self.assertEqual(clinica.obtener_recurrencias()[0].obtener_duracion(), duracion)
+            diario.cerrar()
+
+    def test_snapshot_con_duraciones_en_segundos(self):
+        """Test para verificar que se cargan los snapshots anteriores, con la duración en segundos"""
+        with open(os.path.join(self.directorio, DiarioClinica.ARCHIVO_SNAPSHOT), "w", encoding="utf-8") as archivo:
+            json.dump({
+                "version": 1, "secuencia": 0,
+                "pacientes": [{"nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "15/03/1985"}],
+                "medicos": [{"nombre": "Dr. García", "matricula": "MED001",
+                             "especialidades": [{"tipo": "Cardiología", "dias": ["lunes"]}]}],
+                "turnos": [{"dni": "12345678", "matricula": "MED001", "fecha_hora": "2030-06-03T10:00:00",
+                            "especialidad": "Cardiología", "duracion": 1800}],
+                "recetas": [],
+            }, archivo)
+
+        with DiarioClinica(self.directorio) as clinica:
+            turno = clinica.obtener_turno(clinica.buscar_turno("MED001", datetime(2030, 6, 3, 10, 0)))
+            self.assertEqual(turno.obtener_duracion(), timedelta(minutes=30))
+
+
+if __name__ == '__main__':
+    unittest.main()
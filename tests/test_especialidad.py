@@ -0,0 +1,34 @@
+import unittest
+
+from src.modelo.especialidad import Especialidad
+from src.modelo.excepciones import DatosInvalidosException
+
+
+class TestEspecialidad(unittest.TestCase):
+
+    def test_verificar_dia(self):
+        """Test para verificar la consulta de días sin distinguir mayúsculas"""
+        especialidad = Especialidad("Pediatría", ["Lunes", " jueves"])
+        self.assertTrue(especialidad.verificar_dia("LUNES"))
+        self.assertTrue(especialidad.verificar_dia("jueves"))
+        self.assertFalse(especialidad.verificar_dia("martes"))
+
+    def test_indices_dias(self):
+        """Test para verificar los días expresados como índices de weekday()"""
+        especialidad = Especialidad("Pediatría", ["domingo", "lunes", "miércoles"])
+        self.assertEqual(especialidad.obtener_indices_dias(), (6, 0, 2))
+
+    def test_datos_invalidos(self):
+        """Test para verificar las validaciones de la especialidad"""
+        with self.assertRaises(DatosInvalidosException):
+            Especialidad("", ["lunes"])
+        with self.assertRaises(DatosInvalidosException):
+            Especialidad("Pediatría", [])
+        with self.assertRaises(DatosInvalidosException):
+            Especialidad("Pediatría", ["feriado"])
+        with self.assertRaises(DatosInvalidosException):
+            Especialidad("Pediatría", ["lunes", "Lunes"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.clinica import Clinica
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.persistencia.almacen_sqlite import AlmacenSQLite
+from src.persistencia import exportacion
+from src.persistencia.exportacion import (
+    ExportadorHistorias, nombre_archivo, registro_paciente, historia_desde_registro,
+)
+
+
+class TestExportacionMemoria(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+        self.clinica = self._crear_clinica()
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        lunes = datetime(2030, 6, 3, 8, 0)
+        for i in range(7):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{i + 1:08d}", "15/03/1985"))
+        for i in range(20):
+            self.clinica.agendar_turno(f"{i % 6 + 1:08d}", "MED001", "Cardiología",
+                                       lunes + timedelta(weeks=i // 10, minutes=30 * (i % 10)),
+                                       timedelta(minutes=15 + i % 15))
+        cancelado = self.clinica.buscar_turno("MED001", lunes)
+        self.clinica.cancelar_turno(cancelado)
+        self.clinica.emitir_receta("00000002", "MED001", ["Aspirina 100mg", "Omeprazol 20mg"])
+        self.clinica.agendar_turno_recurrente("00000003", "MED001", "Cardiología",
+                                              lunes + timedelta(days=2), repeticiones=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _crear_clinica(self):
+        return Clinica()
+
+    def _historias(self):
+        return [str(self.clinica.obtener_historia_clinica(p.obtener_dni())) for p in self.clinica.iter_pacientes()]
+
+    def test_archivo_igual_a_historias(self):
+        """Test para verificar que el archivo combinado coincide con str(historia) de cada paciente"""
+        for procesos in (1, 2):
+            with self.subTest(procesos=procesos):
+                salida = io.StringIO()
+                resultado = ExportadorHistorias(self.clinica, procesos, tamano_lote=3).exportar_archivo(salida)
+                self.assertEqual(resultado.historias, 7)
+                self.assertEqual(salida.getvalue(), "".join(h + "\n" for h in self._historias()))
+
+    def test_un_proceso_no_modifica_el_modulo(self):
+        """Test para verificar que exportar sin pool no deja médicos cargados en el proceso"""
+        ExportadorHistorias(self.clinica, 1).exportar_archivo(io.StringIO())
+        self.assertEqual(exportacion._medicos, {})
+
+    def test_duracion_de_series_exacta(self):
+        """Test para verificar que el registro conserva la duración de una serie con fracciones de segundo"""
+        duracion = timedelta(minutes=20, seconds=1, microseconds=500)
+        self.clinica.agendar_turno_recurrente("00000007", "MED001", "Cardiología",
+                                              datetime(2031, 6, 2, 9, 0), repeticiones=2, duracion=duracion)
+        paciente = self.clinica.obtener_paciente_por_dni("00000007")
+        medicos = {"MED001": self.clinica.obtener_medico_por_matricula("MED001")}
+        historia = historia_desde_registro(registro_paciente(self.clinica, paciente), medicos)
+        self.assertEqual(historia.obtener_recurrencias()[0].obtener_duracion(), duracion)
+
+    def test_un_archivo_por_paciente(self):
+        """Test para verificar la exportación de un archivo por paciente"""
+        destino = os.path.join(self.directorio, "historias")
+        resultado = ExportadorHistorias(self.clinica, 2, tamano_lote=2).exportar_directorio(destino)
+        self.assertEqual(resultado.historias, 7)
+        for paciente, historia in zip(self.clinica.iter_pacientes(), self._historias()):
+            with open(os.path.join(destino, f"historia_{paciente.obtener_dni()}.txt"), encoding="utf-8") as archivo:
+                self.assertEqual(archivo.read(), historia)
+
+    def test_dni_no_sale_del_directorio(self):
+        """Test para verificar que un DNI con separadores de ruta no escribe fuera del directorio"""
+        self.clinica.agregar_paciente(Paciente("Paciente Ruta", "../../fuera", "15/03/1985"))
+        destino = os.path.join(self.directorio, "a", "historias")
+        resultado = ExportadorHistorias(self.clinica, 1).exportar_directorio(destino)
+        self.assertEqual(resultado.historias, 8)
+        self.assertEqual(nombre_archivo("../../fuera"), "historia_..%2F..%2Ffuera.txt")
+        self.assertTrue(os.path.isfile(os.path.join(destino, nombre_archivo("../../fuera"))))
+        self.assertEqual(len(os.listdir(destino)), 8)
+        self.assertEqual(os.listdir(os.path.join(self.directorio, "a")), ["historias"])
+
+    def test_parametros_invalidos(self):
+        """Test para verificar que se rechazan cantidades de procesos o lotes no positivas"""
+        with self.assertRaises(ValueError):
+            ExportadorHistorias(self.clinica, -1)
+        with self.assertRaises(ValueError):
+            ExportadorHistorias(self.clinica, 1, tamano_lote=0)
+
+
+class TestExportacionSQLite(TestExportacionMemoria):
+
+    def _crear_clinica(self):
+        self.almacen = AlmacenSQLite(os.path.join(self.directorio, "clinica.db"))
+        return Clinica(self.almacen)
+
+    def tearDown(self):
+        self.almacen.cerrar()
+        super().tearDown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.turno import Turno
+from src.modelo.receta import Receta
+from src.modelo.historia_clinica import HistoriaClinica
+from src.modelo.excepciones import DatosInvalidosException
+
+
+class TestHistoriaClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.paciente = Paciente("Juan Pérez", "12345678", "15/03/1985")
+        self.medico = Medico("Dr. García", "MED001")
+        self.historia = HistoriaClinica(self.paciente)
+        self.fechas = [datetime(2030, 6, 3, 10, 0) + timedelta(days=7 * i) for i in range(5)]
+        for fecha in self.fechas:
+            self.historia.agregar_turno(Turno(self.paciente, self.medico, fecha, "Cardiología"))
+        self.historia.agregar_receta(Receta.restaurar(self.paciente, self.medico, ["Aspirina 100mg"], self.fechas[0]))
+
+    def test_renderizado_completo(self):
+        """Test para verificar el texto completo de la historia clínica"""
+        texto = str(self.historia)
+        self.assertTrue(texto.startswith("=== Historia Clínica de Paciente: Juan Pérez"))
+        self.assertIn("TURNOS (5):\n1. Turno: 12345678 con Dr./Dra. MED001 (Cardiología) - 03/06/2030 10:00\n", texto)
+        self.assertIn("RECETAS (1):\n1. Receta para 12345678", texto)
+
+    def test_historia_vacia(self):
+        """Test para verificar el texto de una historia sin registros"""
+        texto = str(HistoriaClinica(self.paciente))
+        self.assertIn("TURNOS (0):\nNo hay turnos registrados.\n", texto)
+        self.assertIn("RECETAS (0):\nNo hay recetas registradas.\n", texto)
+
+    def test_ultimos_registros(self):
+        """Test para verificar que se muestran sólo los últimos N con su número original"""
+        texto = self.historia.renderizar(ultimos=2)
+        self.assertIn("TURNOS (2 de 5):\n4. ", texto)
+        self.assertIn("\n5. Turno", texto)
+        self.assertNotIn("3. Turno", texto)
+        self.assertIn("RECETAS (1):", texto)
+        self.assertIn("TURNOS (0 de 5):\nNo hay turnos registrados.", self.historia.renderizar(ultimos=0))
+        with self.assertRaises(DatosInvalidosException):
+            self.historia.renderizar(ultimos=-1)
+
+    def test_ventana_de_fechas(self):
+        """Test para verificar el filtro por rango de fechas"""
+        texto = self.historia.renderizar(desde=self.fechas[1], hasta=self.fechas[3])
+        self.assertIn("TURNOS (2 de 5):\n2. ", texto)
+        self.assertIn("\n3. Turno", texto)
+        self.assertIn("RECETAS (0 de 1):\nNo hay recetas registradas.", texto)
+
+    def test_orden_por_fecha(self):
+        """Test para verificar que los registros agregados fuera de orden quedan ordenados por fecha"""
+        anterior = datetime(2030, 5, 1, 9, 0)
+        self.historia.agregar_turno(Turno(self.paciente, self.medico, anterior, "Cardiología"))
+        turnos = self.historia.obtener_turnos()
+        self.assertEqual(turnos[0].obtener_fecha_hora(), anterior)
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos[1:]], self.fechas)
+        self.assertIn("TURNOS (6):\n1. Turno: 12345678 con Dr./Dra. MED001 (Cardiología) - 01/05/2030 09:00\n",
+                      str(self.historia))
+
+    def test_turnos_entre(self):
+        """Test para verificar la consulta de turnos por rango de fechas"""
+        turnos = self.historia.obtener_turnos_entre(self.fechas[1], self.fechas[3])
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos], self.fechas[1:3])
+        self.assertEqual(len(self.historia.obtener_turnos_entre(desde=self.fechas[3])), 2)
+        self.assertEqual(len(self.historia.obtener_turnos_entre(hasta=self.fechas[0])), 0)
+        self.assertEqual(self.historia.obtener_turnos_entre(self.fechas[3], self.fechas[1]), [])
+
+    def test_recetas_entre(self):
+        """Test para verificar la consulta de recetas por rango de fechas"""
+        self.historia.agregar_receta(Receta.restaurar(self.paciente, self.medico, ["Ibuprofeno"], self.fechas[4]))
+        recetas = self.historia.obtener_recetas_entre(desde=self.fechas[4] - timedelta(days=90))
+        self.assertEqual(len(recetas), 2)
+        recetas = self.historia.obtener_recetas_entre(desde=self.fechas[1])
+        self.assertEqual(recetas[0].obtener_medicamentos(), ["Ibuprofeno"])
+
+    def test_ultimos_n(self):
+        """Test para verificar la consulta de los últimos N turnos y recetas"""
+        ultimos = self.historia.obtener_ultimos_turnos(2)
+        self.assertEqual([t.obtener_fecha_hora() for t in ultimos], self.fechas[3:])
+        self.assertEqual(len(self.historia.obtener_ultimos_turnos(10)), 5)
+        self.assertEqual(self.historia.obtener_ultimos_turnos(0), [])
+        self.assertEqual(len(self.historia.obtener_ultimas_recetas(3)), 1)
+        with self.assertRaises(DatosInvalidosException):
+            self.historia.obtener_ultimas_recetas(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
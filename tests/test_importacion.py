@@ -0,0 +1,185 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.modelo.clinica import Clinica
+from src.modelo.excepciones import TurnoOcupadoException
+from src.persistencia.importacion import ImportadorClinica
+from src.persistencia.diario import DiarioClinica
+
+
+class TestImportadorClinica(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+        self.clinica = Clinica()
+        self.importador = ImportadorClinica(self.clinica, tamano_lote=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _archivo(self, nombre, contenido):
+        ruta = os.path.join(self.directorio, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def _importar_medicos(self):
+        lineas = [
+            {"nombre": "Dr. García", "matricula": "MED001",
+             "especialidades": [{"tipo": "Cardiología", "dias": ["lunes", "miércoles"]}]},
+            {"nombre": "Dra. López", "matricula": "MED002", "especialidades": []},
+            {"nombre": "Dr. Repetido", "matricula": "MED001", "especialidades": []},
+        ]
+        ruta = self._archivo("medicos.jsonl", "\n".join(json.dumps(l) for l in lineas) + "\n{roto\n")
+        return self.importador.importar_medicos(ruta)
+
+    def test_importar_pacientes_con_errores_por_fila(self):
+        """Test para verificar que las filas inválidas se informan sin abortar la importación"""
+        ruta = self._archivo("pacientes.csv", (
+            "nombre,dni,fecha_nacimiento\n"
+            "Juan Pérez,12345678,15/03/1985\n"
+            "María González,87654321,31/02/1990\n"
+            "Ana Ruiz,11111111,01/01/2000\n"
+            "Juan Otro,12345678,15/03/1985\n"
+            ",22222222,01/01/2000\n"
+            "Luis Díaz,33333333,10/10/1970\n"
+        ))
+
+        resultado = self.importador.importar_pacientes(ruta)
+
+        self.assertEqual(resultado.procesadas, 6)
+        self.assertEqual(resultado.importadas, 3)
+        self.assertEqual([error.fila for error in resultado.errores], [3, 5, 6])
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 3)
+        self.assertIsNotNone(self.clinica.obtener_historia_clinica("33333333"))
+
+    def test_importar_medicos(self):
+        """Test para verificar la importación de médicos con especialidades desde JSONL"""
+        resultado = self._importar_medicos()
+
+        self.assertEqual(resultado.importadas, 2)
+        self.assertEqual([error.fila for error in resultado.errores], [3, 4])
+        medico = self.clinica.obtener_medico_por_matricula("MED001")
+        self.assertEqual(medico.obtener_especialidad_para_indice_dia(2), "Cardiología")
+
+    def test_importar_turnos_historicos(self):
+        """Test para verificar la importación de turnos pasados y la detección de superposiciones"""
+        self._importar_medicos()
+        self.importador.importar_pacientes(self._archivo("pacientes.jsonl", (
+            '{"nombre": "Juan Pérez", "dni": 12345678, "fecha_nacimiento": "15/03/1985"}\n'
+        )))
+        ruta = self._archivo("turnos.csv", (
+            "dni,matricula,especialidad,fecha_hora,duracion\n"
+            "12345678,MED001,Cardiología,2020-03-02T10:00,\n"
+            "12345678,MED001,Cardiología,2020-03-02T10:15,30\n"
+            "12345678,MED001,Cardiología,2030-06-03T10:00,45\n"
+            "99999999,MED001,Cardiología,2030-06-03T12:00,\n"
+            "12345678,MED001,Cardiología,ayer,\n"
+        ))
+
+        resultado = self.importador.importar_turnos(ruta)
+
+        self.assertEqual(resultado.importadas, 2)
+        self.assertEqual([error.fila for error in resultado.errores], [3, 5, 6])
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 2)
+
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MED001", "Cardiología", datetime(2030, 6, 3, 10, 30))
+
+    def test_turnos_importados_quedan_en_el_diario(self):
+        """Test para verificar que los turnos importados sobreviven a un reinicio de la clínica con diario"""
+        datos = os.path.join(self.directorio, "datos")
+        with DiarioClinica(datos) as clinica:
+            self.importador = ImportadorClinica(clinica, tamano_lote=2)
+            self._importar_medicos()
+            self.importador.importar_pacientes(self._archivo("pacientes.jsonl", (
+                '{"nombre": "Juan Pérez", "dni": 12345678, "fecha_nacimiento": "15/03/1985"}\n'
+            )))
+            resultado = self.importador.importar_turnos(self._archivo("turnos.csv", (
+                "dni,matricula,especialidad,fecha_hora,duracion\n"
+                "12345678,MED001,Cardiología,2020-03-02T10:00,\n"
+                "12345678,MED001,Cardiología,2020-03-04T10:00,30\n"
+                "12345678,MED001,Cardiología,2030-06-03T10:00,45\n"
+            )))
+            self.assertEqual(resultado.importadas, 3)
+            ids = dict(clinica.iter_turnos_con_id())
+
+        with DiarioClinica(datos) as clinica:
+            self.assertEqual({id_turno: str(turno) for id_turno, turno in clinica.iter_turnos_con_id()},
+                             {id_turno: str(turno) for id_turno, turno in ids.items()})
+            self.assertEqual(len(clinica.obtener_historia_clinica("12345678").obtener_turnos()), 3)
+
+    def test_filas_jsonl_mal_formadas(self):
+        """Test para verificar que filas que no son objetos o con campos no simples se informan por fila"""
+        self._importar_medicos()
+        self.importador.importar_pacientes(self._archivo("pacientes.jsonl", (
+            '{"nombre": "Juan Pérez", "dni": 12345678, "fecha_nacimiento": "15/03/1985"}\n'
+        )))
+        lineas = [
+            [1, 2],
+            {"nombre": ["x"], "dni": "22222222", "fecha_nacimiento": "01/01/2000"},
+            "texto",
+            {"nombre": "Ana Ruiz", "dni": "11111111", "fecha_nacimiento": "01/01/2000"},
+        ]
+        resultado = self.importador.importar_pacientes(
+            self._archivo("pacientes2.jsonl", "\n".join(json.dumps(l) for l in lineas)))
+        self.assertEqual(resultado.importadas, 1)
+        self.assertEqual([error.fila for error in resultado.errores], [1, 2, 3])
+
+        lineas = [
+            {"nombre": "Dr. Pérez", "matricula": "MED003", "especialidades": [["Pediatría"]]},
+            {"nombre": "Dr. Díaz", "matricula": {"a": 1}, "especialidades": []},
+        ]
+        resultado = self.importador.importar_medicos(
+            self._archivo("medicos2.jsonl", "\n".join(json.dumps(l) for l in lineas)))
+        self.assertEqual([error.fila for error in resultado.errores], [1, 2])
+
+        base = {"dni": "12345678", "matricula": "MED001", "especialidad": "Cardiología"}
+        lineas = [
+            [1, 2],
+            {**base, "fecha_hora": "2030-06-03T10:00+03:00"},
+            {**base, "fecha_hora": "2030-06-03T11:00", "duracion": [1]},
+            {**base, "fecha_hora": ["2030-06-03T12:00"]},
+            {**base, "fecha_hora": "2030-06-03T13:00", "duracion": 20},
+        ]
+        resultado = self.importador.importar_turnos(
+            self._archivo("turnos.jsonl", "\n".join(json.dumps(l) for l in lineas)))
+        self.assertEqual(resultado.importadas, 1)
+        self.assertEqual([error.fila for error in resultado.errores], [1, 2, 3, 4])
+
+    def test_turnos_fuera_de_la_agenda_del_medico(self):
+        """Test para verificar que se rechazan turnos en días o especialidades que el médico no atiende"""
+        self._importar_medicos()
+        self.importador.importar_pacientes(self._archivo("pacientes.jsonl", (
+            '{"nombre": "Juan Pérez", "dni": 12345678, "fecha_nacimiento": "15/03/1985"}\n'
+        )))
+        contenido = (
+            "dni,matricula,especialidad,fecha_hora,duracion\n"
+            "12345678,MED001,Pediatría,2030-06-08T10:00,\n"
+            "12345678,MED001,Pediatría,2030-06-03T10:00,\n"
+            "12345678,MED001,Cardiología,2030-06-04T10:00,\n"
+            "12345678,MED001,cardiología,2030-06-05T10:00,\n"
+        )
+
+        resultado = self.importador.importar_turnos(self._archivo("turnos.csv", contenido))
+        self.assertEqual(resultado.importadas, 1)
+        self.assertEqual([error.fila for error in resultado.errores], [2, 3, 4])
+
+        confiable = ImportadorClinica(self.clinica).importar_turnos(
+            self._archivo("turnos2.csv", contenido.replace("T10:00", "T12:00")), confiable=True)
+        self.assertEqual(confiable.importadas, 4)
+
+    def test_formato_no_soportado(self):
+        """Test para verificar que se rechazan extensiones desconocidas"""
+        with self.assertRaises(ValueError):
+            self.importador.importar_pacientes(self._archivo("pacientes.txt", ""))
+
+
+if __name__ == '__main__':
+    unittest.main()
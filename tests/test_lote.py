@@ -0,0 +1,129 @@
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from src.modelo.clinica import Clinica
+from src.interfaz import lote
+from src.interfaz.lote import EjecutorLote
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = [
+    {"comando": "agregar_medico", "datos": {
+        "nombre": "Dr. García", "matricula": "MED001",
+        "especialidades": [{"tipo": "Cardiología", "dias": ["lunes"]}],
+    }},
+    {"comando": "agregar_paciente", "datos": {
+        "nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "15/03/1985",
+    }},
+    {"id": 1, "comando": "agendar_turno", "datos": {
+        "dni": "12345678", "matricula": "MED001", "especialidad": "Cardiología",
+        "fecha_hora": "2030-06-03T10:00:00",
+    }},
+    {"id": 2, "comando": "agendar_turno", "datos": {
+        "dni": "12345678", "matricula": "MED001", "especialidad": "Cardiología",
+        "fecha_hora": "2030-06-03T10:00:00",
+    }},
+]
+
+
+def lineas_script():
+    return [json.dumps(solicitud) + "\n" for solicitud in SCRIPT]
+
+
+class TestEjecutorLote(unittest.TestCase):
+
+    def test_ejecutar_script(self):
+        """Test para verificar que el script se ejecuta completo y se informan los errores por línea"""
+        clinica = Clinica()
+        salida = io.StringIO()
+        lineas = lineas_script()
+        lineas.insert(2, "\n")
+        lineas.append("esto no es JSON\n")
+        resultado = EjecutorLote(clinica, salida).ejecutar(lineas)
+
+        self.assertEqual(resultado.procesados, 5)
+        self.assertEqual(resultado.exitosos, 3)
+        self.assertEqual([(e.linea, e.comando, e.error) for e in resultado.errores], [
+            (5, "agendar_turno", "TurnoOcupadoException"),
+            (6, "?", "DatosInvalidosException"),
+        ])
+        self.assertEqual(resultado.por_comando["agendar_turno"], [1, 1])
+        self.assertEqual(clinica.contar_turnos(), 1)
+
+        respuestas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual(len(respuestas), 5)
+        self.assertEqual((respuestas[2]["id"], respuestas[2]["ok"]), (1, True))
+        self.assertEqual((respuestas[3]["id"], respuestas[3]["ok"]), (2, False))
+        self.assertIn("3/5 comandos ejecutados, 2 con errores", resultado.informe())
+        self.assertIn("línea 5 (agendar_turno): TurnoOcupadoException", resultado.informe())
+
+    def test_salida_en_bloques(self):
+        """Test para verificar que las respuestas se escriben en bloques y no una por comando"""
+        escrituras = []
+
+        class Salida:
+            def write(self, texto):
+                escrituras.append(texto)
+
+        original = lote.TAMANO_BUFFER
+        lote.TAMANO_BUFFER = 2
+        try:
+            EjecutorLote(Clinica(), Salida()).ejecutar(lineas_script() * 2 + lineas_script()[:1])
+        finally:
+            lote.TAMANO_BUFFER = original
+        self.assertEqual([texto.count("\n") for texto in escrituras], [2, 2, 2, 2, 1])
+
+
+class TestModoScript(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.directorio = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def test_main_desde_entrada_estandar(self):
+        """Test para verificar que main.py --script - lee la entrada estándar y sale con error si algún comando falló"""
+        proceso = subprocess.run(
+            [sys.executable, os.path.join(RAIZ, "main.py"), "--script", "-"],
+            input="".join(lineas_script()), capture_output=True, text=True, cwd=self.directorio,
+        )
+        self.assertEqual(proceso.returncode, 1)
+        respuestas = [json.loads(linea) for linea in proceso.stdout.splitlines()]
+        self.assertEqual([r["ok"] for r in respuestas], [True, True, True, False])
+        self.assertIn("3/4 comandos ejecutados", proceso.stderr)
+
+    def test_main_con_datos_persistidos(self):
+        """Test para verificar que un script aplicado sobre --datos queda persistido"""
+        script = os.path.join(self.directorio, "script.jsonl")
+        with open(script, "w", encoding="utf-8") as archivo:
+            archivo.writelines(lineas_script()[:3])
+        datos = os.path.join(self.directorio, "datos")
+        respuestas = os.path.join(self.directorio, "respuestas.jsonl")
+        proceso = subprocess.run(
+            [sys.executable, os.path.join(RAIZ, "main.py"), "--datos", datos,
+             "--script", script, "--respuestas", respuestas],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(proceso.returncode, 0, proceso.stderr)
+        self.assertEqual(proceso.stdout, "")
+        with open(respuestas, encoding="utf-8") as archivo:
+            self.assertEqual(len(archivo.readlines()), 3)
+
+        proceso = subprocess.run(
+            [sys.executable, os.path.join(RAIZ, "main.py"), "--datos", datos, "--script", "-"],
+            input=json.dumps({"comando": "listar_turnos"}) + "\n", capture_output=True, text=True,
+        )
+        self.assertEqual(len(json.loads(proceso.stdout)["resultado"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.receta import Receta
+from src.modelo.medicamentos import CatalogoMedicamentos, CATALOGO_MEDICAMENTOS
+
+
+class TestCatalogoMedicamentos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.catalogo = CatalogoMedicamentos()
+
+    def test_internar_reutiliza_ids(self):
+        """Test para verificar que un mismo nombre recibe siempre el mismo id"""
+        aspirina = self.catalogo.internar("Aspirina 100mg")
+        ibuprofeno = self.catalogo.internar("Ibuprofeno 400mg")
+        self.assertNotEqual(aspirina, ibuprofeno)
+        self.assertEqual(self.catalogo.internar("Aspirina 100mg"), aspirina)
+        self.assertEqual(self.catalogo.obtener_nombre(ibuprofeno), "Ibuprofeno 400mg")
+        self.assertEqual(len(self.catalogo), 2)
+
+    def test_buscar_sin_distinguir_mayusculas(self):
+        """Test para verificar la búsqueda por nombre sin distinguir mayúsculas"""
+        ids = {self.catalogo.internar("Aspirina"), self.catalogo.internar("ASPIRINA")}
+        self.assertEqual(set(self.catalogo.buscar(" aspirina ")), ids)
+        self.assertEqual(self.catalogo.buscar("Paracetamol"), [])
+
+    def test_receta_usa_catalogo_compartido(self):
+        """Test para verificar que las recetas guardan ids del catálogo y devuelven los nombres"""
+        paciente = Paciente("Juan Pérez", "12345678", "15/03/1985")
+        medico = Medico("Dr. García", "MED001")
+        primera = Receta(paciente, medico, [" Amoxicilina 500mg ", ""])
+        segunda = Receta(paciente, medico, ["Amoxicilina 500mg"])
+        self.assertEqual(primera.obtener_medicamentos(), ["Amoxicilina 500mg"])
+        self.assertEqual(primera.obtener_ids_medicamentos(), segunda.obtener_ids_medicamentos())
+        self.assertEqual(CATALOGO_MEDICAMENTOS.obtener_nombre(primera.obtener_ids_medicamentos()[0]),
+                         "Amoxicilina 500mg")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.excepciones import DatosInvalidosException, EspecialidadDuplicadaException
+
+
+class TestMedico(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.medico = Medico("Dr. García", "MED001")
+        self.medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "miércoles"]))
+
+    def test_datos_invalidos(self):
+        """Test para verificar que no se aceptan nombre ni matrícula vacíos"""
+        with self.assertRaises(DatosInvalidosException):
+            Medico("", "MED002")
+        with self.assertRaises(DatosInvalidosException):
+            Medico("Dra. López", "  ")
+
+    def test_especialidad_duplicada(self):
+        """Test para verificar que no se repiten especialidades"""
+        with self.assertRaises(EspecialidadDuplicadaException):
+            self.medico.agregar_especialidad(Especialidad("cardiología", ["viernes"]))
+
+    def test_especialidad_por_dia(self):
+        """Test para verificar la tabla de especialidades por día de la semana"""
+        self.medico.agregar_especialidad(Especialidad("Clínica", ["miércoles", "viernes"]))
+
+        self.assertEqual(self.medico.obtener_especialidad_para_dia("Lunes "), "Cardiología")
+        self.assertEqual(self.medico.obtener_especialidad_para_indice_dia(0), "Cardiología")
+        # El miércoles lo ocupa la especialidad agregada primero
+        self.assertEqual(self.medico.obtener_especialidad_para_indice_dia(2), "Cardiología")
+        self.assertEqual(self.medico.obtener_especialidad_para_indice_dia(4), "Clínica")
+        self.assertIsNone(self.medico.obtener_especialidad_para_indice_dia(6))
+        self.assertIsNone(self.medico.obtener_especialidad_para_dia("feriado"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.modelo.clinica import Clinica, OPERACIONES_INSTRUMENTADAS
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.metricas import Metricas
+from src.modelo.excepciones import TurnoOcupadoException, PacienteNoEncontradoException
+
+
+class TestMetricas(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica()
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+        self.metricas = Metricas()
+        self.lunes = datetime(2030, 6, 3, 10, 0)
+
+    def test_llamadas_y_errores_por_tipo(self):
+        """Test para verificar que se cuentan llamadas, latencias y errores por tipo de excepción"""
+        self.clinica.establecer_metricas(self.metricas)
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes)
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.obtener_historia_clinica("99999999")
+
+        instantanea = self.metricas.instantanea()
+        turnos = instantanea["agendar_turno"]
+        self.assertEqual(turnos["llamadas"], 2)
+        self.assertEqual(turnos["errores_por_tipo"], {"TurnoOcupadoException": 1})
+        self.assertEqual(turnos["histograma"][-1], (float("inf"), 2))
+        self.assertGreater(turnos["segundos_total"], 0)
+        self.assertEqual(instantanea["obtener_historia_clinica"]["errores"], 1)
+
+    def test_desactivar_restaura_metodos(self):
+        """Test para verificar que sin métricas los métodos vuelven a ser los de la clase"""
+        self.clinica.establecer_metricas(self.metricas)
+        self.clinica.establecer_metricas(None)
+        for nombre in OPERACIONES_INSTRUMENTADAS:
+            self.assertNotIn(nombre, vars(self.clinica))
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes)
+        self.assertEqual(self.metricas.instantanea(), {})
+        self.assertIsNone(self.clinica.obtener_metricas())
+
+    def test_contexto_y_prometheus(self):
+        """Test para verificar la medición de bloques y el volcado en formato Prometheus"""
+        with self.metricas.medir("importacion"):
+            pass
+        with self.assertRaises(ValueError):
+            with self.metricas.medir("importacion"):
+                raise ValueError("dato inválido")
+
+        texto = self.metricas.exportar_prometheus()
+        self.assertIn("# TYPE clinica_operacion_segundos histogram", texto)
+        self.assertIn('clinica_operacion_segundos_bucket{operacion="importacion",le="+Inf"} 2', texto)
+        self.assertIn('clinica_operacion_segundos_count{operacion="importacion"} 2', texto)
+        self.assertIn('clinica_operacion_errores_total{operacion="importacion",excepcion="ValueError"} 1', texto)
+
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = os.path.join(directorio, "clinica.prom")
+            self.metricas.guardar_prometheus(ruta)
+            with open(ruta, encoding="utf-8") as archivo:
+                self.assertEqual(archivo.read(), texto)
+        finally:
+            shutil.rmtree(directorio)
+
+
+if __name__ == '__main__':
+    unittest.main()
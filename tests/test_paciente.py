@@ -0,0 +1,65 @@
+import unittest
+from datetime import date
+
+from src.modelo.paciente import Paciente, parsear_fecha_nacimiento, formatear_fecha_nacimiento
+from src.modelo.excepciones import DatosInvalidosException
+
+
+class TestPaciente(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.paciente = Paciente("Juan Pérez", "12345678", "15/03/1985")
+
+    def test_fecha_nacimiento_como_fecha(self):
+        """Test para verificar que la fecha de nacimiento se guarda interpretada"""
+        self.assertEqual(self.paciente.obtener_fecha_nacimiento(), date(1985, 3, 15))
+        self.assertIn("Nacimiento: 15/03/1985", str(self.paciente))
+
+    def test_fecha_con_un_digito(self):
+        """Test para verificar que se aceptan día y mes de un solo dígito"""
+        paciente = Paciente("María González", "87654321", "5/7/1990")
+        self.assertEqual(paciente.obtener_fecha_nacimiento(), date(1990, 7, 5))
+
+    def test_str_normaliza_fecha(self):
+        """Test para verificar que str muestra la fecha de nacimiento normalizada, no el texto ingresado"""
+        paciente = Paciente("María González", "87654321", " 5/7/1990 ")
+        self.assertEqual(str(paciente), "Paciente: María González (DNI: 87654321, Nacimiento: 05/07/1990)")
+        restaurado = Paciente.restaurar("María González", "87654321", date(1990, 7, 5))
+        self.assertEqual(str(restaurado), str(paciente))
+
+    def test_fechas_invalidas(self):
+        """Test para verificar que se rechazan formatos y fechas inexistentes"""
+        for texto in ["1985-03-15", "15/03/85", "31/04/1985", "29/02/2023", "00/01/1985", "15/13/1985", "", "a/b/cdef"]:
+            with self.subTest(texto=texto):
+                with self.assertRaises(DatosInvalidosException):
+                    Paciente("Juan Pérez", "12345678", texto)
+
+    def test_anio_bisiesto(self):
+        """Test para verificar que el 29 de febrero sólo vale en años bisiestos"""
+        self.assertEqual(parsear_fecha_nacimiento("29/02/2024"), date(2024, 2, 29))
+
+    def test_formatear_fecha(self):
+        """Test para verificar el formato dd/mm/aaaa"""
+        self.assertEqual(formatear_fecha_nacimiento(date(2001, 1, 9)), "09/01/2001")
+
+    def test_obtener_edad(self):
+        """Test para verificar el cálculo de la edad en años cumplidos"""
+        self.assertEqual(self.paciente.obtener_edad(date(2030, 3, 14)), 44)
+        self.assertEqual(self.paciente.obtener_edad(date(2030, 3, 15)), 45)
+
+    def test_restaurar_sin_validar(self):
+        """Test para verificar que restaurar construye el paciente con los datos dados"""
+        paciente = Paciente.restaurar("Juan Pérez", "12345678", date(1985, 3, 15))
+        self.assertEqual(paciente.obtener_dni(), "12345678")
+        self.assertEqual(str(paciente), str(self.paciente))
+
+
+    def test_sin_diccionario_de_instancia(self):
+        """Test para verificar que Paciente usa __slots__"""
+        self.assertFalse(hasattr(self.paciente, "__dict__"))
+        self.assertFalse(hasattr(Paciente.restaurar("Ana", "1", date(2000, 1, 1)), "__dict__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
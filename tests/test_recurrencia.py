@@ -0,0 +1,175 @@
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.especialidad import Especialidad
+from src.modelo.clinica import Clinica
+from src.modelo.recurrencia import TurnoRecurrente
+from src.modelo.excepciones import (
+    DatosInvalidosException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+)
+from src.persistencia.almacen_sqlite import AlmacenSQLite
+from src.persistencia.diario import DiarioClinica
+
+
+class TestTurnoRecurrente(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.paciente = Paciente("Juan Pérez", "12345678", "15/03/1985")
+        self.medico = Medico("Dr. García", "MED001")
+        self.lunes = datetime(2030, 6, 3, 10, 0)
+        self.serie = TurnoRecurrente(self.paciente, self.medico, self.lunes, "Cardiología", 26)
+
+    def test_sesiones_en_rango(self):
+        """Test para verificar que las sesiones se calculan sólo para el rango pedido"""
+        sesiones = list(self.serie.sesiones(self.lunes + timedelta(days=8), self.lunes + timedelta(days=29)))
+        self.assertEqual(sesiones, [self.lunes + timedelta(days=14), self.lunes + timedelta(days=21),
+                                    self.lunes + timedelta(days=28)])
+        self.assertEqual(len(list(self.serie.sesiones())), 26)
+        self.assertEqual(self.serie.obtener_fecha_hora_fin(),
+                         self.lunes + timedelta(days=7 * 25, minutes=30))
+
+    def test_superposicion(self):
+        """Test para verificar la superposición con las sesiones de la serie"""
+        sesion = self.lunes + timedelta(days=70)
+        self.assertTrue(self.serie.se_superpone(sesion + timedelta(minutes=15), sesion + timedelta(minutes=45)))
+        self.assertFalse(self.serie.se_superpone(sesion + timedelta(minutes=30), sesion + timedelta(minutes=60)))
+        self.assertFalse(self.serie.se_superpone(sesion + timedelta(days=1), sesion + timedelta(days=1, hours=1)))
+        self.assertFalse(self.serie.se_superpone(self.lunes + timedelta(days=7 * 26),
+                                                 self.lunes + timedelta(days=7 * 26, hours=1)))
+
+    def test_cancelar_sesion(self):
+        """Test para verificar que una sesión cancelada deja de generarse y de ocupar el horario"""
+        sesion = self.lunes + timedelta(days=7)
+        self.serie.cancelar_sesion(sesion)
+        self.assertFalse(self.serie.es_sesion(sesion))
+        self.assertFalse(self.serie.se_superpone(sesion, sesion + timedelta(minutes=30)))
+        self.assertEqual(self.serie.contar_sesiones(), 25)
+        self.assertNotIn(sesion, list(self.serie.sesiones()))
+        with self.assertRaises(DatosInvalidosException):
+            self.serie.cancelar_sesion(sesion)
+        with self.assertRaises(DatosInvalidosException):
+            self.serie.cancelar_sesion(sesion + timedelta(hours=1))
+
+    def test_datos_invalidos(self):
+        """Test para verificar la validación de la regla"""
+        with self.assertRaises(DatosInvalidosException):
+            TurnoRecurrente(self.paciente, self.medico, self.lunes, "Cardiología", 0)
+        with self.assertRaises(DatosInvalidosException):
+            TurnoRecurrente(self.paciente, self.medico, self.lunes, "Cardiología", 4, timedelta(hours=36))
+        with self.assertRaises(DatosInvalidosException):
+            TurnoRecurrente(self.paciente, self.medico, datetime(2020, 1, 6, 10, 0), "Cardiología", 4)
+
+
+class TestClinicaRecurrencias(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica()
+        self._cargar_datos(self.clinica)
+        self.lunes = datetime(2030, 6, 3, 10, 0)
+
+    def _cargar_datos(self, clinica):
+        medico = Medico("Dr. García", "MED001")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1985"))
+        clinica.agregar_paciente(Paciente("María González", "87654321", "22/07/1990"))
+
+    def test_serie_ocupa_horarios(self):
+        """Test para verificar que las sesiones participan en la detección de conflictos"""
+        self.clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes,
+                                              hasta=self.lunes + timedelta(days=182))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Cardiología",
+                                       self.lunes + timedelta(days=91, minutes=15))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno_recurrente("87654321", "MED001", "Cardiología",
+                                                  self.lunes - timedelta(days=14), repeticiones=3)
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", self.lunes + timedelta(minutes=30))
+        libres = list(self.clinica.buscar_turnos_libres("Cardiología", self.lunes, self.lunes + timedelta(hours=1)))
+        self.assertEqual(libres, [])
+
+    def test_especialidad_y_parametros(self):
+        """Test para verificar las validaciones al agendar una serie"""
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes,
+                                                  repeticiones=3, intervalo=timedelta(days=1))
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes)
+        self.assertEqual(self.clinica.obtener_recurrencias(), [])
+
+    def test_cancelar_libera_horario(self):
+        """Test para verificar que cancelar una sesión la vuelve agendable"""
+        self.clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes, repeticiones=4)
+        sesion = self.lunes + timedelta(days=14)
+        self.clinica.cancelar_sesion("MED001", sesion)
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", sesion)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.cancelar_sesion("MED001", sesion)
+
+    def test_historia_y_sesiones(self):
+        """Test para verificar las sesiones materializadas en la historia clínica"""
+        self.clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes + timedelta(hours=2))
+        self.clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes, repeticiones=10)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        agenda = historia.obtener_agenda(self.lunes, self.lunes + timedelta(days=8))
+        self.assertEqual([t.obtener_fecha_hora() for t in agenda],
+                         [self.lunes, self.lunes + timedelta(hours=2), self.lunes + timedelta(days=7)])
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.assertIn("TURNOS RECURRENTES (1):\n1. Turno recurrente: 12345678", str(historia))
+        sesiones = self.clinica.obtener_sesiones(self.lunes + timedelta(days=60), self.lunes + timedelta(days=365))
+        self.assertEqual(len(sesiones), 1)
+
+    def test_almacen_sqlite(self):
+        """Test para verificar que las series se guardan y recuperan de SQLite"""
+        directorio = tempfile.mkdtemp()
+        try:
+            ruta = f"{directorio}/clinica.db"
+            almacen = AlmacenSQLite(ruta)
+            clinica = Clinica(almacen)
+            self._cargar_datos(clinica)
+            clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes, repeticiones=4)
+            clinica.cancelar_sesion("MED001", self.lunes + timedelta(days=7))
+            almacen.cerrar()
+
+            almacen = AlmacenSQLite(ruta)
+            clinica = Clinica(almacen)
+            serie, = clinica.obtener_recurrencias()
+            self.assertEqual(serie.obtener_canceladas(), [self.lunes + timedelta(days=7)])
+            with self.assertRaises(TurnoOcupadoException):
+                clinica.agendar_turno("87654321", "MED001", "Cardiología", self.lunes + timedelta(days=14))
+            clinica.agendar_turno("87654321", "MED001", "Cardiología", self.lunes + timedelta(days=7))
+            self.assertEqual(len(clinica.obtener_historia_clinica("12345678").obtener_recurrencias()), 1)
+            almacen.cerrar()
+        finally:
+            shutil.rmtree(directorio)
+
+    def test_diario(self):
+        """Test para verificar que el diario registra series y cancelaciones"""
+        directorio = tempfile.mkdtemp()
+        try:
+            with DiarioClinica(directorio) as clinica:
+                self._cargar_datos(clinica)
+                clinica.agendar_turno_recurrente("12345678", "MED001", "Cardiología", self.lunes, repeticiones=4)
+                clinica.cancelar_sesion("MED001", self.lunes)
+            diario = DiarioClinica(directorio)
+            serie, = diario.abrir().obtener_recurrencias()
+            self.assertEqual(serie.contar_sesiones(), 3)
+            diario.compactar()
+            diario.cerrar()
+            with DiarioClinica(directorio) as clinica:
+                serie, = clinica.obtener_recurrencias()
+                self.assertEqual(serie.obtener_canceladas(), [self.lunes])
+        finally:
+            shutil.rmtree(directorio)
+
+
+if __name__ == '__main__':
+    unittest.main()
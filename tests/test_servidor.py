@@ -0,0 +1,71 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.modelo.clinica import Clinica
+from src.interfaz.servidor import ServidorClinica
+from src.interfaz.cliente import ClienteClinica, prueba_de_carga
+
+
+class TestServidorClinica(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Configuración inicial para cada test"""
+        self.clinica = Clinica()
+        self.servidor = ServidorClinica(self.clinica)
+        self.host, self.puerto = await self.servidor.iniciar_tcp()
+
+    async def asyncTearDown(self):
+        await self.servidor.cerrar()
+
+    async def test_solicitudes_en_paralelo(self):
+        """Test para verificar que varias conexiones con pipelining se atienden correctamente"""
+        resultado = await prueba_de_carga(self.host, self.puerto, clientes=5, solicitudes=200)
+        self.assertEqual(resultado["errores"], 0)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 1000)
+
+    async def test_respuestas_en_orden(self):
+        """Test para verificar que cada respuesta corresponde a su solicitud"""
+        cliente = await ClienteClinica.conectar_tcp(self.host, self.puerto, max_en_vuelo=4)
+        respuestas = await asyncio.gather(
+            cliente.enviar("agregar_paciente", nombre="Juan Pérez", dni="12345678", fecha_nacimiento="15/03/1985"),
+            cliente.enviar("agregar_paciente", nombre="Juan Pérez", dni="12345678", fecha_nacimiento="15/03/1985"),
+            cliente.enviar("listar_pacientes"),
+        )
+        await cliente.cerrar()
+        self.assertTrue(respuestas[0]["ok"])
+        self.assertEqual(respuestas[1]["error"], "ValueError")
+        self.assertEqual(len(respuestas[2]["resultado"]), 1)
+
+    async def test_linea_invalida(self):
+        """Test para verificar que una línea que no es JSON no corta la conexión"""
+        lector, escritor = await asyncio.open_connection(self.host, self.puerto)
+        escritor.write(b"esto no es json\n")
+        escritor.write(b'{"id": 2, "comando": "listar_medicos"}\n')
+        await escritor.drain()
+        primera = json.loads(await lector.readline())
+        segunda = json.loads(await lector.readline())
+        escritor.close()
+        await escritor.wait_closed()
+        self.assertFalse(primera["ok"])
+        self.assertEqual(segunda, {"id": 2, "resultado": [], "ok": True})
+
+    @unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Requiere sockets Unix")
+    async def test_socket_unix(self):
+        """Test para verificar el servidor sobre un socket Unix"""
+        directorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directorio)
+        servidor = ServidorClinica(self.clinica)
+        ruta = await servidor.iniciar_unix(os.path.join(directorio, "clinica.sock"))
+        cliente = await ClienteClinica.conectar_unix(ruta)
+        respuesta = await cliente.enviar("listar_turnos")
+        await cliente.cerrar()
+        await servidor.cerrar()
+        self.assertTrue(respuesta["ok"])
+
+
+if __name__ == '__main__':
+    unittest.main()
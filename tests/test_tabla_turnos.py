@@ -0,0 +1,103 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.turno import Turno
+from src.modelo.tabla_turnos import TablaTurnos, a_microsegundos, desde_microsegundos
+
+
+class TestTablaTurnos(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.tabla = TablaTurnos()
+        self.paciente1 = Paciente("Juan Pérez", "12345678", "15/03/1985")
+        self.paciente2 = Paciente("María González", "87654321", "22/07/1990")
+        self.medico1 = Medico("Dr. García", "MED001")
+        self.medico2 = Medico("Dra. López", "MED002")
+        self.lunes = datetime(2030, 6, 3, 10, 0)
+
+    def _turno(self, paciente, medico, fecha_hora, especialidad="Cardiología", minutos=30):
+        return Turno(paciente, medico, fecha_hora, especialidad, timedelta(minutes=minutos))
+
+    def test_vista_conserva_los_datos(self):
+        """Test para verificar que la vista materializada reproduce el turno guardado"""
+        fecha = datetime(2030, 6, 3, 10, 0, 17, 250)
+        fila = self.tabla.agregar(self._turno(self.paciente1, self.medico1, fecha, minutos=45))
+        turno = self.tabla.obtener(fila)
+        self.assertIs(turno.obtener_paciente(), self.paciente1)
+        self.assertIs(turno.obtener_medico(), self.medico1)
+        self.assertEqual(turno.obtener_fecha_hora(), fecha)
+        self.assertEqual(turno.obtener_duracion(), timedelta(minutes=45))
+        self.assertEqual(turno.obtener_especialidad(), "Cardiología")
+
+    def test_filas_estables_y_orden_de_registro(self):
+        """Test para verificar que las filas son ids estables en orden de registro"""
+        filas = [
+            self.tabla.agregar(self._turno(self.paciente1, self.medico1, self.lunes + timedelta(hours=2))),
+            self.tabla.agregar(self._turno(self.paciente2, self.medico1, self.lunes)),
+        ]
+        self.assertEqual(filas, [0, 1])
+        self.assertEqual(len(self.tabla), 2)
+        self.assertEqual([t.obtener_fecha_hora() for t in self.tabla],
+                         [self.lunes + timedelta(hours=2), self.lunes])
+        # Por médico, en orden de inicio
+        self.assertEqual(self.tabla.filas("MED001"), [1, 0])
+
+    def test_existe_y_esta_libre(self):
+        """Test para verificar las consultas de disponibilidad por médico"""
+        self.tabla.agregar(self._turno(self.paciente1, self.medico1, self.lunes))
+        self.assertTrue(self.tabla.existe("MED001", self.lunes))
+        self.assertFalse(self.tabla.existe("MED002", self.lunes))
+        self.assertFalse(self.tabla.esta_libre("MED001", self.lunes + timedelta(minutes=15),
+                                               self.lunes + timedelta(minutes=45)))
+        self.assertTrue(self.tabla.esta_libre("MED001", self.lunes + timedelta(minutes=30),
+                                              self.lunes + timedelta(minutes=60)))
+        self.assertTrue(self.tabla.esta_libre("MED999", self.lunes, self.lunes + timedelta(minutes=30)))
+
+    def test_filtros_y_conteos(self):
+        """Test para verificar filtros combinados por médico, especialidad y fechas"""
+        self.tabla.agregar_lote([
+            self._turno(self.paciente1, self.medico1, self.lunes),
+            self._turno(self.paciente2, self.medico2, self.lunes, "Pediatría"),
+            self._turno(self.paciente1, self.medico2, self.lunes + timedelta(days=1), "pediatría"),
+            self._turno(self.paciente2, self.medico1, self.lunes + timedelta(days=7)),
+        ])
+        self.assertEqual(self.tabla.contar(), 4)
+        self.assertEqual(self.tabla.contar(especialidad="PEDIATRÍA"), 2)
+        self.assertEqual(self.tabla.contar(matricula="MED001"), 2)
+        self.assertEqual(self.tabla.contar(desde=self.lunes, hasta=self.lunes + timedelta(days=1)), 2)
+        self.assertEqual(self.tabla.filas(especialidad="Pediatría", desde=self.lunes + timedelta(hours=1)), [2])
+        self.assertEqual(self.tabla.filas("MED002", "pediatría"), [1, 2])
+        self.assertEqual(self.tabla.contar(especialidad="Neurología"), 0)
+        self.assertEqual(self.tabla.contar(matricula="MED999"), 0)
+        self.assertEqual(list(self.tabla.filas_paciente("12345678")), [0, 2])
+
+    def test_cancelar_y_reprogramar(self):
+        """Test para verificar los tombstones y la reprogramación en su lugar"""
+        filas = self.tabla.agregar_lote([
+            self._turno(self.paciente1, self.medico1, self.lunes),
+            self._turno(self.paciente2, self.medico1, self.lunes + timedelta(hours=1)),
+        ])
+        self.tabla.cancelar(filas[0])
+        self.assertFalse(self.tabla.es_vigente(filas[0]))
+        self.assertEqual(len(self.tabla), 1)
+        self.assertEqual(self.tabla.cantidad_filas(), 2)
+        self.assertTrue(self.tabla.esta_libre("MED001", self.lunes, self.lunes + timedelta(minutes=30)))
+        self.assertEqual(list(self.tabla.filas_paciente("12345678")), [])
+        self.assertEqual(self.tabla.filas(), [1])
+
+        self.tabla.reprogramar(filas[1], self.lunes, timedelta(minutes=45))
+        self.assertEqual(self.tabla.buscar("MED001", self.lunes), filas[1])
+        self.assertFalse(self.tabla.esta_libre("MED001", self.lunes, self.lunes + timedelta(hours=1)))
+        self.assertTrue(self.tabla.esta_libre("MED001", self.lunes, self.lunes + timedelta(hours=1), excluir=filas[1]))
+
+    def test_conversion_de_fechas(self):
+        """Test para verificar que la conversión a microsegundos no pierde precisión"""
+        fecha = datetime(2030, 12, 31, 23, 59, 59, 999999)
+        self.assertEqual(desde_microsegundos(a_microsegundos(fecha)), fecha)
+
+
+if __name__ == '__main__':
+    unittest.main()
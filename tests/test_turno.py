@@ -0,0 +1,46 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.modelo.paciente import Paciente
+from src.modelo.medico import Medico
+from src.modelo.turno import Turno, DURACION_POR_DEFECTO
+from src.modelo.excepciones import DatosInvalidosException
+
+
+class TestTurno(unittest.TestCase):
+
+    def setUp(self):
+        """Configuración inicial para cada test"""
+        self.paciente = Paciente("Juan Pérez", "12345678", "15/03/1985")
+        self.medico = Medico("Dr. García", "MED001")
+        self.fecha = datetime(2030, 6, 3, 10, 0)
+
+    def test_duracion_por_defecto(self):
+        """Test para verificar la duración por defecto y el horario de fin"""
+        turno = Turno(self.paciente, self.medico, self.fecha, "Cardiología")
+        self.assertEqual(turno.obtener_duracion(), DURACION_POR_DEFECTO)
+        self.assertEqual(turno.obtener_fecha_hora_fin(), self.fecha + DURACION_POR_DEFECTO)
+
+    def test_duracion_invalida(self):
+        """Test para verificar que no se aceptan duraciones nulas o negativas"""
+        with self.assertRaises(DatosInvalidosException):
+            Turno(self.paciente, self.medico, self.fecha, "Cardiología", timedelta(0))
+        with self.assertRaises(DatosInvalidosException):
+            Turno(self.paciente, self.medico, self.fecha, "Cardiología", timedelta(minutes=-15))
+
+    def test_turno_en_el_pasado(self):
+        """Test para verificar que no se agendan turnos en el pasado"""
+        with self.assertRaises(DatosInvalidosException):
+            Turno(self.paciente, self.medico, datetime(2000, 1, 3, 10, 0), "Cardiología")
+
+
+    def test_sin_diccionario_de_instancia(self):
+        """Test para verificar que Turno usa __slots__ y no admite atributos nuevos"""
+        turno = Turno(self.paciente, self.medico, self.fecha, "Cardiología")
+        self.assertFalse(hasattr(turno, "__dict__"))
+        with self.assertRaises(AttributeError):
+            turno.nota = "sin lugar"
+
+
+if __name__ == '__main__':
+    unittest.main()